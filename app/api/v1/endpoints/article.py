@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from app.api.v1.pagination import MAX_PAGE_SIZE, ListResponseFormat, list_keyset_page
 from app.core.db import get_db
 from app.models.models import Article
 from app.schemas.article import ArticleCreate, ArticleRead, ArticleUpdate
@@ -38,9 +39,26 @@ def _build_article_code_already_exists_detail(*, article_code: str) -> dict[str,
 
 
 @router.get("/", response_model=list[ArticleRead])
-def list_articles(db: Session = Depends(get_db)):
-    articles = db.query(Article).all()
-    return articles
+def list_articles(
+    response: Response,
+    after_id: int | None = Query(
+        default=None,
+        ge=0,
+        description="Keyset cursor: return rows with id greater than this value.",
+    ),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    response_format: ListResponseFormat = Query(default="json", alias="format"),
+    db: Session = Depends(get_db),
+):
+    return list_keyset_page(
+        db,
+        Article,
+        ArticleRead,
+        after_id=after_id,
+        limit=limit,
+        response_format=response_format,
+        response=response,
+    )
 
 
 @router.get("/{id}", response_model=ArticleRead)
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from app.api.v1.pagination import MAX_PAGE_SIZE, ListResponseFormat, list_keyset_page
 from app.core.db import get_db
 from app.models.models import Color
 from app.schemas.color import ColorCreate, ColorRead, ColorUpdate
@@ -38,9 +39,26 @@ def _build_color_inner_code_already_exists_detail(*, inner_code: str) -> dict[st
 
 
 @router.get("/", response_model=list[ColorRead])
-def list_colors(db: Session = Depends(get_db)):
-    colors = db.query(Color).all()
-    return colors
+def list_colors(
+    response: Response,
+    after_id: int | None = Query(
+        default=None,
+        ge=0,
+        description="Keyset cursor: return rows with id greater than this value.",
+    ),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    response_format: ListResponseFormat = Query(default="json", alias="format"),
+    db: Session = Depends(get_db),
+):
+    return list_keyset_page(
+        db,
+        Color,
+        ColorRead,
+        after_id=after_id,
+        limit=limit,
+        response_format=response_format,
+        response=response,
+    )
 
 
 @router.get("/{id}", response_model=ColorRead)
@@ -1,9 +1,22 @@
+from collections import defaultdict
 from datetime import date
+from functools import lru_cache
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.api.v1.export import ExportFormat, build_csv_export_response, build_ndjson_export_response
+from app.api.v1.responses import (
+    build_conditional_model_response,
+    build_conditional_response,
+    build_versioned_model_response,
+    compute_etag,
+    render_model_json,
+)
+from app.core.db import get_async_db, get_db
+from app.core.metrics import REGISTRY
 from app.models.models import (
     Article,
     ArticlePlanningSettings,
@@ -15,7 +28,7 @@ from app.models.models import (
 )
 from app.schemas.demand import DemandResult
 from app.schemas.planning import BundleAvailabilityResponse
-from app.schemas.order_explanation import OrderExplanationPortfolioResponse
+from app.schemas.order_explanation import ArticleOrderExplanation, OrderExplanationPortfolioResponse
 from app.schemas.integrations import IntegrationsConfigSnapshot
 from app.schemas.monitoring import MonitoringSnapshot
 from app.schemas.monitoring_dashboard import MonitoringDashboardResponse, MonitoringStatusSummary, MonitoringStatusResponse
@@ -35,8 +48,8 @@ from app.schemas.monitoring_alerts import (
 )
 from app.schemas.monitoring_history import MonitoringSnapshotRecordSchema, MonitoringHistoryResponse
 from app.schemas.article_bundle_snapshot import ArticleInventorySnapshot
-from app.schemas.bundle_risk import BundleRiskPortfolioResponse
-from app.schemas.planning_health import PlanningHealthPortfolioResponse
+from app.schemas.bundle_risk import ArticleBundleRiskEntry, BundleRiskPortfolioResponse
+from app.schemas.planning_health import ArticleHealthSummary, PlanningHealthPortfolioResponse
 from app.schemas.planning_settings import (
     ArticlePlanningConfigSnapshot,
     ArticlePlanningSettingsExperimentalSnapshot,
@@ -51,30 +64,36 @@ from app.schemas.planning_settings import (
 )
 from app.services.article_bundle_snapshot import build_article_inventory_snapshot
 from app.services.bundle_planning import calculate_bundle_availability
-from app.services.bundle_risk import build_bundle_risk_portfolio
+from app.services.bundle_risk import build_bundle_risk_portfolio, iter_bundle_risk_portfolio
 from app.services.demand_engine import compute_demand
-from app.services.order_explanation import build_order_explanation_portfolio
+from app.services.order_explanation import (
+    build_order_explanation_portfolio,
+    iter_order_explanation_portfolio,
+)
 from app.services.integrations_config import build_integrations_config_snapshot
 from app.services.monitoring import build_monitoring_snapshot
 from app.services.monitoring_history import (
     build_and_persist_monitoring_snapshot,
     get_monitoring_history,
+    get_monitoring_history_async,
 )
 from app.services.monitoring_alerts import evaluate_active_alerts
 from app.services.monitoring_status import build_monitoring_status, build_monitoring_status_summary
-from app.services.monitoring_timeseries import build_monitoring_timeseries
+from app.services.monitoring_timeseries import build_monitoring_timeseries_async
 from app.services.monitoring_risk_focus import build_top_risky_articles
 from app.services.monitoring_metrics import build_monitoring_metrics_catalog
 from app.services.monitoring_layout import build_monitoring_layout
 from app.services.monitoring_bootstrap import build_monitoring_bootstrap
+from app.services.monitoring_version import build_monitoring_version_key
 from app.services.monitoring_alert_rules import (
     create_alert_rule,
     delete_alert_rule,
     list_alert_rules,
+    list_alert_rules_async,
     update_alert_rule,
 )
 from app.services.monitoring_alert_rules_seed import seed_monitoring_alert_rules
-from app.services.planning_health import build_planning_health_portfolio
+from app.services.planning_health import build_planning_health_portfolio, iter_planning_health_portfolio
 from app.services.article_dashboard import build_article_dashboard
 
 
@@ -182,12 +201,13 @@ def _build_global_settings_snapshot(db: Session) -> GlobalPlanningSettingsSnapsh
     )
 
 
-def _build_article_snapshot(db: Session, article: Article) -> ArticlePlanningConfigSnapshot:
-    aps = (
-        db.query(ArticlePlanningSettings)
-        .filter(ArticlePlanningSettings.article_id == article.id)
-        .first()
-    )
+def _build_article_snapshot(
+    article: Article,
+    aps: ArticlePlanningSettings | None,
+    ps: PlanningSettings | None,
+    color_rows: list[ColorPlanningSettings],
+    elastic_rows: list[tuple[ElasticPlanningSettings, ElasticType]],
+) -> ArticlePlanningConfigSnapshot:
     if aps is not None:
         aps_experimental = ArticlePlanningSettingsExperimentalSnapshot(
             include_in_planning=aps.include_in_planning,
@@ -202,11 +222,6 @@ def _build_article_snapshot(db: Session, article: Article) -> ArticlePlanningCon
     else:
         aps_snapshot = None
 
-    ps = (
-        db.query(PlanningSettings)
-        .filter(PlanningSettings.article_id == article.id)
-        .first()
-    )
     if ps is not None:
         ps_experimental = PlanningSettingsExperimentalSnapshot(
             alert_threshold_days=ps.alert_threshold_days,
@@ -223,11 +238,6 @@ def _build_article_snapshot(db: Session, article: Article) -> ArticlePlanningCon
     else:
         ps_snapshot = None
 
-    color_rows = (
-        db.query(ColorPlanningSettings)
-        .filter(ColorPlanningSettings.article_id == article.id)
-        .all()
-    )
     color_snapshots = [
         ColorPlanningSettingsSnapshot(
             color_id=row.color_id,
@@ -236,12 +246,6 @@ def _build_article_snapshot(db: Session, article: Article) -> ArticlePlanningCon
         for row in color_rows
     ]
 
-    elastic_rows = (
-        db.query(ElasticPlanningSettings, ElasticType)
-        .join(ElasticType, ElasticType.id == ElasticPlanningSettings.elastic_type_id)
-        .filter(ElasticPlanningSettings.article_id == article.id)
-        .all()
-    )
     elastic_snapshots = [
         ElasticPlanningSettingsSnapshot(
             elastic_type_id=et.id,
@@ -261,11 +265,67 @@ def _build_article_snapshot(db: Session, article: Article) -> ArticlePlanningCon
     )
 
 
+def _build_article_snapshots(db: Session, articles: list[Article]) -> list[ArticlePlanningConfigSnapshot]:
+    """Build config snapshots for ``articles`` with one query per settings table.
+
+    Rows are grouped by article in memory; for one-per-article tables the lowest id wins.
+    """
+
+    if not articles:
+        return []
+    article_ids = [article.id for article in articles]
+
+    aps_by_article: dict[int, ArticlePlanningSettings] = {}
+    for aps in db.scalars(
+        select(ArticlePlanningSettings)
+        .where(ArticlePlanningSettings.article_id.in_(article_ids))
+        .order_by(ArticlePlanningSettings.id)
+    ):
+        aps_by_article.setdefault(aps.article_id, aps)
+
+    ps_by_article: dict[int, PlanningSettings] = {}
+    for ps in db.scalars(
+        select(PlanningSettings)
+        .where(PlanningSettings.article_id.in_(article_ids))
+        .order_by(PlanningSettings.id)
+    ):
+        ps_by_article.setdefault(ps.article_id, ps)
+
+    colors_by_article: dict[int, list[ColorPlanningSettings]] = defaultdict(list)
+    for row in db.scalars(
+        select(ColorPlanningSettings)
+        .where(ColorPlanningSettings.article_id.in_(article_ids))
+        .order_by(ColorPlanningSettings.id)
+    ):
+        colors_by_article[row.article_id].append(row)
+
+    elastics_by_article: dict[int, list[tuple[ElasticPlanningSettings, ElasticType]]] = defaultdict(list)
+    for eps, et in db.execute(
+        select(ElasticPlanningSettings, ElasticType)
+        .join(ElasticType, ElasticType.id == ElasticPlanningSettings.elastic_type_id)
+        .where(ElasticPlanningSettings.article_id.in_(article_ids))
+        .order_by(ElasticPlanningSettings.id)
+    ):
+        elastics_by_article[eps.article_id].append((eps, et))
+
+    return [
+        _build_article_snapshot(
+            article,
+            aps_by_article.get(article.id),
+            ps_by_article.get(article.id),
+            colors_by_article.get(article.id, []),
+            elastics_by_article.get(article.id, []),
+        )
+        for article in articles
+    ]
+
+
 @router.get(
     "/config-snapshot",
     response_model=PlanningConfigSnapshotResponse,
 )
 def get_planning_config_snapshot(
+    request: Request,
     article_id: int | None = Query(
         default=None,
         description=(
@@ -292,7 +352,7 @@ def get_planning_config_snapshot(
                 detail=_build_article_not_found_detail(article_id=article_id),
             )
 
-        snapshot = _build_article_snapshot(db, article)
+        [snapshot] = _build_article_snapshots(db, [article])
 
         if (
             snapshot.article_planning_settings is None
@@ -314,12 +374,14 @@ def get_planning_config_snapshot(
             .order_by(Article.id)
             .all()
         )
-        for _ps, article in ps_rows:
-            articles.append(_build_article_snapshot(db, article))
+        articles.extend(_build_article_snapshots(db, [article for _ps, article in ps_rows]))
 
-    return PlanningConfigSnapshotResponse(
-        global_settings=global_snapshot,
-        articles=articles,
+    return build_conditional_model_response(
+        request,
+        PlanningConfigSnapshotResponse(
+            global_settings=global_snapshot,
+            articles=articles,
+        ),
     )
 
 
@@ -346,8 +408,18 @@ def get_article_bundle_snapshot(
 )
 def get_bundle_risk_portfolio(
     article_ids: list[int] | None = Query(default=None),
+    response_format: ExportFormat = Query(default="json", alias="format"),
     db: Session = Depends(get_db),
 ) -> BundleRiskPortfolioResponse:
+    if response_format == "ndjson":
+        return build_ndjson_export_response(iter_bundle_risk_portfolio(db=db, article_ids=article_ids))
+    if response_format == "csv":
+        return build_csv_export_response(
+            iter_bundle_risk_portfolio(db=db, article_ids=article_ids),
+            row_model=ArticleBundleRiskEntry,
+            filename="bundle-risk-portfolio.csv",
+        )
+
     items = build_bundle_risk_portfolio(db=db, article_ids=article_ids)
     return BundleRiskPortfolioResponse(items=items)
 
@@ -358,8 +430,21 @@ def get_bundle_risk_portfolio(
 )
 def get_order_explanation_portfolio(
     article_ids: list[int] | None = Query(default=None),
+    response_format: ExportFormat = Query(default="json", alias="format"),
     db: Session = Depends(get_db),
 ) -> OrderExplanationPortfolioResponse:
+    if response_format == "ndjson":
+        return build_ndjson_export_response(
+            iter_order_explanation_portfolio(db=db, article_ids=article_ids)
+        )
+    if response_format == "csv":
+        # One row per article, so articles without reasons still appear; reasons stay in one JSON cell.
+        return build_csv_export_response(
+            iter_order_explanation_portfolio(db=db, article_ids=article_ids),
+            row_model=ArticleOrderExplanation,
+            filename="order-explanation-portfolio.csv",
+        )
+
     items = build_order_explanation_portfolio(db=db, article_ids=article_ids)
     return OrderExplanationPortfolioResponse(items=items)
 
@@ -370,8 +455,20 @@ def get_order_explanation_portfolio(
 )
 def get_planning_health_portfolio(
     article_ids: list[int] | None = Query(default=None),
+    response_format: ExportFormat = Query(default="json", alias="format"),
     db: Session = Depends(get_db),
 ) -> PlanningHealthPortfolioResponse:
+    if response_format == "ndjson":
+        return build_ndjson_export_response(
+            iter_planning_health_portfolio(db=db, article_ids=article_ids)
+        )
+    if response_format == "csv":
+        return build_csv_export_response(
+            iter_planning_health_portfolio(db=db, article_ids=article_ids),
+            row_model=ArticleHealthSummary,
+            filename="health-portfolio.csv",
+        )
+
     items = build_planning_health_portfolio(db=db, article_ids=article_ids)
     return PlanningHealthPortfolioResponse(items=items)
 
@@ -427,28 +524,47 @@ def capture_monitoring_snapshot(
     "/monitoring/history",
     response_model=MonitoringHistoryResponse,
 )
-def get_monitoring_history_api(
+async def get_monitoring_history_api(
     limit: int = Query(default=30, ge=1, le=365),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> MonitoringHistoryResponse:
-    items = get_monitoring_history(db=db, limit=limit)
+    items = await get_monitoring_history_async(db=db, limit=limit)
     return MonitoringHistoryResponse(items=items)
 
 
+@lru_cache(maxsize=1)
+def _render_monitoring_metrics_catalog() -> tuple[bytes, str]:
+    # The catalog is static: render it and its ETag once per process.
+    body = render_model_json(build_monitoring_metrics_catalog())
+    return body, compute_etag(body)
+
+
+@lru_cache(maxsize=1)
+def _render_monitoring_layout() -> tuple[bytes, str]:
+    body = render_model_json(build_monitoring_layout())
+    return body, compute_etag(body)
+
+
+REGISTRY.register_cache("monitoring_metrics_catalog", _render_monitoring_metrics_catalog.cache_info)
+REGISTRY.register_cache("monitoring_layout", _render_monitoring_layout.cache_info)
+
+
 @router.get(
     "/monitoring/metrics",
     response_model=MonitoringMetricsResponse,
 )
-def get_monitoring_metrics() -> MonitoringMetricsResponse:
-    return build_monitoring_metrics_catalog()
+def get_monitoring_metrics(request: Request) -> MonitoringMetricsResponse:
+    body, etag = _render_monitoring_metrics_catalog()
+    return build_conditional_response(request, body, etag)
 
 
 @router.get(
     "/monitoring/layout",
     response_model=MonitoringLayoutResponse,
 )
-def get_monitoring_layout() -> MonitoringLayoutResponse:
-    return build_monitoring_layout()
+def get_monitoring_layout(request: Request) -> MonitoringLayoutResponse:
+    body, etag = _render_monitoring_layout()
+    return build_conditional_response(request, body, etag)
 
 
 @router.get(
@@ -456,19 +572,24 @@ def get_monitoring_layout() -> MonitoringLayoutResponse:
     response_model=MonitoringBootstrapResponse,
 )
 def get_monitoring_bootstrap(
+    request: Request,
     db: Session = Depends(get_db),
 ) -> MonitoringBootstrapResponse:
-    return build_monitoring_bootstrap(db=db)
+    return build_versioned_model_response(
+        request,
+        f"monitoring/bootstrap|{build_monitoring_version_key(db=db)}",
+        lambda: build_monitoring_bootstrap(db=db),
+    )
 
 
 @router.get(
     "/monitoring/timeseries",
     response_model=MonitoringTimeseriesResponse,
 )
-def get_monitoring_timeseries(
+async def get_monitoring_timeseries(
     metrics: list[str] | None = Query(default=None),
     limit: int = Query(default=30, ge=1, le=365),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> MonitoringTimeseriesResponse:
     if not metrics:
         raise HTTPException(
@@ -485,7 +606,7 @@ def get_monitoring_timeseries(
             },
         )
 
-    series = build_monitoring_timeseries(db=db, metrics=metrics, limit=limit)
+    series = await build_monitoring_timeseries_async(db=db, metrics=metrics, limit=limit)
     return MonitoringTimeseriesResponse(items=series)
 
 
@@ -541,8 +662,17 @@ def get_monitoring_status(
     response_model=MonitoringDashboardResponse,
 )
 def get_monitoring_dashboard(
+    request: Request,
     db: Session = Depends(get_db),
 ) -> MonitoringDashboardResponse:
+    return build_versioned_model_response(
+        request,
+        f"monitoring/dashboard|{build_monitoring_version_key(db=db)}",
+        lambda: _build_monitoring_dashboard(db=db),
+    )
+
+
+def _build_monitoring_dashboard(db: Session) -> MonitoringDashboardResponse:
     snapshot = build_monitoring_snapshot(db=db)
     history_items = get_monitoring_history(db=db, limit=30)
     alert_items = evaluate_active_alerts(db=db)
@@ -569,10 +699,10 @@ def get_monitoring_dashboard(
     "/monitoring/alert-rules",
     response_model=AlertRuleListResponse,
 )
-def get_alert_rules(
-    db: Session = Depends(get_db),
+async def get_alert_rules(
+    db: AsyncSession = Depends(get_async_db),
 ) -> AlertRuleListResponse:
-    rules = list_alert_rules(db=db)
+    rules = await list_alert_rules_async(db=db)
     items = [AlertRuleSchema.model_validate(rule) for rule in rules]
     return AlertRuleListResponse(items=items)
 
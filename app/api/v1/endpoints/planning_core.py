@@ -3,10 +3,13 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 
+from app.api.v1.responses import build_model_response
 from app.core.db import get_db
 from app.core.planning.domain import PlanningProposalRequest
 from app.core.planning.service import PlanningService
 from app.schemas.planning_production_order import (
+    ProductionOrderPortfolioRequest,
+    ProductionOrderPortfolioResponse,
     ProductionOrderProposalFromWbRequest,
     ProductionOrderProposalRequest,
     ProductionOrderProposalResponse,
@@ -20,6 +23,7 @@ from app.services.planning_production_order_admin import (
     upsert_production_order_admin_settings,
 )
 from app.services.planning_production_order import (
+    build_production_order_portfolio,
     build_production_order_proposal,
     build_production_order_proposal_from_wb,
 )
@@ -83,7 +87,7 @@ async def create_production_order_proposal(
     request: ProductionOrderProposalRequest,
     db: Session = Depends(get_db),
 ) -> ProductionOrderProposalResponse:
-    return build_production_order_proposal(db=db, request=request)
+    return build_model_response(build_production_order_proposal(db=db, request=request))
 
 
 @router.post(
@@ -94,7 +98,18 @@ async def create_production_order_proposal_from_wb(
     request: ProductionOrderProposalFromWbRequest,
     db: Session = Depends(get_db),
 ) -> ProductionOrderProposalResponse:
-    return build_production_order_proposal_from_wb(db=db, request=request)
+    return build_model_response(build_production_order_proposal_from_wb(db=db, request=request))
+
+
+@router.post(
+    "/core/production-order/portfolio",
+    response_model=ProductionOrderPortfolioResponse,
+)
+async def create_production_order_portfolio(
+    request: ProductionOrderPortfolioRequest,
+    db: Session = Depends(get_db),
+) -> ProductionOrderPortfolioResponse:
+    return build_model_response(build_production_order_portfolio(db=db, request=request))
 
 
 @router.get(
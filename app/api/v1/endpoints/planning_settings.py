@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from app.api.v1.pagination import MAX_PAGE_SIZE, ListResponseFormat, list_keyset_page
 from app.core.db import get_db
 from app.models.models import PlanningSettings
 from app.schemas.planning_settings import (
@@ -42,9 +43,26 @@ def _build_planning_settings_article_already_exists_detail(*, article_id: int) -
 
 
 @router.get("/", response_model=list[PlanningSettingsRead])
-def list_planning_settings(db: Session = Depends(get_db)):
-    items = db.query(PlanningSettings).all()
-    return items
+def list_planning_settings(
+    response: Response,
+    after_id: int | None = Query(
+        default=None,
+        ge=0,
+        description="Keyset cursor: return rows with id greater than this value.",
+    ),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    response_format: ListResponseFormat = Query(default="json", alias="format"),
+    db: Session = Depends(get_db),
+):
+    return list_keyset_page(
+        db,
+        PlanningSettings,
+        PlanningSettingsRead,
+        after_id=after_id,
+        limit=limit,
+        response_format=response_format,
+        response=response,
+    )
 
 
 @router.get("/{id}", response_model=PlanningSettingsRead)
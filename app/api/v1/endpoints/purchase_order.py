@@ -3,9 +3,11 @@ from __future__ import annotations
 from datetime import date, datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
-from app.core.db import get_db
+from app.core.db import get_async_db, get_db
 from app.models.models import PurchaseOrder, PurchaseOrderItem
 from app.schemas.purchase_order import (
     PurchaseOrderFromProposalRequest,
@@ -35,22 +37,29 @@ def create_from_proposal(
 
 
 @router.get("/", response_model=list[PurchaseOrderRead])
-def list_purchase_orders(
+async def list_purchase_orders(
     status_filter: str | None = Query(None, alias="status"),
     limit: int = 50,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[PurchaseOrder]:
-    query = db.query(PurchaseOrder)
+    # PurchaseOrderRead serializes items: batch-load them in one extra SELECT for the whole page
+    # (async sessions cannot lazy-load, and per-order lazy loads would be N+1 anyway).
+    statement = select(PurchaseOrder).options(selectinload(PurchaseOrder.items))
     if status_filter is not None:
-        query = query.filter(PurchaseOrder.status == status_filter)
-    orders = query.offset(offset).limit(limit).all()
-    return orders
+        statement = statement.where(PurchaseOrder.status == status_filter)
+    result = await db.execute(statement.offset(offset).limit(limit))
+    return list(result.scalars().all())
 
 
 @router.get("/{order_id}", response_model=PurchaseOrderRead)
 def get_purchase_order(order_id: int, db: Session = Depends(get_db)) -> PurchaseOrder:
-    po = db.query(PurchaseOrder).filter(PurchaseOrder.id == order_id).first()
+    po = (
+        db.query(PurchaseOrder)
+        .options(selectinload(PurchaseOrder.items))
+        .filter(PurchaseOrder.id == order_id)
+        .first()
+    )
     if po is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from app.api.v1.pagination import MAX_PAGE_SIZE, ListResponseFormat, list_keyset_page
 from app.core.db import get_db
 from app.models.models import SkuUnit
 from app.schemas.sku_unit import SkuUnitCreate, SkuUnitRead, SkuUnitUpdate
@@ -65,9 +66,26 @@ def _ensure_unique_combination(db: Session, article_id: int, color_id: int, size
 
 
 @router.get("/", response_model=list[SkuUnitRead])
-def list_sku_units(db: Session = Depends(get_db)):
-    items = db.query(SkuUnit).all()
-    return items
+def list_sku_units(
+    response: Response,
+    after_id: int | None = Query(
+        default=None,
+        ge=0,
+        description="Keyset cursor: return rows with id greater than this value.",
+    ),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    response_format: ListResponseFormat = Query(default="json", alias="format"),
+    db: Session = Depends(get_db),
+):
+    return list_keyset_page(
+        db,
+        SkuUnit,
+        SkuUnitRead,
+        after_id=after_id,
+        limit=limit,
+        response_format=response_format,
+        response=response,
+    )
 
 
 @router.get("/{id}", response_model=SkuUnitRead)
@@ -6,9 +6,10 @@ from typing import List
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
+from app.api.v1.export import ExportFormat, build_csv_export_response, build_ndjson_export_response
 from app.core.db import get_db
-from app.schemas import WbManagerOnlineResponse
-from app.services.wb_manager import compute_manager_stats
+from app.schemas import WbManagerOnlineResponse, WbManagerSkuStats
+from app.services.wb_manager import compute_manager_stats, iter_manager_stats
 
 
 router = APIRouter()
@@ -30,8 +31,24 @@ def wb_manager_online(
         default=None,
         description="Optional list of article IDs to filter by",
     ),
+    response_format: ExportFormat = Query(
+        default="json",
+        alias="format",
+        description="json (default), or ndjson/csv to stream per-SKU rows without the wrapper",
+    ),
     db: Session = Depends(get_db),
 ) -> WbManagerOnlineResponse:
+    if response_format == "ndjson":
+        return build_ndjson_export_response(
+            iter_manager_stats(db=db, target_date=target_date, article_ids=article_ids)
+        )
+    if response_format == "csv":
+        return build_csv_export_response(
+            iter_manager_stats(db=db, target_date=target_date, article_ids=article_ids),
+            row_model=WbManagerSkuStats,
+            filename=f"wb-manager-online-{target_date.isoformat()}.csv",
+        )
+
     stats = compute_manager_stats(
         db=db,
         target_date=target_date,
@@ -4,10 +4,11 @@ from datetime import date, datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
-from sqlalchemy import func, case
-from sqlalchemy.orm import Session
+from sqlalchemy import func, case, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
-from app.core.db import get_db
+from app.core.db import get_async_db, get_db
 from app.models.models import WbShipment, WbShipmentItem
 from app.schemas.wb_shipment import (
     WbShipmentCreate,
@@ -217,7 +218,7 @@ class WbShipmentStatusList(BaseModel):
     summary="List WB shipment statuses",
     description="Returns the ordered list of shipment statuses used in WB Manager UI filters.",
 )
-def get_shipment_status_list() -> WbShipmentStatusList:
+async def get_shipment_status_list() -> WbShipmentStatusList:
     return WbShipmentStatusList(statuses=list(WB_SHIPMENT_STATUS_ORDER))
 
 
@@ -283,7 +284,8 @@ def list_shipments(
     date_to: date | None = None,
     db: Session = Depends(get_db),
 ) -> list[WbShipment]:
-    query = db.query(WbShipment)
+    # WbShipmentRead serializes items; selectin keeps the page at two queries instead of N+1.
+    query = db.query(WbShipment).options(selectinload(WbShipment.items))
     if status is not None:
         query = query.filter(WbShipment.status == status)
     if date_from is not None:
@@ -307,7 +309,7 @@ def list_shipments(
         "with optional filters, sorting and pagination."
     ),
 )
-def list_shipment_headers(
+async def list_shipment_headers(
     shipment_status: str | None = Query(None, alias="status"),
     article_id: int | None = None,
     date_from: date | None = None,
@@ -316,7 +318,7 @@ def list_shipment_headers(
     sort_dir: str = "desc",
     limit: int = 50,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[WbShipmentHeaderRead]:
     sortable_fields: dict[str, any] = {
         "id": WbShipment.id,
@@ -354,8 +356,8 @@ def list_shipment_headers(
         func.sum(case((WbShipmentItem.oos_risk_before == "yellow", 1), else_=0)), 0
     )
 
-    query = (
-        db.query(
+    statement = (
+        select(
             WbShipment.id,
             WbShipment.status,
             WbShipment.target_date,
@@ -372,15 +374,15 @@ def list_shipment_headers(
     )
 
     if shipment_status is not None:
-        query = query.filter(WbShipment.status == shipment_status)
+        statement = statement.where(WbShipment.status == shipment_status)
     if date_from is not None:
-        query = query.filter(WbShipment.target_date >= date_from)
+        statement = statement.where(WbShipment.target_date >= date_from)
     if date_to is not None:
-        query = query.filter(WbShipment.target_date <= date_to)
+        statement = statement.where(WbShipment.target_date <= date_to)
     if article_id is not None:
-        query = query.filter(WbShipmentItem.article_id == article_id)
+        statement = statement.where(WbShipmentItem.article_id == article_id)
 
-    query = query.group_by(
+    statement = statement.group_by(
         WbShipment.id,
         WbShipment.status,
         WbShipment.target_date,
@@ -389,9 +391,9 @@ def list_shipment_headers(
         WbShipment.created_at,
         WbShipment.updated_at,
     )
-    query = query.order_by(order_expr).offset(offset).limit(limit)
+    statement = statement.order_by(order_expr).offset(offset).limit(limit)
 
-    rows = query.all()
+    rows = (await db.execute(statement)).all()
     result: list[WbShipmentHeaderRead] = []
     for row in rows:
         result.append(
@@ -506,7 +508,12 @@ def get_shipment(
     shipment_id: int,
     db: Session = Depends(get_db),
 ) -> WbShipment:
-    shipment = db.query(WbShipment).filter(WbShipment.id == shipment_id).first()
+    shipment = (
+        db.query(WbShipment)
+        .options(selectinload(WbShipment.items))
+        .filter(WbShipment.id == shipment_id)
+        .first()
+    )
     if shipment is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
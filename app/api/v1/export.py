@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import csv
+import io
+import itertools
+import json
+from collections.abc import Iterable, Iterator
+from typing import Literal
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.api.v1.pagination import NDJSON_MEDIA_TYPE
+
+
+ExportFormat = Literal["json", "ndjson", "csv"]
+
+CSV_MEDIA_TYPE = "text/csv"
+
+
+def iter_ndjson(rows: Iterable[BaseModel]) -> Iterator[bytes]:
+    for row in rows:
+        yield row.model_dump_json().encode("utf-8") + b"\n"
+
+
+def _csv_cell(value: object) -> object:
+    # Nested payloads (lists of reasons/warehouses) are kept as compact JSON in a single cell.
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    if value is None:
+        return ""
+    return value
+
+
+def iter_csv(rows: Iterable[BaseModel], row_model: type[BaseModel]) -> Iterator[bytes]:
+    columns = list(row_model.model_fields)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    writer.writerow(columns)
+    for row in rows:
+        payload = row.model_dump(mode="json")
+        writer.writerow([_csv_cell(payload.get(column)) for column in columns])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    # Header-only export for empty portfolios.
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _prime_rows(rows: Iterable[BaseModel]) -> Iterator[BaseModel]:
+    # Pull the first row before the response starts, so target resolution and the first batch run
+    # while an HTTPException can still become a structured error response instead of a broken stream.
+    iterator = iter(rows)
+    for first in iterator:
+        return itertools.chain((first,), iterator)
+    return iter(())
+
+
+def build_ndjson_export_response(rows: Iterable[BaseModel]) -> StreamingResponse:
+    return StreamingResponse(iter_ndjson(_prime_rows(rows)), media_type=NDJSON_MEDIA_TYPE)
+
+
+def build_csv_export_response(
+    rows: Iterable[BaseModel],
+    *,
+    row_model: type[BaseModel],
+    filename: str,
+) -> StreamingResponse:
+    return StreamingResponse(
+        iter_csv(_prime_rows(rows), row_model),
+        media_type=CSV_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Literal
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+
+ListResponseFormat = Literal["json", "ndjson"]
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NEXT_CURSOR_HEADER = "X-Next-After-Id"
+MAX_PAGE_SIZE = 1000
+STREAM_YIELD_PER = 500
+
+
+def build_keyset_statement(model, *, after_id: int | None, limit: int | None) -> Select:
+    """Select rows of ``model`` ordered by primary key, starting strictly after ``after_id``."""
+
+    statement = select(model).order_by(model.id)
+    if after_id is not None:
+        statement = statement.where(model.id > after_id)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def iter_ndjson_rows(
+    db: Session,
+    statement: Select,
+    read_schema: type[BaseModel],
+    *,
+    yield_per: int = STREAM_YIELD_PER,
+) -> Iterator[bytes]:
+    # yield_per enables server-side cursors (stream_results) on PostgreSQL, so only one
+    # chunk of ORM rows is held in memory while the response is being written.
+    result = db.execute(statement.execution_options(yield_per=yield_per))
+    for row in result.scalars():
+        yield read_schema.model_validate(row).model_dump_json().encode("utf-8") + b"\n"
+
+
+def list_keyset_page(
+    db: Session,
+    model,
+    read_schema: type[BaseModel],
+    *,
+    after_id: int | None,
+    limit: int | None,
+    response_format: ListResponseFormat,
+    response: Response,
+):
+    """Serve a keyset-paginated CRUD list as a JSON array or a streamed NDJSON body.
+
+    Without ``after_id``/``limit`` the full table is returned (legacy behavior), ordered by id.
+    In JSON mode a full page sets ``X-Next-After-Id`` to the last returned id.
+    """
+
+    statement = build_keyset_statement(model, after_id=after_id, limit=limit)
+
+    if response_format == "ndjson":
+        return StreamingResponse(
+            iter_ndjson_rows(db, statement, read_schema),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
+    rows = db.scalars(statement).all()
+    if limit is not None and len(rows) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(rows[-1].id)
+    return rows
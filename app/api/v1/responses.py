@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def build_model_response(model: BaseModel, *, status_code: int = 200) -> OrjsonResponse:
+    """Serialize an already validated response model exactly once.
+
+    Returning a ``Response`` makes FastAPI skip its ``response_model`` pass (re-validation of the
+    returned model plus a second serialization), so ``response_model`` on the route only drives
+    the OpenAPI schema. Use it for large planning payloads built by services from typed models.
+    """
+
+    return OrjsonResponse(model.model_dump(mode="json"), status_code=status_code)
+
+
+def render_model_json(model: BaseModel) -> bytes:
+    return orjson.dumps(model.model_dump(mode="json"), option=orjson.OPT_NON_STR_KEYS)
+
+
+def compute_etag(body: bytes) -> str:
+    """Weak ETag for a rendered JSON body.
+
+    The tag is weak because the bytes on the wire can differ under one tag: GZipMiddleware
+    compresses the body after the tag is set, and version-keyed tags ignore volatile fields.
+    """
+
+    return f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _if_none_match_hits(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2): opaque tags match with or without W/.
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def _conditional_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=_conditional_headers(etag))
+
+
+def build_conditional_response(request: Request, body: bytes, etag: str | None = None) -> Response:
+    """Answer a polled GET with ``304 Not Modified`` when the client already has ``body``.
+
+    ``Cache-Control: no-cache`` lets clients keep the body but forces revalidation on every poll.
+    """
+
+    etag = etag or compute_etag(body)
+    if _if_none_match_hits(request, etag):
+        return _not_modified(etag)
+    return Response(content=body, media_type="application/json", headers=_conditional_headers(etag))
+
+
+def build_conditional_model_response(request: Request, model: BaseModel) -> Response:
+    return build_conditional_response(request, render_model_json(model))
+
+
+def build_versioned_model_response(
+    request: Request,
+    version_key: str,
+    build_model: Callable[[], BaseModel],
+) -> Response:
+    """Conditional response whose ETag comes from a cheap version key, not from the body.
+
+    ``build_model`` runs only when the client's copy is stale, and its body is rendered once.
+    Live payloads stamp compute times such as ``updated_at``; a 304 means "nothing the key
+    tracks has changed since your copy" and the client keeps its earlier timestamps.
+    """
+
+    etag = compute_etag(version_key.encode("utf-8"))
+    if _if_none_match_hits(request, etag):
+        return _not_modified(etag)
+    return build_conditional_response(request, render_model_json(build_model()), etag)
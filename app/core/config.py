@@ -4,3 +4,51 @@ DB_URL = os.getenv(
     "DATABASE_URL",
     "postgresql+psycopg2://maconly:maconly@db:5432/maconly_db",
 )
+
+
+def _derive_async_db_url(sync_url: str) -> str:
+    """Map a sync SQLAlchemy URL onto the matching async driver.
+
+    PostgreSQL runs on asyncpg, SQLite on aiosqlite; other URLs are returned unchanged.
+    """
+    scheme, separator, rest = sync_url.partition("://")
+    if not separator:
+        return sync_url
+    dialect = scheme.split("+", 1)[0]
+    if dialect in {"postgresql", "postgres"}:
+        return f"postgresql+asyncpg://{rest}"
+    if dialect == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    return sync_url
+
+
+ASYNC_DB_URL = os.getenv("ASYNC_DATABASE_URL") or _derive_async_db_url(DB_URL)
+ASYNC_DB_POOL_SIZE = int(os.getenv("ASYNC_DB_POOL_SIZE", "20"))
+ASYNC_DB_MAX_OVERFLOW = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "20"))
+
+# Responses smaller than this (bytes) are sent uncompressed even when the client accepts gzip.
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1024"))
+
+# Per-request SQL statement tracking (Server-Timing / X-DB-Queries headers and request log lines).
+QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "true").lower() in {"1", "true", "yes"}
+# Requests slower than this (ms) are logged at WARNING with their full statement list.
+DB_SLOW_REQUEST_MS = float(os.getenv("DB_SLOW_REQUEST_MS", "500"))
+QUERY_STATS_TOP_STATEMENTS = int(os.getenv("QUERY_STATS_TOP_STATEMENTS", "5"))
+
+# On-demand request profiling: requests sending `X-Profile: 1` (or `?profile=1`) together with
+# `X-Admin-Token: <PROFILING_ADMIN_TOKEN>` are sampled and saved under PROFILING_OUTPUT_DIR.
+# Profiling is disabled while the token is empty.
+PROFILING_ADMIN_TOKEN = os.getenv("PROFILING_ADMIN_TOKEN", "")
+PROFILING_OUTPUT_DIR = os.getenv("PROFILING_OUTPUT_DIR", "profiles")
+PROFILING_SAMPLE_INTERVAL_MS = float(os.getenv("PROFILING_SAMPLE_INTERVAL_MS", "5"))
+
+# Runtime self-validation of planning contract summaries (layer1..layer5, capital constraint, resource
+# allocation): "full" re-checks every proposal, "sampled" checks 1 in CONTRACT_VALIDATION_SAMPLE_EVERY_N
+# proposals, "off" skips the checks. Skipped contracts still report their version with status "skipped".
+CONTRACT_VALIDATION_LEVEL = os.getenv("CONTRACT_VALIDATION_LEVEL", "full").strip().lower()
+CONTRACT_VALIDATION_SAMPLE_EVERY_N = int(os.getenv("CONTRACT_VALIDATION_SAMPLE_EVERY_N", "100"))
+
+# Process-local pantone -> sibling articles index used by the production-order shared color pool.
+# ORM writes to colors, SKUs, articles, planning settings, WB mappings or WB sales invalidate it at
+# once; the TTL (seconds) bounds staleness from writes made by other processes. 0 disables caching.
+SHARED_COLOR_POOL_INDEX_TTL_SECONDS = float(os.getenv("SHARED_COLOR_POOL_INDEX_TTL_SECONDS", "60"))
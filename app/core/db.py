@@ -1,15 +1,62 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.core.config import DB_URL
+from app.core.config import ASYNC_DB_MAX_OVERFLOW, ASYNC_DB_POOL_SIZE, ASYNC_DB_URL, DB_URL
+from app.core.metrics import REGISTRY
 
 engine = create_engine(DB_URL, echo=False, future=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _async_engine_kwargs(url: str) -> dict[str, object]:
+    # SQLite pools (NullPool/StaticPool) do not accept queue sizing arguments.
+    if url.startswith("sqlite"):
+        return {}
+    return {"pool_size": ASYNC_DB_POOL_SIZE, "max_overflow": ASYNC_DB_MAX_OVERFLOW}
+
+
+# Async stack for high-concurrency read endpoints; runs alongside the sync engine above.
+async_engine = create_async_engine(ASYNC_DB_URL, echo=False, **_async_engine_kwargs(ASYNC_DB_URL))
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+def _collect_pool_stats() -> dict[tuple[str, ...], float]:
+    samples: dict[tuple[str, ...], float] = {}
+    for engine_name, pool in (("sync", engine.pool), ("async", async_engine.sync_engine.pool)):
+        # Only queue-based pools track size/overflow; SQLite test pools expose none of these.
+        for state, method_name in (
+            ("size", "size"),
+            ("checked_in", "checkedin"),
+            ("checked_out", "checkedout"),
+            ("overflow", "overflow"),
+        ):
+            method = getattr(pool, method_name, None)
+            if callable(method):
+                samples[(engine_name, state)] = float(method())
+    return samples
+
+
+REGISTRY.callback(
+    "db_pool_connections",
+    "SQLAlchemy connection pool state per engine.",
+    labelnames=("engine", "state"),
+    collect=_collect_pool_stats,
+)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Literal
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+@dataclass
+class HistogramSample:
+    # Non-cumulative per-bucket counts; the last slot is the +Inf overflow bucket.
+    bucket_counts: list[int]
+    count: int = 0
+    sum: float = 0.0
+
+
+@dataclass
+class Histogram:
+    """In-process histogram with fixed upper bounds and optional labels (Prometheus semantics)."""
+
+    name: str
+    documentation: str
+    labelnames: tuple[str, ...] = ()
+    buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    _samples: dict[tuple[str, ...], HistogramSample] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            sample = self._samples.get(key)
+            if sample is None:
+                sample = HistogramSample(bucket_counts=[0] * (len(self.buckets) + 1))
+                self._samples[key] = sample
+            sample.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+            sample.count += 1
+            sample.sum += value
+
+    def samples(self) -> dict[tuple[str, ...], HistogramSample]:
+        with self._lock:
+            return {
+                key: HistogramSample(
+                    bucket_counts=list(sample.bucket_counts),
+                    count=sample.count,
+                    sum=sample.sum,
+                )
+                for key, sample in self._samples.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+@dataclass
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    name: str
+    documentation: str
+    labelnames: tuple[str, ...] = ()
+    _values: dict[tuple[str, ...], float] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> dict[tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+@dataclass
+class CallbackMetric:
+    """Gauge/counter whose labelled values are read from ``collect`` at scrape time (pools, caches)."""
+
+    name: str
+    documentation: str
+    labelnames: tuple[str, ...]
+    collect: Callable[[], dict[tuple[str, ...], float]]
+    metric_type: Literal["gauge", "counter"] = "gauge"
+
+    def samples(self) -> dict[tuple[str, ...], float]:
+        return self.collect()
+
+
+Metric = Histogram | Counter | CallbackMetric
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._caches: dict[str, Callable[[], object]] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, factory: Callable[[], Metric]) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = factory()
+                self._metrics[name] = metric
+            return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram registered under ``name``, creating it on first use."""
+
+        return self._get_or_create(
+            name,
+            lambda: Histogram(name=name, documentation=documentation, labelnames=labelnames, buckets=buckets),
+        )
+
+    def counter(self, name: str, documentation: str, *, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(
+            name,
+            lambda: Counter(name=name, documentation=documentation, labelnames=labelnames),
+        )
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        labelnames: tuple[str, ...],
+        collect: Callable[[], dict[tuple[str, ...], float]],
+        metric_type: Literal["gauge", "counter"] = "gauge",
+    ) -> CallbackMetric:
+        return self._get_or_create(
+            name,
+            lambda: CallbackMetric(
+                name=name,
+                documentation=documentation,
+                labelnames=labelnames,
+                collect=collect,
+                metric_type=metric_type,
+            ),
+        )
+
+    def register_cache(self, name: str, cache_info: Callable[[], object]) -> None:
+        """Export hits/misses of a ``functools`` cache; ``cache_info`` returns a ``CacheInfo``."""
+
+        with self._lock:
+            self._caches[name] = cache_info
+
+    def cache_stats(self) -> dict[str, tuple[int, int]]:
+        with self._lock:
+            caches = dict(self._caches)
+        stats: dict[str, tuple[int, int]] = {}
+        for name, cache_info in caches.items():
+            info = cache_info()
+            stats[name] = (int(info.hits), int(info.misses))
+        return stats
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(name)
+
+    def metrics(self) -> list[Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+
+REGISTRY = MetricsRegistry()
+
+
+def _collect_cache_requests() -> dict[tuple[str, ...], float]:
+    samples: dict[tuple[str, ...], float] = {}
+    for name, (hits, misses) in REGISTRY.cache_stats().items():
+        samples[(name, "hit")] = float(hits)
+        samples[(name, "miss")] = float(misses)
+    return samples
+
+
+def _collect_cache_hit_ratio() -> dict[tuple[str, ...], float]:
+    return {
+        (name,): (hits / (hits + misses) if hits + misses else 0.0)
+        for name, (hits, misses) in REGISTRY.cache_stats().items()
+    }
+
+
+REGISTRY.callback(
+    "cache_requests_total",
+    "Lookups of in-process caches by result.",
+    labelnames=("cache", "result"),
+    collect=_collect_cache_requests,
+    metric_type="counter",
+)
+REGISTRY.callback(
+    "cache_hit_ratio",
+    "Hit ratio of in-process caches since process start.",
+    labelnames=("cache",),
+    collect=_collect_cache_hit_ratio,
+)
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: tuple[str, ...], key: tuple[str, ...], extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = [*zip(labelnames, key), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def render_prometheus_text(registry: MetricsRegistry = REGISTRY) -> str:
+    """Render every registered metric in the Prometheus text exposition format (0.0.4)."""
+
+    lines: list[str] = []
+    for metric in sorted(registry.metrics(), key=lambda item: item.name):
+        if isinstance(metric, Histogram):
+            metric_type = "histogram"
+        elif isinstance(metric, Counter):
+            metric_type = "counter"
+        else:
+            metric_type = metric.metric_type
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric_type}")
+
+        if isinstance(metric, Histogram):
+            for key, sample in sorted(metric.samples().items()):
+                cumulative = 0
+                for upper_bound, bucket_count in zip((*metric.buckets, float("inf")), sample.bucket_counts):
+                    cumulative += bucket_count
+                    le = (("le", _format_value(upper_bound)),)
+                    lines.append(f"{metric.name}_bucket{_format_labels(metric.labelnames, key, le)} {cumulative}")
+                labels = _format_labels(metric.labelnames, key)
+                lines.append(f"{metric.name}_sum{labels} {_format_value(sample.sum)}")
+                lines.append(f"{metric.name}_count{labels} {sample.count}")
+            continue
+
+        for key, value in sorted(metric.samples().items()):
+            lines.append(f"{metric.name}{_format_labels(metric.labelnames, key)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
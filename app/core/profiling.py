@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import hmac
+import json
+import logging
+import marshal
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import PROFILING_ADMIN_TOKEN, PROFILING_OUTPUT_DIR, PROFILING_SAMPLE_INTERVAL_MS
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_PARAM = "profile"
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+REQUEST_ID_HEADER = "X-Request-ID"
+
+SPEEDSCOPE_SUFFIX = ".speedscope.json"
+PSTATS_SUFFIX = ".prof"
+
+_OPT_IN_VALUES = {"1", "true", "yes"}
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+# A thread whose innermost frame is in one of these modules is parked (idle worker, event loop
+# waiting on its selector) rather than doing work for the request.
+_IDLE_LEAF_FILES = ("threading.py", "queue.py", "selectors.py")
+
+FrameKey = tuple[str, int, str]  # (filename, first line, function name), as used by pstats
+
+
+class StackSampler:
+    """Periodically sample the Python stacks of every thread in the process.
+
+    Sync endpoints run in a threadpool worker, so a deterministic profiler started by the
+    middleware would only see the event loop. Sampling all busy threads covers both; requests
+    running concurrently in the same process show up in the profile too.
+    """
+
+    def __init__(self, interval_ms: float) -> None:
+        self.interval_s = max(interval_ms, 0.1) / 1000.0
+        # thread id -> [(stack from outermost to innermost frame, seconds the sample stands for)]
+        self.samples: dict[int, list[tuple[tuple[FrameKey, ...], float]]] = defaultdict(list)
+        self.started_at = 0.0
+        self.duration_s = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self.started_at = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.duration_s = time.perf_counter() - self.started_at
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        last_tick = time.perf_counter()
+        while not self._stop.wait(self.interval_s):
+            # The sampler competes for the GIL, so ticks can be much further apart than the
+            # interval; weighting by the real gap keeps the reported times honest.
+            now = time.perf_counter()
+            weight_s = now - last_tick
+            last_tick = now
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_ident or frame.f_code.co_filename.endswith(_IDLE_LEAF_FILES):
+                    continue
+                stack: list[FrameKey] = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                stack.reverse()
+                self.samples[thread_id].append((tuple(stack), weight_s))
+
+
+def build_speedscope_profile(sampler: StackSampler, *, name: str) -> dict[str, object]:
+    """Render samples in the speedscope "sampled" file format, one profile per thread."""
+
+    frame_index: dict[FrameKey, int] = {}
+    frames: list[dict[str, object]] = []
+    profiles: list[dict[str, object]] = []
+
+    for thread_id, stacks in sorted(sampler.samples.items()):
+        encoded: list[list[int]] = []
+        weights: list[float] = []
+        for stack, weight_s in stacks:
+            weights.append(round(weight_s * 1000.0, 3))
+            row: list[int] = []
+            for key in stack:
+                if key not in frame_index:
+                    frame_index[key] = len(frames)
+                    frames.append({"name": key[2], "file": key[0], "line": key[1]})
+                row.append(frame_index[key])
+            encoded.append(row)
+        profiles.append(
+            {
+                "type": "sampled",
+                "name": f"{name} [thread {thread_id}]",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": round(sum(weights), 3),
+                "samples": encoded,
+                "weights": weights,
+            }
+        )
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "maconly-supply-brain",
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": profiles,
+    }
+
+
+def build_pstats_data(sampler: StackSampler) -> dict[FrameKey, tuple]:
+    """Convert samples into the marshalled dict that `pstats.Stats` loads.
+
+    Call counts are sample counts and times are sampled wall time, so the numbers are
+    estimates; `tottime`/`cumtime` rankings are what matter.
+    """
+
+    counts: Counter[FrameKey] = Counter()
+    self_time: defaultdict[FrameKey, float] = defaultdict(float)
+    total_time: defaultdict[FrameKey, float] = defaultdict(float)
+    edge_counts: Counter[tuple[FrameKey, FrameKey]] = Counter()
+    edge_self_time: defaultdict[tuple[FrameKey, FrameKey], float] = defaultdict(float)
+    edge_total_time: defaultdict[tuple[FrameKey, FrameKey], float] = defaultdict(float)
+
+    for stacks in sampler.samples.values():
+        for stack, weight_s in stacks:
+            if not stack:
+                continue
+            self_time[stack[-1]] += weight_s
+            for key in set(stack):
+                counts[key] += 1
+                total_time[key] += weight_s
+            for edge in set(zip(stack, stack[1:])):
+                edge_counts[edge] += 1
+                edge_total_time[edge] += weight_s
+            if len(stack) > 1:
+                edge_self_time[(stack[-2], stack[-1])] += weight_s
+
+    callers: dict[FrameKey, dict[FrameKey, tuple]] = defaultdict(dict)
+    for (caller, callee), count in edge_counts.items():
+        edge = (caller, callee)
+        callers[callee][caller] = (count, count, edge_self_time[edge], edge_total_time[edge])
+
+    return {
+        key: (count, count, self_time[key], total_time[key], callers.get(key, {}))
+        for key, count in counts.items()
+    }
+
+
+def write_profile(
+    sampler: StackSampler,
+    *,
+    output_dir: Path,
+    request_id: str,
+    name: str,
+) -> list[Path]:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    speedscope_path = output_dir / f"{request_id}{SPEEDSCOPE_SUFFIX}"
+    speedscope_path.write_text(json.dumps(build_speedscope_profile(sampler, name=name)), encoding="utf-8")
+    pstats_path = output_dir / f"{request_id}{PSTATS_SUFFIX}"
+    with pstats_path.open("wb") as handle:
+        marshal.dump(build_pstats_data(sampler), handle)
+    return [speedscope_path, pstats_path]
+
+
+def _build_profiling_forbidden_detail() -> dict[str, object]:
+    return {
+        "code": "profiling_forbidden",
+        "message": "Request profiling requires a valid admin token",
+        "field": ADMIN_TOKEN_HEADER,
+        "field_metadata": {
+            "description": "Admin token matching PROFILING_ADMIN_TOKEN",
+            "type": "header",
+        },
+        "next_steps": ["send_valid_admin_token", "retry_without_profile_flag"],
+    }
+
+
+def _profiling_requested(scope: Scope, headers: Headers) -> bool:
+    if headers.get(PROFILE_HEADER, "").lower() in _OPT_IN_VALUES:
+        return True
+    query_string = scope.get("query_string", b"")
+    if PROFILE_QUERY_PARAM.encode() not in query_string:
+        return False
+    values = parse_qs(query_string.decode("latin-1")).get(PROFILE_QUERY_PARAM, [])
+    return any(value.lower() in _OPT_IN_VALUES for value in values)
+
+
+def _resolve_request_id(headers: Headers) -> str:
+    candidate = headers.get(REQUEST_ID_HEADER, "")
+    if _REQUEST_ID_PATTERN.match(candidate):
+        return candidate
+    return uuid.uuid4().hex
+
+
+class ProfilingMiddleware:
+    """Admin-gated, opt-in sampling profiler around a single request.
+
+    Requests opt in with ``X-Profile: 1`` or ``?profile=1`` and must carry ``X-Admin-Token``
+    matching ``PROFILING_ADMIN_TOKEN``; otherwise they get ``403``. The profile is written to
+    ``<output_dir>/<request id>.speedscope.json`` and ``<request id>.prof`` (pstats) after the
+    response finishes, and the request id is echoed in ``X-Request-ID``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        admin_token: str = PROFILING_ADMIN_TOKEN,
+        output_dir: str | Path = PROFILING_OUTPUT_DIR,
+        interval_ms: float = PROFILING_SAMPLE_INTERVAL_MS,
+    ) -> None:
+        self.app = app
+        self.admin_token = admin_token
+        self.output_dir = Path(output_dir)
+        self.interval_ms = interval_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if not _profiling_requested(scope, headers):
+            await self.app(scope, receive, send)
+            return
+
+        # Header values are decoded as latin-1 and compare_digest rejects non-ASCII str, so the
+        # comparison runs on bytes: the raw header bytes against the UTF-8 configured token.
+        supplied_token = headers.get(ADMIN_TOKEN_HEADER, "").encode("latin-1")
+        if not self.admin_token or not hmac.compare_digest(supplied_token, self.admin_token.encode()):
+            response = JSONResponse({"detail": _build_profiling_forbidden_detail()}, status_code=403)
+            await response(scope, receive, send)
+            return
+
+        request_id = _resolve_request_id(headers)
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        sampler = StackSampler(self.interval_ms)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            sampler.stop()
+            name = f"{scope.get('method')} {scope.get('path')}"
+            paths = await run_in_threadpool(
+                write_profile,
+                sampler,
+                output_dir=self.output_dir,
+                request_id=request_id,
+                name=name,
+            )
+            logger.info(
+                "request_profile_saved %s",
+                json.dumps(
+                    {
+                        "request_id": request_id,
+                        "request": name,
+                        "duration_ms": round(sampler.duration_s * 1000.0, 2),
+                        "samples": sum(len(stacks) for stacks in sampler.samples.values()),
+                        "files": [str(path) for path in paths],
+                    }
+                ),
+            )
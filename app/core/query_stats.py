@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import DB_SLOW_REQUEST_MS, QUERY_STATS_ENABLED, QUERY_STATS_TOP_STATEMENTS
+
+logger = logging.getLogger(__name__)
+
+DB_QUERIES_HEADER = "X-DB-Queries"
+SERVER_TIMING_HEADER = "Server-Timing"
+
+_START_TIMES_KEY = "query_stats_start_times"
+
+
+@dataclass
+class StatementTiming:
+    statement: str
+    duration_ms: float
+
+
+@dataclass
+class QueryStats:
+    """Statements executed while a request (or any other tracked scope) is active."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    statements: list[StatementTiming] = field(default_factory=list)
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.statements.append(StatementTiming(statement=statement, duration_ms=duration_ms))
+
+    def slowest(self, limit: int) -> list[StatementTiming]:
+        return sorted(self.statements, key=lambda item: item.duration_ms, reverse=True)[:limit]
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current_stats.get()
+
+
+def start_query_stats() -> tuple[QueryStats, object]:
+    """Begin tracking statements in the current context; pass the token to ``stop_query_stats``."""
+
+    stats = QueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def stop_query_stats(token) -> None:
+    _current_stats.reset(token)
+
+
+# Listeners live on the Engine class so every engine (sync, async_engine.sync_engine, test
+# engines) is covered. They are no-ops unless a tracking scope is active in the current context.
+# Sync endpoints run in a threadpool that copies the context, so they share the request's stats.
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+    if _current_stats.get() is None:
+        return
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+    stats = _current_stats.get()
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if stats is None or not start_times:
+        return
+    stats.record(statement, (time.perf_counter() - start_times.pop()) * 1000.0)
+
+
+def _server_timing_value(stats: QueryStats) -> str:
+    return f'db;dur={stats.total_ms:.2f};desc="{stats.count} queries"'
+
+
+def _log_request_stats(scope: Scope, status_code: int | None, stats: QueryStats, elapsed_ms: float) -> None:
+    payload = {
+        "method": scope.get("method"),
+        "path": scope.get("path"),
+        "status_code": status_code,
+        "duration_ms": round(elapsed_ms, 2),
+        "db_queries": stats.count,
+        "db_time_ms": round(stats.total_ms, 2),
+    }
+    if elapsed_ms < DB_SLOW_REQUEST_MS:
+        logger.info("request_db_stats %s", json.dumps(payload))
+        return
+
+    payload["slowest_statements"] = [
+        {"duration_ms": round(item.duration_ms, 2), "statement": item.statement}
+        for item in stats.slowest(QUERY_STATS_TOP_STATEMENTS)
+    ]
+    payload["statements"] = [item.statement for item in stats.statements]
+    logger.warning("slow_request_db_stats %s", json.dumps(payload))
+
+
+class QueryStatsMiddleware:
+    """Per-request SQL statement count/time as ``Server-Timing`` and ``X-DB-Queries`` headers.
+
+    Headers reflect statements executed before the response starts; the log line written when the
+    request finishes also covers statements issued while a streaming body was being sent.
+    Requests slower than ``DB_SLOW_REQUEST_MS`` are logged at WARNING with their statement list.
+    """
+
+    def __init__(self, app: ASGIApp, *, enabled: bool = QUERY_STATS_ENABLED) -> None:
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_query_stats()
+        started = time.perf_counter()
+        status_code: int | None = None
+
+        async def send_with_stats(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers[DB_QUERIES_HEADER] = str(stats.count)
+                headers.append(SERVER_TIMING_HEADER, _server_timing_value(stats))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            stop_query_stats(token)
+            _log_request_stats(scope, status_code, stats, (time.perf_counter() - started) * 1000.0)
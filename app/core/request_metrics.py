@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import REGISTRY
+
+UNMATCHED_ROUTE = "unmatched"
+
+REQUEST_DURATION_HISTOGRAM = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template, method and status code.",
+    labelnames=("method", "route", "status"),
+)
+
+
+def _route_label(scope: Scope) -> str:
+    # The router stores the matched route in the scope; using its template keeps label
+    # cardinality bounded (``/articles/{article_id}`` rather than one series per id).
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if not isinstance(template, str):
+        return UNMATCHED_ROUTE
+
+    # Routes of included routers carry their own path only; recover the include prefixes from
+    # the concrete request path so ``/api/v1/...`` routes do not collide across routers.
+    path_format = getattr(route, "path_format", template)
+    try:
+        rendered = path_format.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    path = scope.get("path", "")
+    if rendered and path.endswith(rendered):
+        return path[: len(path) - len(rendered)] + template
+    return template
+
+
+class RequestMetricsMiddleware:
+    """Observe every HTTP request into ``http_request_duration_seconds``.
+
+    The duration covers the whole exchange, including a streamed body. Requests that raise before
+    a response starts are recorded with status 500.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUEST_DURATION_HISTOGRAM.observe(
+                time.perf_counter() - started,
+                method=scope.get("method", ""),
+                route=_route_label(scope),
+                status=status_code,
+            )
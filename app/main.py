@@ -1,9 +1,16 @@
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.v1.router import api_router
+from app.core.config import GZIP_MINIMUM_SIZE
+from app.core.db import async_engine
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus_text
+from app.core.profiling import ProfilingMiddleware
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.request_metrics import RequestMetricsMiddleware
 from app.services.monitoring_scheduler import MonitoringScheduler
 
 
@@ -18,12 +25,22 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         scheduler = getattr(app.state, "monitoring_scheduler", None)
         if scheduler is not None:
             scheduler.shutdown()
+        await async_engine.dispose()
 
 
 app = FastAPI(title="MACONLY Supply Brain", lifespan=lifespan)
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(RequestMetricsMiddleware)
+app.add_middleware(ProfilingMiddleware)
 app.include_router(api_router, prefix="/api/v1")
 
 
 @app.get("/")
 def root():
     return {"status": "ok", "message": "MACONLY backend running"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    return Response(render_prometheus_text(), media_type=PROMETHEUS_CONTENT_TYPE)
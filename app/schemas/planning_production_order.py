@@ -3,7 +3,8 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, computed_field, field_validator, model_validator
+from pydantic.json_schema import SkipJsonSchema
 
 
 class BundleDemandInput(BaseModel):
@@ -79,7 +80,9 @@ class PlanningOverridesInput(BaseModel):
 class ProductionOrderProposalRequest(BaseModel):
     article_id: int = Field(..., ge=1)
     planning_horizon_days: int = Field(90, ge=1, le=365)
-    explainability_mode: Literal["full", "compact"] = "full"
+    explainability_mode: Literal["full", "compact", "none"] = "full"
+    debug_stage_timings: bool = False
+    layer4_scenario_grid_points: int = Field(0, ge=0, le=1001)
     bundle_daily_sales: list[BundleDemandInput] = Field(default_factory=list)
     bundle_stock: list[BundleStockInput] = Field(default_factory=list)
     in_flight_supply: list[InFlightSupplyInput] = Field(default_factory=list)
@@ -124,7 +127,9 @@ class ProductionOrderProposalRequest(BaseModel):
 class ProductionOrderProposalFromWbRequest(BaseModel):
     article_id: int = Field(..., ge=1)
     planning_horizon_days: int = Field(90, ge=1, le=365)
-    explainability_mode: Literal["full", "compact"] = "full"
+    explainability_mode: Literal["full", "compact", "none"] = "full"
+    debug_stage_timings: bool = False
+    layer4_scenario_grid_points: int = Field(0, ge=0, le=1001)
     observation_window_days: int = Field(30, ge=1, le=365)
     as_of_date: date | None = None
     freshness_mode: Literal["warn", "strict"] = "warn"
@@ -232,9 +237,25 @@ class ProductionOrderAlternative(BaseModel):
 
 class ProductionOrderExplanationBlock(BaseModel):
     summary: str
-    steps: list[str]
+    # Plain strings or structured step records (anything with `render()`); records are formatted
+    # only when `steps` is read or the block is serialized.
+    step_records: SkipJsonSchema[list[Any]] = Field(default_factory=list, exclude=True, repr=False)
     meta: dict[str, Any] = Field(default_factory=dict)
 
+    @model_validator(mode="before")
+    @classmethod
+    def accept_text_steps(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "steps" in data:
+            data = dict(data)
+            steps = data.pop("steps")
+            data.setdefault("step_records", list(steps))
+        return data
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def steps(self) -> list[str]:
+        return [step if isinstance(step, str) else step.render() for step in self.step_records]
+
 
 class ProductionOrderPhysicalScope(BaseModel):
     local_stock_scope: Literal["all_warehouses_merged", "warehouse_filtered"]
@@ -273,3 +294,53 @@ class ProductionOrderProposalResponse(BaseModel):
     arrival_projection: ProductionOrderArrivalProjection | None = None
     alternatives: list[ProductionOrderAlternative]
     explanation: ProductionOrderExplanationBlock
+
+
+class ProductionOrderPortfolioRequest(BaseModel):
+    available_capital: float = Field(..., ge=0)
+    proposals: list[ProductionOrderProposalRequest] = Field(..., min_length=1, max_length=500)
+
+    @field_validator("proposals")
+    @classmethod
+    def validate_proposals(cls, value: list[ProductionOrderProposalRequest]) -> list[ProductionOrderProposalRequest]:
+        seen: set[int] = set()
+        for item in value:
+            if item.article_id in seen:
+                raise ValueError("proposals contains duplicate article_id")
+            seen.add(item.article_id)
+        return value
+
+
+class ProductionOrderPortfolioCutLine(BaseModel):
+    rank: int
+    color_id: int
+    size_id: int
+    requested_qty: int
+    allocated_qty: int
+
+
+class ProductionOrderPortfolioArticleAllocation(BaseModel):
+    article_id: int
+    unit_capital_per_unit: float
+    requested_qty: int
+    allocated_qty: int
+    cut_qty: int
+    required_capital: float
+    allocated_capital: float
+    line_count_before: int
+    line_count_after: int
+    cut_lines: list[ProductionOrderPortfolioCutLine]
+    lines: list[ProductionOrderRecommendationLine]
+
+
+class ProductionOrderPortfolioResponse(BaseModel):
+    status: Literal["within_budget", "budget_limited_applied"]
+    generated_at: datetime
+    constrained: bool
+    available_capital: float
+    required_capital: float
+    allocated_capital: float
+    remaining_capital: float
+    skipped_article_ids: list[int]
+    waiting_article_ids: list[int]
+    articles: list[ProductionOrderPortfolioArticleAllocation]
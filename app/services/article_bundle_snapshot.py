@@ -13,6 +13,7 @@ from app.models.models import (
     ArticleWbMapping,
     BundleRecipe,
     BundleType,
+    Size,
     SkuUnit,
     StockBalance,
     Warehouse,
@@ -46,6 +47,20 @@ def _build_article_not_found_detail(*, article_id: int) -> dict[str, object]:
     }
 
 
+def _build_bundle_type_not_found_detail(*, bundle_type_id: int) -> dict[str, object]:
+    return {
+        "code": "bundle_type_not_found",
+        "message": "BundleType not found",
+        "bundle_type_id": int(bundle_type_id),
+        "field": "bundle_type_id",
+        "field_metadata": {
+            "description": "Requested bundle type identifier",
+            "type": "int",
+        },
+        "next_steps": ["use_existing_bundle_type_id"],
+    }
+
+
 def compute_bundle_capacity_for_article(db: Session, article_id: int) -> Dict[CapacityKey, int]:
     """Compute max number of bundles from NSC single-stock per (bundle_type, size).
 
@@ -195,81 +210,130 @@ def build_article_inventory_snapshot(db: Session, article_id: int) -> ArticleInv
     - Aggregate bundle coverage per bundle type
     """
 
-    article = db.query(Article).filter(Article.id == article_id).first()
-    if article is None:
+    snapshots = build_article_inventory_snapshots(db=db, article_ids=[article_id])
+    snapshot = snapshots.get(article_id)
+    if snapshot is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=_build_article_not_found_detail(article_id=article_id),
         )
+    return snapshot
 
-    # NSK single SKU stock (raw singles by color/size across internal warehouses)
-    sku_units = db.query(SkuUnit).filter(SkuUnit.article_id == article.id).all()
-    nsk_single_sku_stock: list[NskSkuStockSnapshot] = []
-    if sku_units:
-        sku_ids = [s.id for s in sku_units]
-        sku_to_color = {s.id: s.color_id for s in sku_units}
-        sku_to_size = {s.id: s.size_id for s in sku_units}
-
-        balances_with_wh = (
-            db.query(StockBalance, Warehouse)
-            .join(Warehouse, Warehouse.id == StockBalance.warehouse_id)
-            .filter(
-                StockBalance.sku_unit_id.in_(sku_ids),
-                Warehouse.type == "internal",
-            )
-            .all()
-        )
 
-        qty_by_pair: Dict[Tuple[int, int], int] = defaultdict(int)
-        for balance, _wh in balances_with_wh:
-            color_id = sku_to_color.get(balance.sku_unit_id)
-            size_id = sku_to_size.get(balance.sku_unit_id)
-            if color_id is None or size_id is None:
-                continue
-            qty_by_pair[(color_id, size_id)] += balance.quantity
+def build_article_inventory_snapshots(
+    db: Session,
+    article_ids: list[int],
+) -> Dict[int, ArticleInventorySnapshot]:
+    """Assemble inventory snapshots for many articles with a fixed number of queries.
 
-        nsk_single_sku_stock = [
-            NskSkuStockSnapshot(
-                color_id=color_id,
-                size_id=size_id,
-                quantity=qty,
-            )
-            for (color_id, size_id), qty in sorted(qty_by_pair.items())
-        ]
+    Produces the same snapshots as calling `build_article_inventory_snapshot` per
+    article, but every table is read once for the whole batch instead of once per
+    article (and per bundle type). Unknown article IDs are absent from the result.
+    """
 
-    # WB bundle stock (via ArticleWbMapping.bundle_type_id and WbStock)
-    wb_bundle_stock: list[WbBundleStockSnapshot] = []
+    if not article_ids:
+        return {}
 
-    mappings = (
-        db.query(ArticleWbMapping)
+    articles = db.query(Article).filter(Article.id.in_(article_ids)).all()
+    if not articles:
+        return {}
+    found_ids = [a.id for a in articles]
+
+    sku_units = db.query(SkuUnit).filter(SkuUnit.article_id.in_(found_ids)).all()
+    skus_by_article: Dict[int, list[SkuUnit]] = defaultdict(list)
+    sku_by_id: Dict[int, SkuUnit] = {}
+    for sku in sku_units:
+        skus_by_article[sku.article_id].append(sku)
+        sku_by_id[sku.id] = sku
+
+    # Internal balances drive both NSC single stock and the capacity warehouse choice.
+    balance_rows = (
+        db.query(StockBalance.sku_unit_id, StockBalance.warehouse_id, StockBalance.quantity)
+        .join(Warehouse, Warehouse.id == StockBalance.warehouse_id)
+        .join(SkuUnit, SkuUnit.id == StockBalance.sku_unit_id)
         .filter(
-            ArticleWbMapping.article_id == article.id,
-            ArticleWbMapping.bundle_type_id.is_not(None),
+            SkuUnit.article_id.in_(found_ids),
+            Warehouse.type == "internal",
         )
         .all()
     )
+    internal_qty_by_pair: Dict[int, Dict[Tuple[int, int], int]] = defaultdict(lambda: defaultdict(int))
+    nsk_warehouse_by_article: Dict[int, int] = {}
+    balance_by_wh_sku: Dict[Tuple[int, int], int] = {}
+    for sku_unit_id, warehouse_id, quantity in balance_rows:
+        sku = sku_by_id[sku_unit_id]
+        internal_qty_by_pair[sku.article_id][(sku.color_id, sku.size_id)] += quantity
+        current = nsk_warehouse_by_article.get(sku.article_id)
+        if current is None or warehouse_id < current:
+            nsk_warehouse_by_article[sku.article_id] = warehouse_id
+        balance_by_wh_sku[(warehouse_id, sku_unit_id)] = quantity
+
+    fallback_warehouse_id: int | None = None
+    if len(nsk_warehouse_by_article) < len(found_ids):
+        fallback_warehouse_id = (
+            db.query(Warehouse.id)
+            .filter(Warehouse.type == "internal")
+            .order_by(Warehouse.id)
+            .limit(1)
+            .scalar()
+        )
+
+    mappings = db.query(ArticleWbMapping).filter(ArticleWbMapping.article_id.in_(found_ids)).all()
+    mappings_by_article: Dict[int, list[ArticleWbMapping]] = defaultdict(list)
+    for m in mappings:
+        mappings_by_article[m.article_id].append(m)
+
+    stocked_wb_skus = {m.wb_sku for m in mappings if m.bundle_type_id is not None}
+    wb_qty_by_sku: Dict[str, int] = {}
+    if stocked_wb_skus:
+        wb_qty_by_sku = {
+            wb_sku: int(qty or 0)
+            for wb_sku, qty in db.query(WbStock.wb_sku, func.sum(WbStock.stock_qty))
+            .filter(WbStock.wb_sku.in_(stocked_wb_skus))
+            .group_by(WbStock.wb_sku)
+            .all()
+        }
+
+    recipes = db.query(BundleRecipe).filter(BundleRecipe.article_id.in_(found_ids)).all()
+    recipe_colors: Dict[int, Dict[int, set[int]]] = defaultdict(lambda: defaultdict(set))
+    for recipe in recipes:
+        recipe_colors[recipe.article_id][recipe.bundle_type_id].add(recipe.color_id)
+
+    bundle_type_ids = {m.bundle_type_id for m in mappings if m.bundle_type_id is not None}
+    bundle_type_ids.update(r.bundle_type_id for r in recipes)
+    bundle_type_map: Dict[int, str] = {}
+    if bundle_type_ids:
+        for bt in db.query(BundleType).filter(BundleType.id.in_(bundle_type_ids)).all():
+            bundle_type_map[bt.id] = bt.name
+
+    size_ids = {sku.size_id for sku in sku_units}
+    size_labels: Dict[int, str] = {}
+    if size_ids:
+        size_labels = {s.id: s.label for s in db.query(Size).filter(Size.id.in_(size_ids)).all()}
+
+    observation_window_days = 30
+    sales_skus_by_key: Dict[Tuple[int, int], set[str]] = defaultdict(set)
+    for m in mappings:
+        if m.bundle_type_id is not None:
+            sales_skus_by_key[(m.article_id, m.bundle_type_id)].add(m.wb_sku)
+    avg_sales_by_key = _compute_bundle_sales_averages(
+        db=db,
+        skus_by_key=sales_skus_by_key,
+        observation_window_days=observation_window_days,
+    )
 
-    if mappings:
-        wb_skus = {m.wb_sku for m in mappings}
-        stock_rows = db.query(WbStock).filter(WbStock.wb_sku.in_(wb_skus)).all()
-        qty_by_sku: Dict[str, int] = defaultdict(int)
-        for row in stock_rows:
-            qty_by_sku[row.wb_sku] += row.stock_qty
+    snapshots: Dict[int, ArticleInventorySnapshot] = {}
+    for article in articles:
+        nsk_single_sku_stock = [
+            NskSkuStockSnapshot(color_id=color_id, size_id=size_id, quantity=qty)
+            for (color_id, size_id), qty in sorted(internal_qty_by_pair.get(article.id, {}).items())
+        ]
 
         qty_by_bt_size: Dict[Tuple[int, int], int] = defaultdict(int)
-        bundle_type_ids: set[int] = set()
-        for m in mappings:
+        for m in mappings_by_article.get(article.id, []):
             if m.bundle_type_id is None or m.size_id is None:
                 continue
-            bundle_type_ids.add(m.bundle_type_id)
-            qty = qty_by_sku.get(m.wb_sku, 0)
-            qty_by_bt_size[(m.bundle_type_id, m.size_id)] += qty
-
-        bundle_type_map: Dict[int, str] = {}
-        if bundle_type_ids:
-            for bt in db.query(BundleType).filter(BundleType.id.in_(bundle_type_ids)).all():
-                bundle_type_map[bt.id] = bt.name
-
+            qty_by_bt_size[(m.bundle_type_id, m.size_id)] += wb_qty_by_sku.get(m.wb_sku, 0)
         wb_bundle_stock = [
             WbBundleStockSnapshot(
                 bundle_type_id=bt_id,
@@ -280,68 +344,156 @@ def build_article_inventory_snapshot(db: Session, article_id: int) -> ArticleInv
             for (bt_id, size_id), qty in sorted(qty_by_bt_size.items())
         ]
 
-    # NSC bundle stock: there is no dedicated entity for assembled bundles on NSC yet
-    nsk_bundle_stock: list[NskBundleStockSnapshot] = []
+        warehouse_id = nsk_warehouse_by_article.get(article.id, fallback_warehouse_id)
+        capacity_by_bt_size = _compute_bundle_capacity(
+            article_id=article.id,
+            recipe_colors=recipe_colors.get(article.id, {}),
+            sku_units=skus_by_article.get(article.id, []),
+            warehouse_id=warehouse_id,
+            balance_by_wh_sku=balance_by_wh_sku,
+            size_labels=size_labels,
+            bundle_type_map=bundle_type_map,
+        )
 
-    # Bundle capacity from singles (NSC)
-    capacity_by_bt_size = compute_bundle_capacity_for_article(db=db, article_id=article.id)
+        wb_ready_by_type: Dict[int, int] = defaultdict(int)
+        for s in wb_bundle_stock:
+            wb_ready_by_type[s.bundle_type_id] += s.quantity
+
+        potential_by_type: Dict[int, int] = defaultdict(int)
+        for (bt_id, _size_id), cap in capacity_by_bt_size.items():
+            potential_by_type[bt_id] += cap
+
+        bundle_coverage: list[BundleCoverageSnapshot] = []
+        for bt_id in sorted(set(wb_ready_by_type.keys()) | set(potential_by_type.keys())):
+            wb_ready = wb_ready_by_type.get(bt_id, 0)
+            nsk_ready = 0  # Assembled NSC bundles are not modeled yet
+            potential = potential_by_type.get(bt_id, 0)
+            total = wb_ready + nsk_ready + potential
+
+            avg_daily_sales = avg_sales_by_key.get((article.id, bt_id), 0.0)
+            if avg_daily_sales > 0:
+                days_of_cover = total / avg_daily_sales if total > 0 else 0.0
+            else:
+                days_of_cover = None
+
+            bundle_coverage.append(
+                BundleCoverageSnapshot(
+                    bundle_type_id=bt_id,
+                    bundle_type_name=bundle_type_map.get(bt_id, str(bt_id)),
+                    avg_daily_sales=avg_daily_sales,
+                    wb_ready_bundles=wb_ready,
+                    nsk_ready_bundles=nsk_ready,
+                    potential_bundles_from_singles=potential,
+                    total_available_bundles=total,
+                    days_of_cover=days_of_cover,
+                    observation_window_days=observation_window_days,
+                )
+            )
 
-    # Aggregate bundle coverage per bundle_type
-    wb_ready_by_type: Dict[int, int] = defaultdict(int)
-    for s in wb_bundle_stock:
-        wb_ready_by_type[s.bundle_type_id] += s.quantity
+        snapshots[article.id] = ArticleInventorySnapshot(
+            article_id=article.id,
+            article_code=article.code,
+            nsk_single_sku_stock=nsk_single_sku_stock,
+            wb_bundle_stock=wb_bundle_stock,
+            nsk_bundle_stock=[],  # No dedicated entity for assembled NSC bundles yet
+            bundle_coverage=bundle_coverage,
+        )
 
-    potential_by_type: Dict[int, int] = defaultdict(int)
-    for (bt_id, _size_id), cap in capacity_by_bt_size.items():
-        potential_by_type[bt_id] += cap
+    return snapshots
 
-    bundle_type_ids_union = set(wb_ready_by_type.keys()) | set(potential_by_type.keys())
 
-    bundle_type_map: Dict[int, str] = {}
-    if bundle_type_ids_union:
-        for bt in db.query(BundleType).filter(BundleType.id.in_(bundle_type_ids_union)).all():
-            bundle_type_map[bt.id] = bt.name
+def _compute_bundle_capacity(
+    *,
+    article_id: int,
+    recipe_colors: Dict[int, set[int]],
+    sku_units: list[SkuUnit],
+    warehouse_id: int | None,
+    balance_by_wh_sku: Dict[Tuple[int, int], int],
+    size_labels: Dict[int, str],
+    bundle_type_map: Dict[int, str],
+) -> Dict[CapacityKey, int]:
+    """In-memory equivalent of `compute_bundle_capacity_for_article` over preloaded rows."""
+
+    if warehouse_id is None:
+        return {}
 
-    observation_window_days = 30
+    capacities: Dict[CapacityKey, int] = {}
+    for bundle_type_id, color_ids in recipe_colors.items():
+        if bundle_type_id not in bundle_type_map:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=_build_bundle_type_not_found_detail(bundle_type_id=bundle_type_id),
+            )
 
-    bundle_coverage: list[BundleCoverageSnapshot] = []
-    for bt_id in sorted(bundle_type_ids_union):
-        wb_ready = wb_ready_by_type.get(bt_id, 0)
-        nsk_ready = 0  # Assembled NSC bundles are not modeled yet
-        potential = potential_by_type.get(bt_id, 0)
-        total = wb_ready + nsk_ready + potential
+        size_to_color_sku: Dict[int, Dict[int, SkuUnit]] = defaultdict(dict)
+        for sku in sku_units:
+            if sku.color_id in color_ids:
+                size_to_color_sku[sku.size_id][sku.color_id] = sku
+
+        for size_id, color_sku_map in size_to_color_sku.items():
+            if size_id not in size_labels or not color_ids.issubset(color_sku_map.keys()):
+                available = 0
+            else:
+                available = min(
+                    max(balance_by_wh_sku.get((warehouse_id, color_sku_map[color_id].id), 0), 0)
+                    for color_id in color_ids
+                )
+            capacities[(bundle_type_id, size_id)] = available
 
-        avg_daily_sales = compute_bundle_sales_stats(
-            db=db,
-            article_id=article.id,
-            bundle_type_id=bt_id,
-            observation_window_days=observation_window_days,
-            as_of_date=None,
-        )
-        if avg_daily_sales > 0:
-            days_of_cover = total / avg_daily_sales if total > 0 else 0.0
-        else:
-            days_of_cover = None
+    return capacities
 
-        bundle_coverage.append(
-            BundleCoverageSnapshot(
-                bundle_type_id=bt_id,
-                bundle_type_name=bundle_type_map.get(bt_id, str(bt_id)),
-                avg_daily_sales=avg_daily_sales,
-                wb_ready_bundles=wb_ready,
-                nsk_ready_bundles=nsk_ready,
-                potential_bundles_from_singles=potential,
-                total_available_bundles=total,
-                days_of_cover=days_of_cover,
-                observation_window_days=observation_window_days,
-            )
-        )
 
-    return ArticleInventorySnapshot(
-        article_id=article.id,
-        article_code=article.code,
-        nsk_single_sku_stock=nsk_single_sku_stock,
-        wb_bundle_stock=wb_bundle_stock,
-        nsk_bundle_stock=nsk_bundle_stock,
-        bundle_coverage=bundle_coverage,
+def _compute_bundle_sales_averages(
+    db: Session,
+    skus_by_key: Dict[Tuple[int, int], set[str]],
+    observation_window_days: int,
+) -> Dict[Tuple[int, int], float]:
+    """Batch `compute_bundle_sales_stats` (with as_of_date=None) for many (article, bundle type) keys."""
+
+    all_skus = set().union(*skus_by_key.values()) if skus_by_key else set()
+    if not all_skus or observation_window_days <= 0:
+        return {}
+
+    max_date_by_sku: Dict[str, date] = dict(
+        db.query(WbSalesDaily.wb_sku, func.max(WbSalesDaily.date))
+        .filter(WbSalesDaily.wb_sku.in_(all_skus))
+        .group_by(WbSalesDaily.wb_sku)
+        .all()
     )
+
+    windows: Dict[Tuple[int, int], Tuple[date, date]] = {}
+    for key, wb_skus in skus_by_key.items():
+        sku_max_dates = [max_date_by_sku[sku] for sku in wb_skus if sku in max_date_by_sku]
+        if sku_max_dates:
+            as_of_date = max(sku_max_dates)
+            windows[key] = (as_of_date - timedelta(days=observation_window_days - 1), as_of_date)
+    if not windows:
+        return {}
+
+    earliest_start = min(start for start, _end in windows.values())
+    sales_by_sku: Dict[str, list[Tuple[date, int]]] = defaultdict(list)
+    for wb_sku, sales_date, sales_qty in (
+        db.query(WbSalesDaily.wb_sku, WbSalesDaily.date, WbSalesDaily.sales_qty)
+        .filter(
+            WbSalesDaily.wb_sku.in_({sku for sku in all_skus if sku in max_date_by_sku}),
+            WbSalesDaily.date >= earliest_start,
+        )
+        .all()
+    ):
+        sales_by_sku[wb_sku].append((sales_date, sales_qty))
+
+    averages: Dict[Tuple[int, int], float] = {}
+    for key, (start_cutoff, as_of_date) in windows.items():
+        in_window = [
+            (sales_date, sales_qty)
+            for sku in skus_by_key[key]
+            for sales_date, sales_qty in sales_by_sku.get(sku, [])
+            if start_cutoff <= sales_date <= as_of_date
+        ]
+        if not in_window:
+            continue
+        total_sales_qty = sum(qty for _sales_date, qty in in_window)
+        days_in_window = (max(d for d, _q in in_window) - min(d for d, _q in in_window)).days + 1
+        averages[key] = float(total_sales_qty) / float(days_in_window)
+
+    return averages
@@ -1,26 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import List, Tuple
 
-from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.models.models import PlanningSettings
 from app.schemas.article_bundle_snapshot import ArticleInventorySnapshot
 from app.schemas.bundle_risk import ArticleBundleRiskEntry, BundleRiskLevel
-from app.services.article_bundle_snapshot import build_article_inventory_snapshot
+from app.services.article_bundle_snapshot import build_article_inventory_snapshots
 
 DEFAULT_SAFETY_STOCK_DAYS = 7
 DEFAULT_ALERT_THRESHOLD_DAYS = 14
 OVERSTOCK_MULTIPLIER = 3
-
-
-def _is_article_not_found_detail(detail: object) -> bool:
-    if detail == "Article not found":
-        return True
-    if isinstance(detail, dict):
-        return detail.get("code") == "article_not_found"
-    return False
+PORTFOLIO_BATCH_SIZE = 500
 
 
 def resolve_thresholds_for_article(
@@ -39,7 +32,29 @@ def resolve_thresholds_for_article(
         .filter(PlanningSettings.article_id == article_id)
         .first()
     )
+    return _thresholds_from_settings(ps)
+
 
+def resolve_thresholds_for_articles(
+    db: Session,
+    article_ids: list[int],
+) -> dict[int, tuple[int | None, int | None, int | None]]:
+    """Batch variant of `resolve_thresholds_for_article` using a single query."""
+
+    settings_by_article: dict[int, PlanningSettings] = {}
+    if article_ids:
+        rows = (
+            db.query(PlanningSettings)
+            .filter(PlanningSettings.article_id.in_(article_ids))
+            .order_by(PlanningSettings.id)
+            .all()
+        )
+        for ps in rows:
+            settings_by_article.setdefault(ps.article_id, ps)
+    return {aid: _thresholds_from_settings(settings_by_article.get(aid)) for aid in article_ids}
+
+
+def _thresholds_from_settings(ps: PlanningSettings | None) -> tuple[int | None, int | None, int | None]:
     if ps is not None:
         safety_stock_days = ps.safety_stock_days
         alert_threshold_days = ps.alert_threshold_days
@@ -59,13 +74,17 @@ def resolve_thresholds_for_article(
 def compute_risk_for_article_snapshot(
     db: Session,
     snapshot: ArticleInventorySnapshot,
+    thresholds: tuple[int | None, int | None, int | None] | None = None,
 ) -> list[ArticleBundleRiskEntry]:
-    """Compute risk entries per bundle type for a single article snapshot."""
+    """Compute risk entries per bundle type for a single article snapshot.
 
-    safety_stock_days, alert_threshold_days, overstock_threshold_days = resolve_thresholds_for_article(
-        db=db,
-        article_id=snapshot.article_id,
-    )
+    `thresholds` may be passed pre-resolved (see `resolve_thresholds_for_articles`)
+    to avoid a settings lookup per article.
+    """
+
+    if thresholds is None:
+        thresholds = resolve_thresholds_for_article(db=db, article_id=snapshot.article_id)
+    safety_stock_days, alert_threshold_days, overstock_threshold_days = thresholds
 
     entries: list[ArticleBundleRiskEntry] = []
 
@@ -156,6 +175,15 @@ def build_bundle_risk_portfolio(
     unknown article IDs are silently ignored.
     """
 
+    return list(iter_bundle_risk_portfolio(db=db, article_ids=article_ids))
+
+
+def iter_bundle_risk_portfolio(
+    db: Session,
+    article_ids: list[int] | None = None,
+) -> Iterator[ArticleBundleRiskEntry]:
+    """Yield bundle risk entries article by article; see `build_bundle_risk_portfolio`."""
+
     target_article_ids: list[int]
 
     if article_ids is None:
@@ -174,17 +202,19 @@ def build_bundle_risk_portfolio(
                 seen.add(aid)
                 target_article_ids.append(aid)
 
-    portfolio: list[ArticleBundleRiskEntry] = []
-
-    for article_id in target_article_ids:
-        try:
-            snapshot = build_article_inventory_snapshot(db=db, article_id=article_id)
-        except HTTPException as exc:  # type: ignore[py310-no-except-type-comments]
-            if exc.status_code == status.HTTP_404_NOT_FOUND and _is_article_not_found_detail(exc.detail):
+    # Articles are processed in fixed-size batches so the query count stays constant
+    # per batch while entries are still streamed to the caller.
+    for offset in range(0, len(target_article_ids), PORTFOLIO_BATCH_SIZE):
+        batch_ids = target_article_ids[offset : offset + PORTFOLIO_BATCH_SIZE]
+        snapshots = build_article_inventory_snapshots(db=db, article_ids=batch_ids)
+        thresholds_by_article = resolve_thresholds_for_articles(db=db, article_ids=list(snapshots))
+        for article_id in batch_ids:
+            snapshot = snapshots.get(article_id)
+            if snapshot is None:
                 # Ignore unknown article IDs
                 continue
-            raise
-
-        portfolio.extend(compute_risk_for_article_snapshot(db=db, snapshot=snapshot))
-
-    return portfolio
+            yield from compute_risk_for_article_snapshot(
+                db=db,
+                snapshot=snapshot,
+                thresholds=thresholds_by_article[article_id],
+            )
@@ -15,43 +15,106 @@ OBSERVATION_WINDOW_DAYS = 30
 def compute_demand(db: Session, article_id: int, target_date: date) -> DemandResult:
     """Compute demand metrics for a given article on WB data."""
 
-    explanation_parts: list[str] = []
+    return compute_demand_for_articles(db=db, article_ids=[article_id], target_date=target_date)[article_id]
 
-    # Map article to WB SKUs
-    mappings = (
-        db.query(ArticleWbMapping)
-        .filter(ArticleWbMapping.article_id == article_id)
-        .all()
-    )
-    wb_skus = sorted({m.wb_sku for m in mappings})
 
-    if not wb_skus:
-        explanation_parts.append(
-            "No WB SKU mappings (article_wb_mapping) found for this article; "
-            "treating sales and stock as zero."
-        )
+def compute_demand_for_articles(
+    db: Session,
+    article_ids: list[int],
+    target_date: date,
+) -> dict[int, DemandResult]:
+    """Compute demand metrics for many articles with a fixed number of queries.
+
+    Results match calling `compute_demand` per article; every requested ID gets
+    an entry (articles without WB mappings get zero sales and stock).
+    """
+
+    if not article_ids:
+        return {}
+
+    wb_skus_by_article: dict[int, set[str]] = {aid: set() for aid in article_ids}
+    for mapping_article_id, wb_sku in (
+        db.query(ArticleWbMapping.article_id, ArticleWbMapping.wb_sku)
+        .filter(ArticleWbMapping.article_id.in_(article_ids))
+        .all()
+    ):
+        wb_skus_by_article[mapping_article_id].add(wb_sku)
+    all_wb_skus = set().union(*wb_skus_by_article.values())
 
-    # Aggregate sales over observation window
     start_date = target_date - timedelta(days=OBSERVATION_WINDOW_DAYS - 1)
-    total_sales = 0
-    days_with_sales = 0
-
-    if wb_skus:
-        total_sales, days_with_sales = (
-            db.query(
-                func.coalesce(func.sum(WbSalesDaily.sales_qty), 0),
-                func.count(func.distinct(WbSalesDaily.date)),
-            )
+    sales_by_sku: dict[str, list[tuple[date, int]]] = {}
+    stock_by_sku: dict[str, int] = {}
+    if all_wb_skus:
+        for wb_sku, sales_date, sales_qty in (
+            db.query(WbSalesDaily.wb_sku, WbSalesDaily.date, func.sum(WbSalesDaily.sales_qty))
             .filter(
-                WbSalesDaily.wb_sku.in_(wb_skus),
+                WbSalesDaily.wb_sku.in_(all_wb_skus),
                 WbSalesDaily.date >= start_date,
                 WbSalesDaily.date <= target_date,
             )
-            .one()
+            .group_by(WbSalesDaily.wb_sku, WbSalesDaily.date)
+            .all()
+        ):
+            sales_by_sku.setdefault(wb_sku, []).append((sales_date, int(sales_qty or 0)))
+        stock_by_sku = {
+            wb_sku: int(qty or 0)
+            for wb_sku, qty in db.query(WbStock.wb_sku, func.sum(WbStock.stock_qty))
+            .filter(WbStock.wb_sku.in_(all_wb_skus))
+            .group_by(WbStock.wb_sku)
+            .all()
+        }
+
+    aps_by_article: dict[int, ArticlePlanningSettings] = {}
+    for aps in (
+        db.query(ArticlePlanningSettings)
+        .filter(ArticlePlanningSettings.article_id.in_(article_ids))
+        .order_by(ArticlePlanningSettings.id)
+        .all()
+    ):
+        aps_by_article.setdefault(aps.article_id, aps)
+
+    gps = db.query(GlobalPlanningSettings).first()
+    fallback_target_coverage = gps.default_target_coverage_days if gps else 60
+
+    results: dict[int, DemandResult] = {}
+    for article_id in article_ids:
+        wb_skus = sorted(wb_skus_by_article[article_id])
+        sales_dates: set[date] = set()
+        total_sales = 0
+        for wb_sku in wb_skus:
+            for sales_date, sales_qty in sales_by_sku.get(wb_sku, []):
+                sales_dates.add(sales_date)
+                total_sales += sales_qty
+        results[article_id] = _build_demand_result(
+            article_id=article_id,
+            wb_skus=wb_skus,
+            total_sales=total_sales,
+            days_with_sales=len(sales_dates),
+            current_stock=sum(stock_by_sku.get(wb_sku, 0) for wb_sku in wb_skus),
+            aps=aps_by_article.get(article_id),
+            fallback_target_coverage=fallback_target_coverage,
         )
 
-        total_sales = int(total_sales or 0)
-        days_with_sales = int(days_with_sales or 0)
+    return results
+
+
+def _build_demand_result(
+    *,
+    article_id: int,
+    wb_skus: list[str],
+    total_sales: int,
+    days_with_sales: int,
+    current_stock: int,
+    aps: ArticlePlanningSettings | None,
+    fallback_target_coverage: int,
+) -> DemandResult:
+    explanation_parts: list[str] = []
+
+    if not wb_skus:
+        explanation_parts.append(
+            "No WB SKU mappings (article_wb_mapping) found for this article; "
+            "treating sales and stock as zero."
+        )
 
     if days_with_sales > 0:
         obs_days_used = min(OBSERVATION_WINDOW_DAYS, days_with_sales)
@@ -76,15 +139,6 @@ def compute_demand(db: Session, article_id: int, target_date: date) -> DemandRes
         )
 
     # Determine forecast horizon from ArticlePlanningSettings/GlobalPlanningSettings
-    aps = (
-        db.query(ArticlePlanningSettings)
-        .filter(ArticlePlanningSettings.article_id == article_id)
-        .first()
-    )
-
-    gps = db.query(GlobalPlanningSettings).first()
-    fallback_target_coverage = gps.default_target_coverage_days if gps else 60
-
     if aps is not None and aps.target_coverage_days is not None:
         target_coverage_days = aps.target_coverage_days
         explanation_parts.append(
@@ -104,17 +158,6 @@ def compute_demand(db: Session, article_id: int, target_date: date) -> DemandRes
     # Forecast demand
     forecast_demand = avg_daily_sales * float(forecast_horizon_days)
 
-    # Current WB stock
-    current_stock = 0
-    if wb_skus:
-        current_stock = (
-            db.query(func.coalesce(func.sum(WbStock.stock_qty), 0))
-            .filter(WbStock.wb_sku.in_(wb_skus))
-            .scalar()
-            or 0
-        )
-        current_stock = int(current_stock)
-
     # Coverage in days
     if avg_daily_sales > 0:
         coverage_days = float(current_stock) / float(avg_daily_sales)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.models import MonitoringAlertRule
@@ -10,6 +12,11 @@ def list_alert_rules(db: Session) -> list[MonitoringAlertRule]:
     return db.query(MonitoringAlertRule).order_by(MonitoringAlertRule.id).all()
 
 
+async def list_alert_rules_async(db: AsyncSession) -> list[MonitoringAlertRule]:
+    result = await db.execute(select(MonitoringAlertRule).order_by(MonitoringAlertRule.id))
+    return list(result.scalars().all())
+
+
 def create_alert_rule(db: Session, data: AlertRuleCreate) -> MonitoringAlertRule:
     rule = MonitoringAlertRule(
         name=data.name,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.models import MonitoringSnapshotRecord
@@ -31,15 +33,29 @@ def build_and_persist_monitoring_snapshot(db: Session) -> MonitoringSnapshotReco
     return MonitoringSnapshotRecordSchema.model_validate(record, from_attributes=True)
 
 
-def get_monitoring_history(db: Session, limit: int = 30) -> list[MonitoringSnapshotRecordSchema]:
-    rows = (
-        db.query(MonitoringSnapshotRecord)
+def _build_monitoring_history_statement(limit: int) -> Select:
+    return (
+        select(MonitoringSnapshotRecord)
         .order_by(MonitoringSnapshotRecord.created_at.desc())
         .limit(limit)
-        .all()
     )
 
+
+def _to_history_items(rows) -> list[MonitoringSnapshotRecordSchema]:
     return [
         MonitoringSnapshotRecordSchema.model_validate(row, from_attributes=True)
         for row in rows
     ]
+
+
+def get_monitoring_history(db: Session, limit: int = 30) -> list[MonitoringSnapshotRecordSchema]:
+    rows = db.scalars(_build_monitoring_history_statement(limit)).all()
+    return _to_history_items(rows)
+
+
+async def get_monitoring_history_async(
+    db: AsyncSession,
+    limit: int = 30,
+) -> list[MonitoringSnapshotRecordSchema]:
+    result = await db.execute(_build_monitoring_history_statement(limit))
+    return _to_history_items(result.scalars().all())
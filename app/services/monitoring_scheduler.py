@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -10,11 +11,21 @@ from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy.orm import Session
 
 from app.core.db import SessionLocal, engine
+from app.core.metrics import REGISTRY
 from app.services.monitoring_history import build_and_persist_monitoring_snapshot
 
 
 logger = logging.getLogger(__name__)
 
+MONITORING_SNAPSHOT_JOB = "monitoring_snapshot"
+
+JOB_DURATION_HISTOGRAM = REGISTRY.histogram(
+    "monitoring_job_duration_seconds",
+    "Duration of background monitoring jobs by outcome.",
+    labelnames=("job", "outcome"),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+
 
 class MonitoringScheduler:
     """Background scheduler for periodic monitoring snapshots.
@@ -165,11 +176,19 @@ class MonitoringScheduler:
         bring down the application process.
         """
         logger.warning("Monitoring snapshot job started")
+        started = time.perf_counter()
+        outcome = "success"
         db: Session = SessionLocal()
         try:
             build_and_persist_monitoring_snapshot(db=db)
             logger.warning("Monitoring snapshot job completed successfully")
         except Exception:
+            outcome = "error"
             logger.exception("Error while running monitoring snapshot job")
         finally:
             db.close()
+            JOB_DURATION_HISTOGRAM.observe(
+                time.perf_counter() - started,
+                job=MONITORING_SNAPSHOT_JOB,
+                outcome=outcome,
+            )
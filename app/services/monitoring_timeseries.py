@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import timezone
 
@@ -20,11 +22,7 @@ def _normalize_timestamp_to_utc(timestamp):
     return timestamp.astimezone(timezone.utc)
 
 
-def build_monitoring_timeseries(
-    db: Session,
-    metrics: list[str],
-    limit: int,
-) -> list[MonitoringMetricSeries]:
+def _filter_requested_metrics(metrics: list[str]) -> list[str]:
     seen: set[str] = set()
     requested_metrics: list[str] = []
     for metric in metrics:
@@ -32,20 +30,24 @@ def build_monitoring_timeseries(
             seen.add(metric)
             requested_metrics.append(metric)
 
-    filtered_metrics = [m for m in requested_metrics if m in SUPPORTED_METRICS]
-    if not filtered_metrics:
-        return []
+    return [m for m in requested_metrics if m in SUPPORTED_METRICS]
 
-    records = (
-        db.query(MonitoringSnapshotRecord)
+
+def _build_recent_records_statement(limit: int) -> Select:
+    return (
+        select(MonitoringSnapshotRecord)
         .order_by(
             MonitoringSnapshotRecord.created_at.desc(),
             MonitoringSnapshotRecord.id.desc(),
         )
         .limit(limit)
-        .all()
     )
 
+
+def _build_series(
+    filtered_metrics: list[str],
+    records: list[MonitoringSnapshotRecord],
+) -> list[MonitoringMetricSeries]:
     if not records:
         return []
 
@@ -69,3 +71,29 @@ def build_monitoring_timeseries(
         )
 
     return series_list
+
+
+def build_monitoring_timeseries(
+    db: Session,
+    metrics: list[str],
+    limit: int,
+) -> list[MonitoringMetricSeries]:
+    filtered_metrics = _filter_requested_metrics(metrics)
+    if not filtered_metrics:
+        return []
+
+    records = list(db.scalars(_build_recent_records_statement(limit)).all())
+    return _build_series(filtered_metrics, records)
+
+
+async def build_monitoring_timeseries_async(
+    db: AsyncSession,
+    metrics: list[str],
+    limit: int,
+) -> list[MonitoringMetricSeries]:
+    filtered_metrics = _filter_requested_metrics(metrics)
+    if not filtered_metrics:
+        return []
+
+    result = await db.execute(_build_recent_records_statement(limit))
+    return _build_series(filtered_metrics, list(result.scalars().all()))
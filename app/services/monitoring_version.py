@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.models import (
+    MoySkladIntegrationAccount,
+    MonitoringAlertRule,
+    MonitoringSnapshotRecord,
+    WbIntegrationAccount,
+)
+
+
+def build_monitoring_version_key(db: Session) -> str:
+    """Cheap version of the monitoring dashboard state, read in one statement.
+
+    The key moves with the latest persisted snapshot (the record alerts are evaluated against,
+    written by the monitoring scheduler) and with any insert, update or delete of alert rules or
+    integration accounts. Live risk and order counts are therefore revalidated per persisted
+    snapshot, not per poll.
+    """
+
+    latest_snapshot = select(MonitoringSnapshotRecord).order_by(
+        MonitoringSnapshotRecord.created_at.desc(),
+        MonitoringSnapshotRecord.id.desc(),
+    )
+    columns = [
+        latest_snapshot.with_only_columns(MonitoringSnapshotRecord.id).limit(1).scalar_subquery(),
+        latest_snapshot.with_only_columns(MonitoringSnapshotRecord.created_at).limit(1).scalar_subquery(),
+    ]
+    for model in (MonitoringAlertRule, WbIntegrationAccount, MoySkladIntegrationAccount):
+        columns.append(select(func.count(model.id)).scalar_subquery())
+        columns.append(select(func.max(model.updated_at)).scalar_subquery())
+
+    row = db.execute(select(*columns)).one()
+    return "|".join("" if value is None else str(value) for value in row)
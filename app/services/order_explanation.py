@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import date
 
 from fastapi import HTTPException, status
@@ -15,15 +17,18 @@ from app.models.models import (
     SkuUnit,
     StockBalance,
 )
+from app.schemas.demand import DemandResult
 from app.schemas.order_explanation import (
     ArticleOrderExplanation,
     OrderExplanationPortfolioResponse,
     OrderProposalReason,
 )
 from app.schemas.order_proposal import OrderProposalResponse
-from app.services.demand_engine import compute_demand
+from app.services.demand_engine import compute_demand_for_articles
 from app.services.order_proposal import generate_order_proposal
 
+PORTFOLIO_BATCH_SIZE = 500
+
 
 def _build_article_not_found_detail(*, article_id: int) -> dict[str, object]:
     return {
@@ -39,80 +44,109 @@ def _build_article_not_found_detail(*, article_id: int) -> dict[str, object]:
     }
 
 
-def _is_article_not_found_detail(detail: object) -> bool:
-    if detail == "Article not found":
-        return True
-    if isinstance(detail, dict):
-        return detail.get("code") == "article_not_found"
-    return False
-
+@dataclass(frozen=True)
+class _ArticleExplanationInputs:
+    """Per-article rows needed to explain an order, preloaded in bulk."""
 
-def _resolve_article(db: Session, article_id: int) -> Article:
-    article = db.query(Article).filter(Article.id == article_id).first()
-    if article is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=_build_article_not_found_detail(article_id=article_id),
-        )
-    return article
+    article: Article
+    planning_settings: PlanningSettings | None
+    demand: DemandResult | None
+    elastic_min_batch: int | None
+    elastic_type: ElasticType | None
+    color_min_batches: dict[int, int]
+    internal_available: int
+    color_map: dict[int, Color]
 
 
-def _load_colors_for_article(db: Session, article_id: int) -> dict[int, Color]:
-    skus = db.query(SkuUnit).filter(SkuUnit.article_id == article_id).all()
-    color_ids = {s.color_id for s in skus}
-    if not color_ids:
-        return {}
-    colors = db.query(Color).filter(Color.id.in_(color_ids)).all()
-    return {c.id: c for c in colors}
+def _load_explanation_inputs(
+    db: Session,
+    article_ids: list[int],
+    target_date: date,
+) -> dict[int, _ArticleExplanationInputs]:
+    """Load explanation inputs for many articles with a fixed number of queries.
 
+    Unknown article IDs are absent from the result.
+    """
 
-def _load_color_min_batches_for_article(db: Session, article_id: int) -> dict[int, int]:
-    rows = (
-        db.query(ColorPlanningSettings)
-        .filter(ColorPlanningSettings.article_id == article_id)
-        .all()
-    )
-    return {
-        row.color_id: row.fabric_min_batch_qty
-        for row in rows
-        if row.fabric_min_batch_qty is not None and row.fabric_min_batch_qty > 0
-    }
+    if not article_ids:
+        return {}
 
+    articles = db.query(Article).filter(Article.id.in_(article_ids)).all()
+    if not articles:
+        return {}
+    found_ids = [a.id for a in articles]
 
-def _resolve_elastic_min_for_article(db: Session, article_id: int) -> tuple[int | None, ElasticType | None]:
-    rows = (
-        db.query(ElasticPlanningSettings, ElasticType)
-        .join(ElasticType, ElasticType.id == ElasticPlanningSettings.elastic_type_id)
-        .filter(ElasticPlanningSettings.article_id == article_id)
-        .all()
-    )
-    if not rows:
-        return None, None
-
-    max_qty = 0
-    chosen_type: ElasticType | None = None
-    for eps, et in rows:
-        if eps.elastic_min_batch_qty is not None and eps.elastic_min_batch_qty > max_qty:
-            max_qty = eps.elastic_min_batch_qty
-            chosen_type = et
-
-    if max_qty <= 0:
-        return None, None
-
-    return max_qty, chosen_type
-
-
-def _compute_total_available_before(db: Session, article_id: int) -> int:
-    skus = db.query(SkuUnit).filter(SkuUnit.article_id == article_id).all()
-    if not skus:
-        return 0
-    sku_ids = [s.id for s in skus]
-    balances = (
-        db.query(StockBalance)
-        .filter(StockBalance.sku_unit_id.in_(sku_ids))
+    settings_by_article: dict[int, PlanningSettings] = {}
+    for ps in (
+        db.query(PlanningSettings)
+        .filter(PlanningSettings.article_id.in_(found_ids))
+        .order_by(PlanningSettings.id)
         .all()
-    )
-    return sum(b.quantity for b in balances)
+    ):
+        settings_by_article.setdefault(ps.article_id, ps)
+
+    planned_ids = [aid for aid in found_ids if aid in settings_by_article]
+    demand_by_article = compute_demand_for_articles(db=db, article_ids=planned_ids, target_date=target_date)
+
+    elastic_by_article: dict[int, tuple[int, ElasticType | None]] = {}
+    color_min_batches: dict[int, dict[int, int]] = {}
+    skus: list[SkuUnit] = []
+    balances: list[StockBalance] = []
+    colors_by_id: dict[int, Color] = {}
+    if planned_ids:
+        for eps, et in (
+            db.query(ElasticPlanningSettings, ElasticType)
+            .join(ElasticType, ElasticType.id == ElasticPlanningSettings.elastic_type_id)
+            .filter(ElasticPlanningSettings.article_id.in_(planned_ids))
+            .order_by(ElasticPlanningSettings.id)
+            .all()
+        ):
+            max_qty, _chosen_type = elastic_by_article.get(eps.article_id, (0, None))
+            if eps.elastic_min_batch_qty is not None and eps.elastic_min_batch_qty > max_qty:
+                elastic_by_article[eps.article_id] = (eps.elastic_min_batch_qty, et)
+
+        for row in (
+            db.query(ColorPlanningSettings)
+            .filter(ColorPlanningSettings.article_id.in_(planned_ids))
+            .all()
+        ):
+            if row.fabric_min_batch_qty is not None and row.fabric_min_batch_qty > 0:
+                color_min_batches.setdefault(row.article_id, {})[row.color_id] = row.fabric_min_batch_qty
+
+        skus = db.query(SkuUnit).filter(SkuUnit.article_id.in_(planned_ids)).all()
+        if skus:
+            balances = (
+                db.query(StockBalance)
+                .filter(StockBalance.sku_unit_id.in_([s.id for s in skus]))
+                .all()
+            )
+            color_ids = {s.color_id for s in skus}
+            colors_by_id = {c.id: c for c in db.query(Color).filter(Color.id.in_(color_ids)).all()}
+
+    article_by_sku = {s.id: s.article_id for s in skus}
+    internal_available: dict[int, int] = {}
+    for balance in balances:
+        aid = article_by_sku[balance.sku_unit_id]
+        internal_available[aid] = internal_available.get(aid, 0) + balance.quantity
+    color_map: dict[int, dict[int, Color]] = {}
+    for sku in skus:
+        if sku.color_id in colors_by_id:
+            color_map.setdefault(sku.article_id, {})[sku.color_id] = colors_by_id[sku.color_id]
+
+    inputs: dict[int, _ArticleExplanationInputs] = {}
+    for article in articles:
+        elastic_min_batch, elastic_type = elastic_by_article.get(article.id, (None, None))
+        inputs[article.id] = _ArticleExplanationInputs(
+            article=article,
+            planning_settings=settings_by_article.get(article.id),
+            demand=demand_by_article.get(article.id),
+            elastic_min_batch=elastic_min_batch,
+            elastic_type=elastic_type,
+            color_min_batches=color_min_batches.get(article.id, {}),
+            internal_available=internal_available.get(article.id, 0),
+            color_map=color_map.get(article.id, {}),
+        )
+    return inputs
 
 
 def build_order_explanation_for_article(
@@ -120,19 +154,28 @@ def build_order_explanation_for_article(
     article_id: int,
     proposal: OrderProposalResponse | None = None,
 ) -> ArticleOrderExplanation:
-    article = _resolve_article(db, article_id)
+    inputs = _load_explanation_inputs(db=db, article_ids=[article_id], target_date=date.today()).get(article_id)
+    if inputs is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=_build_article_not_found_detail(article_id=article_id),
+        )
+    return _explain_article_order(db=db, inputs=inputs, proposal=proposal)
 
-    ps = (
-        db.query(PlanningSettings)
-        .filter(PlanningSettings.article_id == article.id)
-        .first()
-    )
-    if ps is None:
+
+def _explain_article_order(
+    db: Session,
+    inputs: _ArticleExplanationInputs,
+    proposal: OrderProposalResponse | None,
+) -> ArticleOrderExplanation:
+    article = inputs.article
+    ps = inputs.planning_settings
+    if ps is None or inputs.demand is None:
         return ArticleOrderExplanation(article_id=article.id, article_code=article.code, reasons=[])
 
     target_date = date.today()
 
-    demand = compute_demand(db=db, article_id=article.id, target_date=target_date)
+    demand = inputs.demand
     base_deficit = demand.deficit
     strictness = ps.strictness
     strict_factor = strictness if strictness > 0 else 1.0
@@ -149,10 +192,8 @@ def build_order_explanation_for_article(
     min_fabric_batch = ps.min_fabric_batch if ps.min_fabric_batch > 0 else None
     min_elastic_batch_raw = ps.min_elastic_batch if ps.min_elastic_batch > 0 else None
 
-    elastic_min_batch_from_type, elastic_type = _resolve_elastic_min_for_article(
-        db=db,
-        article_id=article.id,
-    )
+    elastic_min_batch_from_type = inputs.elastic_min_batch
+    elastic_type = inputs.elastic_type
 
     if elastic_min_batch_from_type is not None:
         if min_elastic_batch_raw is None:
@@ -165,10 +206,9 @@ def build_order_explanation_for_article(
     else:
         min_elastic_batch_effective = min_elastic_batch_raw
 
-    color_min_batches = _load_color_min_batches_for_article(db=db, article_id=article.id)
+    color_min_batches = inputs.color_min_batches
 
-    internal_available = _compute_total_available_before(db=db, article_id=article.id)
-    total_available_before = (demand.current_stock or 0) + internal_available
+    total_available_before = (demand.current_stock or 0) + inputs.internal_available
 
     if proposal is None:
         proposal = generate_order_proposal(
@@ -180,7 +220,7 @@ def build_order_explanation_for_article(
 
     article_items = [it for it in proposal.items if it.article_id == article.id]
 
-    color_map = _load_colors_for_article(db=db, article_id=article.id)
+    color_map = inputs.color_map
 
     by_color_and_elastic: dict[tuple[int | None, int | None], int] = {}
 
@@ -300,6 +340,15 @@ def build_order_explanation_portfolio(
     db: Session,
     article_ids: list[int] | None = None,
 ) -> list[ArticleOrderExplanation]:
+    return list(iter_order_explanation_portfolio(db=db, article_ids=article_ids))
+
+
+def iter_order_explanation_portfolio(
+    db: Session,
+    article_ids: list[int] | None = None,
+) -> Iterator[ArticleOrderExplanation]:
+    """Yield per-article order explanations, backed by one scoped proposal per batch."""
+
     target_article_ids: list[int]
 
     if article_ids is None:
@@ -317,28 +366,20 @@ def build_order_explanation_portfolio(
                 seen.add(aid)
                 target_article_ids.append(aid)
 
-    portfolio: list[ArticleOrderExplanation] = []
-    shared_proposal: OrderProposalResponse | None = None
-    if target_article_ids:
-        shared_proposal = generate_order_proposal(
+    target_date = date.today()
+    for offset in range(0, len(target_article_ids), PORTFOLIO_BATCH_SIZE):
+        batch_ids = target_article_ids[offset : offset + PORTFOLIO_BATCH_SIZE]
+        # Proposal items are computed per article, so scoping the proposal to the batch gives the
+        # same rows as one portfolio-wide proposal while the first batch streams without waiting.
+        batch_proposal = generate_order_proposal(
             db=db,
-            target_date=date.today(),
+            target_date=target_date,
             explanation=True,
-            article_ids=target_article_ids,
+            article_ids=batch_ids,
         )
-
-    for aid in target_article_ids:
-        try:
-            explanation = build_order_explanation_for_article(
-                db=db,
-                article_id=aid,
-                proposal=shared_proposal,
-            )
-        except HTTPException as exc:  # type: ignore[py310-no-except-type-comments]
-            if exc.status_code == status.HTTP_404_NOT_FOUND and _is_article_not_found_detail(exc.detail):
+        inputs_by_article = _load_explanation_inputs(db=db, article_ids=batch_ids, target_date=target_date)
+        for aid in batch_ids:
+            inputs = inputs_by_article.get(aid)
+            if inputs is None:
                 continue
-            raise
-
-        portfolio.append(explanation)
-
-    return portfolio
+            yield _explain_article_order(db=db, inputs=inputs, proposal=batch_proposal)
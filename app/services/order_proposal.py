@@ -14,7 +14,7 @@ from app.models.models import (
     Size,
 )
 from app.schemas.order_proposal import OrderProposalItem, OrderProposalResponse
-from app.services.demand_engine import compute_demand
+from app.services.demand_engine import compute_demand_for_articles
 
 
 def generate_order_proposal(
@@ -41,8 +41,67 @@ def generate_order_proposal(
             global_explanation="No planning settings configured; no order proposal generated.",
         )
 
+    # Bulk-load per-article inputs once so the query count does not grow with the portfolio.
+    settings_article_ids = sorted({ps.article_id for ps in settings_list})
+    articles_by_id = {
+        a.id: a for a in db.query(Article).filter(Article.id.in_(settings_article_ids)).all()
+    }
+    skus_by_article: dict[int, list[SkuUnit]] = {}
+    for sku in db.query(SkuUnit).filter(SkuUnit.article_id.in_(settings_article_ids)).all():
+        skus_by_article.setdefault(sku.article_id, []).append(sku)
+    all_skus = [sku for skus in skus_by_article.values() for sku in skus]
+
+    all_size_ids = {sku.size_id for sku in all_skus}
+    size_sort_order: dict[int, int] = {}
+    if all_size_ids:
+        size_sort_order = {
+            s.id: s.sort_order for s in db.query(Size).filter(Size.id.in_(all_size_ids)).all()
+        }
+
+    # Color-level planning settings (fabric minima per color)
+    color_min_batches_by_article: dict[int, dict[int, int]] = {}
+    for cs in (
+        db.query(ColorPlanningSettings)
+        .filter(ColorPlanningSettings.article_id.in_(settings_article_ids))
+        .all()
+    ):
+        if cs.fabric_min_batch_qty is not None and cs.fabric_min_batch_qty > 0:
+            color_min_batches_by_article.setdefault(cs.article_id, {})[cs.color_id] = cs.fabric_min_batch_qty
+
+    # Elastic-level planning settings (simplified: use max elastic_min_batch_qty per article)
+    elastic_min_batch_by_article: dict[int, int] = {}
+    for es in (
+        db.query(ElasticPlanningSettings)
+        .filter(ElasticPlanningSettings.article_id.in_(settings_article_ids))
+        .all()
+    ):
+        if es.elastic_min_batch_qty is not None and es.elastic_min_batch_qty > elastic_min_batch_by_article.get(
+            es.article_id, 0
+        ):
+            elastic_min_batch_by_article[es.article_id] = es.elastic_min_batch_qty
+
+    qty_by_sku: dict[int, int] = {}
+    if all_skus:
+        qty_by_sku = {
+            b.sku_unit_id: b.quantity
+            for b in db.query(StockBalance)
+            .filter(StockBalance.sku_unit_id.in_([s.id for s in all_skus]))
+            .all()
+        }
+
+    demand_article_ids = [
+        ps.article_id
+        for ps in settings_list
+        if ps.is_active and ps.article_id in articles_by_id and skus_by_article.get(ps.article_id)
+    ]
+    demand_by_article = compute_demand_for_articles(
+        db=db,
+        article_ids=list(dict.fromkeys(demand_article_ids)),
+        target_date=target_date,
+    )
+
     for ps in settings_list:
-        article = db.query(Article).filter(Article.id == ps.article_id).first()
+        article = articles_by_id.get(ps.article_id)
         if article is None:
             if explanation:
                 explanation_parts.append(
@@ -57,7 +116,7 @@ def generate_order_proposal(
                 )
             continue
 
-        sku_units = db.query(SkuUnit).filter(SkuUnit.article_id == article.id).all()
+        sku_units = skus_by_article.get(article.id, [])
         if not sku_units:
             if explanation:
                 explanation_parts.append(
@@ -65,53 +124,20 @@ def generate_order_proposal(
                 )
             continue
 
-        # Group SKUs by color and collect size information
+        # Group SKUs by color
         color_to_skus: dict[int, list[SkuUnit]] = {}
-        color_ids: set[int] = set()
-        size_ids: set[int] = set()
         for sku in sku_units:
             color_to_skus.setdefault(sku.color_id, []).append(sku)
-            color_ids.add(sku.color_id)
-            size_ids.add(sku.size_id)
-
-        sizes = db.query(Size).filter(Size.id.in_(size_ids)).all() if size_ids else []
-        size_sort_order: dict[int, int] = {s.id: s.sort_order for s in sizes}
-
-        # Color-level planning settings (fabric minima per color)
-        color_settings = (
-            db.query(ColorPlanningSettings)
-            .filter(
-                ColorPlanningSettings.article_id == article.id,
-                ColorPlanningSettings.color_id.in_(color_ids) if color_ids else False,
-            )
-            .all()
-        )
-        color_min_batches: dict[int, int] = {
-            cs.color_id: cs.fabric_min_batch_qty
-            for cs in color_settings
-            if cs.fabric_min_batch_qty is not None and cs.fabric_min_batch_qty > 0
-        }
 
-        # Elastic-level planning settings (simplified: use max elastic_min_batch_qty per article)
-        elastic_settings = (
-            db.query(ElasticPlanningSettings)
-            .filter(ElasticPlanningSettings.article_id == article.id)
-            .all()
-        )
-        elastic_min_batch = 0
-        for es in elastic_settings:
-            if (
-                es.elastic_min_batch_qty is not None
-                and es.elastic_min_batch_qty > elastic_min_batch
-            ):
-                elastic_min_batch = es.elastic_min_batch_qty
+        color_min_batches = {
+            color_id: min_batch
+            for color_id, min_batch in color_min_batches_by_article.get(article.id, {}).items()
+            if color_id in color_to_skus
+        }
+        elastic_min_batch = elastic_min_batch_by_article.get(article.id, 0)
 
         # Step 1: WB-based deficit
-        demand = compute_demand(
-            db=db,
-            article_id=article.id,
-            target_date=target_date,
-        )
+        demand = demand_by_article[article.id]
         deficit_base = demand.deficit
 
         if deficit_base <= 0:
@@ -238,14 +264,6 @@ def generate_order_proposal(
                 qty = base + (1 if idx < rem else 0)
                 final_sku_qty[sku.id] = qty
 
-        # Current internal stock for explanations
-        balances = (
-            db.query(StockBalance)
-            .filter(StockBalance.sku_unit_id.in_([s.id for s in sku_units]))
-            .all()
-        )
-        qty_by_sku: dict[int, int] = {b.sku_unit_id: b.quantity for b in balances}
-
         if explanation:
             explanation_text = (
                 f"Article {article.code}: WB demand -> avg_daily_sales={demand.avg_daily_sales:.3f}, "
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterator
 
 from sqlalchemy.orm import Session
 
@@ -79,6 +80,19 @@ def build_planning_health_portfolio(
     db: Session,
     article_ids: list[int] | None = None,
 ) -> list[ArticleHealthSummary]:
+    return list(iter_planning_health_portfolio(db=db, article_ids=article_ids))
+
+
+def iter_planning_health_portfolio(
+    db: Session,
+    article_ids: list[int] | None = None,
+) -> Iterator[ArticleHealthSummary]:
+    """Yield per-article health summaries in article id order.
+
+    Both source portfolios must be complete before the first summary can be ranked,
+    so only the summary list itself is streamed.
+    """
+
     bundle_portfolio = build_bundle_risk_portfolio(db=db, article_ids=article_ids)
     order_portfolio = build_order_explanation_portfolio(db=db, article_ids=article_ids)
 
@@ -92,8 +106,6 @@ def build_planning_health_portfolio(
 
     article_ids_union = set(risk_by_article.keys()) | set(orders_by_article.keys())
 
-    items: list[ArticleHealthSummary] = []
-
     for article_id in sorted(article_ids_union):
         risk_entries = risk_by_article.get(article_id, [])
         order_expl = orders_by_article.get(article_id)
@@ -108,21 +120,17 @@ def build_planning_health_portfolio(
         risk_data = _aggregate_risk(risk_entries)
         total_final_order_qty, dominant_constraint = _aggregate_orders(order_expl)
 
-        items.append(
-            ArticleHealthSummary(
-                article_id=article_id,
-                article_code=article_code,
-                worst_risk_level=risk_data["worst_risk_level"],
-                worst_risk_bundle_type_id=risk_data["worst_risk_bundle_type_id"],
-                worst_risk_bundle_type_name=risk_data["worst_risk_bundle_type_name"],
-                days_of_cover=risk_data["days_of_cover"],
-                avg_daily_sales=risk_data["avg_daily_sales"],
-                total_available_bundles=risk_data["total_available_bundles"],
-                total_final_order_qty=total_final_order_qty,
-                dominant_limiting_constraint=dominant_constraint,
-                has_critical=risk_data["has_critical"],
-                has_warning=risk_data["has_warning"],
-            )
+        yield ArticleHealthSummary(
+            article_id=article_id,
+            article_code=article_code,
+            worst_risk_level=risk_data["worst_risk_level"],
+            worst_risk_bundle_type_id=risk_data["worst_risk_bundle_type_id"],
+            worst_risk_bundle_type_name=risk_data["worst_risk_bundle_type_name"],
+            days_of_cover=risk_data["days_of_cover"],
+            avg_daily_sales=risk_data["avg_daily_sales"],
+            total_available_bundles=risk_data["total_available_bundles"],
+            total_final_order_qty=total_final_order_qty,
+            dominant_limiting_constraint=dominant_constraint,
+            has_critical=risk_data["has_critical"],
+            has_warning=risk_data["has_warning"],
         )
-
-    return items
@@ -14,6 +14,8 @@ from app.models.models import (
 )
 from app.schemas.planning_production_order import (
     ProductionOrderAlternative,
+    ProductionOrderPortfolioRequest,
+    ProductionOrderPortfolioResponse,
     ProductionOrderProposalFromWbRequest,
     ProductionOrderProposalRequest,
     ProductionOrderProposalResponse,
@@ -31,10 +33,6 @@ from app.services.planning_production_order_assorti_application import (
     _AssortiApplicationResult as _extracted_AssortiApplicationResult,
     _apply_production_order_assorti_classification as _extracted_apply_production_order_assorti_classification,
 )
-from app.services.planning_production_order_assorti_unpack_application import (
-    _AssortiUnpackApplicationResult as _extracted_AssortiUnpackApplicationResult,
-    _apply_production_order_assorti_unpack as _extracted_apply_production_order_assorti_unpack,
-)
 from app.services.planning_production_order_assorti import (
     ASSORTI_CLASSIFICATION_ADMIN_FALLBACK_SOURCE as EXTRACTED_ASSORTI_CLASSIFICATION_ADMIN_FALLBACK_SOURCE,
     ASSORTI_CLASSIFICATION_GLOBAL_FALLBACK_SOURCE as EXTRACTED_ASSORTI_CLASSIFICATION_GLOBAL_FALLBACK_SOURCE,
@@ -70,12 +68,9 @@ from app.services.planning_production_order_economic_governance_application impo
     _EconomicGovernanceApplicationResult as _extracted_EconomicGovernanceApplicationResult,
     _apply_production_order_economic_governance as _extracted_apply_production_order_economic_governance,
 )
-from app.services.planning_production_order_economic_governance_unpack_application import (
-    _EconomicGovernanceUnpackApplicationResult as _extracted_EconomicGovernanceUnpackApplicationResult,
-    _apply_production_order_economic_governance_unpack as _extracted_apply_production_order_economic_governance_unpack,
-)
 from app.services.planning_production_order_explainability import (
     EXPLAINABILITY_MODE_COMPACT as EXTRACTED_EXPLAINABILITY_MODE_COMPACT,
+    EXPLAINABILITY_MODE_NONE as EXTRACTED_EXPLAINABILITY_MODE_NONE,
     _apply_from_wb_explainability as _extracted_apply_from_wb_explainability,
     _build_alpha_proxy_economics_meta as _extracted_build_alpha_proxy_economics_meta,
     _build_from_wb_explainability_inputs as _extracted_build_from_wb_explainability_inputs,
@@ -84,6 +79,12 @@ from app.services.planning_production_order_explainability import (
     _build_explanation_warnings as _extracted_build_explanation_warnings,
     _finalize_from_wb_explainability as _extracted_finalize_from_wb_explainability,
     _apply_explainability_mode,
+    _build_none_explanation,
+)
+from app.services.planning_production_order_contract_validation import (
+    CONTRACT_VALIDATION_LEVEL_OFF as EXTRACTED_CONTRACT_VALIDATION_LEVEL_OFF,
+    _select_contract_summary_builder,
+    _should_validate_contracts,
 )
 from app.services.planning_production_order_elastic import (
     _apply_elastic_min_batch_uplift as _extracted_apply_elastic_min_batch_uplift,
@@ -102,50 +103,26 @@ from app.services.planning_production_order_inputs import (
     _PreparedProductionOrderInputs as _extracted_PreparedProductionOrderInputs,
     _prepare_production_order_inputs as _extracted_prepare_production_order_inputs,
 )
-from app.services.planning_production_order_inputs_unpack_application import (
-    _InputsUnpackApplicationResult as _extracted_InputsUnpackApplicationResult,
-    _apply_production_order_inputs_unpack as _extracted_apply_production_order_inputs_unpack,
-)
 from app.services.planning_production_order_layer1_summary_application import (
     _Layer1SummaryApplicationResult as _extracted_Layer1SummaryApplicationResult,
     _apply_production_order_layer1_summary as _extracted_apply_production_order_layer1_summary,
 )
-from app.services.planning_production_order_layer1_summary_unpack_application import (
-    _Layer1SummaryUnpackApplicationResult as _extracted_Layer1SummaryUnpackApplicationResult,
-    _apply_production_order_layer1_summary_unpack as _extracted_apply_production_order_layer1_summary_unpack,
-)
 from app.services.planning_production_order_layer2_allocation_application import (
     _Layer2AllocationApplicationResult as _extracted_Layer2AllocationApplicationResult,
     _apply_production_order_layer2_allocation as _extracted_apply_production_order_layer2_allocation,
 )
-from app.services.planning_production_order_layer2_allocation_unpack_application import (
-    _Layer2AllocationUnpackApplicationResult as _extracted_Layer2AllocationUnpackApplicationResult,
-    _apply_production_order_layer2_allocation_unpack as _extracted_apply_production_order_layer2_allocation_unpack,
-)
 from app.services.planning_production_order_layer2_summary_application import (
     _Layer2SummaryApplicationResult as _extracted_Layer2SummaryApplicationResult,
     _apply_production_order_layer2_summary as _extracted_apply_production_order_layer2_summary,
 )
-from app.services.planning_production_order_layer2_summary_unpack_application import (
-    _Layer2SummaryUnpackApplicationResult as _extracted_Layer2SummaryUnpackApplicationResult,
-    _apply_production_order_layer2_summary_unpack as _extracted_apply_production_order_layer2_summary_unpack,
-)
 from app.services.planning_production_order_layer3_application import (
     _Layer3ApplicationResult as _extracted_Layer3ApplicationResult,
     _apply_production_order_layer3 as _extracted_apply_production_order_layer3,
 )
-from app.services.planning_production_order_layer3_unpack_application import (
-    _Layer3UnpackApplicationResult as _extracted_Layer3UnpackApplicationResult,
-    _apply_production_order_layer3_unpack as _extracted_apply_production_order_layer3_unpack,
-)
 from app.services.planning_production_order_line_requirements_application import (
     _LineRequirementsApplicationResult as _extracted_LineRequirementsApplicationResult,
     _apply_production_order_line_requirements as _extracted_apply_production_order_line_requirements,
 )
-from app.services.planning_production_order_line_requirements_unpack_application import (
-    _LineRequirementsUnpackApplicationResult as _extracted_LineRequirementsUnpackApplicationResult,
-    _apply_production_order_line_requirements_unpack as _extracted_apply_production_order_line_requirements_unpack,
-)
 from app.services.planning_production_order_line_requirements import (
     _LineRequirementsPlan as _extracted_LineRequirementsPlan,
     _build_line_requirements_plan as _extracted_build_line_requirements_plan,
@@ -154,18 +131,10 @@ from app.services.planning_production_order_constraint_application import (
     _ConstraintApplicationResult as _extracted_ConstraintApplicationResult,
     _apply_production_order_constraints as _extracted_apply_production_order_constraints,
 )
-from app.services.planning_production_order_constraint_unpack_application import (
-    _ConstraintUnpackApplicationResult as _extracted_ConstraintUnpackApplicationResult,
-    _apply_production_order_constraint_unpack as _extracted_apply_production_order_constraint_unpack,
-)
 from app.services.planning_production_order_candidate_lines_application import (
     _CandidateLinesApplicationResult as _extracted_CandidateLinesApplicationResult,
     _apply_production_order_candidate_lines as _extracted_apply_production_order_candidate_lines,
 )
-from app.services.planning_production_order_candidate_lines_unpack_application import (
-    _CandidateLinesUnpackApplicationResult as _extracted_CandidateLinesUnpackApplicationResult,
-    _apply_production_order_candidate_lines_unpack as _extracted_apply_production_order_candidate_lines_unpack,
-)
 from app.services.planning_production_order_candidate_lines import (
     _build_candidate_lines as _extracted_build_candidate_lines,
 )
@@ -173,106 +142,55 @@ from app.services.planning_production_order_capital_application import (
     _CapitalApplicationResult as _extracted_CapitalApplicationResult,
     _apply_production_order_capital_constraints as _extracted_apply_production_order_capital_constraints,
 )
-from app.services.planning_production_order_capital_unpack_application import (
-    _CapitalUnpackApplicationResult as _extracted_CapitalUnpackApplicationResult,
-    _apply_production_order_capital_unpack as _extracted_apply_production_order_capital_unpack,
-)
 from app.services.planning_production_order_layer4_application import (
     _Layer4ApplicationResult as _extracted_Layer4ApplicationResult,
     _apply_production_order_layer4_analysis as _extracted_apply_production_order_layer4_analysis,
 )
-from app.services.planning_production_order_layer4_unpack_application import (
-    _Layer4UnpackApplicationResult as _extracted_Layer4UnpackApplicationResult,
-    _apply_production_order_layer4_unpack as _extracted_apply_production_order_layer4_unpack,
-)
 from app.services.planning_production_order_layer5_application import (
     _Layer5ApplicationResult as _extracted_Layer5ApplicationResult,
     _apply_production_order_layer5_analysis as _extracted_apply_production_order_layer5_analysis,
 )
-from app.services.planning_production_order_layer5_unpack_application import (
-    _Layer5UnpackApplicationResult as _extracted_Layer5UnpackApplicationResult,
-    _apply_production_order_layer5_unpack as _extracted_apply_production_order_layer5_unpack,
-)
 from app.services.planning_production_order_scope_recommendation import (
     _ScopeRecommendationResult as _extracted_ScopeRecommendationResult,
     _apply_production_order_scope_and_recommendation as _extracted_apply_production_order_scope_and_recommendation,
 )
-from app.services.planning_production_order_scope_recommendation_unpack_application import (
-    _ScopeRecommendationUnpackApplicationResult as _extracted_ScopeRecommendationUnpackApplicationResult,
-    _apply_production_order_scope_recommendation_unpack as _extracted_apply_production_order_scope_recommendation_unpack,
-)
 from app.services.planning_production_order_explanation_warning_application import (
     _ExplanationWarningApplicationResult as _extracted_ExplanationWarningApplicationResult,
     _apply_production_order_explanation_warnings as _extracted_apply_production_order_explanation_warnings,
 )
-from app.services.planning_production_order_explanation_warning_unpack_application import (
-    _ExplanationWarningUnpackApplicationResult as _extracted_ExplanationWarningUnpackApplicationResult,
-    _apply_production_order_explanation_warning_unpack as _extracted_apply_production_order_explanation_warning_unpack,
-)
 from app.services.planning_production_order_alpha_proxy_application import (
     _AlphaProxyApplicationResult as _extracted_AlphaProxyApplicationResult,
     _apply_production_order_alpha_proxy_economics as _extracted_apply_production_order_alpha_proxy_economics,
 )
-from app.services.planning_production_order_alpha_proxy_unpack_application import (
-    _AlphaProxyUnpackApplicationResult as _extracted_AlphaProxyUnpackApplicationResult,
-    _apply_production_order_alpha_proxy_unpack as _extracted_apply_production_order_alpha_proxy_unpack,
-)
 from app.services.planning_production_order_explanation_application import (
     _ExplanationApplicationResult as _extracted_ExplanationApplicationResult,
     _apply_production_order_explanation as _extracted_apply_production_order_explanation,
-)
-from app.services.planning_production_order_explanation_unpack_application import (
-    _ExplanationUnpackApplicationResult as _extracted_ExplanationUnpackApplicationResult,
-    _apply_production_order_explanation_unpack as _extracted_apply_production_order_explanation_unpack,
+    _build_production_order_explanation_summary as _extracted_build_production_order_explanation_summary,
 )
 from app.services.planning_production_order_explainability_mode_application import (
     _ExplainabilityModeApplicationResult as _extracted_ExplainabilityModeApplicationResult,
     _apply_production_order_explainability_mode as _extracted_apply_production_order_explainability_mode,
 )
-from app.services.planning_production_order_explainability_mode_unpack_application import (
-    _ExplainabilityModeUnpackApplicationResult as _extracted_ExplainabilityModeUnpackApplicationResult,
-    _apply_production_order_explainability_mode_unpack as _extracted_apply_production_order_explainability_mode_unpack,
-)
 from app.services.planning_production_order_response_application import (
     _ResponseApplicationResult as _extracted_ResponseApplicationResult,
     _apply_production_order_response as _extracted_apply_production_order_response,
 )
-from app.services.planning_production_order_response_unpack_application import (
-    _ResponseUnpackApplicationResult as _extracted_ResponseUnpackApplicationResult,
-    _apply_production_order_response_unpack as _extracted_apply_production_order_response_unpack,
-)
 from app.services.planning_production_order_horizon_application import (
     _HorizonApplicationResult as _extracted_HorizonApplicationResult,
     _apply_production_order_horizon as _extracted_apply_production_order_horizon,
 )
-from app.services.planning_production_order_horizon_unpack_application import (
-    _HorizonUnpackApplicationResult as _extracted_HorizonUnpackApplicationResult,
-    _apply_production_order_horizon_unpack as _extracted_apply_production_order_horizon_unpack,
-)
 from app.services.planning_production_order_risk_application import (
     _RiskApplicationResult as _extracted_RiskApplicationResult,
     _apply_production_order_risk_level as _extracted_apply_production_order_risk_level,
 )
-from app.services.planning_production_order_risk_unpack_application import (
-    _RiskUnpackApplicationResult as _extracted_RiskUnpackApplicationResult,
-    _apply_production_order_risk_unpack as _extracted_apply_production_order_risk_unpack,
-)
 from app.services.planning_production_order_resource_allocation_application import (
     _ResourceAllocationApplicationResult as _extracted_ResourceAllocationApplicationResult,
     _apply_production_order_resource_allocation as _extracted_apply_production_order_resource_allocation,
 )
-from app.services.planning_production_order_resource_allocation_unpack_application import (
-    _ResourceAllocationUnpackApplicationResult as _extracted_ResourceAllocationUnpackApplicationResult,
-    _apply_production_order_resource_allocation_unpack as _extracted_apply_production_order_resource_allocation_unpack,
-)
 from app.services.planning_production_order_skip_application import (
     _SkipApplicationResult as _extracted_SkipApplicationResult,
     _apply_production_order_skip as _extracted_apply_production_order_skip,
 )
-from app.services.planning_production_order_skip_unpack_application import (
-    _SkipUnpackApplicationResult as _extracted_SkipUnpackApplicationResult,
-    _apply_production_order_skip_unpack as _extracted_apply_production_order_skip_unpack,
-)
 from app.services.planning_production_order_scope import (
     _build_physical_scope_contract as _extracted_build_physical_scope_contract,
     _build_arrival_horizon_projection as _extracted_build_arrival_horizon_projection,
@@ -288,17 +206,12 @@ from app.services.planning_production_order_settings_loading_application import
     _SettingsLoadingApplicationResult as _extracted_SettingsLoadingApplicationResult,
     _apply_production_order_settings_loading as _extracted_apply_production_order_settings_loading,
 )
-from app.services.planning_production_order_settings_loading_unpack_application import (
-    _SettingsLoadingUnpackApplicationResult as _extracted_SettingsLoadingUnpackApplicationResult,
-    _apply_production_order_settings_loading_unpack as _extracted_apply_production_order_settings_loading_unpack,
-)
 from app.services.planning_production_order_settings_resolution_application import (
     _SettingsResolutionApplicationResult as _extracted_SettingsResolutionApplicationResult,
     _apply_production_order_settings_resolution as _extracted_apply_production_order_settings_resolution,
 )
-from app.services.planning_production_order_settings_resolution_unpack_application import (
-    _SettingsResolutionUnpackApplicationResult as _extracted_SettingsResolutionUnpackApplicationResult,
-    _apply_production_order_settings_resolution_unpack as _extracted_apply_production_order_settings_resolution_unpack,
+from app.services.planning_production_order_stage_executor import (
+    _ProductionOrderStageExecutor,
 )
 from app.services.planning_production_order_supply_policy import (
     _compute_economic_buffer_days as _extracted_compute_economic_buffer_days,
@@ -317,6 +230,7 @@ from app.services.planning_production_order_constraints import (
 from app.services.planning_production_order_capital import (
     CAPITAL_CONSTRAINT_CONTRACT_VERSION as EXTRACTED_CAPITAL_CONSTRAINT_CONTRACT_VERSION,
     LAYER4_CONTRACT_VERSION as EXTRACTED_LAYER4_CONTRACT_VERSION,
+    LAYER4_EFFICIENCY_FRONTIER_META_KEY as EXTRACTED_LAYER4_EFFICIENCY_FRONTIER_META_KEY,
     LAYER4_SCENARIO_FACTORS as EXTRACTED_LAYER4_SCENARIO_FACTORS,
     LAYER4_SCENARIO_ORDER as EXTRACTED_LAYER4_SCENARIO_ORDER,
     _bounded_unit_float as _extracted_bounded_unit_float,
@@ -325,6 +239,7 @@ from app.services.planning_production_order_capital import (
     _build_capital_gap_summary as _extracted_build_capital_gap_summary,
     _build_layer4_aggregate_deltas as _extracted_build_layer4_aggregate_deltas,
     _build_layer4_contract_summary as _extracted_build_layer4_contract_summary,
+    _build_layer4_efficiency_frontier_summary as _extracted_build_layer4_efficiency_frontier_summary,
     _build_layer4_scenarios as _extracted_build_layer4_scenarios,
     _build_line_objective_capital_rankings as _extracted_build_line_objective_capital_rankings,
     _compute_objective_components as _extracted_compute_objective_components,
@@ -426,6 +341,9 @@ from app.services.planning_production_order_from_wb import (
     _resolve_bundle_type_ids_for_from_wb as _extracted_resolve_bundle_type_ids_for_from_wb,
     _summarize_from_wb_price_samples as _extracted_summarize_from_wb_price_samples,
 )
+from app.services.planning_production_order_portfolio import (
+    _build_production_order_portfolio_response as _extracted_build_production_order_portfolio_response,
+)
 from app.services.planning_production_order_freshness import (
     FROM_WB_SALES_STALE_AFTER_DAYS as EXTRACTED_FROM_WB_SALES_STALE_AFTER_DAYS,
     FROM_WB_STOCK_STALE_AFTER_DAYS as EXTRACTED_FROM_WB_STOCK_STALE_AFTER_DAYS,
@@ -460,6 +378,8 @@ ASSORTI_CLASSIFICATION_GLOBAL_FALLBACK_SOURCE = EXTRACTED_ASSORTI_CLASSIFICATION
 ASSORTI_CLASSIFICATION_MISSING_SOURCE = EXTRACTED_ASSORTI_CLASSIFICATION_MISSING_SOURCE
 EXPLAINABILITY_MODE_FULL = "full"
 EXPLAINABILITY_MODE_COMPACT = EXTRACTED_EXPLAINABILITY_MODE_COMPACT
+EXPLAINABILITY_MODE_NONE = EXTRACTED_EXPLAINABILITY_MODE_NONE
+CONTRACT_VALIDATION_LEVEL_OFF = EXTRACTED_CONTRACT_VALIDATION_LEVEL_OFF
 LAYER_PROXY_VALUE_SOURCE = EXTRACTED_LAYER_PROXY_VALUE_SOURCE
 ECONOMICS_FORMULA_VERSION = EXTRACTED_ECONOMICS_FORMULA_VERSION
 ECONOMICS_DEFAULT_PRODUCTION_COST_PER_UNIT = EXTRACTED_ECONOMICS_DEFAULT_PRODUCTION_COST_PER_UNIT
@@ -505,6 +425,7 @@ LAYER3_FACTOR_BOUNDS = EXTRACTED_LAYER3_FACTOR_BOUNDS
 LAYER4_SCENARIO_ORDER = EXTRACTED_LAYER4_SCENARIO_ORDER
 LAYER4_CONTRACT_VERSION = EXTRACTED_LAYER4_CONTRACT_VERSION
 LAYER4_SCENARIO_FACTORS = EXTRACTED_LAYER4_SCENARIO_FACTORS
+LAYER4_EFFICIENCY_FRONTIER_META_KEY = EXTRACTED_LAYER4_EFFICIENCY_FRONTIER_META_KEY
 CAPITAL_CONSTRAINT_CONTRACT_VERSION = EXTRACTED_CAPITAL_CONSTRAINT_CONTRACT_VERSION
 RESOURCE_ALLOCATION_CONTRACT_VERSION = EXTRACTED_RESOURCE_ALLOCATION_CONTRACT_VERSION
 LAYER5_CONTRACT_VERSION = EXTRACTED_LAYER5_CONTRACT_VERSION
@@ -562,6 +483,7 @@ _build_from_wb_no_mapping_detail = _extracted_build_from_wb_no_mapping_detail
 _build_from_wb_missing_requested_bundle_type_detail = _extracted_build_from_wb_missing_requested_bundle_type_detail
 _build_from_wb_preflight_context = _extracted_build_from_wb_preflight_context
 _build_production_order_proposal_from_wb_response = _extracted_build_production_order_proposal_from_wb_response
+_build_production_order_portfolio_response = _extracted_build_production_order_portfolio_response
 _build_from_wb_proposal_request = _extracted_build_from_wb_proposal_request
 _build_from_wb_runtime_economic_overrides = _extracted_build_from_wb_runtime_economic_overrides
 _get_wb_mapped_bundle_type_ids = _extracted_get_wb_mapped_bundle_type_ids
@@ -581,131 +503,79 @@ _build_capital_gap_summary = _extracted_build_capital_gap_summary
 _build_layer4_aggregate_deltas = _extracted_build_layer4_aggregate_deltas
 _build_layer4_contract_summary = _extracted_build_layer4_contract_summary
 _build_layer4_scenarios = _extracted_build_layer4_scenarios
+_build_layer4_efficiency_frontier_summary = _extracted_build_layer4_efficiency_frontier_summary
 _build_recommendation_and_alternatives = _extracted_build_recommendation_and_alternatives
 
 _AssortiApplicationResult = _extracted_AssortiApplicationResult
 _apply_production_order_assorti_classification = (
     _extracted_apply_production_order_assorti_classification
 )
-_AssortiUnpackApplicationResult = _extracted_AssortiUnpackApplicationResult
-_apply_production_order_assorti_unpack = _extracted_apply_production_order_assorti_unpack
 _EffectiveSettings = _extracted_EffectiveSettings
 _build_effective_settings = _extracted_build_effective_settings
 _EconomicGovernanceApplicationResult = _extracted_EconomicGovernanceApplicationResult
 _apply_production_order_economic_governance = (
     _extracted_apply_production_order_economic_governance
 )
-_EconomicGovernanceUnpackApplicationResult = _extracted_EconomicGovernanceUnpackApplicationResult
-_apply_production_order_economic_governance_unpack = (
-    _extracted_apply_production_order_economic_governance_unpack
-)
 _SettingsLoadingApplicationResult = _extracted_SettingsLoadingApplicationResult
 _apply_production_order_settings_loading = (
     _extracted_apply_production_order_settings_loading
 )
-_SettingsLoadingUnpackApplicationResult = _extracted_SettingsLoadingUnpackApplicationResult
-_apply_production_order_settings_loading_unpack = _extracted_apply_production_order_settings_loading_unpack
 _SettingsResolutionApplicationResult = _extracted_SettingsResolutionApplicationResult
 _apply_production_order_settings_resolution = (
     _extracted_apply_production_order_settings_resolution
 )
-_SettingsResolutionUnpackApplicationResult = _extracted_SettingsResolutionUnpackApplicationResult
-_apply_production_order_settings_resolution_unpack = (
-    _extracted_apply_production_order_settings_resolution_unpack
-)
 _load_admin_size_weights = _extracted_load_admin_size_weights
 _load_admin_in_flight_defaults = _extracted_load_admin_in_flight_defaults
 _PreparedProductionOrderInputs = _extracted_PreparedProductionOrderInputs
 _prepare_production_order_inputs = _extracted_prepare_production_order_inputs
-_InputsUnpackApplicationResult = _extracted_InputsUnpackApplicationResult
-_apply_production_order_inputs_unpack = _extracted_apply_production_order_inputs_unpack
 _Layer1SummaryApplicationResult = _extracted_Layer1SummaryApplicationResult
 _apply_production_order_layer1_summary = _extracted_apply_production_order_layer1_summary
-_Layer1SummaryUnpackApplicationResult = _extracted_Layer1SummaryUnpackApplicationResult
-_apply_production_order_layer1_summary_unpack = _extracted_apply_production_order_layer1_summary_unpack
 _Layer2AllocationApplicationResult = _extracted_Layer2AllocationApplicationResult
 _apply_production_order_layer2_allocation = _extracted_apply_production_order_layer2_allocation
-_Layer2AllocationUnpackApplicationResult = _extracted_Layer2AllocationUnpackApplicationResult
-_apply_production_order_layer2_allocation_unpack = _extracted_apply_production_order_layer2_allocation_unpack
 _Layer2SummaryApplicationResult = _extracted_Layer2SummaryApplicationResult
 _apply_production_order_layer2_summary = _extracted_apply_production_order_layer2_summary
-_Layer2SummaryUnpackApplicationResult = _extracted_Layer2SummaryUnpackApplicationResult
-_apply_production_order_layer2_summary_unpack = _extracted_apply_production_order_layer2_summary_unpack
 _Layer3ApplicationResult = _extracted_Layer3ApplicationResult
 _apply_production_order_layer3 = _extracted_apply_production_order_layer3
-_Layer3UnpackApplicationResult = _extracted_Layer3UnpackApplicationResult
-_apply_production_order_layer3_unpack = _extracted_apply_production_order_layer3_unpack
 _LineRequirementsApplicationResult = _extracted_LineRequirementsApplicationResult
 _apply_production_order_line_requirements = (
     _extracted_apply_production_order_line_requirements
 )
-_LineRequirementsUnpackApplicationResult = _extracted_LineRequirementsUnpackApplicationResult
-_apply_production_order_line_requirements_unpack = _extracted_apply_production_order_line_requirements_unpack
 _LineRequirementsPlan = _extracted_LineRequirementsPlan
 _build_line_requirements_plan = _extracted_build_line_requirements_plan
 _ConstraintApplicationResult = _extracted_ConstraintApplicationResult
 _apply_production_order_constraints = _extracted_apply_production_order_constraints
-_ConstraintUnpackApplicationResult = _extracted_ConstraintUnpackApplicationResult
-_apply_production_order_constraint_unpack = _extracted_apply_production_order_constraint_unpack
 _CandidateLinesApplicationResult = _extracted_CandidateLinesApplicationResult
 _apply_production_order_candidate_lines = _extracted_apply_production_order_candidate_lines
-_CandidateLinesUnpackApplicationResult = _extracted_CandidateLinesUnpackApplicationResult
-_apply_production_order_candidate_lines_unpack = _extracted_apply_production_order_candidate_lines_unpack
 _build_candidate_lines = _extracted_build_candidate_lines
 _CapitalApplicationResult = _extracted_CapitalApplicationResult
 _apply_production_order_capital_constraints = _extracted_apply_production_order_capital_constraints
-_CapitalUnpackApplicationResult = _extracted_CapitalUnpackApplicationResult
-_apply_production_order_capital_unpack = _extracted_apply_production_order_capital_unpack
 _Layer4ApplicationResult = _extracted_Layer4ApplicationResult
 _apply_production_order_layer4_analysis = _extracted_apply_production_order_layer4_analysis
-_Layer4UnpackApplicationResult = _extracted_Layer4UnpackApplicationResult
-_apply_production_order_layer4_unpack = _extracted_apply_production_order_layer4_unpack
 _Layer5ApplicationResult = _extracted_Layer5ApplicationResult
 _apply_production_order_layer5_analysis = _extracted_apply_production_order_layer5_analysis
-_Layer5UnpackApplicationResult = _extracted_Layer5UnpackApplicationResult
-_apply_production_order_layer5_unpack = _extracted_apply_production_order_layer5_unpack
 _ScopeRecommendationResult = _extracted_ScopeRecommendationResult
 _apply_production_order_scope_and_recommendation = _extracted_apply_production_order_scope_and_recommendation
-_ScopeRecommendationUnpackApplicationResult = _extracted_ScopeRecommendationUnpackApplicationResult
-_apply_production_order_scope_recommendation_unpack = _extracted_apply_production_order_scope_recommendation_unpack
 _ExplanationWarningApplicationResult = _extracted_ExplanationWarningApplicationResult
 _apply_production_order_explanation_warnings = _extracted_apply_production_order_explanation_warnings
-_ExplanationWarningUnpackApplicationResult = _extracted_ExplanationWarningUnpackApplicationResult
-_apply_production_order_explanation_warning_unpack = _extracted_apply_production_order_explanation_warning_unpack
 _AlphaProxyApplicationResult = _extracted_AlphaProxyApplicationResult
 _apply_production_order_alpha_proxy_economics = _extracted_apply_production_order_alpha_proxy_economics
-_AlphaProxyUnpackApplicationResult = _extracted_AlphaProxyUnpackApplicationResult
-_apply_production_order_alpha_proxy_unpack = _extracted_apply_production_order_alpha_proxy_unpack
 _ExplanationApplicationResult = _extracted_ExplanationApplicationResult
 _apply_production_order_explanation = _extracted_apply_production_order_explanation
-_ExplanationUnpackApplicationResult = _extracted_ExplanationUnpackApplicationResult
-_apply_production_order_explanation_unpack = _extracted_apply_production_order_explanation_unpack
+_build_production_order_explanation_summary = _extracted_build_production_order_explanation_summary
 _ExplainabilityModeApplicationResult = _extracted_ExplainabilityModeApplicationResult
 _apply_production_order_explainability_mode = _extracted_apply_production_order_explainability_mode
-_ExplainabilityModeUnpackApplicationResult = _extracted_ExplainabilityModeUnpackApplicationResult
-_apply_production_order_explainability_mode_unpack = _extracted_apply_production_order_explainability_mode_unpack
 _HorizonApplicationResult = _extracted_HorizonApplicationResult
 _apply_production_order_horizon = _extracted_apply_production_order_horizon
-_HorizonUnpackApplicationResult = _extracted_HorizonUnpackApplicationResult
-_apply_production_order_horizon_unpack = _extracted_apply_production_order_horizon_unpack
 _RiskApplicationResult = _extracted_RiskApplicationResult
 _apply_production_order_risk_level = _extracted_apply_production_order_risk_level
-_RiskUnpackApplicationResult = _extracted_RiskUnpackApplicationResult
-_apply_production_order_risk_unpack = _extracted_apply_production_order_risk_unpack
 _ResponseApplicationResult = _extracted_ResponseApplicationResult
 _apply_production_order_response = _extracted_apply_production_order_response
-_ResponseUnpackApplicationResult = _extracted_ResponseUnpackApplicationResult
-_apply_production_order_response_unpack = _extracted_apply_production_order_response_unpack
 _ResourceAllocationApplicationResult = _extracted_ResourceAllocationApplicationResult
 _apply_production_order_resource_allocation = (
     _extracted_apply_production_order_resource_allocation
 )
-_ResourceAllocationUnpackApplicationResult = _extracted_ResourceAllocationUnpackApplicationResult
-_apply_production_order_resource_allocation_unpack = _extracted_apply_production_order_resource_allocation_unpack
 _SkipApplicationResult = _extracted_SkipApplicationResult
 _apply_production_order_skip = _extracted_apply_production_order_skip
-_SkipUnpackApplicationResult = _extracted_SkipUnpackApplicationResult
-_apply_production_order_skip_unpack = _extracted_apply_production_order_skip_unpack
 
 _apply_elastic_min_batch_uplift = _extracted_apply_elastic_min_batch_uplift
 _resolve_elastic_binding_scope = _extracted_resolve_elastic_binding_scope
@@ -740,6 +610,17 @@ def build_production_order_proposal_from_wb(
     )
 
 
+def build_production_order_portfolio(
+    db: Session,
+    request: ProductionOrderPortfolioRequest,
+) -> ProductionOrderPortfolioResponse:
+    return _build_production_order_portfolio_response(
+        db=db,
+        request=request,
+        build_production_order_proposal=build_production_order_proposal,
+    )
+
+
 def build_production_order_proposal(
     db: Session,
     request: ProductionOrderProposalRequest,
@@ -749,23 +630,36 @@ def build_production_order_proposal(
     runtime_economic_source_overrides: dict[str, str] | None = None,
     shared_color_pool_observation_window_days: int | None = None,
     shared_color_pool_as_of_date: date | None = None,
+    contract_validation_level: str | None = None,
+    stage_results: dict[str, object] | None = None,
+    enforce_capital_limit: bool = True,
 ) -> ProductionOrderProposalResponse:
     now = datetime.now(timezone.utc)
+    stages = _ProductionOrderStageExecutor(results=stage_results)
+
+    # "none" skips every explanation-only stage (contract summaries, warnings, steps, meta),
+    # not just the rendering, so batch callers pay only for the recommendation.
+    explanation_enabled = request.explainability_mode != EXPLAINABILITY_MODE_NONE
+    # Contract summaries re-check invariants the test suite already covers; outside "full"
+    # validation they keep only their version and report status "skipped".
+    validate_contracts = _should_validate_contracts(level=contract_validation_level)
 
     _require_article(db=db, article_id=request.article_id)
+    stages.mark("article_lookup")
 
-    settings_loading_application = _apply_production_order_settings_loading(
+    settings_loading_application = stages.run(
+        "settings_loading",
+        _apply_production_order_settings_loading,
         db=db,
         article_id=request.article_id,
     )
-    settings_loading_unpack = _apply_production_order_settings_loading_unpack(
-        settings_loading_application=settings_loading_application,
-    )
-    article_settings = settings_loading_unpack.article_settings
-    planning_settings = settings_loading_unpack.planning_settings
-    global_settings = settings_loading_unpack.global_settings
+    article_settings = settings_loading_application.article_settings
+    planning_settings = settings_loading_application.planning_settings
+    global_settings = settings_loading_application.global_settings
 
-    settings_resolution_application = _apply_production_order_settings_resolution(
+    settings_resolution_application = stages.run(
+        "settings_resolution",
+        _apply_production_order_settings_resolution,
         article_settings=article_settings,
         planning_settings=planning_settings,
         global_settings=global_settings,
@@ -777,15 +671,14 @@ def build_production_order_proposal(
         resolve_layer_proxy_settings=_resolve_layer_proxy_settings,
         resolve_economic_settings=_resolve_economic_settings,
     )
-    settings_resolution_unpack = _apply_production_order_settings_resolution_unpack(
-        settings_resolution_application=settings_resolution_application,
-    )
-    settings = settings_resolution_unpack.settings
-    layer_proxy_settings = settings_resolution_unpack.layer_proxy_settings
-    economic_settings = settings_resolution_unpack.economic_settings
+    settings = settings_resolution_application.settings
+    layer_proxy_settings = settings_resolution_application.layer_proxy_settings
+    economic_settings = settings_resolution_application.economic_settings
 
     if not settings.include_in_planning:
-        skip_application = _apply_production_order_skip(
+        skip_application = stages.run(
+            "skip",
+            _apply_production_order_skip,
             article_id=request.article_id,
             generated_at=now,
             lead_time_days_total=settings.lead_time_days_total,
@@ -796,12 +689,11 @@ def build_production_order_proposal(
             apply_explainability_mode=_apply_explainability_mode,
             apply_production_order_response=_apply_production_order_response,
         )
-        skip_unpack = _apply_production_order_skip_unpack(
-            skip_application=skip_application,
-        )
-        return skip_unpack.response
+        return stages.finish(skip_application.response, enabled=request.debug_stage_timings)
 
-    economic_governance_application = _apply_production_order_economic_governance(
+    economic_governance_application = stages.run(
+        "economic_governance",
+        _apply_production_order_economic_governance,
         article_id=request.article_id,
         economic_settings=economic_settings,
         overrides=request.overrides,
@@ -812,15 +704,14 @@ def build_production_order_proposal(
         build_missing_available_capital_strict_detail=_build_missing_available_capital_strict_detail,
         resolve_economic_trust_and_capital_governance=_resolve_economic_trust_and_capital_governance,
     )
-    economic_governance_unpack = _apply_production_order_economic_governance_unpack(
-        economic_governance_application=economic_governance_application,
-    )
-    economic_settings = economic_governance_unpack.economic_settings
-    economics_trust = economic_governance_unpack.economics_trust
-    economics_warnings = economic_governance_unpack.economics_warnings
-    capital_governance = economic_governance_unpack.capital_governance
+    economic_settings = economic_governance_application.economic_settings
+    economics_trust = economic_governance_application.economics_trust
+    economics_warnings = economic_governance_application.economics_warnings
+    capital_governance = economic_governance_application.capital_governance
 
-    prepared_inputs = _prepare_production_order_inputs(
+    prepared_inputs = stages.run(
+        "inputs",
+        _prepare_production_order_inputs,
         db=db,
         request=request,
         lead_time_days_total=settings.lead_time_days_total,
@@ -832,32 +723,31 @@ def build_production_order_proposal(
         build_direct_missing_bundle_recipe_detail=_build_direct_missing_bundle_recipe_detail,
         build_direct_missing_sku_scope_detail=_build_direct_missing_sku_scope_detail,
     )
-    inputs_unpack = _apply_production_order_inputs_unpack(
-        inputs_application=prepared_inputs,
-    )
-    bundle_type_ids = inputs_unpack.bundle_type_ids
-    recipe_colors_by_bundle = inputs_unpack.recipe_colors_by_bundle
-    all_recipe_color_ids = inputs_unpack.all_recipe_color_ids
-    sku_by_color_size = inputs_unpack.sku_by_color_size
-    color_to_sizes = inputs_unpack.color_to_sizes
-    size_ids = inputs_unpack.size_ids
-    size_weights_source = inputs_unpack.size_weights_source
-    size_weights = inputs_unpack.size_weights
-    stock_by_color_size = inputs_unpack.stock_by_color_size
-    current_stock_by_color_size = inputs_unpack.current_stock_by_color_size
-    in_flight_source = inputs_unpack.in_flight_source
-    in_flight_raw_qty_total = inputs_unpack.in_flight_raw_qty_total
-    in_flight_effective_qty_total = inputs_unpack.in_flight_effective_qty_total
-    in_flight_effective_lines = inputs_unpack.in_flight_effective_lines
-    in_flight_effective_by_color_size = inputs_unpack.in_flight_effective_by_color_size
-    in_flight_eta_days_by_color_size = inputs_unpack.in_flight_eta_days_by_color_size
-    demand_by_bundle = inputs_unpack.demand_by_bundle
-    total_daily_sales = inputs_unpack.total_daily_sales
-    bundle_stock_source = inputs_unpack.bundle_stock_source
-    ready_bundle_stock_total = inputs_unpack.ready_bundle_stock_total
-    shares_by_bundle = inputs_unpack.shares_by_bundle
+    bundle_type_ids = prepared_inputs.bundle_type_ids
+    recipe_colors_by_bundle = prepared_inputs.recipe_colors_by_bundle
+    all_recipe_color_ids = prepared_inputs.all_recipe_color_ids
+    sku_by_color_size = prepared_inputs.sku_by_color_size
+    color_to_sizes = prepared_inputs.color_to_sizes
+    size_ids = prepared_inputs.size_ids
+    size_weights_source = prepared_inputs.size_weights_source
+    size_weights = prepared_inputs.size_weights
+    stock_by_color_size = prepared_inputs.stock_by_color_size
+    current_stock_by_color_size = prepared_inputs.current_stock_by_color_size
+    in_flight_source = prepared_inputs.in_flight_source
+    in_flight_raw_qty_total = prepared_inputs.in_flight_raw_qty_total
+    in_flight_effective_qty_total = prepared_inputs.in_flight_effective_qty_total
+    in_flight_effective_lines = prepared_inputs.in_flight_effective_lines
+    in_flight_effective_by_color_size = prepared_inputs.in_flight_effective_by_color_size
+    in_flight_eta_days_by_color_size = prepared_inputs.in_flight_eta_days_by_color_size
+    demand_by_bundle = prepared_inputs.demand_by_bundle
+    total_daily_sales = prepared_inputs.total_daily_sales
+    bundle_stock_source = prepared_inputs.bundle_stock_source
+    ready_bundle_stock_total = prepared_inputs.ready_bundle_stock_total
+    shares_by_bundle = prepared_inputs.shares_by_bundle
 
-    resource_allocation_application = _apply_production_order_resource_allocation(
+    resource_allocation_application = stages.run(
+        "resource_allocation",
+        _apply_production_order_resource_allocation,
         bundle_type_ids=bundle_type_ids,
         recipe_colors_by_bundle=recipe_colors_by_bundle,
         all_recipe_color_ids=all_recipe_color_ids,
@@ -868,18 +758,19 @@ def build_production_order_proposal(
         build_competition_aware_resource_allocation=(
             _build_competition_aware_resource_allocation
         ),
+        validate_contract=validate_contracts,
     )
-    resource_allocation_unpack = _apply_production_order_resource_allocation_unpack(
-        resource_allocation_application=resource_allocation_application,
-    )
-    resource_allocation = resource_allocation_unpack.resource_allocation
-    competition_raw_by_bundle = resource_allocation_unpack.competition_raw_by_bundle
-    competition_raw_bundle_stock = resource_allocation_unpack.competition_raw_bundle_stock
-    competition_raw_breakdown = resource_allocation_unpack.competition_raw_breakdown
-    available_bundles_for_cover = resource_allocation_unpack.available_bundles_for_cover
+    resource_allocation = resource_allocation_application.resource_allocation
+    competition_raw_by_bundle = resource_allocation_application.competition_raw_by_bundle
+    competition_raw_bundle_stock = resource_allocation_application.competition_raw_bundle_stock
+    competition_raw_breakdown = resource_allocation_application.competition_raw_breakdown
+    available_bundles_for_cover = resource_allocation_application.available_bundles_for_cover
+    competition_allocation_plan = resource_allocation_application.competition_allocation_plan
     reorder_point_days = settings.lead_time_days_total + settings.safety_stock_days
 
-    assorti_application = _apply_production_order_assorti_classification(
+    assorti_application = stages.run(
+        "assorti_classification",
+        _apply_production_order_assorti_classification,
         db=db,
         article_settings=article_settings,
         global_settings=global_settings,
@@ -887,19 +778,16 @@ def build_production_order_proposal(
         parse_assorti_bundle_type_ids=_parse_assorti_bundle_type_ids,
         load_assorti_bundle_type_flags=_load_assorti_bundle_type_flags,
     )
-    assorti_unpack = _apply_production_order_assorti_unpack(
-        assorti_application=assorti_application,
-    )
-    admin_assorti_bundle_type_ids = assorti_unpack.admin_assorti_bundle_type_ids
-    global_assorti_bundle_type_ids = assorti_unpack.global_assorti_bundle_type_ids
-    assorti_by_bundle_type = assorti_unpack.assorti_by_bundle_type
+    admin_assorti_bundle_type_ids = assorti_application.admin_assorti_bundle_type_ids
+    global_assorti_bundle_type_ids = assorti_application.global_assorti_bundle_type_ids
+    assorti_by_bundle_type = assorti_application.assorti_by_bundle_type
     assorti_classification_by_bundle_type = (
-        assorti_unpack.assorti_classification_by_bundle_type
+        assorti_application.assorti_classification_by_bundle_type
     )
-    assorti_bundle_type_count = assorti_unpack.assorti_bundle_type_count
-    main_bundle_type_count = assorti_unpack.main_bundle_type_count
+    assorti_bundle_type_count = assorti_application.assorti_bundle_type_count
+    main_bundle_type_count = assorti_application.main_bundle_type_count
     assorti_classification_source_breakdown = (
-        assorti_unpack.assorti_classification_source_breakdown
+        assorti_application.assorti_classification_source_breakdown
     )
 
     layer1_stock_health_metrics = _build_layer1_stock_health_metrics(
@@ -918,7 +806,9 @@ def build_production_order_proposal(
         margin_assorti_per_unit=economic_settings.margin_assorti_per_unit,
         unit_capital_per_unit=economic_settings.unit_capital_per_unit,
     )
-    layer2_allocation_application = _apply_production_order_layer2_allocation(
+    layer2_allocation_application = stages.run(
+        "layer2_allocation",
+        _apply_production_order_layer2_allocation,
         layer1_stock_health_metrics=layer1_stock_health_metrics,
         lead_time_days_total=settings.lead_time_days_total,
         margin_main_per_unit=economic_settings.margin_main_per_unit,
@@ -929,50 +819,56 @@ def build_production_order_proposal(
         overstock_penalty_weight=layer_proxy_settings.layer2_overstock_penalty_weight,
         build_layer2_allocation_decisions=_build_layer2_allocation_decisions,
     )
-    layer2_allocation_unpack = _apply_production_order_layer2_allocation_unpack(
-        layer2_allocation_application=layer2_allocation_application,
-    )
-    layer2_allocation_decisions = layer2_allocation_unpack.layer2_allocation_decisions
-    layer2_allocation_summary = layer2_allocation_unpack.layer2_allocation_summary
-    layer2_summary_application = _apply_production_order_layer2_summary(
+    layer2_allocation_decisions = layer2_allocation_application.layer2_allocation_decisions
+    layer2_allocation_summary = layer2_allocation_application.layer2_allocation_summary
+    layer2_summary_application = stages.run(
+        "layer2_summary",
+        _apply_production_order_layer2_summary,
         layer2_allocation_decisions=layer2_allocation_decisions,
         layer2_allocation_summary=layer2_allocation_summary,
-        build_layer2_contract_summary=_build_layer2_contract_summary,
+        build_layer2_contract_summary=_select_contract_summary_builder(
+            _build_layer2_contract_summary,
+            version=LAYER2_CONTRACT_VERSION,
+            validate=validate_contracts,
+        ),
         build_layer2_decision_quality_summary=_build_layer2_decision_quality_summary,
+        include_explanation_summaries=explanation_enabled,
     )
-    layer2_summary_unpack = _apply_production_order_layer2_summary_unpack(
-        layer2_summary_application=layer2_summary_application,
-    )
-    layer2_contract = layer2_summary_unpack.layer2_contract
-    layer2_decision_quality = layer2_summary_unpack.layer2_decision_quality
-    layer1_summary_application = _apply_production_order_layer1_summary(
+    layer2_contract = layer2_summary_application.layer2_contract
+    layer2_decision_quality = layer2_summary_application.layer2_decision_quality
+    layer1_summary_application = stages.run(
+        "layer1_summary",
+        _apply_production_order_layer1_summary,
         layer1_stock_health_metrics=layer1_stock_health_metrics,
         layer1_high_stockout_risk_threshold=LAYER1_HIGH_STOCKOUT_RISK_THRESHOLD,
-        build_layer1_contract_summary=_build_layer1_contract_summary,
-    )
-    layer1_summary_unpack = _apply_production_order_layer1_summary_unpack(
-        layer1_summary_application=layer1_summary_application,
+        build_layer1_contract_summary=_select_contract_summary_builder(
+            _build_layer1_contract_summary,
+            version=LAYER1_CONTRACT_VERSION,
+            validate=validate_contracts,
+        ),
+        include_explanation_summaries=explanation_enabled,
     )
-    layer1_avg_coverage_days = layer1_summary_unpack.layer1_avg_coverage_days
+    layer1_avg_coverage_days = layer1_summary_application.layer1_avg_coverage_days
     layer1_high_stockout_risk_count = (
-        layer1_summary_unpack.layer1_high_stockout_risk_count
+        layer1_summary_application.layer1_high_stockout_risk_count
     )
-    layer1_contract = layer1_summary_unpack.layer1_contract
+    layer1_contract = layer1_summary_application.layer1_contract
 
-    risk_application = _apply_production_order_risk_level(
+    risk_application = stages.run(
+        "risk_level",
+        _apply_production_order_risk_level,
         total_daily_sales=total_daily_sales,
         available_bundles_for_cover=available_bundles_for_cover,
         reorder_point_days=reorder_point_days,
         alert_threshold_days=settings.alert_threshold_days,
         target_coverage_days=settings.target_coverage_days,
     )
-    risk_unpack = _apply_production_order_risk_unpack(
-        risk_application=risk_application,
-    )
-    days_of_cover_estimate = risk_unpack.days_of_cover_estimate
-    risk_level = risk_unpack.risk_level
+    days_of_cover_estimate = risk_application.days_of_cover_estimate
+    risk_level = risk_application.risk_level
 
-    horizon_application = _apply_production_order_horizon(
+    horizon_application = stages.run(
+        "horizon",
+        _apply_production_order_horizon,
         risk_level=risk_level,
         allow_order_with_buffer=settings.allow_order_with_buffer,
         total_daily_sales=total_daily_sales,
@@ -984,15 +880,14 @@ def build_production_order_proposal(
         compute_economic_buffer_days=_compute_economic_buffer_days,
         ceil_to_int=_ceil_to_int,
     )
-    horizon_unpack = _apply_production_order_horizon_unpack(
-        horizon_application=horizon_application,
-    )
-    economic_buffer_days = horizon_unpack.economic_buffer_days
-    target_bundle_horizon_days = horizon_unpack.target_bundle_horizon_days
-    required_bundle_units = horizon_unpack.required_bundle_units
-    bundle_deficit_total = horizon_unpack.bundle_deficit_total
+    economic_buffer_days = horizon_application.economic_buffer_days
+    target_bundle_horizon_days = horizon_application.target_bundle_horizon_days
+    required_bundle_units = horizon_application.required_bundle_units
+    bundle_deficit_total = horizon_application.bundle_deficit_total
 
-    line_requirements_application = _apply_production_order_line_requirements(
+    line_requirements_application = stages.run(
+        "line_requirements",
+        _apply_production_order_line_requirements,
         bundle_deficit_total=bundle_deficit_total,
         bundle_type_ids=bundle_type_ids,
         all_recipe_color_ids=all_recipe_color_ids,
@@ -1003,30 +898,33 @@ def build_production_order_proposal(
         stock_by_color_size=stock_by_color_size,
         build_line_requirements_plan=_build_line_requirements_plan,
     )
-    line_requirements_unpack = _apply_production_order_line_requirements_unpack(
-        line_requirements_application=line_requirements_application,
-    )
-    color_probability = line_requirements_unpack.color_probability
-    line_required = line_requirements_unpack.line_required
-    line_qty = line_requirements_unpack.line_qty
+    color_probability = line_requirements_application.color_probability
+    line_required = line_requirements_application.line_required
+    line_qty = line_requirements_application.line_qty
 
-    layer3_application = _apply_production_order_layer3(
+    layer3_application = stages.run(
+        "layer3",
+        _apply_production_order_layer3,
         line_qty=line_qty,
         layer2_allocation_decisions=layer2_allocation_decisions,
         layer1_stock_health_metrics=layer1_stock_health_metrics,
         layer3_stockout_boost_max=layer_proxy_settings.layer3_stockout_boost_max,
         layer3_overstock_dampen_max=layer_proxy_settings.layer3_overstock_dampen_max,
         apply_layer3_purchase_shaping=_apply_layer3_purchase_shaping,
-        build_layer3_contract_summary=_build_layer3_contract_summary,
-    )
-    layer3_unpack = _apply_production_order_layer3_unpack(
-        layer3_application=layer3_application,
+        build_layer3_contract_summary=_select_contract_summary_builder(
+            _build_layer3_contract_summary,
+            version=LAYER3_CONTRACT_VERSION,
+            validate=validate_contracts,
+        ),
+        include_explanation_summaries=explanation_enabled,
     )
-    layer3_decision_by_line = layer3_unpack.layer3_decision_by_line
-    layer3_purchase_shaping = layer3_unpack.layer3_purchase_shaping
-    layer3_contract = layer3_unpack.layer3_contract
+    layer3_decision_by_line = layer3_application.layer3_decision_by_line
+    layer3_purchase_shaping = layer3_application.layer3_purchase_shaping
+    layer3_contract = layer3_application.layer3_contract
 
-    constraint_application = _apply_production_order_constraints(
+    constraint_application = stages.run(
+        "constraints",
+        _apply_production_order_constraints,
         db=db,
         article_id=request.article_id,
         resource_allocation=resource_allocation,
@@ -1043,56 +941,60 @@ def build_production_order_proposal(
         apply_shared_color_pool_fabric_min_batches=_apply_shared_color_pool_fabric_min_batches,
         apply_elastic_min_batch_uplift=_apply_elastic_min_batch_uplift,
     )
-    constraint_unpack = _apply_production_order_constraint_unpack(
-        constraint_application=constraint_application,
-    )
-    constraints_applied = constraint_unpack.constraints_applied
-    shared_color_pool = constraint_unpack.shared_color_pool
-    applicable_elastic_type_ids = constraint_unpack.applicable_elastic_type_ids
-    elastic_scope_line_keys = constraint_unpack.elastic_scope_line_keys
-    elastic_scope_mode = constraint_unpack.elastic_scope_mode
-    scoped_elastic_rows_count = constraint_unpack.scoped_elastic_rows_count
-    elastic_uplift_delta = constraint_unpack.elastic_uplift_delta
-    elastic_uplift_scope = constraint_unpack.elastic_uplift_scope
-    elastic_uplift_keys = constraint_unpack.elastic_uplift_keys
-    elastic_uplift_line_alloc = constraint_unpack.elastic_uplift_line_alloc
+    constraints_applied = constraint_application.constraints_applied
+    shared_color_pool = constraint_application.shared_color_pool
+    applicable_elastic_type_ids = constraint_application.applicable_elastic_type_ids
+    elastic_scope_line_keys = constraint_application.elastic_scope_line_keys
+    elastic_scope_mode = constraint_application.elastic_scope_mode
+    scoped_elastic_rows_count = constraint_application.scoped_elastic_rows_count
+    elastic_uplift_delta = constraint_application.elastic_uplift_delta
+    elastic_uplift_scope = constraint_application.elastic_uplift_scope
+    elastic_uplift_keys = constraint_application.elastic_uplift_keys
+    elastic_uplift_line_alloc = constraint_application.elastic_uplift_line_alloc
 
-    candidate_lines_application = _apply_production_order_candidate_lines(
+    candidate_lines_application = stages.run(
+        "candidate_lines",
+        _apply_production_order_candidate_lines,
         article_id=request.article_id,
         line_qty=line_qty,
         layer3_decision_by_line=layer3_decision_by_line,
         build_candidate_lines=_build_candidate_lines,
     )
-    candidate_lines_unpack = _apply_production_order_candidate_lines_unpack(
-        candidate_lines_application=candidate_lines_application,
-    )
-    candidate_lines = candidate_lines_unpack.candidate_lines
+    candidate_lines = candidate_lines_application.candidate_lines
 
-    capital_application = _apply_production_order_capital_constraints(
+    capital_application = stages.run(
+        "capital_constraints",
+        _apply_production_order_capital_constraints,
         candidate_lines=candidate_lines,
         layer3_decision_by_line=layer3_decision_by_line,
         layer1_stock_health_metrics=layer1_stock_health_metrics,
         margin_main_per_unit=economic_settings.margin_main_per_unit,
         margin_assorti_per_unit=economic_settings.margin_assorti_per_unit,
         unit_capital_per_unit=economic_settings.unit_capital_per_unit,
-        available_capital=economic_settings.available_capital,
+        # Portfolio runs rank the article's full need and apply the shared budget afterwards, so
+        # the per-article cut (and the action that follows from it) must not see any budget.
+        available_capital=economic_settings.available_capital if enforce_capital_limit else None,
         capital_cost_rate=layer_proxy_settings.layer2_capital_cost_rate,
         stockout_penalty_weight=layer_proxy_settings.layer2_stockout_penalty_weight,
         overstock_penalty_weight=layer_proxy_settings.layer2_overstock_penalty_weight,
         build_line_objective_capital_rankings=_build_line_objective_capital_rankings,
         apply_capital_constraint_to_candidate_lines=_apply_capital_constraint_to_candidate_lines,
-        build_capital_constraint_contract_summary=_build_capital_constraint_contract_summary,
-    )
-    capital_unpack_application = _apply_production_order_capital_unpack(
-        capital_application=capital_application,
+        build_capital_constraint_contract_summary=_select_contract_summary_builder(
+            _build_capital_constraint_contract_summary,
+            version=CAPITAL_CONSTRAINT_CONTRACT_VERSION,
+            validate=validate_contracts,
+        ),
+        include_explanation_summaries=explanation_enabled,
     )
-    candidate_lines = capital_unpack_application.candidate_lines
-    capital_rankings = capital_unpack_application.capital_rankings
-    capital_constraint_summary = capital_unpack_application.capital_constraint_summary
-    capital_constraint_contract = capital_unpack_application.capital_constraint_contract
-    candidate_total_units = capital_unpack_application.candidate_total_units
+    candidate_lines = capital_application.candidate_lines
+    capital_rankings = capital_application.capital_rankings
+    capital_constraint_summary = capital_application.capital_constraint_summary
+    capital_constraint_contract = capital_application.capital_constraint_contract
+    candidate_total_units = capital_application.candidate_total_units
 
-    layer4_application = _apply_production_order_layer4_analysis(
+    layer4_application = stages.run(
+        "layer4",
+        _apply_production_order_layer4_analysis,
         candidate_total_units=candidate_total_units,
         planning_horizon_days=request.planning_horizon_days,
         available_bundles_for_cover=available_bundles_for_cover,
@@ -1110,19 +1012,26 @@ def build_production_order_proposal(
         overstock_penalty_weight=layer_proxy_settings.layer2_overstock_penalty_weight,
         build_layer4_scenarios=_build_layer4_scenarios,
         build_capital_gap_summary=_build_capital_gap_summary,
-        build_layer4_contract_summary=_build_layer4_contract_summary,
+        build_layer4_contract_summary=_select_contract_summary_builder(
+            _build_layer4_contract_summary,
+            version=LAYER4_CONTRACT_VERSION,
+            validate=validate_contracts,
+        ),
         build_layer4_aggregate_deltas=_build_layer4_aggregate_deltas,
+        include_explanation_summaries=explanation_enabled,
+        scenario_grid_points=request.layer4_scenario_grid_points,
+        build_layer4_efficiency_frontier_summary=_build_layer4_efficiency_frontier_summary,
     )
-    layer4_unpack_application = _apply_production_order_layer4_unpack(
-        layer4_application=layer4_application,
-    )
-    expected_horizon_sales = layer4_unpack_application.expected_horizon_sales
-    layer4_scenarios = layer4_unpack_application.layer4_scenarios
-    capital_gap_summary = layer4_unpack_application.capital_gap_summary
-    layer4_contract = layer4_unpack_application.layer4_contract
-    layer4_aggregate_deltas = layer4_unpack_application.layer4_aggregate_deltas
+    expected_horizon_sales = layer4_application.expected_horizon_sales
+    layer4_scenarios = layer4_application.layer4_scenarios
+    capital_gap_summary = layer4_application.capital_gap_summary
+    layer4_contract = layer4_application.layer4_contract
+    layer4_aggregate_deltas = layer4_application.layer4_aggregate_deltas
+    layer4_efficiency_frontier = layer4_application.layer4_efficiency_frontier
 
-    layer5_application = _apply_production_order_layer5_analysis(
+    layer5_application = stages.run(
+        "layer5",
+        _apply_production_order_layer5_analysis,
         risk_level=risk_level,
         layer4_scenarios=layer4_scenarios,
         in_flight_effective_qty_total=in_flight_effective_qty_total,
@@ -1132,16 +1041,20 @@ def build_production_order_proposal(
         price_slowdown_lost_volume_rate=layer_proxy_settings.layer5_price_slowdown_lost_volume_rate,
         reduce_order_marginal_profit_rate=layer_proxy_settings.layer5_reduce_order_marginal_profit_rate,
         build_layer5_intervention_signals=_build_layer5_intervention_signals,
-        build_layer5_contract_summary=_build_layer5_contract_summary,
-    )
-    layer5_unpack_application = _apply_production_order_layer5_unpack(
-        layer5_application=layer5_application,
+        build_layer5_contract_summary=_select_contract_summary_builder(
+            _build_layer5_contract_summary,
+            version=LAYER5_CONTRACT_VERSION,
+            validate=validate_contracts,
+        ),
+        include_explanation_summaries=explanation_enabled,
     )
-    layer5_intervention = layer5_unpack_application.layer5_intervention
-    layer5_contract = layer5_unpack_application.layer5_contract
-    layer5_intervention_meta = layer5_unpack_application.layer5_intervention_meta
+    layer5_intervention = layer5_application.layer5_intervention
+    layer5_contract = layer5_application.layer5_contract
+    layer5_intervention_meta = layer5_application.layer5_intervention_meta
 
-    scope_recommendation = _apply_production_order_scope_and_recommendation(
+    scope_recommendation = stages.run(
+        "scope_recommendation",
+        _apply_production_order_scope_and_recommendation,
         bundle_stock_source=bundle_stock_source,
         in_flight_source=in_flight_source,
         size_weights_source=size_weights_source,
@@ -1164,222 +1077,230 @@ def build_production_order_proposal(
         estimate_raw_bundle_stock=_estimate_competition_aware_raw_bundle_stock,
         build_physical_scope_and_arrival_projection=build_physical_scope_and_arrival_projection,
         build_recommendation_and_alternatives=_build_recommendation_and_alternatives,
+        competition_allocation_plan=competition_allocation_plan,
     )
-    scope_recommendation_unpack = _apply_production_order_scope_recommendation_unpack(
-        scope_recommendation=scope_recommendation,
-    )
-    physical_scope = scope_recommendation_unpack.physical_scope
-    arrival_projection = scope_recommendation_unpack.arrival_projection
-    action = scope_recommendation_unpack.action
-    recommendation = scope_recommendation_unpack.recommendation
-    alternatives = scope_recommendation_unpack.alternatives
+    physical_scope = scope_recommendation.physical_scope
+    arrival_projection = scope_recommendation.arrival_projection
+    action = scope_recommendation.action
+    recommendation = scope_recommendation.recommendation
+    alternatives = scope_recommendation.alternatives
 
-    explanation_warning_application = _apply_production_order_explanation_warnings(
-        economics_warnings=economics_warnings,
-        article_id=request.article_id,
-        invalid_values_ignored=layer_proxy_settings.invalid_values_ignored,
-        threshold_order_adjusted=layer_proxy_settings.threshold_order_adjusted,
-        accelerate_threshold_effective=layer_proxy_settings.layer5_accelerate_production_risk_threshold,
-        unavoidable_threshold_effective=layer_proxy_settings.layer5_unavoidable_stockout_risk_threshold,
-        threshold_effective_source=layer_proxy_settings.source.get(
-            "layer5_accelerate_production_risk_threshold"
-        ),
-        arrival_projection_status=arrival_projection.status,
-        action=action,
-        capital_constraint_summary=capital_constraint_summary,
-        projected_shortage_before_arrival=arrival_projection.projected_shortage_before_arrival,
-        available_capital_effective=economic_settings.available_capital,
-        build_explanation_warnings=_build_explanation_warnings,
-        build_layer_proxy_invalid_values_ignored_warning=_build_layer_proxy_invalid_values_ignored_warning,
-        build_layer5_threshold_clamped_warning=_build_layer5_threshold_clamped_warning,
-        build_shortage_wait_blocked_by_capital_constraint_warning=(
-            _build_shortage_wait_blocked_by_capital_constraint_warning
-        ),
-    )
-    explanation_warning_unpack = _apply_production_order_explanation_warning_unpack(
-        explanation_warning_application=explanation_warning_application,
-    )
-    explanation_warnings = explanation_warning_unpack.explanation_warnings
+    if not explanation_enabled:
+        explanation = _build_none_explanation(
+            _build_production_order_explanation_summary(
+                risk_level=risk_level,
+                days_of_cover_estimate=days_of_cover_estimate,
+                reorder_point_days=reorder_point_days,
+                lead_time_days_total=settings.lead_time_days_total,
+                safety_stock_days=settings.safety_stock_days,
+            )
+        )
+        stages.mark("explanation")
+    else:
+        explanation_warning_application = stages.run(
+            "explanation_warnings",
+            _apply_production_order_explanation_warnings,
+            economics_warnings=economics_warnings,
+            article_id=request.article_id,
+            invalid_values_ignored=layer_proxy_settings.invalid_values_ignored,
+            threshold_order_adjusted=layer_proxy_settings.threshold_order_adjusted,
+            accelerate_threshold_effective=layer_proxy_settings.layer5_accelerate_production_risk_threshold,
+            unavoidable_threshold_effective=layer_proxy_settings.layer5_unavoidable_stockout_risk_threshold,
+            threshold_effective_source=layer_proxy_settings.source.get(
+                "layer5_accelerate_production_risk_threshold"
+            ),
+            arrival_projection_status=arrival_projection.status,
+            action=action,
+            capital_constraint_summary=capital_constraint_summary,
+            projected_shortage_before_arrival=arrival_projection.projected_shortage_before_arrival,
+            available_capital_effective=economic_settings.available_capital,
+            build_explanation_warnings=_build_explanation_warnings,
+            build_layer_proxy_invalid_values_ignored_warning=_build_layer_proxy_invalid_values_ignored_warning,
+            build_layer5_threshold_clamped_warning=_build_layer5_threshold_clamped_warning,
+            build_shortage_wait_blocked_by_capital_constraint_warning=(
+                _build_shortage_wait_blocked_by_capital_constraint_warning
+            ),
+        )
+        explanation_warnings = explanation_warning_application.explanation_warnings
 
-    alpha_proxy_application = _apply_production_order_alpha_proxy_economics(
-        layer4_scenario_factors=LAYER4_SCENARIO_FACTORS,
-        layer_proxy_value_source=LAYER_PROXY_VALUE_SOURCE,
-        economics_formula_version=ECONOMICS_FORMULA_VERSION,
-        economic_calibration_state=economic_settings.calibration_state,
-        economics_trust=economics_trust,
-        capital_governance=capital_governance,
-        layer1_high_stockout_risk_threshold=LAYER1_HIGH_STOCKOUT_RISK_THRESHOLD,
-        layer2_allocation_method=LAYER2_ALLOCATION_METHOD_CANONICAL,
-        layer2_allocation_method_canonical=LAYER2_ALLOCATION_METHOD_CANONICAL,
-        layer2_legacy_allocation_method=LAYER2_ALLOCATION_METHOD,
-        layer2_decision_gate=LAYER2_DECISION_GATE_CANONICAL,
-        layer2_decision_gate_canonical=LAYER2_DECISION_GATE_CANONICAL,
-        layer2_legacy_decision_gate=LAYER2_DECISION_GATE_LEGACY,
-        layer2_near_tie_objective_gap_threshold=LAYER2_NEAR_TIE_OBJECTIVE_GAP_THRESHOLD,
-        layer2_near_tie_profit_gap_threshold=LAYER2_NEAR_TIE_OBJECTIVE_GAP_THRESHOLD,
-        layer2_objective_parameters={
-            "capital_cost_rate": layer_proxy_settings.layer2_capital_cost_rate,
-            "stockout_penalty_weight": layer_proxy_settings.layer2_stockout_penalty_weight,
-            "overstock_penalty_weight": layer_proxy_settings.layer2_overstock_penalty_weight,
-        },
-        main_margin_proxy=economic_settings.margin_main_per_unit,
-        assorti_margin_proxy=economic_settings.margin_assorti_per_unit,
-        unit_capital_proxy=economic_settings.unit_capital_per_unit,
-        economic_inputs={
-            "production_cost_per_unit": economic_settings.production_cost_per_unit,
-            "logistics_cost_per_unit": economic_settings.logistics_cost_per_unit,
-            "wb_commission_percent_main": economic_settings.wb_commission_percent_main,
-            "wb_commission_percent_assorti": economic_settings.wb_commission_percent_assorti,
-            "average_realized_price_main": economic_settings.average_realized_price_main,
-            "average_realized_price_assorti": economic_settings.average_realized_price_assorti,
-            "available_capital": economic_settings.available_capital,
-        },
-        economic_source=economic_settings.source,
-        layer3_purchase_factors=LAYER3_PURCHASE_FACTOR_BY_DECISION,
-        layer3_calibration_method=LAYER3_CALIBRATION_METHOD,
-        layer3_stockout_boost_max=layer_proxy_settings.layer3_stockout_boost_max,
-        layer3_overstock_dampen_max=layer_proxy_settings.layer3_overstock_dampen_max,
-        layer3_stockout_weight_by_decision=LAYER3_STOCKOUT_WEIGHT_BY_DECISION,
-        layer3_overstock_weight_by_decision=LAYER3_OVERSTOCK_WEIGHT_BY_DECISION,
-        layer3_factor_bounds=LAYER3_FACTOR_BOUNDS,
-        layer_proxy_source=layer_proxy_settings.source,
-        layer5_threshold_order_adjusted=layer_proxy_settings.threshold_order_adjusted,
-        layer4_contract_version=LAYER4_CONTRACT_VERSION,
-        layer5_unavoidable_stockout_risk_threshold=layer_proxy_settings.layer5_unavoidable_stockout_risk_threshold,
-        layer5_accelerate_production_risk_threshold=layer_proxy_settings.layer5_accelerate_production_risk_threshold,
-        layer5_accelerate_action_cost_rate=layer_proxy_settings.layer5_accelerate_action_cost_rate,
-        layer5_price_slowdown_lost_volume_rate=layer_proxy_settings.layer5_price_slowdown_lost_volume_rate,
-        layer5_reduce_order_marginal_profit_rate=layer_proxy_settings.layer5_reduce_order_marginal_profit_rate,
-        build_layer2_legacy_alias_deprecation_plan=_build_layer2_legacy_alias_deprecation_plan,
-        build_alpha_proxy_economics_meta=_build_alpha_proxy_economics_meta,
-    )
-    alpha_proxy_unpack = _apply_production_order_alpha_proxy_unpack(
-        alpha_proxy_application=alpha_proxy_application,
-    )
-    layer4_scenario_factor_items = alpha_proxy_unpack.layer4_scenario_factor_items
-    alpha_proxy_economics = alpha_proxy_unpack.alpha_proxy_economics
+        alpha_proxy_application = stages.run(
+            "alpha_proxy_economics",
+            _apply_production_order_alpha_proxy_economics,
+            layer4_scenario_factors=LAYER4_SCENARIO_FACTORS,
+            layer_proxy_value_source=LAYER_PROXY_VALUE_SOURCE,
+            economics_formula_version=ECONOMICS_FORMULA_VERSION,
+            economic_calibration_state=economic_settings.calibration_state,
+            economics_trust=economics_trust,
+            capital_governance=capital_governance,
+            layer1_high_stockout_risk_threshold=LAYER1_HIGH_STOCKOUT_RISK_THRESHOLD,
+            layer2_allocation_method=LAYER2_ALLOCATION_METHOD_CANONICAL,
+            layer2_allocation_method_canonical=LAYER2_ALLOCATION_METHOD_CANONICAL,
+            layer2_legacy_allocation_method=LAYER2_ALLOCATION_METHOD,
+            layer2_decision_gate=LAYER2_DECISION_GATE_CANONICAL,
+            layer2_decision_gate_canonical=LAYER2_DECISION_GATE_CANONICAL,
+            layer2_legacy_decision_gate=LAYER2_DECISION_GATE_LEGACY,
+            layer2_near_tie_objective_gap_threshold=LAYER2_NEAR_TIE_OBJECTIVE_GAP_THRESHOLD,
+            layer2_near_tie_profit_gap_threshold=LAYER2_NEAR_TIE_OBJECTIVE_GAP_THRESHOLD,
+            layer2_objective_parameters={
+                "capital_cost_rate": layer_proxy_settings.layer2_capital_cost_rate,
+                "stockout_penalty_weight": layer_proxy_settings.layer2_stockout_penalty_weight,
+                "overstock_penalty_weight": layer_proxy_settings.layer2_overstock_penalty_weight,
+            },
+            main_margin_proxy=economic_settings.margin_main_per_unit,
+            assorti_margin_proxy=economic_settings.margin_assorti_per_unit,
+            unit_capital_proxy=economic_settings.unit_capital_per_unit,
+            economic_inputs={
+                "production_cost_per_unit": economic_settings.production_cost_per_unit,
+                "logistics_cost_per_unit": economic_settings.logistics_cost_per_unit,
+                "wb_commission_percent_main": economic_settings.wb_commission_percent_main,
+                "wb_commission_percent_assorti": economic_settings.wb_commission_percent_assorti,
+                "average_realized_price_main": economic_settings.average_realized_price_main,
+                "average_realized_price_assorti": economic_settings.average_realized_price_assorti,
+                "available_capital": economic_settings.available_capital,
+            },
+            economic_source=economic_settings.source,
+            layer3_purchase_factors=LAYER3_PURCHASE_FACTOR_BY_DECISION,
+            layer3_calibration_method=LAYER3_CALIBRATION_METHOD,
+            layer3_stockout_boost_max=layer_proxy_settings.layer3_stockout_boost_max,
+            layer3_overstock_dampen_max=layer_proxy_settings.layer3_overstock_dampen_max,
+            layer3_stockout_weight_by_decision=LAYER3_STOCKOUT_WEIGHT_BY_DECISION,
+            layer3_overstock_weight_by_decision=LAYER3_OVERSTOCK_WEIGHT_BY_DECISION,
+            layer3_factor_bounds=LAYER3_FACTOR_BOUNDS,
+            layer_proxy_source=layer_proxy_settings.source,
+            layer5_threshold_order_adjusted=layer_proxy_settings.threshold_order_adjusted,
+            layer4_contract_version=LAYER4_CONTRACT_VERSION,
+            layer5_unavoidable_stockout_risk_threshold=layer_proxy_settings.layer5_unavoidable_stockout_risk_threshold,
+            layer5_accelerate_production_risk_threshold=layer_proxy_settings.layer5_accelerate_production_risk_threshold,
+            layer5_accelerate_action_cost_rate=layer_proxy_settings.layer5_accelerate_action_cost_rate,
+            layer5_price_slowdown_lost_volume_rate=layer_proxy_settings.layer5_price_slowdown_lost_volume_rate,
+            layer5_reduce_order_marginal_profit_rate=layer_proxy_settings.layer5_reduce_order_marginal_profit_rate,
+            build_layer2_legacy_alias_deprecation_plan=_build_layer2_legacy_alias_deprecation_plan,
+            build_alpha_proxy_economics_meta=_build_alpha_proxy_economics_meta,
+        )
+        layer4_scenario_factor_items = alpha_proxy_application.layer4_scenario_factor_items
+        alpha_proxy_economics = alpha_proxy_application.alpha_proxy_economics
 
-    explanation_application = _apply_production_order_explanation(
-        risk_level=risk_level,
-        days_of_cover_estimate=days_of_cover_estimate,
-        reorder_point_days=reorder_point_days,
-        lead_time_days_total=settings.lead_time_days_total,
-        safety_stock_days=settings.safety_stock_days,
-        total_daily_sales=total_daily_sales,
-        planning_horizon_days=request.planning_horizon_days,
-        expected_horizon_sales=expected_horizon_sales,
-        ready_bundle_stock_total=ready_bundle_stock_total,
-        competition_raw_bundle_stock=competition_raw_bundle_stock,
-        competition_raw_breakdown=competition_raw_breakdown,
-        physical_scope=physical_scope,
-        resource_allocation=resource_allocation,
-        arrival_projection=arrival_projection,
-        shared_color_pool=shared_color_pool,
-        required_bundle_units=required_bundle_units,
-        available_bundles_for_cover=available_bundles_for_cover,
-        bundle_deficit_total=bundle_deficit_total,
-        allow_order_with_buffer=settings.allow_order_with_buffer,
-        economic_buffer_days=economic_buffer_days,
-        target_bundle_horizon_days=target_bundle_horizon_days,
-        size_weights_source=size_weights_source,
-        in_flight_source=in_flight_source,
-        bundle_stock_source=bundle_stock_source,
-        economics_trust=economics_trust,
-        capital_governance=capital_governance,
-        explanation_warnings=explanation_warnings,
-        assorti_classification_source=ASSORTI_CLASSIFICATION_SOURCE,
-        admin_assorti_bundle_type_ids=admin_assorti_bundle_type_ids,
-        global_assorti_bundle_type_ids=global_assorti_bundle_type_ids,
-        assorti_bundle_type_count=assorti_bundle_type_count,
-        main_bundle_type_count=main_bundle_type_count,
-        assorti_classification_source_breakdown=assorti_classification_source_breakdown,
-        assorti_classification_by_bundle_type=assorti_classification_by_bundle_type,
-        layer1_stock_health_metrics=layer1_stock_health_metrics,
-        layer1_avg_coverage_days=layer1_avg_coverage_days,
-        layer1_high_stockout_risk_count=layer1_high_stockout_risk_count,
-        layer1_high_stockout_risk_threshold=LAYER1_HIGH_STOCKOUT_RISK_THRESHOLD,
-        layer1_contract=layer1_contract,
-        layer2_allocation_method=LAYER2_ALLOCATION_METHOD_CANONICAL,
-        layer2_allocation_method_canonical=LAYER2_ALLOCATION_METHOD_CANONICAL,
-        layer2_legacy_allocation_method=LAYER2_ALLOCATION_METHOD,
-        layer2_allocation_decisions=layer2_allocation_decisions,
-        layer2_allocation_summary=layer2_allocation_summary,
-        layer2_contract=layer2_contract,
-        layer2_decision_quality=layer2_decision_quality,
-        layer2_decision_gate=LAYER2_DECISION_GATE_CANONICAL,
-        layer2_decision_gate_canonical=LAYER2_DECISION_GATE_CANONICAL,
-        layer2_legacy_decision_gate=LAYER2_DECISION_GATE_LEGACY,
-        layer2_objective_parameters={
-            "capital_cost_rate": layer_proxy_settings.layer2_capital_cost_rate,
-            "stockout_penalty_weight": layer_proxy_settings.layer2_stockout_penalty_weight,
-            "overstock_penalty_weight": layer_proxy_settings.layer2_overstock_penalty_weight,
-        },
-        layer2_objective_source={
-            "capital_cost_rate": layer_proxy_settings.source.get("layer2_capital_cost_rate"),
-            "stockout_penalty_weight": layer_proxy_settings.source.get(
-                "layer2_stockout_penalty_weight"
+        explanation_application = stages.run(
+            "explanation",
+            _apply_production_order_explanation,
+            risk_level=risk_level,
+            days_of_cover_estimate=days_of_cover_estimate,
+            reorder_point_days=reorder_point_days,
+            lead_time_days_total=settings.lead_time_days_total,
+            safety_stock_days=settings.safety_stock_days,
+            total_daily_sales=total_daily_sales,
+            planning_horizon_days=request.planning_horizon_days,
+            expected_horizon_sales=expected_horizon_sales,
+            ready_bundle_stock_total=ready_bundle_stock_total,
+            competition_raw_bundle_stock=competition_raw_bundle_stock,
+            competition_raw_breakdown=competition_raw_breakdown,
+            physical_scope=physical_scope,
+            resource_allocation=resource_allocation,
+            arrival_projection=arrival_projection,
+            shared_color_pool=shared_color_pool,
+            required_bundle_units=required_bundle_units,
+            available_bundles_for_cover=available_bundles_for_cover,
+            bundle_deficit_total=bundle_deficit_total,
+            allow_order_with_buffer=settings.allow_order_with_buffer,
+            economic_buffer_days=economic_buffer_days,
+            target_bundle_horizon_days=target_bundle_horizon_days,
+            size_weights_source=size_weights_source,
+            in_flight_source=in_flight_source,
+            bundle_stock_source=bundle_stock_source,
+            economics_trust=economics_trust,
+            capital_governance=capital_governance,
+            explanation_warnings=explanation_warnings,
+            assorti_classification_source=ASSORTI_CLASSIFICATION_SOURCE,
+            admin_assorti_bundle_type_ids=admin_assorti_bundle_type_ids,
+            global_assorti_bundle_type_ids=global_assorti_bundle_type_ids,
+            assorti_bundle_type_count=assorti_bundle_type_count,
+            main_bundle_type_count=main_bundle_type_count,
+            assorti_classification_source_breakdown=assorti_classification_source_breakdown,
+            assorti_classification_by_bundle_type=assorti_classification_by_bundle_type,
+            layer1_stock_health_metrics=layer1_stock_health_metrics,
+            layer1_avg_coverage_days=layer1_avg_coverage_days,
+            layer1_high_stockout_risk_count=layer1_high_stockout_risk_count,
+            layer1_high_stockout_risk_threshold=LAYER1_HIGH_STOCKOUT_RISK_THRESHOLD,
+            layer1_contract=layer1_contract,
+            layer2_allocation_method=LAYER2_ALLOCATION_METHOD_CANONICAL,
+            layer2_allocation_method_canonical=LAYER2_ALLOCATION_METHOD_CANONICAL,
+            layer2_legacy_allocation_method=LAYER2_ALLOCATION_METHOD,
+            layer2_allocation_decisions=layer2_allocation_decisions,
+            layer2_allocation_summary=layer2_allocation_summary,
+            layer2_contract=layer2_contract,
+            layer2_decision_quality=layer2_decision_quality,
+            layer2_decision_gate=LAYER2_DECISION_GATE_CANONICAL,
+            layer2_decision_gate_canonical=LAYER2_DECISION_GATE_CANONICAL,
+            layer2_legacy_decision_gate=LAYER2_DECISION_GATE_LEGACY,
+            layer2_objective_parameters={
+                "capital_cost_rate": layer_proxy_settings.layer2_capital_cost_rate,
+                "stockout_penalty_weight": layer_proxy_settings.layer2_stockout_penalty_weight,
+                "overstock_penalty_weight": layer_proxy_settings.layer2_overstock_penalty_weight,
+            },
+            layer2_objective_source={
+                "capital_cost_rate": layer_proxy_settings.source.get("layer2_capital_cost_rate"),
+                "stockout_penalty_weight": layer_proxy_settings.source.get(
+                    "layer2_stockout_penalty_weight"
+                ),
+                "overstock_penalty_weight": layer_proxy_settings.source.get(
+                    "layer2_overstock_penalty_weight"
+                ),
+            },
+            layer3_purchase_factors=LAYER3_PURCHASE_FACTOR_BY_DECISION,
+            layer3_contract=layer3_contract,
+            layer3_purchase_shaping=layer3_purchase_shaping,
+            layer4_scenario_factor_items=layer4_scenario_factor_items,
+            layer4_contract=layer4_contract,
+            layer4_aggregate_deltas=layer4_aggregate_deltas,
+            layer4_scenarios=layer4_scenarios,
+            layer5_intervention=layer5_intervention,
+            layer5_contract=layer5_contract,
+            layer5_intervention_meta=layer5_intervention_meta,
+            capital_gap_summary=capital_gap_summary,
+            capital_constraint_summary=capital_constraint_summary,
+            capital_constraint_contract=capital_constraint_contract,
+            alpha_proxy_economics=alpha_proxy_economics,
+            in_flight_raw_qty_total=in_flight_raw_qty_total,
+            in_flight_effective_qty_total=in_flight_effective_qty_total,
+            in_flight_effective_lines=in_flight_effective_lines,
+            elastic_scope_mode=elastic_scope_mode,
+            applicable_elastic_type_ids=applicable_elastic_type_ids,
+            scoped_elastic_rows_count=scoped_elastic_rows_count,
+            elastic_scope_line_count=len(elastic_scope_line_keys),
+            elastic_uplift_delta=elastic_uplift_delta,
+            elastic_uplift_scope=elastic_uplift_scope,
+            elastic_uplift_keys=elastic_uplift_keys,
+            elastic_uplift_line_alloc=elastic_uplift_line_alloc,
+            fabric_constraint_count=len(constraints_applied.fabric_min_batches),
+            elastic_constraint_count=len(constraints_applied.elastic_min_batches),
+            assorti_classification_admin_fallback_source=(
+                ASSORTI_CLASSIFICATION_ADMIN_FALLBACK_SOURCE
             ),
-            "overstock_penalty_weight": layer_proxy_settings.source.get(
-                "layer2_overstock_penalty_weight"
+            assorti_classification_global_fallback_source=(
+                ASSORTI_CLASSIFICATION_GLOBAL_FALLBACK_SOURCE
             ),
-        },
-        layer3_purchase_factors=LAYER3_PURCHASE_FACTOR_BY_DECISION,
-        layer3_contract=layer3_contract,
-        layer3_purchase_shaping=layer3_purchase_shaping,
-        layer4_scenario_factor_items=layer4_scenario_factor_items,
-        layer4_contract=layer4_contract,
-        layer4_aggregate_deltas=layer4_aggregate_deltas,
-        layer4_scenarios=layer4_scenarios,
-        layer5_intervention=layer5_intervention,
-        layer5_contract=layer5_contract,
-        layer5_intervention_meta=layer5_intervention_meta,
-        capital_gap_summary=capital_gap_summary,
-        capital_constraint_summary=capital_constraint_summary,
-        capital_constraint_contract=capital_constraint_contract,
-        alpha_proxy_economics=alpha_proxy_economics,
-        in_flight_raw_qty_total=in_flight_raw_qty_total,
-        in_flight_effective_qty_total=in_flight_effective_qty_total,
-        in_flight_effective_lines=in_flight_effective_lines,
-        elastic_scope_mode=elastic_scope_mode,
-        applicable_elastic_type_ids=applicable_elastic_type_ids,
-        scoped_elastic_rows_count=scoped_elastic_rows_count,
-        elastic_scope_line_count=len(elastic_scope_line_keys),
-        elastic_uplift_delta=elastic_uplift_delta,
-        elastic_uplift_scope=elastic_uplift_scope,
-        elastic_uplift_keys=elastic_uplift_keys,
-        elastic_uplift_line_alloc=elastic_uplift_line_alloc,
-        fabric_constraint_count=len(constraints_applied.fabric_min_batches),
-        elastic_constraint_count=len(constraints_applied.elastic_min_batches),
-        assorti_classification_admin_fallback_source=(
-            ASSORTI_CLASSIFICATION_ADMIN_FALLBACK_SOURCE
-        ),
-        assorti_classification_global_fallback_source=(
-            ASSORTI_CLASSIFICATION_GLOBAL_FALLBACK_SOURCE
-        ),
-        main_margin_proxy=economic_settings.margin_main_per_unit,
-        assorti_margin_proxy=economic_settings.margin_assorti_per_unit,
-        unit_capital_proxy=economic_settings.unit_capital_per_unit,
-        economic_buffer_enabled=settings.allow_order_with_buffer,
-        build_layer2_legacy_alias_deprecation_plan=_build_layer2_legacy_alias_deprecation_plan,
-        build_explanation_steps=_build_explanation_steps,
-        build_explanation_meta=_build_explanation_meta,
-    )
-    explanation_unpack = _apply_production_order_explanation_unpack(
-        explanation_application=explanation_application,
-    )
-    explanation = explanation_unpack.explanation
+            main_margin_proxy=economic_settings.margin_main_per_unit,
+            assorti_margin_proxy=economic_settings.margin_assorti_per_unit,
+            unit_capital_proxy=economic_settings.unit_capital_per_unit,
+            economic_buffer_enabled=settings.allow_order_with_buffer,
+            build_layer2_legacy_alias_deprecation_plan=_build_layer2_legacy_alias_deprecation_plan,
+            build_explanation_steps=_build_explanation_steps,
+            build_explanation_meta=_build_explanation_meta,
+        )
+        explanation = explanation_application.explanation
 
-    explainability_mode_application = _apply_production_order_explainability_mode(
-        explanation=explanation,
-        mode=request.explainability_mode,
-        apply_explainability_mode=_apply_explainability_mode,
-    )
-    explainability_mode_unpack = _apply_production_order_explainability_mode_unpack(
-        explainability_mode_application=explainability_mode_application,
-    )
-    explanation = explainability_mode_unpack.explanation
+        explainability_mode_application = stages.run(
+            "explainability_mode",
+            _apply_production_order_explainability_mode,
+            explanation=explanation,
+            mode=request.explainability_mode,
+            apply_explainability_mode=_apply_explainability_mode,
+        )
+        explanation = explainability_mode_application.explanation
 
-    response_application = _apply_production_order_response(
+    response_application = stages.run(
+        "response",
+        _apply_production_order_response,
         status="ok",
         article_id=request.article_id,
         generated_at=now,
@@ -1393,7 +1314,8 @@ def build_production_order_proposal(
         alternatives=alternatives,
         explanation=explanation,
     )
-    response_unpack = _apply_production_order_response_unpack(
-        response_application=response_application,
-    )
-    return response_unpack.response
+    response = response_application.response
+    if layer4_efficiency_frontier is not None:
+        # Requested explicitly, so it is attached after explainability-mode compaction.
+        response.explanation.meta[LAYER4_EFFICIENCY_FRONTIER_META_KEY] = layer4_efficiency_frontier
+    return stages.finish(response, enabled=request.debug_stage_timings)
@@ -4,7 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _AlphaProxyApplicationResult:
     layer4_scenario_factor_items: list[dict[str, object]]
     alpha_proxy_economics: dict[str, object]
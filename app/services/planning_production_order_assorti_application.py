@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from sqlalchemy.orm import Session
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _AssortiApplicationResult:
     admin_assorti_bundle_type_ids: set[int]
     global_assorti_bundle_type_ids: set[int]
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from app.schemas.planning_production_order import ProductionOrderRecommendationLine
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _CandidateLinesApplicationResult:
     candidate_lines: list[ProductionOrderRecommendationLine]
 
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
+
 from app.schemas.planning_production_order import ProductionOrderRecommendationLine
 from app.services.planning_production_order_economics import (
     ECONOMICS_DEFAULT_AVERAGE_REALIZED_PRICE_ASSORTI,
@@ -22,6 +26,12 @@ LAYER4_SCENARIO_FACTORS: tuple[tuple[str, float], ...] = (
     ("Balanced", 1.00),
     ("Aggressive", 1.20),
 )
+# Opt-in purchase-factor grid behind `explanation.meta.layer4_efficiency_frontier`; the fixed
+# scenarios above stay the decision surface.
+LAYER4_SCENARIO_GRID_FACTOR_MIN = 0.0
+LAYER4_SCENARIO_GRID_FACTOR_MAX = 2.0
+LAYER4_SCENARIO_GRID_MAX_POINTS = 1001
+LAYER4_EFFICIENCY_FRONTIER_META_KEY = "layer4_efficiency_frontier"
 CAPITAL_CONSTRAINT_CONTRACT_VERSION = "v1_alpha"
 
 
@@ -82,7 +92,45 @@ def _compute_objective_components(
     }
 
 
-def _build_layer4_scenarios(
+@dataclass(frozen=True, slots=True)
+class _Layer4ScenarioBasis:
+    """Scenario inputs that do not depend on the purchase factor, resolved once per proposal."""
+
+    base_purchase_units: int
+    available_bundles_for_cover: int
+    total_daily_sales: float
+    reorder_anchor: int
+    overstock_anchor: int
+    expected_horizon_sales: float
+    assorti_share: float
+    unit_capital: float
+    weighted_price: float
+    weighted_margin: float
+    capital_cost_rate: float
+    stockout_penalty_weight: float
+    overstock_penalty_weight: float
+
+
+@dataclass(frozen=True, slots=True)
+class _Layer4ScenarioGrid:
+    """Unrounded Layer 4 metrics for a grid of purchase factors, one list per metric."""
+
+    factors: list[float]
+    purchase_units: list[int]
+    total_capital_required: list[float]
+    projected_cover_days: list[float]
+    stockout_risk: list[float]
+    overstock_risk: list[float]
+    expected_turnover_proxy: list[float]
+    expected_revenue: list[float]
+    expected_gross_profit: list[float]
+    capital_cost_penalty: list[float]
+    stockout_penalty: list[float]
+    overstock_penalty: list[float]
+    objective_score: list[float]
+
+
+def _build_layer4_scenario_basis(
     *,
     base_purchase_units: int,
     available_bundles_for_cover: int,
@@ -98,7 +146,7 @@ def _build_layer4_scenarios(
     capital_cost_rate: float = LAYER2_CAPITAL_COST_RATE,
     stockout_penalty_weight: float = LAYER2_STOCKOUT_PENALTY_WEIGHT,
     overstock_penalty_weight: float = LAYER2_OVERSTOCK_PENALTY_WEIGHT,
-) -> list[dict[str, str | int | float]]:
+) -> _Layer4ScenarioBasis:
     decision_lines_total = max(
         int(layer3_purchase_shaping.get("main_lines", 0))
         + int(layer3_purchase_shaping.get("assorti_lines", 0))
@@ -112,74 +160,240 @@ def _build_layer4_scenarios(
         else 0.0
     )
 
-    scenarios: list[dict[str, str | int | float]] = []
     reorder_anchor = max(int(reorder_point_days), 1)
-    overstock_anchor = max(reorder_anchor * 2, 1)
-    unit_capital = max(float(unit_capital_per_unit), 0.0)
     margin_main = max(float(margin_main_per_unit), 0.0)
     margin_assorti = max(float(margin_assorti_per_unit), 0.0)
     price_main = max(float(average_realized_price_main), 0.0)
     price_assorti = max(float(average_realized_price_assorti), 0.0)
-    capital_cost_rate_value = max(float(capital_cost_rate), 0.0)
-    stockout_penalty_weight_value = max(float(stockout_penalty_weight), 0.0)
-    overstock_penalty_weight_value = max(float(overstock_penalty_weight), 0.0)
-
-    for scenario_name, factor in LAYER4_SCENARIO_FACTORS:
-        purchase_units = max(_ceil_to_int(float(base_purchase_units) * factor), 0)
-        total_capital_required = round(float(purchase_units) * unit_capital, 2)
-
-        projected_units = max(int(available_bundles_for_cover) + purchase_units, 0)
-        if total_daily_sales > 0:
-            projected_cover_days = float(projected_units) / float(total_daily_sales)
-            stockout_risk_proxy = max(
-                0.0,
-                min(
-                    (float(reorder_anchor) - projected_cover_days) / float(reorder_anchor),
-                    1.0,
-                ),
-            )
-            overstock_risk_proxy = max(
-                0.0,
-                min(
-                    (projected_cover_days - float(overstock_anchor)) / float(overstock_anchor),
-                    1.0,
-                ),
-            )
-            expected_turnover_proxy = float(expected_horizon_sales) / float(max(projected_units, 1))
-        else:
-            projected_cover_days = 9999.0
-            stockout_risk_proxy = 0.0
-            overstock_risk_proxy = 0.0
-            expected_turnover_proxy = 0.0
-
-        weighted_price = (price_main * (1.0 - assorti_share)) + (price_assorti * assorti_share)
-        weighted_margin = (margin_main * (1.0 - assorti_share)) + (margin_assorti * assorti_share)
-        expected_sellable_units = min(float(projected_units), float(max(expected_horizon_sales, 0.0)))
-        expected_revenue = expected_sellable_units * weighted_price
-        expected_gross_profit = expected_sellable_units * weighted_margin
+    return _Layer4ScenarioBasis(
+        base_purchase_units=int(base_purchase_units),
+        available_bundles_for_cover=int(available_bundles_for_cover),
+        total_daily_sales=total_daily_sales,
+        reorder_anchor=reorder_anchor,
+        overstock_anchor=max(reorder_anchor * 2, 1),
+        expected_horizon_sales=expected_horizon_sales,
+        assorti_share=assorti_share,
+        unit_capital=max(float(unit_capital_per_unit), 0.0),
+        weighted_price=(price_main * (1.0 - assorti_share)) + (price_assorti * assorti_share),
+        weighted_margin=(margin_main * (1.0 - assorti_share)) + (margin_assorti * assorti_share),
+        capital_cost_rate=max(float(capital_cost_rate), 0.0),
+        stockout_penalty_weight=max(float(stockout_penalty_weight), 0.0),
+        overstock_penalty_weight=max(float(overstock_penalty_weight), 0.0),
+    )
+
+
+def _evaluate_layer4_scenario_grid(
+    basis: _Layer4ScenarioBasis,
+    factors: Sequence[float],
+) -> _Layer4ScenarioGrid:
+    """Evaluate every purchase factor column by column.
+
+    Factor-independent terms live on `basis`, so each metric is one pass over the grid with no
+    per-scenario dict or helper call. For the fixed scenario factors this reproduces the values
+    `_compute_objective_components` yields for the same inputs.
+    """
+
+    grid_factors = [float(factor) for factor in factors]
+    base_units = float(basis.base_purchase_units)
+    purchase_units = [max(_ceil_to_int(base_units * factor), 0) for factor in grid_factors]
+    unit_capital = basis.unit_capital
+    total_capital_required = [round(float(units) * unit_capital, 2) for units in purchase_units]
+    projected_units = [max(basis.available_bundles_for_cover + units, 0) for units in purchase_units]
+
+    expected_horizon_sales = basis.expected_horizon_sales
+    if basis.total_daily_sales > 0:
+        daily_sales = float(basis.total_daily_sales)
+        reorder_anchor = float(basis.reorder_anchor)
+        overstock_anchor = float(basis.overstock_anchor)
+        projected_cover_days = [float(units) / daily_sales for units in projected_units]
+        stockout_risk = [
+            max(0.0, min((reorder_anchor - cover_days) / reorder_anchor, 1.0))
+            for cover_days in projected_cover_days
+        ]
+        overstock_risk = [
+            max(0.0, min((cover_days - overstock_anchor) / overstock_anchor, 1.0))
+            for cover_days in projected_cover_days
+        ]
+        expected_turnover_proxy = [
+            float(expected_horizon_sales) / float(max(units, 1)) for units in projected_units
+        ]
+    else:
+        projected_cover_days = [9999.0] * len(grid_factors)
+        stockout_risk = [0.0] * len(grid_factors)
+        overstock_risk = [0.0] * len(grid_factors)
+        expected_turnover_proxy = [0.0] * len(grid_factors)
+
+    sellable_cap = float(max(expected_horizon_sales, 0.0))
+    sellable_units = [min(float(units), sellable_cap) for units in projected_units]
+    expected_revenue = [units * basis.weighted_price for units in sellable_units]
+    expected_gross_profit = [units * basis.weighted_margin for units in sellable_units]
+
+    # Same terms as `_compute_objective_components` with horizon_factor=1.0: the stockout loss is
+    # the expected gross profit and the carrying cost is the locked capital.
+    capital_cost_penalty = [capital * basis.capital_cost_rate * 1.0 for capital in total_capital_required]
+    stockout_penalty = [
+        risk * profit * basis.stockout_penalty_weight
+        for risk, profit in zip(stockout_risk, expected_gross_profit)
+    ]
+    overstock_penalty = [
+        risk * capital * basis.overstock_penalty_weight
+        for risk, capital in zip(overstock_risk, total_capital_required)
+    ]
+    objective_score = [
+        profit - capital_penalty - stockout_loss - overstock_loss
+        for profit, capital_penalty, stockout_loss, overstock_loss in zip(
+            expected_gross_profit, capital_cost_penalty, stockout_penalty, overstock_penalty
+        )
+    ]
+    return _Layer4ScenarioGrid(
+        factors=grid_factors,
+        purchase_units=purchase_units,
+        total_capital_required=total_capital_required,
+        projected_cover_days=projected_cover_days,
+        stockout_risk=stockout_risk,
+        overstock_risk=overstock_risk,
+        expected_turnover_proxy=expected_turnover_proxy,
+        expected_revenue=expected_revenue,
+        expected_gross_profit=expected_gross_profit,
+        capital_cost_penalty=capital_cost_penalty,
+        stockout_penalty=stockout_penalty,
+        overstock_penalty=overstock_penalty,
+        objective_score=objective_score,
+    )
+
+
+def _build_layer4_scenario_grid_factors(
+    grid_points: int,
+    *,
+    factor_min: float = LAYER4_SCENARIO_GRID_FACTOR_MIN,
+    factor_max: float = LAYER4_SCENARIO_GRID_FACTOR_MAX,
+) -> list[float]:
+    if grid_points <= 0:
+        return []
+    if grid_points == 1:
+        return [1.0]
+    step = (factor_max - factor_min) / float(grid_points - 1)
+    return [factor_min + step * index for index in range(grid_points)]
+
+
+def _build_layer4_efficiency_frontier(grid: _Layer4ScenarioGrid) -> list[dict[str, int | float]]:
+    """Grid points not dominated on (capital, stockout risk, overstock risk), cheapest first.
+
+    Points are swept in ascending capital order against a staircase of accepted
+    (stockout, overstock) pairs, so the frontier costs O(n log n) rather than pairwise checks.
+    Grid points that round to the same purchase units collapse onto the smallest factor.
+    """
+
+    order = sorted(
+        range(len(grid.factors)),
+        key=lambda index: (
+            grid.total_capital_required[index],
+            grid.stockout_risk[index],
+            grid.overstock_risk[index],
+            grid.factors[index],
+        ),
+    )
+    staircase_stockout: list[float] = []
+    staircase_overstock: list[float] = []
+    frontier: list[dict[str, int | float]] = []
+    for index in order:
+        stockout = grid.stockout_risk[index]
+        overstock = grid.overstock_risk[index]
+        # Accepted pairs are sorted by stockout with strictly falling overstock, so the last one
+        # at or below this stockout has the lowest overstock any cheaper point reached.
+        position = bisect_right(staircase_stockout, stockout)
+        if position > 0 and staircase_overstock[position - 1] <= overstock:
+            continue
+
+        end = position
+        while end < len(staircase_stockout) and staircase_overstock[end] >= overstock:
+            end += 1
+        staircase_stockout[position:end] = [stockout]
+        staircase_overstock[position:end] = [overstock]
+        frontier.append(
+            {
+                "purchase_factor": round(grid.factors[index], 4),
+                "purchase_units": int(grid.purchase_units[index]),
+                "total_capital_required": grid.total_capital_required[index],
+                "stockout_risk_proxy": round(stockout, 4),
+                "overstock_risk_proxy": round(overstock, 4),
+                "expected_gross_profit": round(grid.expected_gross_profit[index], 2),
+                "objective_score": round(grid.objective_score[index], 2),
+                "projected_cover_days": round(grid.projected_cover_days[index], 2),
+            }
+        )
+    return frontier
+
+
+def _build_layer4_efficiency_frontier_summary(
+    *,
+    grid_points: int,
+    **scenario_inputs: object,
+) -> dict[str, object]:
+    factors = _build_layer4_scenario_grid_factors(grid_points)
+    grid = _evaluate_layer4_scenario_grid(_build_layer4_scenario_basis(**scenario_inputs), factors)
+    frontier = _build_layer4_efficiency_frontier(grid)
+    return {
+        "factor_min": LAYER4_SCENARIO_GRID_FACTOR_MIN if grid_points > 1 else 1.0,
+        "factor_max": LAYER4_SCENARIO_GRID_FACTOR_MAX if grid_points > 1 else 1.0,
+        "grid_points": len(factors),
+        "frontier_points": len(frontier),
+        "frontier": frontier,
+    }
+
+
+def _build_layer4_scenarios(
+    *,
+    base_purchase_units: int,
+    available_bundles_for_cover: int,
+    total_daily_sales: float,
+    reorder_point_days: int,
+    expected_horizon_sales: float,
+    layer3_purchase_shaping: dict[str, int],
+    unit_capital_per_unit: float,
+    margin_main_per_unit: float,
+    margin_assorti_per_unit: float,
+    average_realized_price_main: float = ECONOMICS_DEFAULT_AVERAGE_REALIZED_PRICE_MAIN,
+    average_realized_price_assorti: float = ECONOMICS_DEFAULT_AVERAGE_REALIZED_PRICE_ASSORTI,
+    capital_cost_rate: float = LAYER2_CAPITAL_COST_RATE,
+    stockout_penalty_weight: float = LAYER2_STOCKOUT_PENALTY_WEIGHT,
+    overstock_penalty_weight: float = LAYER2_OVERSTOCK_PENALTY_WEIGHT,
+) -> list[dict[str, str | int | float]]:
+    basis = _build_layer4_scenario_basis(
+        base_purchase_units=base_purchase_units,
+        available_bundles_for_cover=available_bundles_for_cover,
+        total_daily_sales=total_daily_sales,
+        reorder_point_days=reorder_point_days,
+        expected_horizon_sales=expected_horizon_sales,
+        layer3_purchase_shaping=layer3_purchase_shaping,
+        unit_capital_per_unit=unit_capital_per_unit,
+        margin_main_per_unit=margin_main_per_unit,
+        margin_assorti_per_unit=margin_assorti_per_unit,
+        average_realized_price_main=average_realized_price_main,
+        average_realized_price_assorti=average_realized_price_assorti,
+        capital_cost_rate=capital_cost_rate,
+        stockout_penalty_weight=stockout_penalty_weight,
+        overstock_penalty_weight=overstock_penalty_weight,
+    )
+    grid = _evaluate_layer4_scenario_grid(basis, [factor for _name, factor in LAYER4_SCENARIO_FACTORS])
+    assorti_share = basis.assorti_share
+
+    scenarios: list[dict[str, str | int | float]] = []
+    for index, (scenario_name, factor) in enumerate(LAYER4_SCENARIO_FACTORS):
+        total_capital_required = grid.total_capital_required[index]
+        expected_revenue = grid.expected_revenue[index]
+        expected_gross_profit = grid.expected_gross_profit[index]
+        stockout_risk_proxy = grid.stockout_risk[index]
+        overstock_risk_proxy = grid.overstock_risk[index]
         expected_margin_percent = (
             (expected_gross_profit / expected_revenue) * 100.0
             if expected_revenue > 0
             else 0.0
         )
-        expected_turnover_days = projected_cover_days
-
-        objective_components = _compute_objective_components(
-            expected_gross_profit=expected_gross_profit,
-            capital_locked=total_capital_required,
-            stockout_risk=stockout_risk_proxy,
-            overstock_risk=overstock_risk_proxy,
-            expected_lost_margin_if_stockout=expected_gross_profit,
-            inventory_carrying_cost=total_capital_required,
-            capital_cost_rate=capital_cost_rate_value,
-            stockout_penalty_weight=stockout_penalty_weight_value,
-            overstock_penalty_weight=overstock_penalty_weight_value,
-            horizon_factor=1.0,
-        )
         risk_adjusted_profit = (
             expected_gross_profit
-            - objective_components["stockout_penalty"]
-            - objective_components["overstock_penalty"]
+            - grid.stockout_penalty[index]
+            - grid.overstock_penalty[index]
         )
         capital_efficiency_metric = (
             expected_gross_profit / total_capital_required
@@ -201,28 +415,28 @@ def _build_layer4_scenarios(
         scenarios.append(
             {
                 "scenario": scenario_name,
-                "purchase_units": int(purchase_units),
+                "purchase_units": int(grid.purchase_units[index]),
                 "total_capital_required": total_capital_required,
                 "expected_revenue": round(expected_revenue, 2),
                 "expected_gross_profit": round(expected_gross_profit, 2),
                 "expected_margin_percent": round(expected_margin_percent, 2),
-                "expected_turnover_days": round(expected_turnover_days, 2),
-                "expected_turnover_proxy": round(expected_turnover_proxy, 4),
+                "expected_turnover_days": round(grid.projected_cover_days[index], 2),
+                "expected_turnover_proxy": round(grid.expected_turnover_proxy[index], 4),
                 "stockout_probability_proxy": round(stockout_risk_proxy, 4),
                 "stockout_risk_proxy": round(stockout_risk_proxy, 4),
                 "overstock_risk_proxy": round(overstock_risk_proxy, 4),
-                "capital_cost_penalty": round(objective_components["capital_cost_penalty"], 2),
-                "stockout_penalty": round(objective_components["stockout_penalty"], 2),
-                "overstock_penalty": round(objective_components["overstock_penalty"], 2),
+                "capital_cost_penalty": round(grid.capital_cost_penalty[index], 2),
+                "stockout_penalty": round(grid.stockout_penalty[index], 2),
+                "overstock_penalty": round(grid.overstock_penalty[index], 2),
                 "risk_adjusted_profit": round(risk_adjusted_profit, 2),
                 "capital_efficiency_metric": round(capital_efficiency_metric, 6),
-                "objective_score": round(objective_components["objective_score"], 2),
+                "objective_score": round(grid.objective_score[index], 2),
                 "capital_delta_vs_balanced": 0.0,
                 "expected_revenue_delta_vs_balanced": 0.0,
                 "expected_gross_profit_delta_vs_balanced": 0.0,
                 "gross_profit_delta_vs_balanced": 0.0,
                 "objective_score_delta_vs_balanced": 0.0,
-                "projected_cover_days": round(projected_cover_days, 2),
+                "projected_cover_days": round(grid.projected_cover_days[index], 2),
                 "assorti_sustainability_proxy": assorti_sustainability_proxy,
                 "assorti_sustainability_impact": assorti_sustainability_impact,
             }
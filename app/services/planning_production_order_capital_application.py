@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from app.schemas.planning_production_order import ProductionOrderRecommendationLine
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _CapitalApplicationResult:
     candidate_lines: list[ProductionOrderRecommendationLine]
     capital_rankings: list[dict[str, int | float | str]]
@@ -30,6 +30,7 @@ def _apply_production_order_capital_constraints(
     build_line_objective_capital_rankings: Callable[..., list[dict[str, int | float | str]]],
     apply_capital_constraint_to_candidate_lines: Callable[..., tuple[list[ProductionOrderRecommendationLine], dict[str, object]]],
     build_capital_constraint_contract_summary: Callable[..., dict[str, str | dict[str, bool]]],
+    include_explanation_summaries: bool = True,
 ) -> _CapitalApplicationResult:
     capital_rankings = build_line_objective_capital_rankings(
         candidate_lines=candidate_lines,
@@ -48,13 +49,15 @@ def _apply_production_order_capital_constraints(
         available_capital=available_capital,
         unit_capital_per_unit=unit_capital_per_unit,
     )
-    capital_constraint_contract = build_capital_constraint_contract_summary(
-        capital_constraint_summary,
-    )
-    capital_constraint_summary = {
-        **capital_constraint_summary,
-        "contract": capital_constraint_contract,
-    }
+    capital_constraint_contract: dict[str, str | dict[str, bool]] = {}
+    if include_explanation_summaries:
+        capital_constraint_contract = build_capital_constraint_contract_summary(
+            capital_constraint_summary,
+        )
+        capital_constraint_summary = {
+            **capital_constraint_summary,
+            "contract": capital_constraint_contract,
+        }
     candidate_total_units = sum(line.recommended_qty for line in candidate_lines)
 
     return _CapitalApplicationResult(
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from app.services.planning_production_order_grid import _as_color_size_grid
+from app.services.planning_production_order_math import _allocate_units_batch, _normalize_weights
+
+# Ownership: this module owns the competition-aware split of shared color stock between the
+# bundle types whose recipes consume that color. Raw bundle stock estimates and the resource
+# allocation reservation breakdown are both derived from `_run_competition_allocation`.
+
+
+@dataclass(frozen=True)
+class _CompetitionAllocationPlan:
+    bundle_type_ids: list[int]
+    recipe_colors_by_bundle: dict[int, set[int]]
+    all_recipe_color_ids: list[int]
+    size_ids: list[int]
+    consumers_by_color: dict[int, list[int]]
+    consumer_weights_by_color: dict[int, dict[int, float]]
+
+
+@dataclass(frozen=True)
+class _CompetitionAllocationPass:
+    reserved_by_color_size: dict[tuple[int, int], dict[int, int]]
+    bundle_units: dict[int, int]
+
+
+def _build_competition_allocation_plan(
+    *,
+    bundle_type_ids: list[int],
+    recipe_colors_by_bundle: dict[int, set[int]],
+    all_recipe_color_ids: list[int],
+    size_ids: list[int],
+    shares_by_bundle: dict[int, float],
+) -> _CompetitionAllocationPlan:
+    consumers_by_color: dict[int, list[int]] = {
+        int(color_id): [
+            int(bundle_type_id)
+            for bundle_type_id in bundle_type_ids
+            if color_id in recipe_colors_by_bundle.get(bundle_type_id, set())
+        ]
+        for color_id in all_recipe_color_ids
+    }
+    # Demand shares do not depend on size, so each shared color is normalized once per proposal
+    # instead of once per (color, size) key and stock source.
+    consumer_weights_by_color: dict[int, dict[int, float]] = {
+        color_id: _normalize_weights(
+            consumers,
+            {bundle_type_id: shares_by_bundle.get(bundle_type_id, 0.0) for bundle_type_id in consumers},
+        )
+        for color_id, consumers in consumers_by_color.items()
+        if len(consumers) > 1
+    }
+    return _CompetitionAllocationPlan(
+        bundle_type_ids=[int(bundle_type_id) for bundle_type_id in bundle_type_ids],
+        recipe_colors_by_bundle=recipe_colors_by_bundle,
+        all_recipe_color_ids=[int(color_id) for color_id in all_recipe_color_ids],
+        size_ids=[int(size_id) for size_id in size_ids],
+        consumers_by_color=consumers_by_color,
+        consumer_weights_by_color=consumer_weights_by_color,
+    )
+
+
+def _run_competition_allocation(
+    plan: _CompetitionAllocationPlan,
+    stock_by_color_size: Mapping[tuple[int, int], int],
+) -> _CompetitionAllocationPass:
+    stock_rows = _as_color_size_grid(
+        stock_by_color_size,
+        color_ids=plan.all_recipe_color_ids,
+        size_ids=plan.size_ids,
+    ).rows()
+    stock_qty_by_key: dict[tuple[int, int], int] = {}
+    for size_ordinal, size_id in enumerate(plan.size_ids):
+        for color_id, stock_row in zip(plan.all_recipe_color_ids, stock_rows):
+            stock_qty = stock_row[size_ordinal]
+            if stock_qty > 0 and plan.consumers_by_color.get(color_id):
+                stock_qty_by_key[(color_id, size_id)] = stock_qty
+
+    # Every shared (color, size) key is split in one kernel call; keys of the same color reuse
+    # that color's prepared weight vector.
+    shared_keys = [key for key in stock_qty_by_key if key[0] in plan.consumer_weights_by_color]
+    shared_allocations = _allocate_units_batch(
+        [stock_qty_by_key[key] for key in shared_keys],
+        [plan.consumer_weights_by_color[color_id] for color_id, _size_id in shared_keys],
+    )
+    shared_splits = dict(zip(shared_keys, shared_allocations))
+
+    reserved_by_color_size: dict[tuple[int, int], dict[int, int]] = {}
+    reserved_by_key: dict[tuple[int, int, int], int] = {}
+    for (color_id, size_id), stock_qty in stock_qty_by_key.items():
+        consumers = plan.consumers_by_color[color_id]
+        if len(consumers) == 1:
+            split = {consumers[0]: stock_qty}
+        else:
+            allocated = shared_splits[(color_id, size_id)]
+            split = {
+                bundle_type_id: allocated[bundle_type_id]
+                for bundle_type_id in consumers
+                if allocated.get(bundle_type_id, 0) > 0
+            }
+        reserved_by_color_size[(color_id, size_id)] = split
+        for bundle_type_id, reserved_qty in split.items():
+            reserved_by_key[(color_id, size_id, bundle_type_id)] = reserved_qty
+
+    bundle_units: dict[int, int] = {bundle_type_id: 0 for bundle_type_id in plan.bundle_type_ids}
+    for size_id in plan.size_ids:
+        for bundle_type_id in plan.bundle_type_ids:
+            recipe_colors = plan.recipe_colors_by_bundle.get(bundle_type_id, set())
+            if not recipe_colors:
+                continue
+
+            color_quantities = [
+                reserved_by_key.get((int(color_id), size_id, bundle_type_id), 0) for color_id in recipe_colors
+            ]
+            if any(quantity <= 0 for quantity in color_quantities):
+                continue
+            bundle_units[bundle_type_id] += min(color_quantities)
+
+    return _CompetitionAllocationPass(
+        reserved_by_color_size=reserved_by_color_size,
+        bundle_units=bundle_units,
+    )
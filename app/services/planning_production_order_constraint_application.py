@@ -16,7 +16,7 @@ from app.models.models import (
 from app.schemas.planning_production_order import ProductionOrderConstraintsApplied
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ConstraintApplicationResult:
     constraints_applied: ProductionOrderConstraintsApplied
     shared_color_pool: dict[str, object]
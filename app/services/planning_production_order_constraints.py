@@ -1,26 +1,27 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, datetime, timezone
 
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.models.models import (
-    Article,
-    ArticlePlanningSettings,
-    ArticleWbMapping,
-    Color,
-    SkuUnit,
-    WbSalesDaily,
-)
 from app.schemas.planning_production_order import (
     FabricConstraintApplied,
     ProductionOrderResourceAllocationApplied,
     ResourceAllocationBundleReservation,
     ResourceAllocationReservation,
 )
+from app.services.planning_production_order_competition import (
+    _build_competition_allocation_plan,
+    _CompetitionAllocationPlan,
+    _run_competition_allocation,
+)
+from app.services.planning_production_order_contract_validation import _build_skipped_contract_summary
+from app.services.planning_production_order_grid import _as_color_size_grid
+from app.services.planning_production_order_math import _add_units_for_color, _allocate_units
+from app.services.planning_production_order_shared_color_pool_index import SHARED_COLOR_POOL_INDEX_CACHE
 
 RESOURCE_ALLOCATION_CONTRACT_VERSION = "v1_alpha"
 SHARED_COLOR_POOL_SOURCE = "wb_sales_article_proxy"
@@ -34,63 +35,6 @@ def _ceil_to_int(value: float) -> int:
     return as_int
 
 
-def _normalize_weights(size_ids: list[int], raw_weights: dict[int, float]) -> dict[int, float]:
-    if not size_ids:
-        return {}
-
-    weights: dict[int, float] = {}
-    for size_id in size_ids:
-        weight = raw_weights.get(size_id)
-        if weight is not None and weight > 0:
-            weights[size_id] = float(weight)
-
-    if not weights:
-        uniform = 1.0 / len(size_ids)
-        return {size_id: uniform for size_id in size_ids}
-
-    total = sum(weights.values())
-    if total <= 0:
-        uniform = 1.0 / len(size_ids)
-        return {size_id: uniform for size_id in size_ids}
-
-    normalized = {size_id: weight / total for size_id, weight in weights.items()}
-
-    for size_id in size_ids:
-        normalized.setdefault(size_id, 0.0)
-
-    norm_total = sum(normalized.values())
-    if norm_total <= 0:
-        uniform = 1.0 / len(size_ids)
-        return {size_id: uniform for size_id in size_ids}
-
-    return {size_id: normalized[size_id] / norm_total for size_id in size_ids}
-
-
-def _allocate_units(total_units: int, weights: dict[int, float]) -> dict[int, int]:
-    if total_units <= 0 or not weights:
-        return {key: 0 for key in weights}
-
-    keys = sorted(weights.keys())
-    raw_values: dict[int, float] = {
-        key: float(total_units) * max(weights.get(key, 0.0), 0.0) for key in keys
-    }
-
-    allocated: dict[int, int] = {key: int(raw_values[key]) for key in keys}
-    assigned = sum(allocated.values())
-    remainder = max(total_units - assigned, 0)
-
-    if remainder > 0:
-        remainders = sorted(
-            keys,
-            key=lambda key: (raw_values[key] - allocated[key], -key),
-            reverse=True,
-        )
-        for index in range(remainder):
-            allocated[remainders[index % len(remainders)]] += 1
-
-    return allocated
-
-
 def _build_resource_allocation_contract_summary(
     resource_allocation: ProductionOrderResourceAllocationApplied | dict[str, object],
 ) -> dict[str, object]:
@@ -148,31 +92,37 @@ def _build_competition_aware_resource_allocation(
     recipe_colors_by_bundle: dict[int, set[int]],
     all_recipe_color_ids: list[int],
     size_ids: list[int],
-    stock_by_color_size: dict[tuple[int, int], int],
+    stock_by_color_size: Mapping[tuple[int, int], int],
     shares_by_bundle: dict[int, float],
+    validate_contract: bool = True,
+    allocation_plan: _CompetitionAllocationPlan | None = None,
 ) -> ProductionOrderResourceAllocationApplied:
+    if allocation_plan is None:
+        allocation_plan = _build_competition_allocation_plan(
+            bundle_type_ids=bundle_type_ids,
+            recipe_colors_by_bundle=recipe_colors_by_bundle,
+            all_recipe_color_ids=all_recipe_color_ids,
+            size_ids=size_ids,
+            shares_by_bundle=shares_by_bundle,
+        )
+    allocation_pass = _run_competition_allocation(allocation_plan, stock_by_color_size)
+
     reservations: list[ResourceAllocationReservation] = []
-    reserved_bundle_units: dict[int, int] = {int(bundle_type_id): 0 for bundle_type_id in bundle_type_ids}
     competing_resource_keys = 0
     fully_reserved_resource_keys = 0
     total_stock_units = 0
     total_reserved_units = 0
 
-    color_consumers: dict[int, list[int]] = {
-        int(color_id): [
-            int(bundle_type_id)
-            for bundle_type_id in bundle_type_ids
-            if color_id in recipe_colors_by_bundle.get(bundle_type_id, set())
-        ]
-        for color_id in all_recipe_color_ids
-    }
-
-    for size_id in size_ids:
-        color_bundle_alloc: dict[tuple[int, int], int] = {}
-        for color_id in all_recipe_color_ids:
-            stock_qty = max(int(stock_by_color_size.get((color_id, size_id), 0) or 0), 0)
+    stock_rows = _as_color_size_grid(
+        stock_by_color_size,
+        color_ids=allocation_plan.all_recipe_color_ids,
+        size_ids=allocation_plan.size_ids,
+    ).rows()
+    for size_ordinal, size_id in enumerate(allocation_plan.size_ids):
+        for color_id, stock_row in zip(allocation_plan.all_recipe_color_ids, stock_rows):
+            stock_qty = max(stock_row[size_ordinal], 0)
             total_stock_units += stock_qty
-            consumers = color_consumers.get(int(color_id), [])
+            consumers = allocation_plan.consumers_by_color.get(color_id, [])
             if not consumers:
                 continue
 
@@ -180,41 +130,18 @@ def _build_competition_aware_resource_allocation(
             if shared_resource:
                 competing_resource_keys += 1
 
-            allocations: list[ResourceAllocationBundleReservation] = []
-            total_reserved_qty = 0
-            if len(consumers) == 1:
-                bundle_type_id = int(consumers[0])
-                if stock_qty > 0:
-                    allocations.append(
-                        ResourceAllocationBundleReservation(
-                            bundle_type_id=bundle_type_id,
-                            reserved_qty=stock_qty,
-                            share_weight=1.0,
-                            allocation_basis="single_consumer",
-                        )
-                    )
-                    color_bundle_alloc[(int(color_id), bundle_type_id)] = stock_qty
-                    total_reserved_qty = stock_qty
-            else:
-                consumer_weights = _normalize_weights(
-                    consumers,
-                    {bundle_type_id: shares_by_bundle.get(bundle_type_id, 0.0) for bundle_type_id in consumers},
+            reserved_split = allocation_pass.reserved_by_color_size.get((color_id, size_id), {})
+            consumer_weights = allocation_plan.consumer_weights_by_color.get(color_id, {})
+            allocations = [
+                ResourceAllocationBundleReservation(
+                    bundle_type_id=bundle_type_id,
+                    reserved_qty=reserved_qty,
+                    share_weight=float(consumer_weights.get(bundle_type_id, 0.0)) if shared_resource else 1.0,
+                    allocation_basis="demand_share" if shared_resource else "single_consumer",
                 )
-                allocated = _allocate_units(stock_qty, consumer_weights)
-                for bundle_type_id in consumers:
-                    reserved_qty = max(int(allocated.get(bundle_type_id, 0) or 0), 0)
-                    if reserved_qty <= 0:
-                        continue
-                    allocations.append(
-                        ResourceAllocationBundleReservation(
-                            bundle_type_id=int(bundle_type_id),
-                            reserved_qty=reserved_qty,
-                            share_weight=float(consumer_weights.get(bundle_type_id, 0.0)),
-                            allocation_basis="demand_share",
-                        )
-                    )
-                    color_bundle_alloc[(int(color_id), int(bundle_type_id))] = reserved_qty
-                    total_reserved_qty += reserved_qty
+                for bundle_type_id, reserved_qty in reserved_split.items()
+            ]
+            total_reserved_qty = sum(reserved_split.values())
 
             if stock_qty > 0 or allocations:
                 if stock_qty > 0 and total_reserved_qty >= stock_qty:
@@ -222,29 +149,16 @@ def _build_competition_aware_resource_allocation(
                 total_reserved_units += total_reserved_qty
                 reservations.append(
                     ResourceAllocationReservation(
-                        color_id=int(color_id),
-                        size_id=int(size_id),
+                        color_id=color_id,
+                        size_id=size_id,
                         stock_qty=stock_qty,
                         total_reserved_qty=total_reserved_qty,
                         shared_resource=shared_resource,
-                        consumer_bundle_type_ids=[int(bundle_type_id) for bundle_type_id in consumers],
+                        consumer_bundle_type_ids=list(consumers),
                         allocations=allocations,
                     )
                 )
 
-        for bundle_type_id in bundle_type_ids:
-            recipe_colors = recipe_colors_by_bundle.get(bundle_type_id, set())
-            if not recipe_colors:
-                continue
-
-            reserved_color_qty = [
-                color_bundle_alloc.get((int(color_id), int(bundle_type_id)), 0)
-                for color_id in recipe_colors
-            ]
-            if not reserved_color_qty or any(quantity <= 0 for quantity in reserved_color_qty):
-                continue
-            reserved_bundle_units[int(bundle_type_id)] += min(reserved_color_qty)
-
     allocation = ProductionOrderResourceAllocationApplied(
         mode="per_article_bundle_competition",
         total_resource_keys=len(all_recipe_color_ids) * len(size_ids),
@@ -252,38 +166,18 @@ def _build_competition_aware_resource_allocation(
         fully_reserved_resource_keys=fully_reserved_resource_keys,
         total_stock_units=total_stock_units,
         total_reserved_units=total_reserved_units,
-        reserved_bundle_units=reserved_bundle_units,
+        reserved_bundle_units=dict(allocation_pass.bundle_units),
         reservations=reservations,
         contract={},
     )
-    allocation.contract = _build_resource_allocation_contract_summary(allocation)
+    allocation.contract = (
+        _build_resource_allocation_contract_summary(allocation)
+        if validate_contract
+        else _build_skipped_contract_summary(RESOURCE_ALLOCATION_CONTRACT_VERSION)
+    )
     return allocation
 
 
-def _add_units_for_color_with_constraints_weights(
-    *,
-    line_qty: dict[tuple[int, int], int],
-    color_id: int,
-    additional_qty: int,
-    color_to_sizes: dict[int, list[int]],
-    global_size_weights: dict[int, float],
-) -> None:
-    if additional_qty <= 0:
-        return
-
-    sizes = color_to_sizes.get(color_id, [])
-    if not sizes:
-        return
-
-    local_weights = _normalize_weights(sizes, global_size_weights)
-    allocated = _allocate_units(additional_qty, local_weights)
-    for size_id, qty in allocated.items():
-        if qty <= 0:
-            continue
-        key = (color_id, size_id)
-        line_qty[key] = line_qty.get(key, 0) + qty
-
-
 @dataclass(frozen=True)
 class _SharedColorPoolFabricConstraintsResult:
     shared_color_pool: dict[str, object]
@@ -291,13 +185,12 @@ class _SharedColorPoolFabricConstraintsResult:
 
 
 def _resolve_shared_color_pool_as_of_date(
-    db: Session,
     requested_as_of_date: date | None,
+    latest_sales_date: date | None,
 ) -> tuple[date, str]:
     if requested_as_of_date is not None:
         return requested_as_of_date, "request"
 
-    latest_sales_date = db.query(func.max(WbSalesDaily.date)).scalar()
     if isinstance(latest_sales_date, date):
         return latest_sales_date, "latest_wb_sales"
 
@@ -316,7 +209,13 @@ def _build_shared_color_pool_snapshot(
 ) -> dict[str, object]:
     pantone_codes = sorted({value for value in pantone_by_color.values() if value})
     window_days = max(int(observation_window_days or SHARED_COLOR_POOL_DEFAULT_OBSERVATION_WINDOW_DAYS), 1)
-    effective_as_of_date, as_of_source = _resolve_shared_color_pool_as_of_date(db, as_of_date)
+    # Sibling lookup and window sales come from the process-wide pantone index, so repeated
+    # proposals (a portfolio batch in particular) do not re-query SKUs, settings and sales.
+    pool_index = SHARED_COLOR_POOL_INDEX_CACHE.get(db)
+    effective_as_of_date, as_of_source = _resolve_shared_color_pool_as_of_date(
+        as_of_date,
+        pool_index.latest_sales_date,
+    )
 
     snapshot: dict[str, object] = {
         "source": SHARED_COLOR_POOL_SOURCE,
@@ -333,17 +232,15 @@ def _build_shared_color_pool_snapshot(
     if not pantone_codes:
         return snapshot
 
-    sibling_rows = (
-        db.query(SkuUnit.article_id, Color.pantone_code)
-        .join(Color, Color.id == SkuUnit.color_id)
-        .filter(
-            SkuUnit.article_id != article_id,
-            Color.pantone_code.isnot(None),
-            Color.pantone_code.in_(pantone_codes),
-        )
-        .all()
+    candidate_article_ids = sorted(
+        {
+            sibling_article_id
+            for pantone_code in pantone_codes
+            for sibling_article_id in pool_index.article_ids_by_pantone.get(pantone_code, ())
+            if sibling_article_id != article_id
+        }
     )
-    if not sibling_rows:
+    if not candidate_article_ids:
         snapshot["status"] = "no_sibling_articles"
         snapshot["pantones"] = {
             pantone_code: {
@@ -355,20 +252,11 @@ def _build_shared_color_pool_snapshot(
         }
         return snapshot
 
-    candidate_article_ids = sorted({int(row.article_id) for row in sibling_rows})
-    article_settings_rows = (
-        db.query(ArticlePlanningSettings)
-        .filter(ArticlePlanningSettings.article_id.in_(candidate_article_ids))
-        .all()
-    )
-    include_in_planning_by_article = {
-        int(row.article_id): bool(row.include_in_planning) for row in article_settings_rows
-    }
-    sibling_article_ids = sorted(
+    sibling_article_ids = [
         article_id_value
         for article_id_value in candidate_article_ids
-        if include_in_planning_by_article.get(article_id_value, True)
-    )
+        if pool_index.include_in_planning_by_article.get(article_id_value, True)
+    ]
     if not sibling_article_ids:
         snapshot["status"] = "siblings_excluded_from_planning"
         snapshot["pantones"] = {
@@ -381,42 +269,14 @@ def _build_shared_color_pool_snapshot(
         }
         return snapshot
 
-    article_code_rows = db.query(Article.id, Article.code).filter(Article.id.in_(sibling_article_ids)).all()
-    article_code_by_id = {int(article_row_id): str(article_code) for article_row_id, article_code in article_code_rows}
-
-    article_pantone_rows = (
-        db.query(SkuUnit.article_id, Color.pantone_code)
-        .join(Color, Color.id == SkuUnit.color_id)
-        .filter(
-            SkuUnit.article_id.in_(sibling_article_ids),
-            Color.pantone_code.isnot(None),
-        )
-        .distinct()
-        .all()
-    )
-    pantones_by_article: dict[int, set[str]] = defaultdict(set)
-    for sibling_article_id, pantone_code in article_pantone_rows:
-        if pantone_code:
-            pantones_by_article[int(sibling_article_id)].add(str(pantone_code))
-
-    sales_window_start = effective_as_of_date - timedelta(days=window_days - 1)
-    sibling_sales_rows = (
-        db.query(
-            ArticleWbMapping.article_id,
-            func.coalesce(func.sum(WbSalesDaily.sales_qty), 0).label("sales_qty"),
-        )
-        .join(WbSalesDaily, WbSalesDaily.wb_sku == ArticleWbMapping.wb_sku)
-        .filter(
-            ArticleWbMapping.article_id.in_(sibling_article_ids),
-            WbSalesDaily.date >= sales_window_start,
-            WbSalesDaily.date <= effective_as_of_date,
-        )
-        .group_by(ArticleWbMapping.article_id)
-        .all()
+    article_code_by_id = pool_index.article_code_by_id
+    pantones_by_article = pool_index.pantones_by_article
+    sales_qty_by_article = SHARED_COLOR_POOL_INDEX_CACHE.article_window_sales(
+        db,
+        pool_index,
+        as_of_date=effective_as_of_date,
+        window_days=window_days,
     )
-    sales_qty_by_article = {
-        int(row.article_id): max(int(row.sales_qty or 0), 0) for row in sibling_sales_rows
-    }
 
     pantone_items: dict[str, dict[str, object]] = {
         pantone_code: {
@@ -430,7 +290,7 @@ def _build_shared_color_pool_snapshot(
     total_proxy_required = 0
     pantone_code_set = set(pantone_codes)
     for sibling_article_id in sibling_article_ids:
-        article_pantones = sorted(pantones_by_article.get(sibling_article_id, set()) & pantone_code_set)
+        article_pantones = sorted(pantones_by_article.get(sibling_article_id, frozenset()) & pantone_code_set)
         if not article_pantones:
             continue
 
@@ -538,7 +398,7 @@ def _apply_shared_color_pool_fabric_min_batches(
         )
 
         if len(pantone_color_ids) == 1:
-            _add_units_for_color_with_constraints_weights(
+            _add_units_for_color(
                 line_qty=line_qty,
                 color_id=pantone_color_ids[0],
                 additional_qty=delta,
@@ -553,7 +413,7 @@ def _apply_shared_color_pool_fabric_min_batches(
             }
             color_alloc = _allocate_units(delta, color_weights)
             for color_id, qty in color_alloc.items():
-                _add_units_for_color_with_constraints_weights(
+                _add_units_for_color(
                     line_qty=line_qty,
                     color_id=color_id,
                     additional_qty=qty,
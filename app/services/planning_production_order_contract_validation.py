@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable, Iterator
+
+from app.core.config import CONTRACT_VALIDATION_LEVEL, CONTRACT_VALIDATION_SAMPLE_EVERY_N
+
+CONTRACT_VALIDATION_LEVEL_FULL = "full"
+CONTRACT_VALIDATION_LEVEL_SAMPLED = "sampled"
+CONTRACT_VALIDATION_LEVEL_OFF = "off"
+CONTRACT_VALIDATION_LEVELS = (
+    CONTRACT_VALIDATION_LEVEL_FULL,
+    CONTRACT_VALIDATION_LEVEL_SAMPLED,
+    CONTRACT_VALIDATION_LEVEL_OFF,
+)
+CONTRACT_STATUS_SKIPPED = "skipped"
+
+# Process-wide proposal counter for the "sampled" level; `next()` on itertools.count is atomic
+# under the GIL, so concurrent requests never validate the same slot twice.
+_contract_validation_sequence = itertools.count()
+
+
+def _should_validate_contracts(
+    *,
+    level: str | None = None,
+    sample_every_n: int | None = None,
+    sequence: Iterator[int] | None = None,
+) -> bool:
+    resolved_level = CONTRACT_VALIDATION_LEVEL if level is None else level
+    if resolved_level == CONTRACT_VALIDATION_LEVEL_OFF:
+        return False
+    if resolved_level == CONTRACT_VALIDATION_LEVEL_SAMPLED:
+        every_n = max(CONTRACT_VALIDATION_SAMPLE_EVERY_N if sample_every_n is None else sample_every_n, 1)
+        return next(_contract_validation_sequence if sequence is None else sequence) % every_n == 0
+    # Unknown levels fall back to full validation rather than silently dropping the checks.
+    return True
+
+
+def _build_skipped_contract_summary(version: str) -> dict[str, object]:
+    return {
+        "version": version,
+        "status": CONTRACT_STATUS_SKIPPED,
+        "checks": {},
+    }
+
+
+def _select_contract_summary_builder(
+    build_contract_summary: Callable[..., dict[str, object]],
+    *,
+    version: str,
+    validate: bool,
+) -> Callable[..., dict[str, object]]:
+    if validate:
+        return build_contract_summary
+
+    def _build_skipped(*_args: object, **_kwargs: object) -> dict[str, object]:
+        return _build_skipped_contract_summary(version)
+
+    return _build_skipped
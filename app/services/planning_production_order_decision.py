@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Mapping
 
 from app.services.planning_production_order_capital import (
     _bounded_unit_float,
@@ -11,6 +12,7 @@ from app.services.planning_production_order_layer_proxy import (
     LAYER2_OVERSTOCK_PENALTY_WEIGHT,
     LAYER2_STOCKOUT_PENALTY_WEIGHT,
 )
+from app.services.planning_production_order_math import _normalize_weights
 
 LAYER2_ALLOCATION_METHOD = "time_window_profit_proxy_with_gmroi_diagnostics"
 LAYER2_ALLOCATION_METHOD_CANONICAL = "time_window_composite_objective_with_gmroi_diagnostics"
@@ -69,37 +71,6 @@ def _build_layer2_legacy_alias_deprecation_plan() -> dict[str, object]:
     }
 
 
-def _normalize_weights(size_ids: list[int], raw_weights: dict[int, float]) -> dict[int, float]:
-    if not size_ids:
-        return {}
-
-    weights: dict[int, float] = {}
-    for size_id in size_ids:
-        weight = raw_weights.get(size_id)
-        if weight is not None and weight > 0:
-            weights[size_id] = float(weight)
-
-    if not weights:
-        uniform = 1.0 / len(size_ids)
-        return {size_id: uniform for size_id in size_ids}
-
-    total = sum(weights.values())
-    if total <= 0:
-        uniform = 1.0 / len(size_ids)
-        return {size_id: uniform for size_id in size_ids}
-
-    normalized = {size_id: weight / total for size_id, weight in weights.items()}
-    for size_id in size_ids:
-        normalized.setdefault(size_id, 0.0)
-
-    norm_total = sum(normalized.values())
-    if norm_total <= 0:
-        uniform = 1.0 / len(size_ids)
-        return {size_id: uniform for size_id in size_ids}
-
-    return {size_id: normalized[size_id] / norm_total for size_id in size_ids}
-
-
 def _build_layer1_stock_health_metrics(
     *,
     bundle_type_ids: list[int],
@@ -107,8 +78,8 @@ def _build_layer1_stock_health_metrics(
     recipe_colors_by_bundle: dict[int, set[int]],
     color_to_sizes: dict[int, list[int]],
     size_weights: dict[int, float],
-    current_stock_by_color_size: dict[tuple[int, int], int],
-    in_flight_effective_by_color_size: dict[tuple[int, int], int],
+    current_stock_by_color_size: Mapping[tuple[int, int], int],
+    in_flight_effective_by_color_size: Mapping[tuple[int, int], int],
     in_flight_eta_days_by_color_size: dict[tuple[int, int], int],
     assorti_by_bundle_type: dict[int, bool],
     reorder_point_days: int,
@@ -119,6 +90,9 @@ def _build_layer1_stock_health_metrics(
 ) -> list[dict[str, int | float | None]]:
     velocity_main_by_color_size: dict[tuple[int, int], float] = defaultdict(float)
     velocity_assorti_by_color_size: dict[tuple[int, int], float] = defaultdict(float)
+    # Size weights depend only on the color, so colors shared by several bundle types are
+    # normalized once rather than once per bundle type.
+    local_size_weights_by_color: dict[int, dict[int, float]] = {}
 
     for bundle_type_id in bundle_type_ids:
         daily_sales = float(demand_by_bundle.get(bundle_type_id, 0.0))
@@ -134,10 +108,13 @@ def _build_layer1_stock_health_metrics(
             if not sizes_for_color:
                 continue
 
-            local_size_weights = _normalize_weights(
-                sizes_for_color,
-                {size_id: size_weights.get(size_id, 0.0) for size_id in sizes_for_color},
-            )
+            local_size_weights = local_size_weights_by_color.get(color_id)
+            if local_size_weights is None:
+                local_size_weights = _normalize_weights(
+                    sizes_for_color,
+                    {size_id: size_weights.get(size_id, 0.0) for size_id in sizes_for_color},
+                )
+                local_size_weights_by_color[color_id] = local_size_weights
 
             for size_id, weight in local_size_weights.items():
                 key = (color_id, size_id)
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from fastapi import HTTPException, status
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _EconomicGovernanceApplicationResult:
     economic_settings: object
     economics_trust: dict[str, object]
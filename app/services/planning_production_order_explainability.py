@@ -4,43 +4,60 @@ from collections.abc import Callable
 from datetime import date, timedelta
 
 from app.schemas.planning_production_order import ProductionOrderExplanationBlock
+from app.services.planning_production_order_capital import LAYER4_EFFICIENCY_FRONTIER_META_KEY
+from app.services.planning_production_order_explanation_steps import (
+    COMPACT_STEP_CODES,
+    STEP_CODE_ASSORTI_CLASSIFICATION,
+    STEP_CODE_ARRIVAL_PROJECTION,
+    STEP_CODE_BUNDLE_DEFICIT,
+    STEP_CODE_CAPITAL_CONSTRAINT,
+    STEP_CODE_CAPITAL_GAP,
+    STEP_CODE_COMPACT_OMITTED,
+    STEP_CODE_CONSTRAINTS_APPLIED,
+    STEP_CODE_DEMAND,
+    STEP_CODE_ECONOMIC_BUFFER,
+    STEP_CODE_ECONOMICS_TRUST,
+    STEP_CODE_ELASTIC_SCOPE,
+    STEP_CODE_ELASTIC_UPLIFT,
+    STEP_CODE_IN_FLIGHT,
+    STEP_CODE_LAYER1_STOCK_HEALTH,
+    STEP_CODE_LAYER2_ALLOCATION,
+    STEP_CODE_LAYER3_PURCHASE_SHAPING,
+    STEP_CODE_LAYER4_AGGREGATE_DELTAS,
+    STEP_CODE_LAYER4_CONTRACT,
+    STEP_CODE_LAYER4_SCENARIOS,
+    STEP_CODE_LAYER5_INTERVENTION,
+    STEP_CODE_PARAMETER_SOURCES,
+    STEP_CODE_PHYSICAL_SCOPE,
+    STEP_CODE_READY_STOCK,
+    STEP_CODE_REORDER_POLICY,
+    STEP_CODE_RESOURCE_ALLOCATION,
+    STEP_CODE_SHARED_COLOR_POOL,
+    STEP_CODE_WB_INGESTION_ADAPTER,
+    ExplanationStep,
+)
 from app.services.planning_production_order_freshness import (
     FROM_WB_STRICT_ALLOWED_FRESHNESS_STATUSES,
     build_from_wb_freshness_blocker,
     build_from_wb_freshness_next_steps,
     is_from_wb_freshness_status_allowed_in_strict_mode,
 )
+from app.services.planning_production_order_stage_timing import STAGE_TIMINGS_META_KEY
 
 EXPLAINABILITY_MODE_COMPACT = "compact"
+EXPLAINABILITY_MODE_NONE = "none"
 
 
-def _compact_explanation_steps(steps: list[str]) -> tuple[list[str], int]:
+def _compact_explanation_steps(
+    steps: list[ExplanationStep | str],
+) -> tuple[list[ExplanationStep | str], int]:
     if not steps:
         return [], 0
 
-    keep_tokens = (
-        "WB ingestion adapter",
-        "Спрос по наборам",
-        "Источник параметров",
-        "Economics trust",
-        "Assorti classification",
-        "Physical scope",
-        "Resource allocation",
-        "Arrival projection",
-        "Shared color pool",
-        "Layer 1 stock health",
-        "Layer 2 allocation",
-        "Layer 3 purchase shaping",
-        "Layer 4 scenarios",
-        "Capital constraint",
-        "Layer 5 intervention",
-        "Применены ограничения",
-    )
-
     compact_steps = [
         step
         for step in steps
-        if any(token in step for token in keep_tokens)
+        if isinstance(step, ExplanationStep) and step.code in COMPACT_STEP_CODES
     ]
     if not compact_steps:
         compact_steps = steps[: min(len(steps), 6)]
@@ -49,7 +66,7 @@ def _compact_explanation_steps(steps: list[str]) -> tuple[list[str], int]:
     omitted_steps = max(len(steps) - len(compact_steps), 0)
     if omitted_steps > 0:
         compact_steps.append(
-            f"Explainability compact mode: omitted_steps={omitted_steps}."
+            ExplanationStep(STEP_CODE_COMPACT_OMITTED, {"omitted_steps": omitted_steps})
         )
 
     return compact_steps, omitted_steps
@@ -292,206 +309,197 @@ def _build_explanation_steps(
     in_flight_effective_lines: int,
     fabric_constraint_count: int,
     elastic_constraint_count: int,
-) -> list[str]:
+) -> list[ExplanationStep]:
     return [
-        (
-            f"Спрос по наборам: total_daily_sales={total_daily_sales:.3f}, "
-            f"planning_horizon_days={planning_horizon_days}, "
-            f"expected_horizon_sales={expected_horizon_sales:.1f}."
+        ExplanationStep(
+            STEP_CODE_DEMAND,
+            {
+                "total_daily_sales": total_daily_sales,
+                "planning_horizon_days": planning_horizon_days,
+                "expected_horizon_sales": expected_horizon_sales,
+            },
         ),
-        (
-            f"Учтены ready stock наборов (WB+локальный)={ready_bundle_stock_total} и "
-            f"оценка сырьевого потенциала={competition_raw_bundle_stock} "
-            f"(competition-aware by bundle: {competition_raw_breakdown})."
+        ExplanationStep(
+            STEP_CODE_READY_STOCK,
+            {
+                "ready_bundle_stock_total": ready_bundle_stock_total,
+                "competition_raw_bundle_stock": competition_raw_bundle_stock,
+                "competition_raw_breakdown": competition_raw_breakdown,
+            },
         ),
-        (
-            "Physical scope: "
-            f"local_stock_scope={getattr(physical_scope, 'local_stock_scope')}, "
-            f"wb_stock_scope={getattr(physical_scope, 'wb_stock_scope')}, "
-            f"ready_bundle_source={getattr(physical_scope, 'ready_bundle_source')}, "
-            f"raw_single_source={getattr(physical_scope, 'raw_single_source')}, "
-            "nsc_assembled_bundle_inventory_state="
-            f"{getattr(physical_scope, 'nsc_assembled_bundle_inventory_state')}."
+        ExplanationStep(
+            STEP_CODE_PHYSICAL_SCOPE,
+            {
+                "physical_scope": physical_scope,
+            },
         ),
-        (
-            f"Resource allocation: mode={getattr(resource_allocation, 'mode')}, "
-            f"resource_keys={getattr(resource_allocation, 'total_resource_keys')}, "
-            f"competing={getattr(resource_allocation, 'competing_resource_keys')}, "
-            f"reserved_units={getattr(resource_allocation, 'total_reserved_units')}, "
-            f"contract_status={getattr(resource_allocation, 'contract').get('status')}."
+        ExplanationStep(
+            STEP_CODE_RESOURCE_ALLOCATION,
+            {
+                "resource_allocation": resource_allocation,
+            },
         ),
-        (
-            "Arrival projection: "
-            f"status={getattr(arrival_projection, 'status')}, "
-            f"arrival_horizon_days={getattr(arrival_projection, 'arrival_horizon_days')}, "
-            f"demand_units_until_arrival={getattr(arrival_projection, 'demand_units_until_arrival')}, "
-            f"projected_supply_units_before_arrival={getattr(arrival_projection, 'projected_supply_units_before_arrival')}, "
-            "projected_shortage_before_arrival="
-            f"{getattr(arrival_projection, 'projected_shortage_before_arrival')}."
+        ExplanationStep(
+            STEP_CODE_ARRIVAL_PROJECTION,
+            {
+                "arrival_projection": arrival_projection,
+            },
         ),
-        (
-            "Shared color pool: "
-            f"status={shared_color_pool.get('status')}, "
-            f"source={shared_color_pool.get('source')}, "
-            f"sibling_article_count={shared_color_pool.get('sibling_article_count')}, "
-            f"sibling_proxy_required_total={shared_color_pool.get('sibling_proxy_required_total')}, "
-            f"observation_window_days={shared_color_pool.get('observation_window_days')}, "
-            f"as_of_date={shared_color_pool.get('as_of_date')}."
+        ExplanationStep(
+            STEP_CODE_SHARED_COLOR_POOL,
+            {
+                "shared_color_pool": shared_color_pool,
+            },
         ),
-        (
-            f"Дефицит по модели B: target_bundle_units={required_bundle_units}, "
-            f"available_for_cover={available_bundles_for_cover}, deficit={bundle_deficit_total}."
+        ExplanationStep(
+            STEP_CODE_BUNDLE_DEFICIT,
+            {
+                "required_bundle_units": required_bundle_units,
+                "available_bundles_for_cover": available_bundles_for_cover,
+                "bundle_deficit_total": bundle_deficit_total,
+            },
         ),
-        (
-            f"Reorder policy: lead_time_days={lead_time_days_total}, "
-            f"safety_stock_days={safety_stock_days}, reorder_point_days={reorder_point_days}."
+        ExplanationStep(
+            STEP_CODE_REORDER_POLICY,
+            {
+                "lead_time_days_total": lead_time_days_total,
+                "safety_stock_days": safety_stock_days,
+                "reorder_point_days": reorder_point_days,
+            },
         ),
-        (
-            f"Economic buffer policy: enabled={allow_order_with_buffer}, "
-            f"economic_buffer_days={economic_buffer_days}, target_horizon_days={target_bundle_horizon_days}."
+        ExplanationStep(
+            STEP_CODE_ECONOMIC_BUFFER,
+            {
+                "allow_order_with_buffer": allow_order_with_buffer,
+                "economic_buffer_days": economic_buffer_days,
+                "target_bundle_horizon_days": target_bundle_horizon_days,
+            },
         ),
-        (
-            f"Источник параметров: size_weights={size_weights_source}, "
-            f"in_flight={in_flight_source}, bundle_stock={bundle_stock_source}."
+        ExplanationStep(
+            STEP_CODE_PARAMETER_SOURCES,
+            {
+                "size_weights_source": size_weights_source,
+                "in_flight_source": in_flight_source,
+                "bundle_stock_source": bundle_stock_source,
+            },
         ),
-        (
-            "Economics trust: "
-            f"level={economics_trust['economics_trust_level']}, "
-            "code_default_key_fields="
-            f"{economics_trust['code_default_key_fields']}, "
-            "code_default_key_fields_count="
-            f"{economics_trust['code_default_key_fields_count']}, "
-            "code_default_dominance_ratio="
-            f"{economics_trust['code_default_dominance_ratio']}, "
-            f"warnings={explanation_warnings}."
+        ExplanationStep(
+            STEP_CODE_ECONOMICS_TRUST,
+            {
+                "economics_trust": economics_trust,
+                "explanation_warnings": explanation_warnings,
+            },
         ),
-        (
-            "Assorti classification: "
-            f"source={assorti_classification_source}, "
-            f"fallback_admin_ids={sorted(admin_assorti_bundle_type_ids)}, "
-            f"fallback_global_ids={sorted(global_assorti_bundle_type_ids)}, "
-            f"assorti_bundle_types={assorti_bundle_type_count}, "
-            f"main_bundle_types={main_bundle_type_count}, "
-            f"source_breakdown={assorti_classification_source_breakdown}."
+        ExplanationStep(
+            STEP_CODE_ASSORTI_CLASSIFICATION,
+            {
+                "assorti_classification_source": assorti_classification_source,
+                "admin_assorti_bundle_type_ids": admin_assorti_bundle_type_ids,
+                "global_assorti_bundle_type_ids": global_assorti_bundle_type_ids,
+                "assorti_bundle_type_count": assorti_bundle_type_count,
+                "main_bundle_type_count": main_bundle_type_count,
+                "assorti_classification_source_breakdown": assorti_classification_source_breakdown,
+            },
         ),
-        (
-            f"Layer 1 stock health: sku_count={layer1_sku_count}, "
-            f"avg_coverage_days={layer1_avg_coverage_days}, "
-            f"high_stockout_risk_skus={layer1_high_stockout_risk_count}, "
-            f"high_stockout_threshold={layer1_high_stockout_risk_threshold}, "
-            f"contract_status={layer1_contract_status}."
+        ExplanationStep(
+            STEP_CODE_LAYER1_STOCK_HEALTH,
+            {
+                "layer1_sku_count": layer1_sku_count,
+                "layer1_avg_coverage_days": layer1_avg_coverage_days,
+                "layer1_high_stockout_risk_count": layer1_high_stockout_risk_count,
+                "layer1_high_stockout_risk_threshold": layer1_high_stockout_risk_threshold,
+                "layer1_contract_status": layer1_contract_status,
+            },
         ),
-        (
-            f"Layer 2 allocation: method={layer2_allocation_method_canonical}, "
-            f"legacy_method={layer2_allocation_method_legacy}, "
-            f"decision_gate={layer2_decision_gate_canonical}, "
-            f"legacy_decision_gate={layer2_decision_gate_legacy}, "
-            "tie_break=hold, "
-            f"main={layer2_allocation_summary['main']}, "
-            f"assorti={layer2_allocation_summary['assorti']}, "
-            f"hold={layer2_allocation_summary['hold']}, "
-            f"near_tie={layer2_decision_quality['near_tie_count']}, "
-            f"tie_count={layer2_decision_quality['tie_count']}, "
-            "reason_counts="
-            f"{layer2_decision_quality['decision_reason_counts']}, "
-            "objective_reason_counts="
-            f"{layer2_decision_quality['decision_reason_counts_objective_score']}, "
-            "avg_profit_gap_until_eta="
-            f"{layer2_decision_quality['avg_profit_gap_until_eta']}, "
-            "avg_objective_score_gap_until_eta="
-            f"{layer2_decision_quality['avg_objective_score_gap_until_eta']}, "
-            "capital_locked_total="
-            f"{layer2_decision_quality['capital_locked_total']}, "
-            f"contract_status={layer2_contract_status}."
+        ExplanationStep(
+            STEP_CODE_LAYER2_ALLOCATION,
+            {
+                "layer2_allocation_method_canonical": layer2_allocation_method_canonical,
+                "layer2_allocation_method_legacy": layer2_allocation_method_legacy,
+                "layer2_decision_gate_canonical": layer2_decision_gate_canonical,
+                "layer2_decision_gate_legacy": layer2_decision_gate_legacy,
+                "layer2_allocation_summary": layer2_allocation_summary,
+                "layer2_decision_quality": layer2_decision_quality,
+                "layer2_contract_status": layer2_contract_status,
+            },
         ),
-        (
-            "Layer 3 purchase shaping: method=allocation_decision_factors, "
-            f"qty_before={layer3_purchase_shaping['qty_before']}, "
-            f"qty_after_base={layer3_purchase_shaping['qty_after_base']}, "
-            f"qty_after={layer3_purchase_shaping['qty_after']}, "
-            f"adjusted_lines={layer3_purchase_shaping['adjusted_lines']}, "
-            f"calibration_delta_vs_base={layer3_purchase_shaping['qty_delta_vs_base']}, "
-            f"contract_status={layer3_contract_status}, "
-            "decision_lines="
-            f"main:{layer3_purchase_shaping['main_lines']}|"
-            f"assorti:{layer3_purchase_shaping['assorti_lines']}|"
-            f"hold:{layer3_purchase_shaping['hold_lines']}."
+        ExplanationStep(
+            STEP_CODE_LAYER3_PURCHASE_SHAPING,
+            {
+                "layer3_purchase_shaping": layer3_purchase_shaping,
+                "layer3_contract_status": layer3_contract_status,
+            },
         ),
-        (
-            "Layer 4 scenarios: "
-            f"Conservative(capital={layer4_scenarios[0]['total_capital_required']},gross_profit={layer4_scenarios[0]['expected_gross_profit']},objective={layer4_scenarios[0]['objective_score']},risk={layer4_scenarios[0]['stockout_risk_proxy']}), "
-            f"Balanced(capital={layer4_scenarios[1]['total_capital_required']},gross_profit={layer4_scenarios[1]['expected_gross_profit']},objective={layer4_scenarios[1]['objective_score']},risk={layer4_scenarios[1]['stockout_risk_proxy']}), "
-            f"Aggressive(capital={layer4_scenarios[2]['total_capital_required']},gross_profit={layer4_scenarios[2]['expected_gross_profit']},objective={layer4_scenarios[2]['objective_score']},risk={layer4_scenarios[2]['stockout_risk_proxy']})."
+        ExplanationStep(
+            STEP_CODE_LAYER4_SCENARIOS,
+            {
+                "layer4_scenarios": layer4_scenarios,
+            },
         ),
-        (
-            "Layer 4 contract: "
-            f"version={layer4_contract['version']}, "
-            f"status={layer4_contract['status']}, "
-            f"order_matches_expected={layer4_contract['order_matches_expected']}, "
-            f"checks={layer4_contract['checks']}."
+        ExplanationStep(
+            STEP_CODE_LAYER4_CONTRACT,
+            {
+                "layer4_contract": layer4_contract,
+            },
         ),
-        (
-            "Layer 4 aggregate deltas: "
-            "aggressive_vs_conservative("
-            "capital_delta="
-            f"{layer4_aggregate_deltas['aggressive_vs_conservative']['capital_delta']},"
-            "gross_profit_delta="
-            f"{layer4_aggregate_deltas['aggressive_vs_conservative']['gross_profit_delta']},"
-            "objective_delta="
-            f"{layer4_aggregate_deltas['aggressive_vs_conservative']['objective_delta']})."
+        ExplanationStep(
+            STEP_CODE_LAYER4_AGGREGATE_DELTAS,
+            {
+                "layer4_aggregate_deltas": layer4_aggregate_deltas,
+            },
         ),
-        (
-            "Capital gap: "
-            f"status={capital_gap_summary['status']}, "
-            f"available_capital={capital_gap_summary['available_capital']}, "
-            f"required_capital={capital_gap_summary['required_capital']}, "
-            f"deficit_or_surplus={capital_gap_summary['deficit_or_surplus']}."
+        ExplanationStep(
+            STEP_CODE_CAPITAL_GAP,
+            {
+                "capital_gap_summary": capital_gap_summary,
+            },
         ),
-        (
-            "Capital constraint: "
-            f"status={capital_constraint_summary['status']}, "
-            f"constrained={capital_constraint_summary['constrained']}, "
-            f"available_capital={capital_constraint_summary['available_capital']}, "
-            "required_capital_before_constraint="
-            f"{capital_constraint_summary['required_capital_before_constraint']}, "
-            "allocated_capital_after_constraint="
-            f"{capital_constraint_summary['allocated_capital_after_constraint']}, "
-            f"cutoff_line={capital_constraint_summary['cutoff_line']}, "
-            f"contract_status={capital_constraint_contract_status}."
+        ExplanationStep(
+            STEP_CODE_CAPITAL_CONSTRAINT,
+            {
+                "capital_constraint_summary": capital_constraint_summary,
+                "capital_constraint_contract_status": capital_constraint_contract_status,
+            },
         ),
-        (
-            "Layer 5 intervention: "
-            f"unavoidable_stockout={layer5_intervention['unavoidable_stockout']}, "
-            f"signals={layer5_intervention['signals']}, "
-            f"reason={layer5_intervention['reason']}, "
-            "aggressive_stockout_risk="
-            f"{layer5_intervention['aggressive_stockout_risk_proxy']}, "
-            f"threshold={layer5_intervention['risk_threshold']}, "
-            f"signal_thresholds={layer5_intervention['signal_thresholds']}, "
-            "economic_justification="
-            f"{layer5_intervention.get('economic_justification', {})}, "
-            f"contract_status={layer5_contract_status}."
+        ExplanationStep(
+            STEP_CODE_LAYER5_INTERVENTION,
+            {
+                "layer5_intervention": layer5_intervention,
+                "layer5_contract_status": layer5_contract_status,
+            },
         ),
-        (
-            f"Elastic scope: mode={elastic_scope_mode}, "
-            f"applicable_types={sorted(applicable_elastic_type_ids)}, "
-            f"scoped_settings={scoped_elastic_rows_count}, "
-            f"scoped_lines={elastic_scope_line_count}."
+        ExplanationStep(
+            STEP_CODE_ELASTIC_SCOPE,
+            {
+                "elastic_scope_mode": elastic_scope_mode,
+                "applicable_elastic_type_ids": applicable_elastic_type_ids,
+                "scoped_elastic_rows_count": scoped_elastic_rows_count,
+                "elastic_scope_line_count": elastic_scope_line_count,
+            },
         ),
-        (
-            f"Elastic uplift: delta={elastic_uplift_delta}, "
-            f"scope={elastic_uplift_scope}, "
-            f"affected_lines={len(elastic_uplift_keys)}, "
-            f"line_keys={elastic_uplift_keys}, "
-            f"line_alloc={elastic_uplift_line_alloc}."
+        ExplanationStep(
+            STEP_CODE_ELASTIC_UPLIFT,
+            {
+                "elastic_uplift_delta": elastic_uplift_delta,
+                "elastic_uplift_scope": elastic_uplift_scope,
+                "elastic_uplift_keys": elastic_uplift_keys,
+                "elastic_uplift_line_alloc": elastic_uplift_line_alloc,
+            },
         ),
-        (
-            f"In-flight вклад (ETA/stage): raw_qty={in_flight_raw_qty_total}, "
-            f"effective_qty={in_flight_effective_qty_total}, lines={in_flight_effective_lines}."
+        ExplanationStep(
+            STEP_CODE_IN_FLIGHT,
+            {
+                "in_flight_raw_qty_total": in_flight_raw_qty_total,
+                "in_flight_effective_qty_total": in_flight_effective_qty_total,
+                "in_flight_effective_lines": in_flight_effective_lines,
+            },
         ),
-        (
-            f"Применены ограничения: fabric_constraints={fabric_constraint_count}, "
-            f"elastic_constraints={elastic_constraint_count}."
+        ExplanationStep(
+            STEP_CODE_CONSTRAINTS_APPLIED,
+            {
+                "fabric_constraint_count": fabric_constraint_count,
+                "elastic_constraint_count": elastic_constraint_count,
+            },
         ),
     ]
 
@@ -822,7 +830,7 @@ def _apply_from_wb_explainability(
         stale_components.append("sales")
     if stale_stock:
         stale_components.append("stock")
-    freshness_actionability_text = ""
+    freshness_actionability: dict[str, object] | None = None
     freshness_blocker = build_from_wb_freshness_blocker(
         freshness_status=freshness_status,
         sales_age_days=freshness_sales_age_days,
@@ -842,12 +850,12 @@ def _apply_from_wb_explainability(
         freshness_meta["blocker"] = freshness_blocker
         freshness_meta["stale_components"] = stale_components
         freshness_meta["next_steps"] = freshness_next_steps
-        freshness_actionability_text = (
-            f", freshness_blocker={freshness_meta['blocker']}, "
-            f"freshness_next_steps={freshness_meta['next_steps']}"
-        )
+        freshness_actionability = {
+            "blocker": freshness_meta["blocker"],
+            "next_steps": freshness_meta["next_steps"],
+        }
 
-    strict_policy_text = ""
+    strict_policy_meta: dict[str, object] | None = None
     if (
         freshness_mode == "strict"
         and freshness_status != "fresh"
@@ -860,10 +868,6 @@ def _apply_from_wb_explainability(
             "allowed_statuses": sorted(FROM_WB_STRICT_ALLOWED_FRESHNESS_STATUSES),
         }
         freshness_meta["strict_policy"] = strict_policy_meta
-        strict_policy_text = (
-            ", freshness_strict_policy="
-            f"{strict_policy_meta['decision']}:{strict_policy_meta['effective_status']}"
-        )
 
     explanation.meta["from_wb"] = {
         "observation_window_days": observation_window_days,
@@ -888,38 +892,33 @@ def _apply_from_wb_explainability(
         "freshness": freshness_meta,
     }
 
-    explanation.steps.insert(
+    explanation.step_records.insert(
         0,
-        (
-            "WB ingestion adapter: "
-            f"observation_window_days={observation_window_days}, "
-            f"freshness_mode={freshness_mode}, "
-            f"requested_as_of_date={requested_as_of_text}, "
-            f"as_of_date={as_of_text}, as_of_source={as_of_source}, "
-            f"bundle_type_ids={bundle_type_ids}."
-            f" sales_window={window_text},"
-            f" daily_sales_by_bundle={daily_sales_snapshot}, "
-            f"wb_stock_by_bundle={wb_stock_snapshot}, "
-            f"wb_stock_updated_at_by_bundle={wb_stock_updated_at_by_bundle}, "
-            f"economic_observed_prices={observed_price_calibration.get('prices')}, "
-            f"economic_observed_source={observed_price_calibration.get('source')}, "
-            "economic_observed_commission="
-            f"{observed_commission_calibration.get('commission_percent')}, "
-            "economic_observed_commission_status="
-            f"{observed_commission_calibration.get('status')}, "
-            "economic_observed_commission_source="
-            f"{observed_commission_calibration.get('source')}, "
-            f"freshness_status={freshness_status}, "
-            f"freshness_sales_age_days={freshness_sales_age_days_text}, "
-            "freshness_stock_oldest_age_days="
-            f"{freshness_stock_oldest_age_days_text}, "
-            "freshness_stock_age_days_by_bundle="
-            f"{freshness_stock_age_days_by_bundle}, "
-            "freshness_threshold_days="
-            f"sales:{sales_stale_after_days}|stock:{stock_stale_after_days}, "
-            "freshness_threshold_source="
-            f"sales:{freshness_threshold_source['sales']}|stock:{freshness_threshold_source['stock']}"
-            f"{freshness_actionability_text}{strict_policy_text}."
+        ExplanationStep(
+            STEP_CODE_WB_INGESTION_ADAPTER,
+            {
+                "observation_window_days": observation_window_days,
+                "freshness_mode": freshness_mode,
+                "requested_as_of_text": requested_as_of_text,
+                "as_of_text": as_of_text,
+                "as_of_source": as_of_source,
+                "bundle_type_ids": bundle_type_ids,
+                "window_text": window_text,
+                "daily_sales_snapshot": daily_sales_snapshot,
+                "wb_stock_snapshot": wb_stock_snapshot,
+                "wb_stock_updated_at_by_bundle": wb_stock_updated_at_by_bundle,
+                "observed_price_calibration": observed_price_calibration,
+                "observed_commission_calibration": observed_commission_calibration,
+                "freshness_status": freshness_status,
+                "freshness_sales_age_days_text": freshness_sales_age_days_text,
+                "freshness_stock_oldest_age_days_text": freshness_stock_oldest_age_days_text,
+                "freshness_stock_age_days_by_bundle": freshness_stock_age_days_by_bundle,
+                "sales_stale_after_days": sales_stale_after_days,
+                "stock_stale_after_days": stock_stale_after_days,
+                "freshness_threshold_source": freshness_threshold_source,
+                "freshness_actionability": freshness_actionability,
+                "strict_policy": strict_policy_meta,
+            },
         ),
     )
     return explanation
@@ -947,6 +946,11 @@ def _finalize_from_wb_explainability(
     stock_stale_after_days: int,
     freshness_threshold_source: dict[str, object],
 ) -> ProductionOrderExplanationBlock:
+    if explainability_mode == EXPLAINABILITY_MODE_NONE:
+        return _apply_explainability_mode(
+            explanation=explanation,
+            mode=explainability_mode,
+        )
     from_wb_explainability_inputs = _build_from_wb_explainability_inputs(
         requested_as_of_date=requested_as_of_date,
         effective_as_of_date=effective_as_of_date,
@@ -1196,17 +1200,33 @@ def _build_compact_explanation_meta(meta: dict[str, object]) -> dict[str, object
             },
         }
 
+    # Debug stage timings and the Layer 4 frontier are requested explicitly, so they survive compaction.
+    for requested_key in (STAGE_TIMINGS_META_KEY, LAYER4_EFFICIENCY_FRONTIER_META_KEY):
+        if requested_key in meta:
+            compact_meta[requested_key] = meta[requested_key]
+
     return compact_meta
 
 
+def _build_none_explanation(summary: str) -> ProductionOrderExplanationBlock:
+    """Explanation for `explainability_mode="none"`: the summary line only, no steps or meta."""
+
+    return ProductionOrderExplanationBlock(
+        summary=summary,
+        meta={"explainability": {"mode": EXPLAINABILITY_MODE_NONE}},
+    )
+
+
 def _apply_explainability_mode(
     explanation: ProductionOrderExplanationBlock,
     mode: str,
 ) -> ProductionOrderExplanationBlock:
+    if mode == EXPLAINABILITY_MODE_NONE:
+        return _build_none_explanation(explanation.summary)
     if mode != EXPLAINABILITY_MODE_COMPACT:
         return explanation
 
-    compact_steps, omitted_steps = _compact_explanation_steps(explanation.steps)
+    compact_steps, omitted_steps = _compact_explanation_steps(explanation.step_records)
     compact_meta = _build_compact_explanation_meta(explanation.meta)
     compact_meta["explainability"] = {
         "mode": EXPLAINABILITY_MODE_COMPACT,
@@ -1215,6 +1235,6 @@ def _apply_explainability_mode(
 
     return ProductionOrderExplanationBlock(
         summary=explanation.summary,
-        steps=compact_steps,
+        step_records=compact_steps,
         meta=compact_meta,
     )
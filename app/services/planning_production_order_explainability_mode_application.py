@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from app.schemas.planning_production_order import ProductionOrderExplanationBlock
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ExplainabilityModeApplicationResult:
     explanation: ProductionOrderExplanationBlock
 
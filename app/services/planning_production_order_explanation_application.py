@@ -4,13 +4,29 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 from app.schemas.planning_production_order import ProductionOrderExplanationBlock
+from app.services.planning_production_order_explanation_steps import ExplanationStep
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ExplanationApplicationResult:
     explanation: ProductionOrderExplanationBlock
 
 
+def _build_production_order_explanation_summary(
+    *,
+    risk_level: str,
+    days_of_cover_estimate: float,
+    reorder_point_days: int,
+    lead_time_days_total: int,
+    safety_stock_days: int,
+) -> str:
+    return (
+        f"Риск {risk_level}: оценка покрытия {days_of_cover_estimate:.1f} дней при reorder point "
+        f"{reorder_point_days} дней (lead_time={lead_time_days_total}, "
+        f"safety_stock={safety_stock_days})."
+    )
+
+
 def _apply_production_order_explanation(
     *,
     risk_level: str,
@@ -98,16 +114,18 @@ def _apply_production_order_explanation(
     unit_capital_proxy: float,
     economic_buffer_enabled: bool,
     build_layer2_legacy_alias_deprecation_plan: Callable[[], dict[str, object]],
-    build_explanation_steps: Callable[..., list[str]],
+    build_explanation_steps: Callable[..., list[ExplanationStep]],
     build_explanation_meta: Callable[..., dict[str, object]],
 ) -> _ExplanationApplicationResult:
     explanation = ProductionOrderExplanationBlock(
-        summary=(
-            f"Риск {risk_level}: оценка покрытия {days_of_cover_estimate:.1f} дней при reorder point "
-            f"{reorder_point_days} дней (lead_time={lead_time_days_total}, "
-            f"safety_stock={safety_stock_days})."
+        summary=_build_production_order_explanation_summary(
+            risk_level=risk_level,
+            days_of_cover_estimate=days_of_cover_estimate,
+            reorder_point_days=reorder_point_days,
+            lead_time_days_total=lead_time_days_total,
+            safety_stock_days=safety_stock_days,
         ),
-        steps=build_explanation_steps(
+        step_records=build_explanation_steps(
             total_daily_sales=total_daily_sales,
             planning_horizon_days=planning_horizon_days,
             expected_horizon_sales=expected_horizon_sales,
@@ -0,0 +1,554 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+STEP_CODE_WB_INGESTION_ADAPTER = "wb_ingestion_adapter"
+STEP_CODE_DEMAND = "demand"
+STEP_CODE_READY_STOCK = "ready_stock"
+STEP_CODE_PHYSICAL_SCOPE = "physical_scope"
+STEP_CODE_RESOURCE_ALLOCATION = "resource_allocation"
+STEP_CODE_ARRIVAL_PROJECTION = "arrival_projection"
+STEP_CODE_SHARED_COLOR_POOL = "shared_color_pool"
+STEP_CODE_BUNDLE_DEFICIT = "bundle_deficit"
+STEP_CODE_REORDER_POLICY = "reorder_policy"
+STEP_CODE_ECONOMIC_BUFFER = "economic_buffer"
+STEP_CODE_PARAMETER_SOURCES = "parameter_sources"
+STEP_CODE_ECONOMICS_TRUST = "economics_trust"
+STEP_CODE_ASSORTI_CLASSIFICATION = "assorti_classification"
+STEP_CODE_LAYER1_STOCK_HEALTH = "layer1_stock_health"
+STEP_CODE_LAYER2_ALLOCATION = "layer2_allocation"
+STEP_CODE_LAYER3_PURCHASE_SHAPING = "layer3_purchase_shaping"
+STEP_CODE_LAYER4_SCENARIOS = "layer4_scenarios"
+STEP_CODE_LAYER4_CONTRACT = "layer4_contract"
+STEP_CODE_LAYER4_AGGREGATE_DELTAS = "layer4_aggregate_deltas"
+STEP_CODE_CAPITAL_GAP = "capital_gap"
+STEP_CODE_CAPITAL_CONSTRAINT = "capital_constraint"
+STEP_CODE_LAYER5_INTERVENTION = "layer5_intervention"
+STEP_CODE_ELASTIC_SCOPE = "elastic_scope"
+STEP_CODE_ELASTIC_UPLIFT = "elastic_uplift"
+STEP_CODE_IN_FLIGHT = "in_flight"
+STEP_CODE_CONSTRAINTS_APPLIED = "constraints_applied"
+STEP_CODE_COMPACT_OMITTED = "compact_omitted"
+
+# Steps kept by `explainability_mode="compact"`, matched by code.
+COMPACT_STEP_CODES = frozenset(
+    {
+        STEP_CODE_WB_INGESTION_ADAPTER,
+        STEP_CODE_DEMAND,
+        STEP_CODE_PARAMETER_SOURCES,
+        STEP_CODE_ECONOMICS_TRUST,
+        STEP_CODE_ASSORTI_CLASSIFICATION,
+        STEP_CODE_PHYSICAL_SCOPE,
+        STEP_CODE_RESOURCE_ALLOCATION,
+        STEP_CODE_ARRIVAL_PROJECTION,
+        STEP_CODE_SHARED_COLOR_POOL,
+        STEP_CODE_LAYER1_STOCK_HEALTH,
+        STEP_CODE_LAYER2_ALLOCATION,
+        STEP_CODE_LAYER3_PURCHASE_SHAPING,
+        STEP_CODE_LAYER4_SCENARIOS,
+        STEP_CODE_CAPITAL_CONSTRAINT,
+        STEP_CODE_LAYER5_INTERVENTION,
+        STEP_CODE_CONSTRAINTS_APPLIED,
+    }
+)
+
+_STEP_RENDERERS: dict[str, Callable[..., str]] = {}
+
+
+@dataclass(frozen=True)
+class ExplanationStep:
+    """Explanation step kept as a `(code, params)` record.
+
+    Params hold references to values the pipeline already computed; the text is formatted by
+    the renderer registered for `code` only when `render()` is called.
+    """
+
+    code: str
+    params: dict[str, object]
+
+    def render(self) -> str:
+        return _STEP_RENDERERS[self.code](**self.params)
+
+
+def _renders(code: str) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    def register(renderer: Callable[..., str]) -> Callable[..., str]:
+        _STEP_RENDERERS[code] = renderer
+        return renderer
+
+    return register
+
+
+@_renders(STEP_CODE_WB_INGESTION_ADAPTER)
+def _render_wb_ingestion_adapter_step(
+    *,
+    observation_window_days: int,
+    freshness_mode: str,
+    requested_as_of_text: str,
+    as_of_text: str,
+    as_of_source: str,
+    bundle_type_ids: list[int],
+    window_text: str,
+    daily_sales_snapshot: dict[int, float],
+    wb_stock_snapshot: dict[int, int],
+    wb_stock_updated_at_by_bundle: dict[int, object],
+    observed_price_calibration: dict[str, object],
+    observed_commission_calibration: dict[str, object],
+    freshness_status: str,
+    freshness_sales_age_days_text: str,
+    freshness_stock_oldest_age_days_text: str,
+    freshness_stock_age_days_by_bundle: dict[int, int | None],
+    sales_stale_after_days: int,
+    stock_stale_after_days: int,
+    freshness_threshold_source: dict[str, object],
+    freshness_actionability: dict[str, object] | None,
+    strict_policy: dict[str, object] | None,
+) -> str:
+    freshness_actionability_text = ""
+    if freshness_actionability is not None:
+        freshness_actionability_text = (
+            f", freshness_blocker={freshness_actionability['blocker']}, "
+            f"freshness_next_steps={freshness_actionability['next_steps']}"
+        )
+    strict_policy_text = ""
+    if strict_policy is not None:
+        strict_policy_text = (
+            ", freshness_strict_policy="
+            f"{strict_policy['decision']}:{strict_policy['effective_status']}"
+        )
+    return (
+        "WB ingestion adapter: "
+        f"observation_window_days={observation_window_days}, "
+        f"freshness_mode={freshness_mode}, "
+        f"requested_as_of_date={requested_as_of_text}, "
+        f"as_of_date={as_of_text}, as_of_source={as_of_source}, "
+        f"bundle_type_ids={bundle_type_ids}."
+        f" sales_window={window_text},"
+        f" daily_sales_by_bundle={daily_sales_snapshot}, "
+        f"wb_stock_by_bundle={wb_stock_snapshot}, "
+        f"wb_stock_updated_at_by_bundle={wb_stock_updated_at_by_bundle}, "
+        f"economic_observed_prices={observed_price_calibration.get('prices')}, "
+        f"economic_observed_source={observed_price_calibration.get('source')}, "
+        "economic_observed_commission="
+        f"{observed_commission_calibration.get('commission_percent')}, "
+        "economic_observed_commission_status="
+        f"{observed_commission_calibration.get('status')}, "
+        "economic_observed_commission_source="
+        f"{observed_commission_calibration.get('source')}, "
+        f"freshness_status={freshness_status}, "
+        f"freshness_sales_age_days={freshness_sales_age_days_text}, "
+        "freshness_stock_oldest_age_days="
+        f"{freshness_stock_oldest_age_days_text}, "
+        "freshness_stock_age_days_by_bundle="
+        f"{freshness_stock_age_days_by_bundle}, "
+        "freshness_threshold_days="
+        f"sales:{sales_stale_after_days}|stock:{stock_stale_after_days}, "
+        "freshness_threshold_source="
+        f"sales:{freshness_threshold_source['sales']}|stock:{freshness_threshold_source['stock']}"
+        f"{freshness_actionability_text}{strict_policy_text}."
+    )
+
+
+@_renders(STEP_CODE_DEMAND)
+def _render_demand_step(
+    *,
+    total_daily_sales: float,
+    planning_horizon_days: int,
+    expected_horizon_sales: float,
+) -> str:
+    return (
+        f"Спрос по наборам: total_daily_sales={total_daily_sales:.3f}, "
+        f"planning_horizon_days={planning_horizon_days}, "
+        f"expected_horizon_sales={expected_horizon_sales:.1f}."
+    )
+
+
+@_renders(STEP_CODE_READY_STOCK)
+def _render_ready_stock_step(
+    *,
+    ready_bundle_stock_total: int,
+    competition_raw_bundle_stock: int,
+    competition_raw_breakdown: str,
+) -> str:
+    return (
+        f"Учтены ready stock наборов (WB+локальный)={ready_bundle_stock_total} и "
+        f"оценка сырьевого потенциала={competition_raw_bundle_stock} "
+        f"(competition-aware by bundle: {competition_raw_breakdown})."
+    )
+
+
+@_renders(STEP_CODE_PHYSICAL_SCOPE)
+def _render_physical_scope_step(*, physical_scope: object) -> str:
+    return (
+        "Physical scope: "
+        f"local_stock_scope={getattr(physical_scope, 'local_stock_scope')}, "
+        f"wb_stock_scope={getattr(physical_scope, 'wb_stock_scope')}, "
+        f"ready_bundle_source={getattr(physical_scope, 'ready_bundle_source')}, "
+        f"raw_single_source={getattr(physical_scope, 'raw_single_source')}, "
+        "nsc_assembled_bundle_inventory_state="
+        f"{getattr(physical_scope, 'nsc_assembled_bundle_inventory_state')}."
+    )
+
+
+@_renders(STEP_CODE_RESOURCE_ALLOCATION)
+def _render_resource_allocation_step(*, resource_allocation: object) -> str:
+    return (
+        f"Resource allocation: mode={getattr(resource_allocation, 'mode')}, "
+        f"resource_keys={getattr(resource_allocation, 'total_resource_keys')}, "
+        f"competing={getattr(resource_allocation, 'competing_resource_keys')}, "
+        f"reserved_units={getattr(resource_allocation, 'total_reserved_units')}, "
+        f"contract_status={getattr(resource_allocation, 'contract').get('status')}."
+    )
+
+
+@_renders(STEP_CODE_ARRIVAL_PROJECTION)
+def _render_arrival_projection_step(*, arrival_projection: object) -> str:
+    return (
+        "Arrival projection: "
+        f"status={getattr(arrival_projection, 'status')}, "
+        f"arrival_horizon_days={getattr(arrival_projection, 'arrival_horizon_days')}, "
+        f"demand_units_until_arrival={getattr(arrival_projection, 'demand_units_until_arrival')}, "
+        "projected_supply_units_before_arrival="
+        f"{getattr(arrival_projection, 'projected_supply_units_before_arrival')}, "
+        "projected_shortage_before_arrival="
+        f"{getattr(arrival_projection, 'projected_shortage_before_arrival')}."
+    )
+
+
+@_renders(STEP_CODE_SHARED_COLOR_POOL)
+def _render_shared_color_pool_step(*, shared_color_pool: dict[str, object]) -> str:
+    return (
+        "Shared color pool: "
+        f"status={shared_color_pool.get('status')}, "
+        f"source={shared_color_pool.get('source')}, "
+        f"sibling_article_count={shared_color_pool.get('sibling_article_count')}, "
+        f"sibling_proxy_required_total={shared_color_pool.get('sibling_proxy_required_total')}, "
+        f"observation_window_days={shared_color_pool.get('observation_window_days')}, "
+        f"as_of_date={shared_color_pool.get('as_of_date')}."
+    )
+
+
+@_renders(STEP_CODE_BUNDLE_DEFICIT)
+def _render_bundle_deficit_step(
+    *,
+    required_bundle_units: int,
+    available_bundles_for_cover: int,
+    bundle_deficit_total: int,
+) -> str:
+    return (
+        f"Дефицит по модели B: target_bundle_units={required_bundle_units}, "
+        f"available_for_cover={available_bundles_for_cover}, deficit={bundle_deficit_total}."
+    )
+
+
+@_renders(STEP_CODE_REORDER_POLICY)
+def _render_reorder_policy_step(
+    *,
+    lead_time_days_total: int,
+    safety_stock_days: int,
+    reorder_point_days: int,
+) -> str:
+    return (
+        f"Reorder policy: lead_time_days={lead_time_days_total}, "
+        f"safety_stock_days={safety_stock_days}, reorder_point_days={reorder_point_days}."
+    )
+
+
+@_renders(STEP_CODE_ECONOMIC_BUFFER)
+def _render_economic_buffer_step(
+    *,
+    allow_order_with_buffer: bool,
+    economic_buffer_days: int,
+    target_bundle_horizon_days: int,
+) -> str:
+    return (
+        f"Economic buffer policy: enabled={allow_order_with_buffer}, "
+        f"economic_buffer_days={economic_buffer_days}, target_horizon_days={target_bundle_horizon_days}."
+    )
+
+
+@_renders(STEP_CODE_PARAMETER_SOURCES)
+def _render_parameter_sources_step(
+    *,
+    size_weights_source: str,
+    in_flight_source: str,
+    bundle_stock_source: str,
+) -> str:
+    return (
+        f"Источник параметров: size_weights={size_weights_source}, "
+        f"in_flight={in_flight_source}, bundle_stock={bundle_stock_source}."
+    )
+
+
+@_renders(STEP_CODE_ECONOMICS_TRUST)
+def _render_economics_trust_step(
+    *,
+    economics_trust: dict[str, object],
+    explanation_warnings: list[dict[str, object]],
+) -> str:
+    return (
+        "Economics trust: "
+        f"level={economics_trust['economics_trust_level']}, "
+        "code_default_key_fields="
+        f"{economics_trust['code_default_key_fields']}, "
+        "code_default_key_fields_count="
+        f"{economics_trust['code_default_key_fields_count']}, "
+        "code_default_dominance_ratio="
+        f"{economics_trust['code_default_dominance_ratio']}, "
+        f"warnings={explanation_warnings}."
+    )
+
+
+@_renders(STEP_CODE_ASSORTI_CLASSIFICATION)
+def _render_assorti_classification_step(
+    *,
+    assorti_classification_source: str,
+    admin_assorti_bundle_type_ids: list[int],
+    global_assorti_bundle_type_ids: list[int],
+    assorti_bundle_type_count: int,
+    main_bundle_type_count: int,
+    assorti_classification_source_breakdown: dict[str, int],
+) -> str:
+    return (
+        "Assorti classification: "
+        f"source={assorti_classification_source}, "
+        f"fallback_admin_ids={sorted(admin_assorti_bundle_type_ids)}, "
+        f"fallback_global_ids={sorted(global_assorti_bundle_type_ids)}, "
+        f"assorti_bundle_types={assorti_bundle_type_count}, "
+        f"main_bundle_types={main_bundle_type_count}, "
+        f"source_breakdown={assorti_classification_source_breakdown}."
+    )
+
+
+@_renders(STEP_CODE_LAYER1_STOCK_HEALTH)
+def _render_layer1_stock_health_step(
+    *,
+    layer1_sku_count: int,
+    layer1_avg_coverage_days: float,
+    layer1_high_stockout_risk_count: int,
+    layer1_high_stockout_risk_threshold: float,
+    layer1_contract_status: str,
+) -> str:
+    return (
+        f"Layer 1 stock health: sku_count={layer1_sku_count}, "
+        f"avg_coverage_days={layer1_avg_coverage_days}, "
+        f"high_stockout_risk_skus={layer1_high_stockout_risk_count}, "
+        f"high_stockout_threshold={layer1_high_stockout_risk_threshold}, "
+        f"contract_status={layer1_contract_status}."
+    )
+
+
+@_renders(STEP_CODE_LAYER2_ALLOCATION)
+def _render_layer2_allocation_step(
+    *,
+    layer2_allocation_method_canonical: str,
+    layer2_allocation_method_legacy: str,
+    layer2_decision_gate_canonical: str,
+    layer2_decision_gate_legacy: str,
+    layer2_allocation_summary: dict[str, object],
+    layer2_decision_quality: dict[str, object],
+    layer2_contract_status: str,
+) -> str:
+    return (
+        f"Layer 2 allocation: method={layer2_allocation_method_canonical}, "
+        f"legacy_method={layer2_allocation_method_legacy}, "
+        f"decision_gate={layer2_decision_gate_canonical}, "
+        f"legacy_decision_gate={layer2_decision_gate_legacy}, "
+        "tie_break=hold, "
+        f"main={layer2_allocation_summary['main']}, "
+        f"assorti={layer2_allocation_summary['assorti']}, "
+        f"hold={layer2_allocation_summary['hold']}, "
+        f"near_tie={layer2_decision_quality['near_tie_count']}, "
+        f"tie_count={layer2_decision_quality['tie_count']}, "
+        "reason_counts="
+        f"{layer2_decision_quality['decision_reason_counts']}, "
+        "objective_reason_counts="
+        f"{layer2_decision_quality['decision_reason_counts_objective_score']}, "
+        "avg_profit_gap_until_eta="
+        f"{layer2_decision_quality['avg_profit_gap_until_eta']}, "
+        "avg_objective_score_gap_until_eta="
+        f"{layer2_decision_quality['avg_objective_score_gap_until_eta']}, "
+        "capital_locked_total="
+        f"{layer2_decision_quality['capital_locked_total']}, "
+        f"contract_status={layer2_contract_status}."
+    )
+
+
+@_renders(STEP_CODE_LAYER3_PURCHASE_SHAPING)
+def _render_layer3_purchase_shaping_step(
+    *,
+    layer3_purchase_shaping: dict[str, object],
+    layer3_contract_status: str,
+) -> str:
+    return (
+        "Layer 3 purchase shaping: method=allocation_decision_factors, "
+        f"qty_before={layer3_purchase_shaping['qty_before']}, "
+        f"qty_after_base={layer3_purchase_shaping['qty_after_base']}, "
+        f"qty_after={layer3_purchase_shaping['qty_after']}, "
+        f"adjusted_lines={layer3_purchase_shaping['adjusted_lines']}, "
+        f"calibration_delta_vs_base={layer3_purchase_shaping['qty_delta_vs_base']}, "
+        f"contract_status={layer3_contract_status}, "
+        "decision_lines="
+        f"main:{layer3_purchase_shaping['main_lines']}|"
+        f"assorti:{layer3_purchase_shaping['assorti_lines']}|"
+        f"hold:{layer3_purchase_shaping['hold_lines']}."
+    )
+
+
+def _format_layer4_scenario(name: str, scenario: dict[str, object]) -> str:
+    return (
+        f"{name}(capital={scenario['total_capital_required']},"
+        f"gross_profit={scenario['expected_gross_profit']},"
+        f"objective={scenario['objective_score']},"
+        f"risk={scenario['stockout_risk_proxy']})"
+    )
+
+
+@_renders(STEP_CODE_LAYER4_SCENARIOS)
+def _render_layer4_scenarios_step(*, layer4_scenarios: list[dict[str, object]]) -> str:
+    return (
+        "Layer 4 scenarios: "
+        f"{_format_layer4_scenario('Conservative', layer4_scenarios[0])}, "
+        f"{_format_layer4_scenario('Balanced', layer4_scenarios[1])}, "
+        f"{_format_layer4_scenario('Aggressive', layer4_scenarios[2])}."
+    )
+
+
+@_renders(STEP_CODE_LAYER4_CONTRACT)
+def _render_layer4_contract_step(*, layer4_contract: dict[str, object]) -> str:
+    return (
+        "Layer 4 contract: "
+        f"version={layer4_contract['version']}, "
+        f"status={layer4_contract['status']}, "
+        f"order_matches_expected={layer4_contract.get('order_matches_expected')}, "
+        f"checks={layer4_contract['checks']}."
+    )
+
+
+@_renders(STEP_CODE_LAYER4_AGGREGATE_DELTAS)
+def _render_layer4_aggregate_deltas_step(*, layer4_aggregate_deltas: dict[str, object]) -> str:
+    return (
+        "Layer 4 aggregate deltas: "
+        "aggressive_vs_conservative("
+        "capital_delta="
+        f"{layer4_aggregate_deltas['aggressive_vs_conservative']['capital_delta']},"
+        "gross_profit_delta="
+        f"{layer4_aggregate_deltas['aggressive_vs_conservative']['gross_profit_delta']},"
+        "objective_delta="
+        f"{layer4_aggregate_deltas['aggressive_vs_conservative']['objective_delta']})."
+    )
+
+
+@_renders(STEP_CODE_CAPITAL_GAP)
+def _render_capital_gap_step(*, capital_gap_summary: dict[str, object]) -> str:
+    return (
+        "Capital gap: "
+        f"status={capital_gap_summary['status']}, "
+        f"available_capital={capital_gap_summary['available_capital']}, "
+        f"required_capital={capital_gap_summary['required_capital']}, "
+        f"deficit_or_surplus={capital_gap_summary['deficit_or_surplus']}."
+    )
+
+
+@_renders(STEP_CODE_CAPITAL_CONSTRAINT)
+def _render_capital_constraint_step(
+    *,
+    capital_constraint_summary: dict[str, object],
+    capital_constraint_contract_status: str,
+) -> str:
+    return (
+        "Capital constraint: "
+        f"status={capital_constraint_summary['status']}, "
+        f"constrained={capital_constraint_summary['constrained']}, "
+        f"available_capital={capital_constraint_summary['available_capital']}, "
+        "required_capital_before_constraint="
+        f"{capital_constraint_summary['required_capital_before_constraint']}, "
+        "allocated_capital_after_constraint="
+        f"{capital_constraint_summary['allocated_capital_after_constraint']}, "
+        f"cutoff_line={capital_constraint_summary['cutoff_line']}, "
+        f"contract_status={capital_constraint_contract_status}."
+    )
+
+
+@_renders(STEP_CODE_LAYER5_INTERVENTION)
+def _render_layer5_intervention_step(
+    *,
+    layer5_intervention: dict[str, object],
+    layer5_contract_status: str,
+) -> str:
+    return (
+        "Layer 5 intervention: "
+        f"unavoidable_stockout={layer5_intervention['unavoidable_stockout']}, "
+        f"signals={layer5_intervention['signals']}, "
+        f"reason={layer5_intervention['reason']}, "
+        "aggressive_stockout_risk="
+        f"{layer5_intervention['aggressive_stockout_risk_proxy']}, "
+        f"threshold={layer5_intervention['risk_threshold']}, "
+        f"signal_thresholds={layer5_intervention['signal_thresholds']}, "
+        "economic_justification="
+        f"{layer5_intervention.get('economic_justification', {})}, "
+        f"contract_status={layer5_contract_status}."
+    )
+
+
+@_renders(STEP_CODE_ELASTIC_SCOPE)
+def _render_elastic_scope_step(
+    *,
+    elastic_scope_mode: str,
+    applicable_elastic_type_ids: list[int],
+    scoped_elastic_rows_count: int,
+    elastic_scope_line_count: int,
+) -> str:
+    return (
+        f"Elastic scope: mode={elastic_scope_mode}, "
+        f"applicable_types={sorted(applicable_elastic_type_ids)}, "
+        f"scoped_settings={scoped_elastic_rows_count}, "
+        f"scoped_lines={elastic_scope_line_count}."
+    )
+
+
+@_renders(STEP_CODE_ELASTIC_UPLIFT)
+def _render_elastic_uplift_step(
+    *,
+    elastic_uplift_delta: int,
+    elastic_uplift_scope: str,
+    elastic_uplift_keys: list[tuple[int, int]],
+    elastic_uplift_line_alloc: dict[tuple[int, int], int],
+) -> str:
+    return (
+        f"Elastic uplift: delta={elastic_uplift_delta}, "
+        f"scope={elastic_uplift_scope}, "
+        f"affected_lines={len(elastic_uplift_keys)}, "
+        f"line_keys={elastic_uplift_keys}, "
+        f"line_alloc={elastic_uplift_line_alloc}."
+    )
+
+
+@_renders(STEP_CODE_IN_FLIGHT)
+def _render_in_flight_step(
+    *,
+    in_flight_raw_qty_total: int,
+    in_flight_effective_qty_total: int,
+    in_flight_effective_lines: int,
+) -> str:
+    return (
+        f"In-flight вклад (ETA/stage): raw_qty={in_flight_raw_qty_total}, "
+        f"effective_qty={in_flight_effective_qty_total}, lines={in_flight_effective_lines}."
+    )
+
+
+@_renders(STEP_CODE_CONSTRAINTS_APPLIED)
+def _render_constraints_applied_step(
+    *,
+    fabric_constraint_count: int,
+    elastic_constraint_count: int,
+) -> str:
+    return (
+        f"Применены ограничения: fabric_constraints={fabric_constraint_count}, "
+        f"elastic_constraints={elastic_constraint_count}."
+    )
+
+
+@_renders(STEP_CODE_COMPACT_OMITTED)
+def _render_compact_omitted_step(*, omitted_steps: int) -> str:
+    return f"Explainability compact mode: omitted_steps={omitted_steps}."
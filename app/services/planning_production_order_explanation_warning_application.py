@@ -4,7 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ExplanationWarningApplicationResult:
     explanation_warnings: list[dict[str, object]]
 
@@ -30,6 +30,7 @@ from app.services.planning_production_order_economics import (
     FROM_WB_OBSERVED_ECONOMIC_SOURCE,
     _normalize_non_negative_float,
 )
+from app.services.planning_production_order_explainability import EXPLAINABILITY_MODE_NONE
 from app.services.planning_production_order_freshness import (
     _raise_from_wb_strict_freshness_failure_if_needed,
     _resolve_from_wb_freshness_thresholds,
@@ -147,7 +148,14 @@ def _build_from_wb_proposal_request(
     return ProductionOrderProposalRequest(
         article_id=request.article_id,
         planning_horizon_days=request.planning_horizon_days,
-        explainability_mode="full",
+        # From-WB meta is merged before compaction, so only "none" is forwarded as is.
+        explainability_mode=(
+            EXPLAINABILITY_MODE_NONE
+            if request.explainability_mode == EXPLAINABILITY_MODE_NONE
+            else "full"
+        ),
+        debug_stage_timings=request.debug_stage_timings,
+        layer4_scenario_grid_points=request.layer4_scenario_grid_points,
         bundle_daily_sales=[
             BundleDemandInput(
                 bundle_type_id=bundle_type_id,
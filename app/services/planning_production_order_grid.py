@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+
+# Ownership: this module owns the dense color x size quantity grid used inside the
+# production-order pipeline for stock, current stock and effective in-flight quantities.
+
+
+class ColorSizeGrid(Mapping[tuple[int, int], int]):
+    """Integer quantities on ordinal color and size axes.
+
+    Cells are stored row-major in one flat list (`color ordinal * len(size_ids) + size ordinal`)
+    with a presence mask next to it. Hot loops read whole color rows by ordinal instead of
+    hashing `(color_id, size_id)` tuples. Reads also go through the `Mapping` interface keyed by
+    `(color_id, size_id)`, so code written against the old dict maps keeps working. Only cells
+    set with `put`/`add` count as keys; unset cells read as 0 through `rows()`.
+    """
+
+    __slots__ = ("color_ids", "size_ids", "_color_index", "_size_index", "_cells", "_present")
+
+    def __init__(self, color_ids: Iterable[int], size_ids: Iterable[int]) -> None:
+        self.color_ids: tuple[int, ...] = tuple(int(color_id) for color_id in color_ids)
+        self.size_ids: tuple[int, ...] = tuple(int(size_id) for size_id in size_ids)
+        self._color_index = {color_id: ordinal for ordinal, color_id in enumerate(self.color_ids)}
+        self._size_index = {size_id: ordinal for ordinal, size_id in enumerate(self.size_ids)}
+        cell_count = len(self.color_ids) * len(self.size_ids)
+        self._cells: list[int] = [0] * cell_count
+        self._present = bytearray(cell_count)
+
+    @classmethod
+    def from_mapping(
+        cls,
+        quantities: Mapping[tuple[int, int], int | None],
+        *,
+        color_ids: Iterable[int],
+        size_ids: Iterable[int],
+    ) -> ColorSizeGrid:
+        """Build a grid from a `(color_id, size_id)` map; keys outside the axes are dropped."""
+
+        grid = cls(color_ids, size_ids)
+        for key, qty in quantities.items():
+            offset = grid._offset(key)
+            if offset is not None:
+                grid._cells[offset] = int(qty or 0)
+                grid._present[offset] = 1
+        return grid
+
+    def _offset(self, key: object) -> int | None:
+        if not isinstance(key, tuple) or len(key) != 2:
+            return None
+        color_ordinal = self._color_index.get(key[0])
+        size_ordinal = self._size_index.get(key[1])
+        if color_ordinal is None or size_ordinal is None:
+            return None
+        return color_ordinal * len(self.size_ids) + size_ordinal
+
+    def __getitem__(self, key: tuple[int, int]) -> int:
+        offset = self._offset(key)
+        if offset is None or not self._present[offset]:
+            raise KeyError(key)
+        return self._cells[offset]
+
+    def get(self, key: object, default: int | None = None) -> int | None:
+        offset = self._offset(key)
+        if offset is None or not self._present[offset]:
+            return default
+        return self._cells[offset]
+
+    def __contains__(self, key: object) -> bool:
+        offset = self._offset(key)
+        return offset is not None and bool(self._present[offset])
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        width = len(self.size_ids)
+        for color_ordinal, color_id in enumerate(self.color_ids):
+            base = color_ordinal * width
+            for size_ordinal, size_id in enumerate(self.size_ids):
+                if self._present[base + size_ordinal]:
+                    yield (color_id, size_id)
+
+    def __len__(self) -> int:
+        return self._present.count(1)
+
+    def __repr__(self) -> str:
+        return f"ColorSizeGrid({dict(self.items())!r})"
+
+    def put(self, color_id: int, size_id: int, qty: int) -> None:
+        offset = self._offset((color_id, size_id))
+        if offset is None:
+            raise KeyError((color_id, size_id))
+        self._cells[offset] = int(qty)
+        self._present[offset] = 1
+
+    def add(self, color_id: int, size_id: int, qty: int) -> None:
+        offset = self._offset((color_id, size_id))
+        if offset is None:
+            raise KeyError((color_id, size_id))
+        self._cells[offset] += int(qty)
+        self._present[offset] = 1
+
+    def copy(self) -> ColorSizeGrid:
+        grid = ColorSizeGrid.__new__(ColorSizeGrid)
+        grid.color_ids = self.color_ids
+        grid.size_ids = self.size_ids
+        grid._color_index = self._color_index
+        grid._size_index = self._size_index
+        grid._cells = list(self._cells)
+        grid._present = bytearray(self._present)
+        return grid
+
+    def has_axes(self, color_ids: Iterable[int], size_ids: Iterable[int]) -> bool:
+        return self.color_ids == tuple(color_ids) and self.size_ids == tuple(size_ids)
+
+    def rows(self) -> list[list[int]]:
+        """Per-color rows of quantities in `size_ids` order, in `color_ids` order."""
+
+        width = len(self.size_ids)
+        return [
+            self._cells[color_ordinal * width : (color_ordinal + 1) * width]
+            for color_ordinal in range(len(self.color_ids))
+        ]
+
+    def to_dict(self) -> dict[tuple[int, int], int]:
+        return dict(self.items())
+
+
+def _as_color_size_grid(
+    quantities: Mapping[tuple[int, int], int | None],
+    *,
+    color_ids: list[int],
+    size_ids: list[int],
+) -> ColorSizeGrid:
+    if isinstance(quantities, ColorSizeGrid) and quantities.has_axes(color_ids, size_ids):
+        return quantities
+    return ColorSizeGrid.from_mapping(quantities, color_ids=color_ids, size_ids=size_ids)
@@ -4,7 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _HorizonApplicationResult:
     economic_buffer_days: int
     target_bundle_horizon_days: int
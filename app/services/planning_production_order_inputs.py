@@ -10,9 +10,10 @@ from sqlalchemy.orm import Session
 
 from app.models.models import BundleRecipe, SkuUnit, StockBalance
 from app.schemas.planning_production_order import ProductionOrderProposalRequest
+from app.services.planning_production_order_grid import ColorSizeGrid
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _PreparedProductionOrderInputs:
     bundle_type_ids: list[int]
     recipe_colors_by_bundle: dict[int, set[int]]
@@ -22,13 +23,13 @@ class _PreparedProductionOrderInputs:
     size_ids: list[int]
     size_weights_source: str
     size_weights: dict[int, float]
-    stock_by_color_size: dict[tuple[int, int], int]
-    current_stock_by_color_size: dict[tuple[int, int], int]
+    stock_by_color_size: ColorSizeGrid
+    current_stock_by_color_size: ColorSizeGrid
     in_flight_source: str
     in_flight_raw_qty_total: int
     in_flight_effective_qty_total: int
     in_flight_effective_lines: int
-    in_flight_effective_by_color_size: dict[tuple[int, int], int]
+    in_flight_effective_by_color_size: ColorSizeGrid
     in_flight_eta_days_by_color_size: dict[tuple[int, int], int]
     demand_by_bundle: dict[int, float]
     total_daily_sales: float
@@ -157,10 +158,10 @@ def _prepare_production_order_inputs(
         int(row.sku_unit_id): max(int(row.total_qty or 0), 0) for row in stock_agg_rows
     }
 
-    stock_by_color_size: dict[tuple[int, int], int] = {}
+    current_stock_by_color_size = ColorSizeGrid(all_recipe_color_ids, size_ids)
     for sku in sku_units:
-        stock_by_color_size[(sku.color_id, sku.size_id)] = stock_by_sku_id.get(sku.id, 0)
-    current_stock_by_color_size = dict(stock_by_color_size)
+        current_stock_by_color_size.put(sku.color_id, sku.size_id, stock_by_sku_id.get(sku.id, 0))
+    stock_by_color_size = current_stock_by_color_size.copy()
 
     effective_in_flight_supply = list(request.in_flight_supply)
     in_flight_source = "request"
@@ -180,7 +181,7 @@ def _prepare_production_order_inputs(
     in_flight_raw_qty_total = 0
     in_flight_effective_qty_total = 0
     in_flight_effective_lines = 0
-    in_flight_effective_by_color_size: dict[tuple[int, int], int] = defaultdict(int)
+    in_flight_effective_by_color_size = ColorSizeGrid(all_recipe_color_ids, size_ids)
     in_flight_eta_days_by_color_size: dict[tuple[int, int], int] = {}
 
     for in_flight in effective_in_flight_supply:
@@ -212,8 +213,8 @@ def _prepare_production_order_inputs(
 
         in_flight_effective_qty_total += effective_qty
         in_flight_effective_lines += 1
-        in_flight_effective_by_color_size[key] += effective_qty
-        stock_by_color_size[key] = stock_by_color_size.get(key, 0) + effective_qty
+        in_flight_effective_by_color_size.add(in_flight.color_id, in_flight.size_id, effective_qty)
+        stock_by_color_size.add(in_flight.color_id, in_flight.size_id, effective_qty)
 
     demand_by_bundle = {
         item.bundle_type_id: item.daily_sales for item in request.bundle_daily_sales
@@ -278,7 +279,7 @@ def _prepare_production_order_inputs(
         in_flight_raw_qty_total=in_flight_raw_qty_total,
         in_flight_effective_qty_total=in_flight_effective_qty_total,
         in_flight_effective_lines=in_flight_effective_lines,
-        in_flight_effective_by_color_size=dict(in_flight_effective_by_color_size),
+        in_flight_effective_by_color_size=in_flight_effective_by_color_size,
         in_flight_eta_days_by_color_size=in_flight_eta_days_by_color_size,
         demand_by_bundle=demand_by_bundle,
         total_daily_sales=total_daily_sales,
@@ -4,7 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Layer1SummaryApplicationResult:
     layer1_avg_coverage_days: float
     layer1_high_stockout_risk_count: int
@@ -18,6 +18,7 @@ def _apply_production_order_layer1_summary(
     build_layer1_contract_summary: Callable[
         [list[dict[str, int | float | None]]], dict[str, object]
     ],
+    include_explanation_summaries: bool = True,
 ) -> _Layer1SummaryApplicationResult:
     layer1_avg_coverage_days = (
         round(
@@ -33,7 +34,11 @@ def _apply_production_order_layer1_summary(
         for item in layer1_stock_health_metrics
         if float(item["stockout_risk"]) >= layer1_high_stockout_risk_threshold
     )
-    layer1_contract = build_layer1_contract_summary(layer1_stock_health_metrics)
+    layer1_contract = (
+        build_layer1_contract_summary(layer1_stock_health_metrics)
+        if include_explanation_summaries
+        else {}
+    )
     return _Layer1SummaryApplicationResult(
         layer1_avg_coverage_days=layer1_avg_coverage_days,
         layer1_high_stockout_risk_count=layer1_high_stockout_risk_count,
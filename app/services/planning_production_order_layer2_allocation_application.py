@@ -4,7 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Layer2AllocationApplicationResult:
     layer2_allocation_decisions: list[dict[str, int | float | str]]
     layer2_allocation_summary: dict[str, int]
@@ -4,7 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Layer2SummaryApplicationResult:
     layer2_contract: dict[str, object]
     layer2_decision_quality: dict[str, object]
@@ -16,7 +16,10 @@ def _apply_production_order_layer2_summary(
     layer2_allocation_summary: dict[str, int],
     build_layer2_contract_summary: Callable[..., dict[str, object]],
     build_layer2_decision_quality_summary: Callable[..., dict[str, object]],
+    include_explanation_summaries: bool = True,
 ) -> _Layer2SummaryApplicationResult:
+    if not include_explanation_summaries:
+        return _Layer2SummaryApplicationResult(layer2_contract={}, layer2_decision_quality={})
     layer2_contract = build_layer2_contract_summary(
         layer2_allocation_decisions=layer2_allocation_decisions,
         layer2_allocation_summary=layer2_allocation_summary,
@@ -4,7 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Layer3ApplicationResult:
     layer3_decision_by_line: dict[tuple[int, int], str]
     layer3_purchase_shaping: dict[str, int | float | dict[str, object] | str]
@@ -22,6 +22,7 @@ def _apply_production_order_layer3(
         ..., tuple[dict[tuple[int, int], str], dict[str, int | float | dict[str, object] | str]]
     ],
     build_layer3_contract_summary: Callable[[dict[str, object]], dict[str, object]],
+    include_explanation_summaries: bool = True,
 ) -> _Layer3ApplicationResult:
     layer3_decision_by_line, layer3_purchase_shaping = apply_layer3_purchase_shaping(
         line_qty=line_qty,
@@ -30,7 +31,11 @@ def _apply_production_order_layer3(
         layer3_stockout_boost_max=layer3_stockout_boost_max,
         layer3_overstock_dampen_max=layer3_overstock_dampen_max,
     )
-    layer3_contract = build_layer3_contract_summary(layer3_purchase_shaping)
+    layer3_contract = (
+        build_layer3_contract_summary(layer3_purchase_shaping)
+        if include_explanation_summaries
+        else {}
+    )
     return _Layer3ApplicationResult(
         layer3_decision_by_line=layer3_decision_by_line,
         layer3_purchase_shaping=layer3_purchase_shaping,
@@ -4,13 +4,14 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Layer4ApplicationResult:
     expected_horizon_sales: float
     layer4_scenarios: list[dict[str, str | int | float]]
     capital_gap_summary: dict[str, float | str | None]
     layer4_contract: dict[str, str | bool | list[str] | dict[str, bool]]
     layer4_aggregate_deltas: dict[str, dict[str, float]]
+    layer4_efficiency_frontier: dict[str, object] | None = None
 
 
 def _apply_production_order_layer4_analysis(
@@ -34,9 +35,12 @@ def _apply_production_order_layer4_analysis(
     build_capital_gap_summary: Callable[..., dict[str, float | str | None]],
     build_layer4_contract_summary: Callable[..., dict[str, str | bool | list[str] | dict[str, bool]]],
     build_layer4_aggregate_deltas: Callable[..., dict[str, dict[str, float]]],
+    include_explanation_summaries: bool = True,
+    scenario_grid_points: int = 0,
+    build_layer4_efficiency_frontier_summary: Callable[..., dict[str, object]] | None = None,
 ) -> _Layer4ApplicationResult:
     expected_horizon_sales = total_daily_sales * planning_horizon_days
-    layer4_scenarios = build_layer4_scenarios(
+    scenario_inputs = dict(
         base_purchase_units=candidate_total_units,
         available_bundles_for_cover=available_bundles_for_cover,
         total_daily_sales=total_daily_sales,
@@ -52,6 +56,22 @@ def _apply_production_order_layer4_analysis(
         stockout_penalty_weight=stockout_penalty_weight,
         overstock_penalty_weight=overstock_penalty_weight,
     )
+    layer4_scenarios = build_layer4_scenarios(**scenario_inputs)
+    # The frontier is requested per proposal, so it is built even when explanation summaries are off.
+    layer4_efficiency_frontier = (
+        build_layer4_efficiency_frontier_summary(grid_points=scenario_grid_points, **scenario_inputs)
+        if scenario_grid_points > 0 and build_layer4_efficiency_frontier_summary is not None
+        else None
+    )
+    if not include_explanation_summaries:
+        return _Layer4ApplicationResult(
+            expected_horizon_sales=expected_horizon_sales,
+            layer4_scenarios=layer4_scenarios,
+            capital_gap_summary={},
+            layer4_contract={},
+            layer4_aggregate_deltas={},
+            layer4_efficiency_frontier=layer4_efficiency_frontier,
+        )
     capital_gap_summary = build_capital_gap_summary(
         layer4_scenarios=layer4_scenarios,
         available_capital=available_capital,
@@ -65,4 +85,5 @@ def _apply_production_order_layer4_analysis(
         capital_gap_summary=capital_gap_summary,
         layer4_contract=layer4_contract,
         layer4_aggregate_deltas=layer4_aggregate_deltas,
+        layer4_efficiency_frontier=layer4_efficiency_frontier,
     )
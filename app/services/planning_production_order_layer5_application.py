@@ -4,7 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Layer5ApplicationResult:
     layer5_intervention: dict[str, object]
     layer5_contract: dict[str, str | int | dict[str, bool]]
@@ -23,6 +23,7 @@ def _apply_production_order_layer5_analysis(
     reduce_order_marginal_profit_rate: float,
     build_layer5_intervention_signals: Callable[..., dict[str, object]],
     build_layer5_contract_summary: Callable[..., dict[str, str | int | dict[str, bool]]],
+    include_explanation_summaries: bool = True,
 ) -> _Layer5ApplicationResult:
     layer5_intervention = build_layer5_intervention_signals(
         risk_level=risk_level,
@@ -34,6 +35,12 @@ def _apply_production_order_layer5_analysis(
         price_slowdown_lost_volume_rate=price_slowdown_lost_volume_rate,
         reduce_order_marginal_profit_rate=reduce_order_marginal_profit_rate,
     )
+    if not include_explanation_summaries:
+        return _Layer5ApplicationResult(
+            layer5_intervention=layer5_intervention,
+            layer5_contract={},
+            layer5_intervention_meta={},
+        )
     layer5_contract = build_layer5_contract_summary(
         layer5_intervention=layer5_intervention,
         layer4_scenarios=layer4_scenarios,
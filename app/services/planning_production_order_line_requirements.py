@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from app.services.planning_production_order_math import (
-    _allocate_units,
+    _allocate_units_batch,
     _ceil_to_int,
     _normalize_weights,
 )
@@ -25,7 +26,7 @@ def _build_line_requirements_plan(
     shares_by_bundle: dict[int, float],
     color_to_sizes: dict[int, list[int]],
     size_weights: dict[int, float],
-    stock_by_color_size: dict[tuple[int, int], int],
+    stock_by_color_size: Mapping[tuple[int, int], int],
 ) -> _LineRequirementsPlan:
     color_probability: dict[int, float] = {
         color_id: 0.0 for color_id in all_recipe_color_ids
@@ -39,21 +40,36 @@ def _build_line_requirements_plan(
         uniform = 1.0 / len(all_recipe_color_ids)
         color_probability = {color_id: uniform for color_id in all_recipe_color_ids}
 
-    line_required: dict[tuple[int, int], int] = {}
+    color_ids_with_sizes: list[int] = []
+    color_target_units: list[int] = []
+    color_size_weights: list[dict[int, float]] = []
+    local_weights_by_size_run: dict[tuple[int, ...], dict[int, float]] = {}
     for color_id in all_recipe_color_ids:
-        color_target_units = _ceil_to_int(
-            bundle_deficit_total * color_probability.get(color_id, 0.0)
-        )
         sizes_for_color = color_to_sizes.get(color_id, [])
         if not sizes_for_color:
             continue
 
-        local_weights = _normalize_weights(
-            sizes_for_color,
-            {size_id: size_weights.get(size_id, 0.0) for size_id in sizes_for_color},
+        color_ids_with_sizes.append(color_id)
+        color_target_units.append(
+            _ceil_to_int(bundle_deficit_total * color_probability.get(color_id, 0.0))
         )
-        allocated = _allocate_units(color_target_units, local_weights)
+        # Colors sold in the same size run share one normalized vector, which the batch kernel
+        # then prepares once.
+        size_run = tuple(sizes_for_color)
+        local_weights = local_weights_by_size_run.get(size_run)
+        if local_weights is None:
+            local_weights = _normalize_weights(
+                sizes_for_color,
+                {size_id: size_weights.get(size_id, 0.0) for size_id in sizes_for_color},
+            )
+            local_weights_by_size_run[size_run] = local_weights
+        color_size_weights.append(local_weights)
 
+    line_required: dict[tuple[int, int], int] = {}
+    for color_id, allocated in zip(
+        color_ids_with_sizes,
+        _allocate_units_batch(color_target_units, color_size_weights),
+    ):
         for size_id, qty in allocated.items():
             line_required[(color_id, size_id)] = qty
 
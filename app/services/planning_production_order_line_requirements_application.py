@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 
 from app.services.planning_production_order_line_requirements import _LineRequirementsPlan
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _LineRequirementsApplicationResult:
     color_probability: dict[int, float]
     line_required: dict[tuple[int, int], int]
@@ -22,7 +22,7 @@ def _apply_production_order_line_requirements(
     shares_by_bundle: dict[int, float],
     color_to_sizes: dict[int, list[int]],
     size_weights: dict[int, float],
-    stock_by_color_size: dict[tuple[int, int], int],
+    stock_by_color_size: Mapping[tuple[int, int], int],
     build_line_requirements_plan: Callable[..., _LineRequirementsPlan],
 ) -> _LineRequirementsApplicationResult:
     line_requirements_plan = build_line_requirements_plan(
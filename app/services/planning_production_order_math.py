@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 
 def _ceil_to_int(value: float) -> int:
     as_int = int(value)
@@ -40,29 +42,64 @@ def _normalize_weights(size_ids: list[int], raw_weights: dict[int, float]) -> di
     return {size_id: normalized[size_id] / norm_total for size_id in size_ids}
 
 
-def _allocate_units(total_units: int, weights: dict[int, float]) -> dict[int, int]:
-    if total_units <= 0 or not weights:
-        return {key: 0 for key in weights}
-
+def _prepare_allocation_weights(weights: dict[int, float]) -> tuple[list[int], list[float]]:
     keys = sorted(weights.keys())
-    raw_values: dict[int, float] = {
-        key: float(total_units) * max(weights.get(key, 0.0), 0.0) for key in keys
-    }
+    return keys, [max(weights.get(key, 0.0), 0.0) for key in keys]
 
-    allocated: dict[int, int] = {key: int(raw_values[key]) for key in keys}
-    assigned = sum(allocated.values())
-    remainder = max(total_units - assigned, 0)
+
+def _split_units_largest_remainder(
+    total_units: int,
+    keys: list[int],
+    clamped_weights: list[float],
+) -> dict[int, int]:
+    raw_values = [float(total_units) * weight for weight in clamped_weights]
+    allocated = [int(raw_value) for raw_value in raw_values]
+    remainder = max(total_units - sum(allocated), 0)
 
     if remainder > 0:
-        remainders = sorted(
-            keys,
-            key=lambda key: (raw_values[key] - allocated[key], -key),
+        # Largest fractional part first; ties go to the smaller key.
+        order = sorted(
+            range(len(keys)),
+            key=lambda index: (raw_values[index] - allocated[index], -keys[index]),
             reverse=True,
         )
-        for index in range(remainder):
-            allocated[remainders[index % len(remainders)]] += 1
+        for step in range(remainder):
+            allocated[order[step % len(order)]] += 1
+
+    return dict(zip(keys, allocated))
 
-    return allocated
+
+def _allocate_units(total_units: int, weights: dict[int, float]) -> dict[int, int]:
+    if total_units <= 0 or not weights:
+        return {key: 0 for key in weights}
+
+    keys, clamped_weights = _prepare_allocation_weights(weights)
+    return _split_units_largest_remainder(total_units, keys, clamped_weights)
+
+
+def _allocate_units_batch(
+    totals: Sequence[int],
+    weight_vectors: Sequence[dict[int, float]],
+) -> list[dict[int, int]]:
+    """Split each total over its weight vector, exactly as `_allocate_units` would.
+
+    Hot loops hand over all their (total, weights) pairs at once; a weight vector object that
+    appears several times (one color's size weights across stock keys, say) is sorted and
+    clamped once per call instead of once per total.
+    """
+
+    prepared: dict[int, tuple[list[int], list[float]]] = {}
+    results: list[dict[int, int]] = []
+    for total_units, weights in zip(totals, weight_vectors, strict=True):
+        if total_units <= 0 or not weights:
+            results.append({key: 0 for key in weights})
+            continue
+        prepared_weights = prepared.get(id(weights))
+        if prepared_weights is None:
+            prepared_weights = _prepare_allocation_weights(weights)
+            prepared[id(weights)] = prepared_weights
+        results.append(_split_units_largest_remainder(total_units, *prepared_weights))
+    return results
 
 
 def _add_units_for_color(
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from app.schemas.planning_production_order import (
+    PlanningOverridesInput,
+    ProductionOrderPortfolioRequest,
+    ProductionOrderPortfolioResponse,
+    ProductionOrderProposalRequest,
+    ProductionOrderProposalResponse,
+    ProductionOrderRecommendationLine,
+)
+from app.services.planning_production_order_explainability import EXPLAINABILITY_MODE_NONE
+
+# Ownership: this module owns portfolio (batch) capital allocation. Every article in the batch is
+# run through the direct proposal pipeline up to its own capital ranking, then one shared budget is
+# filled across all ranked candidate lines with a single priority-queue greedy.
+
+PORTFOLIO_SOURCE_REASON_SUFFIX = "|portfolio_capital_constraint"
+
+
+@dataclass(frozen=True, slots=True)
+class _PortfolioArticleInput:
+    article_id: int
+    candidate_lines: list[ProductionOrderRecommendationLine]
+    ranking: list[dict[str, int | float | str]]
+    unit_capital_per_unit: float
+
+
+@dataclass(frozen=True, slots=True)
+class _PortfolioAllocation:
+    status: str
+    constrained: bool
+    available_capital: float
+    required_capital: float
+    allocated_capital: float
+    remaining_capital: float
+    articles: list[dict[str, object]]
+
+
+def _allocate_portfolio_capital(
+    *,
+    articles: list[_PortfolioArticleInput],
+    available_capital: float,
+) -> _PortfolioAllocation:
+    """Fill one capital budget across the ranked candidate lines of every article.
+
+    Lines compete on the same key `_build_line_objective_capital_rankings` sorts one article by
+    (objective per capital, objective, stockout risk, overstock risk), with batch position and
+    in-article rank as tie-breakers. The heap is built in O(n) and each line is popped once, so
+    the whole batch costs O(n log n). Like the per-article cut, a line that no longer fits in
+    full is partially filled and cheaper lines further down may still use the remainder.
+    """
+
+    available_capital_value = max(float(available_capital), 0.0)
+    unit_capitals = [max(float(article.unit_capital_per_unit), 0.0) for article in articles]
+    requested_by_article: list[dict[tuple[int, int], int]] = []
+    allocated_by_article: list[dict[tuple[int, int], int]] = []
+    heap: list[tuple[float, float, float, float, int, int, int, int, int]] = []
+    required_capital = 0.0
+
+    for article_index, article in enumerate(articles):
+        unit_capital = unit_capitals[article_index]
+        requested = {
+            (int(line.color_id), int(line.size_id)): max(int(line.recommended_qty), 0)
+            for line in article.candidate_lines
+        }
+        requested_by_article.append(requested)
+        required_capital += sum(requested.values()) * unit_capital
+        if unit_capital <= 0:
+            # Lines that consume no capital never compete for the budget.
+            allocated_by_article.append(dict(requested))
+            continue
+        allocated_by_article.append({})
+        for ranked_line in article.ranking:
+            key = (int(ranked_line["color_id"]), int(ranked_line["size_id"]))
+            if requested.get(key, 0) <= 0:
+                continue
+            heap.append(
+                (
+                    -float(ranked_line["objective_score_per_capital"]),
+                    -float(ranked_line["objective_score"]),
+                    -float(ranked_line.get("stockout_risk", 0.0)),
+                    float(ranked_line.get("overstock_risk", 0.0)),
+                    article_index,
+                    int(ranked_line.get("rank", 0)),
+                    key[0],
+                    key[1],
+                    requested[key],
+                )
+            )
+
+    constrained = required_capital > available_capital_value
+    remaining_capital = available_capital_value
+    if not constrained:
+        for entry in heap:
+            allocated_by_article[entry[4]][(entry[6], entry[7])] = entry[8]
+        remaining_capital = available_capital_value - required_capital
+    else:
+        heapq.heapify(heap)
+        min_unit_capital = min((unit_capitals[entry[4]] for entry in heap), default=0.0)
+        while heap and remaining_capital >= min_unit_capital:
+            *_, article_index, _rank, color_id, size_id, requested_qty = heapq.heappop(heap)
+            unit_capital = unit_capitals[article_index]
+            allocated_qty = min(requested_qty, int(remaining_capital // unit_capital))
+            if allocated_qty <= 0:
+                continue
+            allocated_by_article[article_index][(color_id, size_id)] = allocated_qty
+            remaining_capital = max(remaining_capital - allocated_qty * unit_capital, 0.0)
+
+    article_rows: list[dict[str, object]] = []
+    allocated_capital = 0.0
+    for article_index, article in enumerate(articles):
+        unit_capital = unit_capitals[article_index]
+        requested = requested_by_article[article_index]
+        allocated = allocated_by_article[article_index]
+        rank_by_key = {
+            (int(ranked_line["color_id"]), int(ranked_line["size_id"])): int(ranked_line.get("rank", 0))
+            for ranked_line in article.ranking
+        }
+        lines: list[ProductionOrderRecommendationLine] = []
+        cut_lines: list[dict[str, int]] = []
+        for line in article.candidate_lines:
+            key = (int(line.color_id), int(line.size_id))
+            requested_qty = requested[key]
+            allocated_qty = allocated.get(key, 0)
+            if allocated_qty > 0:
+                lines.append(
+                    line
+                    if allocated_qty == requested_qty
+                    else ProductionOrderRecommendationLine(
+                        article_id=line.article_id,
+                        color_id=line.color_id,
+                        size_id=line.size_id,
+                        recommended_qty=allocated_qty,
+                        source_reason=f"{line.source_reason}{PORTFOLIO_SOURCE_REASON_SUFFIX}",
+                    )
+                )
+            if allocated_qty < requested_qty:
+                cut_lines.append(
+                    {
+                        "rank": rank_by_key.get(key, 0),
+                        "color_id": key[0],
+                        "size_id": key[1],
+                        "requested_qty": requested_qty,
+                        "allocated_qty": allocated_qty,
+                    }
+                )
+        cut_lines.sort(key=lambda item: item["rank"])
+        requested_qty_total = sum(requested.values())
+        allocated_qty_total = sum(line.recommended_qty for line in lines)
+        article_allocated_capital = allocated_qty_total * unit_capital
+        allocated_capital += article_allocated_capital
+        article_rows.append(
+            {
+                "article_id": int(article.article_id),
+                "unit_capital_per_unit": round(unit_capital, 4),
+                "requested_qty": requested_qty_total,
+                "allocated_qty": allocated_qty_total,
+                "cut_qty": requested_qty_total - allocated_qty_total,
+                "required_capital": round(requested_qty_total * unit_capital, 2),
+                "allocated_capital": round(article_allocated_capital, 2),
+                "line_count_before": len(article.candidate_lines),
+                "line_count_after": len(lines),
+                "cut_lines": cut_lines,
+                "lines": lines,
+            }
+        )
+
+    return _PortfolioAllocation(
+        status="budget_limited_applied" if constrained else "within_budget",
+        constrained=constrained,
+        available_capital=round(available_capital_value, 2),
+        required_capital=round(required_capital, 2),
+        allocated_capital=round(allocated_capital, 2),
+        remaining_capital=round(max(remaining_capital, 0.0), 2),
+        articles=article_rows,
+    )
+
+
+def _build_portfolio_proposal_request(
+    proposal: ProductionOrderProposalRequest,
+    *,
+    available_capital: float,
+) -> ProductionOrderProposalRequest:
+    # The per-article run only has to reach the capital ranking, and nothing from the explanation
+    # is read back. The shared budget is set only to satisfy strict capital governance; the run
+    # itself is uncapped (`enforce_capital_limit=False`) and the budget is applied once, across
+    # all articles, by `_allocate_portfolio_capital`.
+    overrides = proposal.overrides or PlanningOverridesInput()
+    return proposal.model_copy(
+        update={
+            "explainability_mode": EXPLAINABILITY_MODE_NONE,
+            "debug_stage_timings": False,
+            "layer4_scenario_grid_points": 0,
+            "overrides": overrides.model_copy(update={"available_capital": available_capital}),
+        }
+    )
+
+
+def _build_production_order_portfolio_response(
+    *,
+    db: Session,
+    request: ProductionOrderPortfolioRequest,
+    build_production_order_proposal: Callable[..., ProductionOrderProposalResponse],
+) -> ProductionOrderPortfolioResponse:
+    article_inputs: list[_PortfolioArticleInput] = []
+    skipped_article_ids: list[int] = []
+    waiting_article_ids: list[int] = []
+    for proposal in request.proposals:
+        stage_results: dict[str, object] = {}
+        build_production_order_proposal(
+            db=db,
+            request=_build_portfolio_proposal_request(proposal, available_capital=request.available_capital),
+            stage_results=stage_results,
+            enforce_capital_limit=False,
+        )
+        capital_application = stage_results.get("capital_constraints")
+        if capital_application is None:
+            skipped_article_ids.append(int(proposal.article_id))
+            continue
+        # Candidate lines exist even when the article's own uncapped decision is to wait (cover
+        # until arrival, ok or overstock risk); such articles must not draw on the shared budget.
+        if stage_results["scope_recommendation"].action == "wait":
+            waiting_article_ids.append(int(proposal.article_id))
+            continue
+        article_inputs.append(
+            _PortfolioArticleInput(
+                article_id=int(proposal.article_id),
+                candidate_lines=stage_results["candidate_lines"].candidate_lines,
+                ranking=capital_application.capital_rankings,
+                unit_capital_per_unit=stage_results["economic_governance"].economic_settings.unit_capital_per_unit,
+            )
+        )
+
+    allocation = _allocate_portfolio_capital(articles=article_inputs, available_capital=request.available_capital)
+    return ProductionOrderPortfolioResponse(
+        status=allocation.status,
+        generated_at=datetime.now(timezone.utc),
+        constrained=allocation.constrained,
+        available_capital=allocation.available_capital,
+        required_capital=allocation.required_capital,
+        allocated_capital=allocation.allocated_capital,
+        remaining_capital=allocation.remaining_capital,
+        skipped_article_ids=skipped_article_ids,
+        waiting_article_ids=waiting_article_ids,
+        articles=allocation.articles,
+    )
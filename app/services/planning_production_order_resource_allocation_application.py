@@ -1,18 +1,23 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 
 from app.schemas.planning_production_order import ProductionOrderResourceAllocationApplied
+from app.services.planning_production_order_competition import (
+    _build_competition_allocation_plan,
+    _CompetitionAllocationPlan,
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ResourceAllocationApplicationResult:
     resource_allocation: ProductionOrderResourceAllocationApplied
     competition_raw_by_bundle: dict[int, int]
     competition_raw_bundle_stock: int
     competition_raw_breakdown: str
     available_bundles_for_cover: int
+    competition_allocation_plan: _CompetitionAllocationPlan
 
 
 def _apply_production_order_resource_allocation(
@@ -21,13 +26,21 @@ def _apply_production_order_resource_allocation(
     recipe_colors_by_bundle: dict[int, set[int]],
     all_recipe_color_ids: list[int],
     size_ids: list[int],
-    stock_by_color_size: dict[tuple[int, int], int],
+    stock_by_color_size: Mapping[tuple[int, int], int],
     shares_by_bundle: dict[int, float],
     ready_bundle_stock_total: int,
     build_competition_aware_resource_allocation: Callable[
         ..., ProductionOrderResourceAllocationApplied
     ],
+    validate_contract: bool = True,
 ) -> _ResourceAllocationApplicationResult:
+    competition_allocation_plan = _build_competition_allocation_plan(
+        bundle_type_ids=bundle_type_ids,
+        recipe_colors_by_bundle=recipe_colors_by_bundle,
+        all_recipe_color_ids=all_recipe_color_ids,
+        size_ids=size_ids,
+        shares_by_bundle=shares_by_bundle,
+    )
     resource_allocation = build_competition_aware_resource_allocation(
         bundle_type_ids=bundle_type_ids,
         recipe_colors_by_bundle=recipe_colors_by_bundle,
@@ -35,6 +48,8 @@ def _apply_production_order_resource_allocation(
         size_ids=size_ids,
         stock_by_color_size=stock_by_color_size,
         shares_by_bundle=shares_by_bundle,
+        validate_contract=validate_contract,
+        allocation_plan=competition_allocation_plan,
     )
     competition_raw_by_bundle = {
         int(bundle_type_id): int(reserved_qty)
@@ -52,4 +67,5 @@ def _apply_production_order_resource_allocation(
         competition_raw_bundle_stock=competition_raw_bundle_stock,
         competition_raw_breakdown=competition_raw_breakdown,
         available_bundles_for_cover=available_bundles_for_cover,
+        competition_allocation_plan=competition_allocation_plan,
     )
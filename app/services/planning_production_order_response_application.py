@@ -6,7 +6,7 @@ from datetime import datetime
 from app.schemas.planning_production_order import ProductionOrderProposalResponse
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ResponseApplicationResult:
     response: ProductionOrderProposalResponse
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from math import ceil
 from typing import Callable
 
@@ -7,6 +8,7 @@ from app.schemas.planning_production_order import (
     ProductionOrderArrivalProjection,
     ProductionOrderPhysicalScope,
 )
+from app.services.planning_production_order_competition import _CompetitionAllocationPlan
 
 # Ownership: this module owns physical-scope and arrival-horizon projection builders.
 
@@ -53,13 +55,14 @@ def _build_arrival_horizon_projection(
     recipe_colors_by_bundle: dict[int, set[int]],
     all_recipe_color_ids: list[int],
     size_ids: list[int],
-    current_stock_by_color_size: dict[tuple[int, int], int],
-    in_flight_effective_by_color_size: dict[tuple[int, int], int],
+    current_stock_by_color_size: Mapping[tuple[int, int], int],
+    in_flight_effective_by_color_size: Mapping[tuple[int, int], int],
     shares_by_bundle: dict[int, float],
     ready_bundle_stock_total: int,
     total_daily_sales: float,
     lead_time_days_total: int,
     estimate_raw_bundle_stock: EstimateRawBundleStock,
+    competition_allocation_plan: _CompetitionAllocationPlan | None = None,
 ) -> ProductionOrderArrivalProjection:
     raw_now_by_bundle = estimate_raw_bundle_stock(
         bundle_type_ids=bundle_type_ids,
@@ -68,6 +71,7 @@ def _build_arrival_horizon_projection(
         size_ids=size_ids,
         stock_by_color_size=current_stock_by_color_size,
         shares_by_bundle=shares_by_bundle,
+        allocation_plan=competition_allocation_plan,
     )
     in_flight_by_bundle = estimate_raw_bundle_stock(
         bundle_type_ids=bundle_type_ids,
@@ -76,6 +80,7 @@ def _build_arrival_horizon_projection(
         size_ids=size_ids,
         stock_by_color_size=in_flight_effective_by_color_size,
         shares_by_bundle=shares_by_bundle,
+        allocation_plan=competition_allocation_plan,
     )
     raw_bundle_capacity_now = sum(raw_now_by_bundle.values())
     in_flight_bundle_capacity_at_arrival = sum(in_flight_by_bundle.values())
@@ -147,13 +152,14 @@ def build_physical_scope_and_arrival_projection(
     recipe_colors_by_bundle: dict[int, set[int]],
     all_recipe_color_ids: list[int],
     size_ids: list[int],
-    current_stock_by_color_size: dict[tuple[int, int], int],
-    in_flight_effective_by_color_size: dict[tuple[int, int], int],
+    current_stock_by_color_size: Mapping[tuple[int, int], int],
+    in_flight_effective_by_color_size: Mapping[tuple[int, int], int],
     shares_by_bundle: dict[int, float],
     ready_bundle_stock_total: int,
     total_daily_sales: float,
     lead_time_days_total: int,
     estimate_raw_bundle_stock: EstimateRawBundleStock,
+    competition_allocation_plan: _CompetitionAllocationPlan | None = None,
 ) -> tuple[ProductionOrderPhysicalScope, ProductionOrderArrivalProjection]:
     physical_scope = _build_physical_scope_contract(
         bundle_stock_source=bundle_stock_source,
@@ -172,5 +178,6 @@ def build_physical_scope_and_arrival_projection(
         total_daily_sales=total_daily_sales,
         lead_time_days_total=lead_time_days_total,
         estimate_raw_bundle_stock=estimate_raw_bundle_stock,
+        competition_allocation_plan=competition_allocation_plan,
     )
     return physical_scope, arrival_projection
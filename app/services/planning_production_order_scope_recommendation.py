@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -11,9 +11,10 @@ from app.schemas.planning_production_order import (
     ProductionOrderRecommendation,
     ProductionOrderRecommendationLine,
 )
+from app.services.planning_production_order_competition import _CompetitionAllocationPlan
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ScopeRecommendationResult:
     physical_scope: ProductionOrderPhysicalScope
     arrival_projection: ProductionOrderArrivalProjection
@@ -31,8 +32,8 @@ def _apply_production_order_scope_and_recommendation(
     recipe_colors_by_bundle: dict[int, set[int]],
     all_recipe_color_ids: list[int],
     size_ids: list[int],
-    current_stock_by_color_size: dict[tuple[int, int], int],
-    in_flight_effective_by_color_size: dict[tuple[int, int], int],
+    current_stock_by_color_size: Mapping[tuple[int, int], int],
+    in_flight_effective_by_color_size: Mapping[tuple[int, int], int],
     shares_by_bundle: dict[int, float],
     ready_bundle_stock_total: int,
     total_daily_sales: float,
@@ -46,6 +47,7 @@ def _apply_production_order_scope_and_recommendation(
     estimate_raw_bundle_stock: Callable[..., int],
     build_physical_scope_and_arrival_projection: Callable[..., tuple[ProductionOrderPhysicalScope, ProductionOrderArrivalProjection]],
     build_recommendation_and_alternatives: Callable[..., tuple[str, ProductionOrderRecommendation, list[ProductionOrderAlternative]]],
+    competition_allocation_plan: _CompetitionAllocationPlan | None = None,
 ) -> _ScopeRecommendationResult:
     physical_scope, arrival_projection = build_physical_scope_and_arrival_projection(
         bundle_stock_source=bundle_stock_source,
@@ -62,6 +64,7 @@ def _apply_production_order_scope_and_recommendation(
         total_daily_sales=total_daily_sales,
         lead_time_days_total=lead_time_days_total,
         estimate_raw_bundle_stock=estimate_raw_bundle_stock,
+        competition_allocation_plan=competition_allocation_plan,
     )
     action, recommendation, alternatives = build_recommendation_and_alternatives(
         arrival_projection=arrival_projection,
@@ -11,7 +11,7 @@ from app.models.models import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _SettingsLoadingApplicationResult:
     article_settings: ArticlePlanningSettings | None
     planning_settings: PlanningSettings | None
@@ -10,7 +10,7 @@ from app.services.planning_production_order_layer_proxy import _EffectiveLayerPr
 from app.services.planning_production_order_settings import _EffectiveSettings
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _SettingsResolutionApplicationResult:
     settings: _EffectiveSettings
     layer_proxy_settings: _EffectiveLayerProxySettings
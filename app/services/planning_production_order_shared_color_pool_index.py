@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import NamedTuple
+
+from sqlalchemy import event, func
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import SHARED_COLOR_POOL_INDEX_TTL_SECONDS
+from app.core.metrics import REGISTRY
+from app.models.models import (
+    Article,
+    ArticlePlanningSettings,
+    ArticleWbMapping,
+    Color,
+    SkuUnit,
+    WbSalesDaily,
+)
+
+# Ownership: this module owns the process-local pantone -> sibling articles index read by the
+# shared color pool. The index and per-(as_of_date, window) article sales are built once per
+# engine and generation; ORM flushes that touch the source tables bump the generation.
+
+SHARED_COLOR_POOL_INDEX_CACHE_NAME = "shared_color_pool_index"
+SHARED_COLOR_POOL_INDEX_MAX_SALES_WINDOWS = 16
+
+_SHARED_COLOR_POOL_INDEX_MODELS: tuple[type, ...] = (
+    Article,
+    ArticlePlanningSettings,
+    ArticleWbMapping,
+    Color,
+    SkuUnit,
+    WbSalesDaily,
+)
+_SESSION_DIRTY_KEY = "shared_color_pool_index_dirty"
+
+
+@dataclass
+class _SharedColorPoolIndex:
+    article_ids_by_pantone: dict[str, tuple[int, ...]]
+    pantones_by_article: dict[int, frozenset[str]]
+    include_in_planning_by_article: dict[int, bool]
+    article_code_by_id: dict[int, str]
+    latest_sales_date: date | None
+    sales_qty_by_window: dict[tuple[date, int], dict[int, int]] = field(default_factory=dict)
+
+
+class _SharedColorPoolIndexCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+def _load_shared_color_pool_index(db: Session) -> _SharedColorPoolIndex:
+    pantone_rows = (
+        db.query(SkuUnit.article_id, Color.pantone_code)
+        .join(Color, Color.id == SkuUnit.color_id)
+        .filter(Color.pantone_code.isnot(None))
+        .distinct()
+        .all()
+    )
+    pantones_by_article: dict[int, set[str]] = defaultdict(set)
+    article_ids_by_pantone: dict[str, set[int]] = defaultdict(set)
+    for article_id, pantone_code in pantone_rows:
+        if pantone_code:
+            pantones_by_article[int(article_id)].add(str(pantone_code))
+            article_ids_by_pantone[str(pantone_code)].add(int(article_id))
+
+    include_in_planning_by_article = {
+        int(article_id): bool(include_in_planning)
+        for article_id, include_in_planning in db.query(
+            ArticlePlanningSettings.article_id,
+            ArticlePlanningSettings.include_in_planning,
+        ).all()
+    }
+    article_code_by_id = {int(article_id): str(code) for article_id, code in db.query(Article.id, Article.code).all()}
+    latest_sales_date = db.query(func.max(WbSalesDaily.date)).scalar()
+
+    return _SharedColorPoolIndex(
+        article_ids_by_pantone={
+            pantone_code: tuple(sorted(article_ids)) for pantone_code, article_ids in article_ids_by_pantone.items()
+        },
+        pantones_by_article={article_id: frozenset(codes) for article_id, codes in pantones_by_article.items()},
+        include_in_planning_by_article=include_in_planning_by_article,
+        article_code_by_id=article_code_by_id,
+        latest_sales_date=latest_sales_date if isinstance(latest_sales_date, date) else None,
+    )
+
+
+def _load_article_window_sales(db: Session, *, as_of_date: date, window_days: int) -> dict[int, int]:
+    sales_window_start = as_of_date - timedelta(days=window_days - 1)
+    rows = (
+        db.query(
+            ArticleWbMapping.article_id,
+            func.coalesce(func.sum(WbSalesDaily.sales_qty), 0).label("sales_qty"),
+        )
+        .join(WbSalesDaily, WbSalesDaily.wb_sku == ArticleWbMapping.wb_sku)
+        .filter(
+            WbSalesDaily.date >= sales_window_start,
+            WbSalesDaily.date <= as_of_date,
+        )
+        .group_by(ArticleWbMapping.article_id)
+        .all()
+    )
+    return {int(row.article_id): max(int(row.sales_qty or 0), 0) for row in rows}
+
+
+@dataclass
+class _SharedColorPoolIndexEntry:
+    index: _SharedColorPoolIndex
+    generation: int
+    built_at: float
+
+
+class _SharedColorPoolIndexCache:
+    """One shared color pool index per database engine, rebuilt after invalidation or TTL expiry.
+
+    Entries are keyed weakly on the engine behind the session, so sessions bound to another
+    database never read this one's siblings. ``invalidate`` bumps the generation; an index built
+    under an older generation is never returned. A session with uncommitted writes to the source
+    tables gets a freshly loaded index that is not cached, so its rows never reach other sessions.
+    Window sales are filled lazily per ``(as_of_date, window_days)`` on the index they belong to.
+    A TTL of 0 disables caching and every call loads a fresh index.
+    """
+
+    def __init__(self, *, ttl_seconds: float = SHARED_COLOR_POOL_INDEX_TTL_SECONDS) -> None:
+        self.ttl_seconds = float(ttl_seconds)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._entries: weakref.WeakKeyDictionary[Engine, _SharedColorPoolIndexEntry] = weakref.WeakKeyDictionary()
+        self._hits = 0
+        self._misses = 0
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def cache_info(self) -> _SharedColorPoolIndexCacheInfo:
+        with self._lock:
+            return _SharedColorPoolIndexCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                currsize=sum(1 + len(entry.index.sales_qty_by_window) for entry in self._entries.values()),
+            )
+
+    def get(self, db: Session) -> _SharedColorPoolIndex:
+        engine = db.get_bind().engine
+        cacheable = self.ttl_seconds > 0 and not db.info.get(_SESSION_DIRTY_KEY, False)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(engine) if cacheable else None
+            if (
+                entry is not None
+                and entry.generation == self._generation
+                and now - entry.built_at < self.ttl_seconds
+            ):
+                self._hits += 1
+                return entry.index
+            self._misses += 1
+            generation = self._generation
+
+        index = _load_shared_color_pool_index(db)
+        with self._lock:
+            if cacheable and generation == self._generation:
+                self._entries[engine] = _SharedColorPoolIndexEntry(index=index, generation=generation, built_at=now)
+        return index
+
+    def article_window_sales(
+        self,
+        db: Session,
+        index: _SharedColorPoolIndex,
+        *,
+        as_of_date: date,
+        window_days: int,
+    ) -> dict[int, int]:
+        key = (as_of_date, int(window_days))
+        with self._lock:
+            sales_qty_by_article = index.sales_qty_by_window.get(key)
+            if sales_qty_by_article is not None:
+                self._hits += 1
+                return sales_qty_by_article
+            self._misses += 1
+
+        sales_qty_by_article = _load_article_window_sales(db, as_of_date=as_of_date, window_days=int(window_days))
+        with self._lock:
+            windows = index.sales_qty_by_window
+            if len(windows) >= SHARED_COLOR_POOL_INDEX_MAX_SALES_WINDOWS:
+                windows.pop(next(iter(windows)))
+            windows[key] = sales_qty_by_article
+        return sales_qty_by_article
+
+
+SHARED_COLOR_POOL_INDEX_CACHE = _SharedColorPoolIndexCache()
+REGISTRY.register_cache(SHARED_COLOR_POOL_INDEX_CACHE_NAME, SHARED_COLOR_POOL_INDEX_CACHE.cache_info)
+
+
+def _touches_shared_color_pool_index(session: Session) -> bool:
+    return any(
+        isinstance(instance, _SHARED_COLOR_POOL_INDEX_MODELS)
+        for instance in (*session.new, *session.dirty, *session.deleted)
+    )
+
+
+# A flush invalidates at once and marks the session, which then bypasses the cache until its
+# transaction ends; the commit or rollback invalidates again so other sessions rebuild from the
+# committed state.
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_flush(session: Session, flush_context) -> None:  # noqa: ARG001
+    if _touches_shared_color_pool_index(session):
+        session.info[_SESSION_DIRTY_KEY] = True
+        SHARED_COLOR_POOL_INDEX_CACHE.invalidate()
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_on_transaction_end(session: Session) -> None:
+    if session.info.pop(_SESSION_DIRTY_KEY, False):
+        SHARED_COLOR_POOL_INDEX_CACHE.invalidate()
@@ -17,7 +17,7 @@ from app.schemas.planning_production_order import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _SkipApplicationResult:
     response: ProductionOrderProposalResponse
 
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from app.schemas.planning_production_order import ProductionOrderProposalResponse
+from app.services.planning_production_order_stage_timing import _ProductionOrderStageTimer
+
+# Ownership: this module owns stage execution for the direct production-order path. Each
+# `_apply_production_order_*` stage runs once through `run`, its slotted result is handed straight
+# back to the orchestrator, and the stage lap is closed in the same place for every stage.
+
+_StageResultT = TypeVar("_StageResultT")
+
+
+class _ProductionOrderStageExecutor:
+    """Shared per-proposal context that runs pipeline stages and owns their timing hooks.
+
+    ``run(stage, apply_stage, **kwargs)`` calls the stage, records its result under the stage name
+    and closes the stage lap, so everything executed since the previous lap (including inline
+    helpers between stages) is attributed to that stage exactly as explicit ``mark`` calls were.
+    A caller-owned ``results`` dict lets batch callers read stage results after the run.
+    """
+
+    __slots__ = ("timer", "results")
+
+    def __init__(
+        self,
+        timer: _ProductionOrderStageTimer | None = None,
+        results: dict[str, object] | None = None,
+    ) -> None:
+        self.timer = timer if timer is not None else _ProductionOrderStageTimer()
+        self.results: dict[str, object] = results if results is not None else {}
+
+    def run(
+        self,
+        stage: str,
+        apply_stage: Callable[..., _StageResultT],
+        /,
+        **kwargs: Any,
+    ) -> _StageResultT:
+        result = apply_stage(**kwargs)
+        self.results[stage] = result
+        self.timer.mark(stage)
+        return result
+
+    def mark(self, stage: str) -> None:
+        self.timer.mark(stage)
+
+    def finish(
+        self,
+        response: ProductionOrderProposalResponse,
+        *,
+        enabled: bool,
+    ) -> ProductionOrderProposalResponse:
+        return self.timer.attach(response, enabled=enabled)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from app.core.metrics import DEFAULT_COUNT_BUCKETS, REGISTRY
+from app.core.query_stats import current_query_stats
+from app.schemas.planning_production_order import ProductionOrderProposalResponse
+
+STAGE_TIMINGS_META_KEY = "stage_timings"
+
+STAGE_DURATION_HISTOGRAM = REGISTRY.histogram(
+    "production_order_stage_duration_seconds",
+    "Wall time spent in each production-order pipeline stage.",
+    labelnames=("stage",),
+)
+STAGE_DB_QUERIES_HISTOGRAM = REGISTRY.histogram(
+    "production_order_stage_db_queries",
+    "SQL statements issued by each production-order pipeline stage (request-scoped only).",
+    labelnames=("stage",),
+    buckets=DEFAULT_COUNT_BUCKETS,
+)
+
+
+class _ProductionOrderStageTimer:
+    """Lap timer for the production-order pipeline.
+
+    ``mark(stage)`` closes the lap that started at the previous mark, so each stage owns everything
+    executed since the last one. Query counts come from the request-scoped ``QueryStats`` and are
+    ``None`` outside an HTTP request. Laps are always exported to the stage histograms.
+    """
+
+    def __init__(self) -> None:
+        self._query_stats = current_query_stats()
+        self._started = time.perf_counter()
+        self._lap_started = self._started
+        self._lap_query_count = self._query_count()
+        self.stages: list[dict[str, Any]] = []
+
+    def _query_count(self) -> int | None:
+        return self._query_stats.count if self._query_stats is not None else None
+
+    def mark(self, stage: str) -> None:
+        now = time.perf_counter()
+        wall_seconds = now - self._lap_started
+        query_count = self._query_count()
+        db_queries = (
+            query_count - self._lap_query_count
+            if query_count is not None and self._lap_query_count is not None
+            else None
+        )
+        self._lap_started = now
+        self._lap_query_count = query_count
+
+        STAGE_DURATION_HISTOGRAM.observe(wall_seconds, stage=stage)
+        if db_queries is not None:
+            STAGE_DB_QUERIES_HISTOGRAM.observe(db_queries, stage=stage)
+        self.stages.append(
+            {
+                "stage": stage,
+                "wall_ms": round(wall_seconds * 1000.0, 3),
+                "db_queries": db_queries,
+            }
+        )
+
+    def as_meta(self) -> dict[str, Any]:
+        db_counts = [entry["db_queries"] for entry in self.stages if entry["db_queries"] is not None]
+        return {
+            "total_wall_ms": round((self._lap_started - self._started) * 1000.0, 3),
+            "total_db_queries": sum(db_counts) if db_counts else None,
+            "stages": list(self.stages),
+        }
+
+    def attach(
+        self,
+        response: ProductionOrderProposalResponse,
+        *,
+        enabled: bool,
+    ) -> ProductionOrderProposalResponse:
+        if enabled:
+            response.explanation.meta[STAGE_TIMINGS_META_KEY] = self.as_meta()
+        return response
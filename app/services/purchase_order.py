@@ -37,7 +37,8 @@ def create_purchase_order_from_proposal(
         canonical_request = ProductionOrderProposalFromWbRequest(
             article_id=article_id,
             planning_horizon_days=_map_target_date_to_planning_horizon_days(target_date),
-            explainability_mode="full" if explanation else "compact",
+            # Only recommendation lines are persisted, so the explanation is never built here.
+            explainability_mode="none",
         )
         canonical_proposal = build_production_order_proposal_from_wb(
             db=db,
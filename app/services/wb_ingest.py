@@ -10,6 +10,7 @@ import httpx
 from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
+from app.core.metrics import REGISTRY
 from app.models.models import (
     Article,
     ArticlePlanningSettings,
@@ -60,6 +61,22 @@ WB_SYNC_HTTP_TIMEOUT_SECONDS = 30.0
 WB_SYNC_RATE_LIMIT_MAX_RETRIES = 2
 WB_SYNC_RATE_LIMIT_MAX_SLEEP_SECONDS = 60
 
+WB_API_REQUESTS_COUNTER = REGISTRY.counter(
+    "wb_api_requests_total",
+    "WB API HTTP calls by method, endpoint path and upstream status (\"error\" for transport failures).",
+    labelnames=("method", "endpoint", "status"),
+)
+WB_API_REQUEST_DURATION_HISTOGRAM = REGISTRY.histogram(
+    "wb_api_request_duration_seconds",
+    "WB API HTTP call latency per attempt, excluding rate-limit back-off sleeps.",
+    labelnames=("method", "endpoint"),
+)
+WB_API_RATE_LIMIT_RETRIES_COUNTER = REGISTRY.counter(
+    "wb_api_rate_limit_retries_total",
+    "WB API calls retried after a 429 response.",
+    labelnames=("endpoint",),
+)
+
 
 def _utcnow() -> datetime:
     """Helper to get timezone-aware UTC now for updated_at default."""
@@ -297,7 +314,11 @@ def _wb_request(
     json_body: dict[str, object] | None = None,
 ) -> httpx.Response:
     response: httpx.Response | None = None
+    # Path only: query strings and hosts would add nothing but label cardinality.
+    endpoint = httpx.URL(url).path
+    metric_method = str(method).upper()
     for attempt in range(WB_SYNC_RATE_LIMIT_MAX_RETRIES + 1):
+        started = time.perf_counter()
         try:
             response = httpx.request(
                 method,
@@ -308,6 +329,12 @@ def _wb_request(
                 timeout=WB_SYNC_HTTP_TIMEOUT_SECONDS,
             )
         except httpx.RequestError as exc:
+            WB_API_REQUEST_DURATION_HISTOGRAM.observe(
+                time.perf_counter() - started,
+                method=metric_method,
+                endpoint=endpoint,
+            )
+            WB_API_REQUESTS_COUNTER.inc(method=metric_method, endpoint=endpoint, status="error")
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
                 detail=_build_wb_api_failure_detail(
@@ -320,6 +347,12 @@ def _wb_request(
                 ),
             ) from exc
 
+        WB_API_REQUEST_DURATION_HISTOGRAM.observe(
+            time.perf_counter() - started,
+            method=metric_method,
+            endpoint=endpoint,
+        )
+        WB_API_REQUESTS_COUNTER.inc(method=metric_method, endpoint=endpoint, status=response.status_code)
         if response.status_code != status.HTTP_429_TOO_MANY_REQUESTS:
             break
 
@@ -347,6 +380,7 @@ def _wb_request(
                 ),
             )
 
+        WB_API_RATE_LIMIT_RETRIES_COUNTER.inc(endpoint=endpoint)
         time.sleep(min(retry_after, WB_SYNC_RATE_LIMIT_MAX_SLEEP_SECONDS))
 
     if response is None:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 from collections import defaultdict
+from collections.abc import Iterator
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
@@ -32,6 +33,16 @@ def compute_manager_stats(
     The aggregated numbers are then repeated for each SKU of the article.
     """
 
+    return list(iter_manager_stats(db=db, target_date=target_date, article_ids=article_ids))
+
+
+def iter_manager_stats(
+    db: Session,
+    target_date: date,
+    article_ids: list[int] | None = None,
+) -> Iterator[WbManagerSkuStats]:
+    """Yield WB manager stats per SKU once article-level aggregates are loaded."""
+
     # Base query: all SKU units with joined article/color/size
     query = (
         db.query(SkuUnit, Article, Color, Size)
@@ -44,7 +55,7 @@ def compute_manager_stats(
 
     sku_rows = query.all()
     if not sku_rows:
-        return []
+        return
 
     # Collect involved article_ids
     article_ids_set: set[int] = {sku.article_id for (sku, _a, _c, _s) in sku_rows}
@@ -131,8 +142,6 @@ def compute_manager_stats(
             data["stock_by_wh"][key] += qty_int
 
     # Build per-SKU stats
-    results: list[WbManagerSkuStats] = []
-
     for sku, article, color, size in sku_rows:
         data = article_data.get(sku.article_id)
         if data is None:
@@ -239,6 +248,4 @@ def compute_manager_stats(
             oos_risk_level=oos_risk,
             explanation=explanation,
         )
-        results.append(stats)
-
-    return results
+        yield stats
@@ -264,7 +264,7 @@ def build_wb_shipment_proposal_comparison(
         canonical_request = ProductionOrderProposalFromWbRequest(
             article_id=article_id,
             planning_horizon_days=planning_horizon_days,
-            explainability_mode="full",
+            explainability_mode="none",
             as_of_date=payload.target_date,
         )
         try:
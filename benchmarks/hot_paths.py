@@ -0,0 +1,493 @@
+"""Benchmark suite for planning, monitoring and ingest hot paths.
+
+Seeds a synthetic portfolio (``benchmarks.synthetic_portfolio``) and times each case for
+``--rounds`` rounds after ``--warmup`` untimed calls, recording pytest-benchmark style statistics
+(min/max/mean/median/stddev) plus the SQL statement count of one round. Results are written to
+``<output-dir>/benchmark_hot_paths.json`` and ``summary.md`` in the same artifact layout as the
+``scripts/mvp_*`` reports.
+
+With ``--baseline <report.json>`` the run is compared against a stored report: a case whose median
+grew by more than ``--max-regression`` (a fraction, default 0.25) is flagged and the command exits
+with status 1.
+
+Usage::
+
+    python -m benchmarks.hot_paths --articles 100 --output-dir bench_reports/current
+    python -m benchmarks.hot_paths --articles 100 --output-dir bench_reports/pr \\
+        --baseline bench_reports/current/benchmark_hot_paths.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import sqlalchemy
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.db import get_db
+from app.core.query_stats import DB_QUERIES_HEADER, start_query_stats, stop_query_stats
+from app.models.base import Base
+from app.models.models import ArticleWbMapping
+from app.schemas.planning_production_order import (
+    ProductionOrderProposalFromWbRequest,
+    ProductionOrderProposalRequest,
+)
+from app.schemas.wb import WbSalesDailyItem
+from app.schemas.wb_replenishment import WbReplenishmentRequest
+from app.schemas.wb_shipment import WbShipmentProposalComparisonRequest
+from app.services.bundle_risk import build_bundle_risk_portfolio
+from app.services.monitoring import build_monitoring_snapshot
+from app.services.order_explanation import build_order_explanation_portfolio
+from app.services.planning_production_order import (
+    build_production_order_proposal,
+    build_production_order_proposal_from_wb,
+)
+from app.services.wb_ingest import load_sales_daily
+from app.services.wb_replenishment import compute_replenishment
+from app.services.wb_shipment_comparison import build_wb_shipment_proposal_comparison
+from benchmarks.synthetic_portfolio import PortfolioSpec, PortfolioSummary, generate_portfolio
+
+REPORT_TYPE = "benchmark_hot_paths"
+SUMMARY_SCHEMA_VERSION = "1.0"
+REPORT_FILENAME = "benchmark_hot_paths.json"
+MARKDOWN_FILENAME = "summary.md"
+DEFAULT_MAX_REGRESSION = 0.25
+DEFAULT_SALES_ROWS = 100_000
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    group: str
+    fn: Callable[[], object]
+    # Cases that go through the ASGI app run in another context; read their count from the result.
+    db_queries_from_result: Callable[[object], int] | None = None
+
+
+@dataclass
+class BenchmarkStats:
+    rounds: int
+    min_ms: float
+    max_ms: float
+    mean_ms: float
+    median_ms: float
+    stddev_ms: float
+    db_queries: int
+
+
+def _measure(case: BenchmarkCase, *, rounds: int, warmup: int) -> BenchmarkStats:
+    for _ in range(warmup):
+        case.fn()
+
+    samples: list[float] = []
+    db_queries = 0
+    for _ in range(rounds):
+        stats, token = start_query_stats()
+        started = time.perf_counter()
+        try:
+            result = case.fn()
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            stop_query_stats(token)
+        samples.append(elapsed_ms)
+        db_queries = case.db_queries_from_result(result) if case.db_queries_from_result else stats.count
+
+    return BenchmarkStats(
+        rounds=rounds,
+        min_ms=round(min(samples), 3),
+        max_ms=round(max(samples), 3),
+        mean_ms=round(statistics.fmean(samples), 3),
+        median_ms=round(statistics.median(samples), 3),
+        stddev_ms=round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0,
+        db_queries=db_queries,
+    )
+
+
+def _direct_request(
+    summary: PortfolioSummary,
+    article_id: int,
+    explainability_mode: str,
+) -> ProductionOrderProposalRequest:
+    bundle_type_ids = summary.bundle_type_ids_by_article[article_id]
+    return ProductionOrderProposalRequest.model_validate(
+        {
+            "article_id": article_id,
+            "planning_horizon_days": 90,
+            "explainability_mode": explainability_mode,
+            "bundle_daily_sales": [
+                {"bundle_type_id": bundle_type_id, "daily_sales": 3.0 + index}
+                for index, bundle_type_id in enumerate(bundle_type_ids)
+            ],
+            "bundle_stock": [
+                {"bundle_type_id": bundle_type_id, "wb_qty": 10, "local_qty": 10} for bundle_type_id in bundle_type_ids
+            ],
+            "in_flight_supply": [],
+        }
+    )
+
+
+def _from_wb_request(
+    summary: PortfolioSummary,
+    article_id: int,
+    explainability_mode: str,
+    as_of: date,
+) -> ProductionOrderProposalFromWbRequest:
+    return ProductionOrderProposalFromWbRequest(
+        article_id=article_id,
+        explainability_mode=explainability_mode,
+        as_of_date=as_of,
+        bundle_type_ids=summary.bundle_type_ids_by_article[article_id],
+    )
+
+
+def _sales_load_case(db: Session, *, code_prefix: str, as_of: date, rows: int) -> Callable[[], object]:
+    """Half of each batch updates existing synthetic rows, half inserts rows under a fresh SKU suffix.
+
+    The fresh suffix per call keeps every round's insert/update mix identical although
+    ``load_sales_daily`` commits.
+    """
+
+    wb_skus = list(
+        db.scalars(
+            select(ArticleWbMapping.wb_sku)
+            .where(ArticleWbMapping.wb_sku.like(f"{code_prefix}%"))
+            .order_by(ArticleWbMapping.wb_sku)
+        )
+    )
+    days = max(1, -(-rows // (2 * max(len(wb_skus), 1))))
+    dates = [as_of - timedelta(days=offset) for offset in range(days)]
+    updates = [
+        WbSalesDailyItem(wb_sku=wb_sku, date=sales_date, sales_qty=1)
+        for sales_date in dates
+        for wb_sku in wb_skus
+    ][: rows // 2]
+    calls = 0
+
+    def run() -> object:
+        nonlocal calls
+        calls += 1
+        inserts = [
+            WbSalesDailyItem(wb_sku=f"{item.wb_sku}-L{calls}", date=item.date, sales_qty=1)
+            for item in updates[: rows - len(updates)]
+        ]
+        return load_sales_daily(db, [*updates, *inserts])
+
+    return run
+
+
+def _dashboard_case(db: Session) -> Callable[[], object]:
+    from app.main import app
+
+    def _get_db_override():
+        yield db
+
+    client = TestClient(app)
+
+    def run() -> object:
+        app.dependency_overrides[get_db] = _get_db_override
+        try:
+            response = client.get("/api/v1/planning/monitoring/dashboard")
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+        response.raise_for_status()
+        return response
+
+    return run
+
+
+def build_cases(db: Session, summary: PortfolioSummary, *, sales_rows: int) -> list[BenchmarkCase]:
+    as_of = date.fromisoformat(summary.as_of)
+    article_id = summary.article_ids[0]
+    replenishment = {
+        "target_date": as_of,
+        "wb_arrival_date": as_of + timedelta(days=7),
+        "article_ids": None,
+    }
+    return [
+        *(
+            BenchmarkCase(
+                name=f"production_order_direct_{mode}",
+                group="planning",
+                fn=lambda request=_direct_request(summary, article_id, mode): build_production_order_proposal(
+                    db=db, request=request
+                ),
+            )
+            for mode in ("none", "compact", "full")
+        ),
+        *(
+            BenchmarkCase(
+                name=f"production_order_from_wb_{mode}",
+                group="planning",
+                fn=lambda request=_from_wb_request(summary, article_id, mode, as_of): (
+                    build_production_order_proposal_from_wb(db=db, request=request)
+                ),
+            )
+            for mode in ("none", "compact", "full")
+        ),
+        BenchmarkCase(name="bundle_risk_portfolio", group="planning", fn=lambda: build_bundle_risk_portfolio(db=db)),
+        BenchmarkCase(
+            name="order_explanation_portfolio",
+            group="planning",
+            fn=lambda: build_order_explanation_portfolio(db=db),
+        ),
+        BenchmarkCase(name="monitoring_snapshot", group="monitoring", fn=lambda: build_monitoring_snapshot(db=db)),
+        BenchmarkCase(
+            name="monitoring_dashboard_http",
+            group="monitoring",
+            fn=_dashboard_case(db),
+            db_queries_from_result=lambda response: int(response.headers[DB_QUERIES_HEADER]),
+        ),
+        BenchmarkCase(
+            name="wb_replenishment",
+            group="wb",
+            fn=lambda: compute_replenishment(db=db, payload=WbReplenishmentRequest(**replenishment)),
+        ),
+        BenchmarkCase(
+            name="wb_shipment_proposal_comparison",
+            group="wb",
+            fn=lambda: build_wb_shipment_proposal_comparison(
+                db=db, payload=WbShipmentProposalComparisonRequest(**replenishment)
+            ),
+        ),
+        BenchmarkCase(
+            name="wb_load_sales_daily",
+            group="ingest",
+            fn=_sales_load_case(db, code_prefix=summary.code_prefix, as_of=as_of, rows=sales_rows),
+        ),
+    ]
+
+
+def _environment(engine) -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "database_dialect": engine.dialect.name,
+    }
+
+
+def run_suite(
+    spec: PortfolioSpec,
+    *,
+    rounds: int = 5,
+    warmup: int = 1,
+    sales_rows: int = DEFAULT_SALES_ROWS,
+    database_url: str | None = None,
+    only: set[str] | None = None,
+) -> dict[str, Any]:
+    """Seed ``spec`` into a fresh database and time every case; returns the report payload."""
+
+    if database_url is None:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+    else:
+        engine = create_engine(database_url)
+
+    try:
+        with sessionmaker(bind=engine, autoflush=False)() as db:
+            summary = generate_portfolio(db, spec)
+            results: dict[str, Any] = {}
+            for case in build_cases(db, summary, sales_rows=sales_rows):
+                if only and case.name not in only:
+                    continue
+                results[case.name] = {"group": case.group, **asdict(_measure(case, rounds=rounds, warmup=warmup))}
+        environment = _environment(engine)
+    finally:
+        engine.dispose()
+
+    dataset = asdict(summary)
+    dataset.pop("article_ids")
+    dataset.pop("bundle_type_ids_by_article")
+    return {
+        "report_type": REPORT_TYPE,
+        "summary_schema_version": SUMMARY_SCHEMA_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "environment": environment,
+        "params": {
+            "articles": spec.articles,
+            "days": spec.days,
+            "seed": spec.seed,
+            "rounds": rounds,
+            "warmup": warmup,
+            "sales_rows": sales_rows,
+        },
+        "dataset": dataset,
+        "results": results,
+    }
+
+
+def compare_reports(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    max_regression: float = DEFAULT_MAX_REGRESSION,
+) -> dict[str, Any]:
+    """Compare case medians; ``ratio`` is current/baseline, so 1.30 means 30% slower."""
+
+    baseline_results = baseline.get("results") or {}
+    cases: list[dict[str, Any]] = []
+    for name, result in (current.get("results") or {}).items():
+        reference = baseline_results.get(name)
+        if not isinstance(reference, dict) or not reference.get("median_ms"):
+            cases.append({"name": name, "status": "new", "current_median_ms": result["median_ms"]})
+            continue
+        ratio = result["median_ms"] / reference["median_ms"]
+        if ratio > 1.0 + max_regression:
+            status = "regression"
+        elif ratio < 1.0 - max_regression:
+            status = "improvement"
+        else:
+            status = "ok"
+        cases.append(
+            {
+                "name": name,
+                "status": status,
+                "baseline_median_ms": reference["median_ms"],
+                "current_median_ms": result["median_ms"],
+                "ratio": round(ratio, 3),
+                "baseline_db_queries": reference.get("db_queries"),
+                "current_db_queries": result.get("db_queries"),
+            }
+        )
+
+    regressions = [case["name"] for case in cases if case["status"] == "regression"]
+    return {
+        "baseline_generated_at": baseline.get("generated_at"),
+        "max_regression": max_regression,
+        "comparison_status": "regression" if regressions else "ok",
+        "regressions": regressions,
+        "validation_messages": (
+            [f"Median time regressed by more than {max_regression:.0%}: {', '.join(regressions)}."]
+            if regressions
+            else [f"No case regressed by more than {max_regression:.0%} against the baseline."]
+        ),
+        "cases": cases,
+    }
+
+
+def _value(value: Any) -> str:
+    if value is None:
+        return "n/a"
+    return str(value)
+
+
+def render_markdown_summary(report: dict[str, Any]) -> str:
+    params = report.get("params") or {}
+    environment = report.get("environment") or {}
+    lines = [
+        "# Hot Path Benchmarks",
+        "",
+        f"- **Report type**: `{_value(report.get('report_type'))}`",
+        f"- **Summary schema version**: `{_value(report.get('summary_schema_version'))}`",
+        f"- **Generated at**: `{_value(report.get('generated_at'))}`",
+        f"- **Database**: `{_value(environment.get('database_dialect'))}`",
+        f"- **Articles**: `{_value(params.get('articles'))}`, rounds `{_value(params.get('rounds'))}`",
+        "",
+        "## Results",
+        "",
+        "| Case | Group | Median ms | Mean ms | Min ms | Max ms | Stddev ms | DB queries |",
+        "|---|---|---:|---:|---:|---:|---:|---:|",
+    ]
+    for name, result in (report.get("results") or {}).items():
+        columns = ("group", "median_ms", "mean_ms", "min_ms", "max_ms", "stddev_ms", "db_queries")
+        lines.append(f"| {name} | " + " | ".join(_value(result.get(column)) for column in columns) + " |")
+
+    comparison = report.get("comparison")
+    if isinstance(comparison, dict):
+        lines.extend(
+            [
+                "",
+                "## Baseline comparison",
+                "",
+                f"- **Comparison status**: `{_value(comparison.get('comparison_status'))}`",
+                f"- **Baseline generated at**: `{_value(comparison.get('baseline_generated_at'))}`",
+            ]
+        )
+        for message in comparison.get("validation_messages") or []:
+            lines.append(f"- **Validation**: {message}")
+        lines.extend(
+            [
+                "",
+                "| Case | Status | Baseline median ms | Current median ms | Ratio |",
+                "|---|---|---:|---:|---:|",
+            ]
+        )
+        for case in comparison.get("cases") or []:
+            lines.append(
+                f"| {case['name']} | {case['status']} | {_value(case.get('baseline_median_ms'))} | "
+                f"{_value(case.get('current_median_ms'))} | {_value(case.get('ratio'))} |"
+            )
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def write_report(output_dir: Path, report: dict[str, Any]) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = output_dir / REPORT_FILENAME
+    with report_path.open("w", encoding="utf-8") as file_obj:
+        json.dump(report, file_obj, ensure_ascii=False, indent=2)
+        file_obj.write("\n")
+    (output_dir / MARKDOWN_FILENAME).write_text(render_markdown_summary(report), encoding="utf-8")
+    return report_path
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output-dir", required=True, type=Path)
+    parser.add_argument("--articles", type=int, default=100)
+    parser.add_argument("--days", type=int, default=PortfolioSpec.days)
+    parser.add_argument("--seed", type=int, default=PortfolioSpec.seed)
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--sales-rows", type=int, default=DEFAULT_SALES_ROWS)
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="empty database with the schema applied; default in-memory SQLite",
+    )
+    parser.add_argument("--only", action="append", default=None, help="run only this case (repeatable)")
+    parser.add_argument("--baseline", type=Path, default=None, help="benchmark_hot_paths.json to compare against")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION)
+    args = parser.parse_args(argv)
+    # Portfolio cases are slow by design; keep per-request statement dumps out of the console.
+    logging.getLogger("app.core.query_stats").setLevel(logging.ERROR)
+
+    report = run_suite(
+        PortfolioSpec(articles=args.articles, days=args.days, seed=args.seed, as_of=args.as_of),
+        rounds=args.rounds,
+        warmup=args.warmup,
+        sales_rows=args.sales_rows,
+        database_url=args.database_url,
+        only=set(args.only) if args.only else None,
+    )
+    if args.baseline is not None:
+        with args.baseline.open("r", encoding="utf-8-sig") as file_obj:
+            baseline = json.load(file_obj)
+        report["comparison"] = compare_reports(report, baseline, max_regression=args.max_regression)
+
+    print(write_report(args.output_dir, report))
+    comparison = report.get("comparison") or {}
+    return 1 if comparison.get("comparison_status") == "regression" else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,423 @@
+"""Offline load-test harness: replay a weighted API request mix at fixed concurrency.
+
+Runs against an already started app (e.g. ``uvicorn app.main:app --workers 4``) and records
+per-route latency percentiles (p50/p95/p99), error rates and status codes. A request counts as an
+error when it fails to complete or returns a 4xx/5xx status. Results are written to
+``<output-dir>/load_test.json`` and ``summary.md`` in the same artifact layout as the
+``scripts/mvp_*`` reports, so runs at different worker counts can be compared side by side.
+
+The request mix comes from one of:
+
+* ``--seed-payloads``: the JSON printed by ``python -m scripts.po_api_smoke_seed`` (also saved as
+  ``seed_payloads.json`` by ``dev.ps1 mvp-first-analytics``). It expands to the default mix:
+  proposal, from-wb, shipment comparison, dashboard, risk-focus and list endpoints.
+* ``--requests-file``: a captured ``requests.json`` (``{"requests": [{name, method, url, body}]}``)
+  from an MVP first analytics report; every captured request is replayed with equal weight, and
+  the list endpoints are added unless ``--no-list-endpoints`` is passed.
+
+Usage::
+
+    python -m scripts.po_api_smoke_seed > seed_payloads.json
+    python -m benchmarks.load_test --base-url http://127.0.0.1:8000 --seed-payloads seed_payloads.json \\
+        --concurrency 16 --requests 2000 --output-dir load_reports/workers-4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+REPORT_TYPE = "load_test"
+SUMMARY_SCHEMA_VERSION = "1.0"
+REPORT_FILENAME = "load_test.json"
+MARKDOWN_FILENAME = "summary.md"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_REQUESTS = 500
+DEFAULT_TIMEOUT_SECONDS = 60.0
+
+API_PREFIX = "/api/v1"
+
+LIST_ENDPOINTS: tuple[tuple[str, str], ...] = (
+    ("article-list", f"{API_PREFIX}/article/"),
+    ("purchase-order-list", f"{API_PREFIX}/purchase-order/"),
+    ("shipment-headers", f"{API_PREFIX}/wb/manager/shipment/headers"),
+)
+
+
+@dataclass(frozen=True)
+class LoadRequest:
+    name: str
+    method: str
+    path: str
+    body: dict[str, Any] | None = None
+    weight: float = 1.0
+
+
+@dataclass(frozen=True)
+class RequestResult:
+    name: str
+    status_code: int | None
+    latency_ms: float
+    error: str | None = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or self.status_code is None or self.status_code >= 400
+
+
+def _list_requests() -> list[LoadRequest]:
+    return [LoadRequest(name=name, method="GET", path=path) for name, path in LIST_ENDPOINTS]
+
+
+def build_default_mix(seed_payloads: dict[str, Any], *, include_lists: bool = True) -> list[LoadRequest]:
+    """Default request mix built from ``scripts.po_api_smoke_seed`` payloads.
+
+    Weights favour the polled read endpoints; proposal calls are heavier but rarer.
+    """
+
+    mix = [
+        LoadRequest(
+            name="production-order-direct",
+            method="POST",
+            path=f"{API_PREFIX}/planning/core/production-order/proposal",
+            body=seed_payloads["direct_payload"],
+            weight=1.0,
+        ),
+        LoadRequest(
+            name="production-order-from-wb",
+            method="POST",
+            path=f"{API_PREFIX}/planning/core/production-order/proposal/from-wb",
+            body=seed_payloads["from_wb_payload"],
+            weight=1.0,
+        ),
+        LoadRequest(
+            name="shipment-comparison",
+            method="POST",
+            path=f"{API_PREFIX}/wb/manager/shipment/from-proposal/comparison",
+            body=seed_payloads["shipment_comparison_payload"],
+            weight=1.0,
+        ),
+        LoadRequest(
+            name="monitoring-dashboard",
+            method="GET",
+            path=f"{API_PREFIX}/planning/monitoring/dashboard",
+            weight=2.0,
+        ),
+        LoadRequest(
+            name="monitoring-risk-focus",
+            method="GET",
+            path=f"{API_PREFIX}/planning/monitoring/risk-focus",
+            weight=2.0,
+        ),
+    ]
+    if include_lists:
+        mix.extend(LoadRequest(name=r.name, method=r.method, path=r.path, weight=2.0) for r in _list_requests())
+    return mix
+
+
+def load_requests_file(path: Path, *, include_lists: bool = True) -> list[LoadRequest]:
+    """Turn a captured MVP ``requests.json`` into a replayable mix (absolute URLs become paths)."""
+
+    with path.open("r", encoding="utf-8-sig") as file_obj:
+        payload = json.load(file_obj)
+
+    mix: list[LoadRequest] = []
+    for item in payload.get("requests") or []:
+        if not isinstance(item, dict) or not item.get("url"):
+            continue
+        parts = urlsplit(str(item["url"]))
+        request_path = parts.path + (f"?{parts.query}" if parts.query else "")
+        body = item.get("body")
+        mix.append(
+            LoadRequest(
+                name=str(item.get("name") or request_path),
+                method=str(item.get("method") or "GET").upper(),
+                path=request_path,
+                body=body if isinstance(body, dict) else None,
+            )
+        )
+    if include_lists:
+        captured_paths = {request.path for request in mix}
+        mix.extend(request for request in _list_requests() if request.path not in captured_paths)
+    return mix
+
+
+def build_schedule(mix: list[LoadRequest], *, total_requests: int, seed: int) -> list[LoadRequest]:
+    """Deterministic weighted sequence of requests; every route appears at least once."""
+
+    if not mix:
+        raise ValueError("request mix is empty")
+    rng = random.Random(seed)
+    schedule = list(mix[:total_requests])
+    remaining = max(total_requests - len(schedule), 0)
+    schedule.extend(rng.choices(mix, weights=[request.weight for request in mix], k=remaining))
+    rng.shuffle(schedule)
+    return schedule
+
+
+async def _send(client: httpx.AsyncClient, request: LoadRequest) -> RequestResult:
+    started = time.perf_counter()
+    try:
+        response = await client.request(request.method, request.path, json=request.body)
+    except httpx.HTTPError as exc:
+        return RequestResult(
+            name=request.name,
+            status_code=None,
+            latency_ms=(time.perf_counter() - started) * 1000.0,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    return RequestResult(
+        name=request.name,
+        status_code=response.status_code,
+        latency_ms=(time.perf_counter() - started) * 1000.0,
+    )
+
+
+async def run_schedule(
+    client: httpx.AsyncClient,
+    schedule: list[LoadRequest],
+    *,
+    concurrency: int,
+) -> list[RequestResult]:
+    """Send ``schedule`` with at most ``concurrency`` requests in flight."""
+
+    queue: asyncio.Queue[LoadRequest] = asyncio.Queue()
+    for request in schedule:
+        queue.put_nowait(request)
+    results: list[RequestResult] = []
+
+    async def worker() -> None:
+        while True:
+            try:
+                request = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            results.append(await _send(client, request))
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return results
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float | None:
+    """Linear-interpolated percentile of an already sorted list (``fraction`` in 0..1)."""
+
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    value = sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+    return round(value, 3)
+
+
+def _latency_summary(results: list[RequestResult], elapsed_s: float) -> dict[str, Any]:
+    latencies = sorted(result.latency_ms for result in results)
+    errors = sum(1 for result in results if result.failed)
+    return {
+        "requests": len(results),
+        "errors": errors,
+        "error_rate": round(errors / len(results), 4) if results else 0.0,
+        "throughput_rps": round(len(results) / elapsed_s, 2) if elapsed_s > 0 else None,
+        "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else None,
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "max_ms": round(latencies[-1], 3) if latencies else None,
+    }
+
+
+def build_report(
+    mix: list[LoadRequest],
+    results: list[RequestResult],
+    *,
+    elapsed_s: float,
+    params: dict[str, Any],
+) -> dict[str, Any]:
+    by_route: dict[str, list[RequestResult]] = defaultdict(list)
+    for result in results:
+        by_route[result.name].append(result)
+
+    routes: dict[str, Any] = {}
+    for request in mix:
+        if request.name in routes:
+            continue
+        route_results = by_route.get(request.name, [])
+        routes[request.name] = {
+            "method": request.method,
+            "path": request.path,
+            **_latency_summary(route_results, elapsed_s),
+            "status_counts": dict(
+                sorted(Counter(str(r.status_code or r.error or "error") for r in route_results).items())
+            ),
+        }
+
+    overall = _latency_summary(results, elapsed_s)
+    error_routes = [name for name, route in routes.items() if route["errors"]]
+    return {
+        "report_type": REPORT_TYPE,
+        "summary_schema_version": SUMMARY_SCHEMA_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "params": params,
+        "elapsed_seconds": round(elapsed_s, 3),
+        "overall": overall,
+        "routes": routes,
+        "validation_messages": (
+            [f"Requests failed on: {', '.join(error_routes)}."]
+            if error_routes
+            else ["All requests completed with a 2xx/3xx status."]
+        ),
+    }
+
+
+def run_load_test(
+    mix: list[LoadRequest],
+    *,
+    base_url: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    total_requests: int = DEFAULT_REQUESTS,
+    seed: int = 0,
+    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> dict[str, Any]:
+    """Replay ``mix`` against ``base_url`` and return the report payload.
+
+    ``transport`` lets tests drive an in-process app through ``httpx.ASGITransport``.
+    """
+
+    schedule = build_schedule(mix, total_requests=total_requests, seed=seed)
+
+    async def _run() -> tuple[list[RequestResult], float]:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout_seconds,
+            limits=limits,
+            transport=transport,
+        ) as client:
+            started = time.perf_counter()
+            results = await run_schedule(client, schedule, concurrency=concurrency)
+            return results, time.perf_counter() - started
+
+    results, elapsed_s = asyncio.run(_run())
+    return build_report(
+        mix,
+        results,
+        elapsed_s=elapsed_s,
+        params={
+            "base_url": base_url,
+            "concurrency": concurrency,
+            "requests": total_requests,
+            "seed": seed,
+            "timeout_seconds": timeout_seconds,
+            "mix": [{"name": r.name, "method": r.method, "path": r.path, "weight": r.weight} for r in mix],
+        },
+    )
+
+
+def _value(value: Any) -> str:
+    if value is None:
+        return "n/a"
+    return str(value)
+
+
+def render_markdown_summary(report: dict[str, Any]) -> str:
+    params = report.get("params") or {}
+    overall = report.get("overall") or {}
+    lines = [
+        "# Load Test",
+        "",
+        f"- **Report type**: `{_value(report.get('report_type'))}`",
+        f"- **Summary schema version**: `{_value(report.get('summary_schema_version'))}`",
+        f"- **Generated at**: `{_value(report.get('generated_at'))}`",
+        f"- **Base URL**: `{_value(params.get('base_url'))}`",
+        f"- **Concurrency**: `{_value(params.get('concurrency'))}`, requests `{_value(params.get('requests'))}`",
+        f"- **Throughput**: `{_value(overall.get('throughput_rps'))}` req/s over "
+        f"`{_value(report.get('elapsed_seconds'))}` s",
+        f"- **Overall latency**: p50 `{_value(overall.get('p50_ms'))}` ms, p95 `{_value(overall.get('p95_ms'))}` ms, "
+        f"p99 `{_value(overall.get('p99_ms'))}` ms; error rate `{_value(overall.get('error_rate'))}`",
+    ]
+    for message in report.get("validation_messages") or []:
+        lines.append(f"- **Validation**: {message}")
+    lines.extend(
+        [
+            "",
+            "## Routes",
+            "",
+            "| Route | Method | Requests | Errors | Error rate | p50 ms | p95 ms | p99 ms | Max ms | Statuses |",
+            "|---|---|---:|---:|---:|---:|---:|---:|---:|---|",
+        ]
+    )
+    for name, route in (report.get("routes") or {}).items():
+        columns = ("method", "requests", "errors", "error_rate", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+        statuses = ", ".join(f"{status}: {count}" for status, count in (route.get("status_counts") or {}).items())
+        lines.append(
+            f"| {name} | " + " | ".join(_value(route.get(column)) for column in columns) + f" | {statuses} |"
+        )
+    lines.append("")
+    return "\n".join(lines)
+
+
+def write_report(output_dir: Path, report: dict[str, Any]) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = output_dir / REPORT_FILENAME
+    with report_path.open("w", encoding="utf-8") as file_obj:
+        json.dump(report, file_obj, ensure_ascii=False, indent=2)
+        file_obj.write("\n")
+    (output_dir / MARKDOWN_FILENAME).write_text(render_markdown_summary(report), encoding="utf-8")
+    return report_path
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", required=True, help="root of the running app, e.g. http://127.0.0.1:8000")
+    parser.add_argument("--output-dir", required=True, type=Path)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--seed-payloads", type=Path, help="JSON printed by scripts.po_api_smoke_seed")
+    source.add_argument("--requests-file", type=Path, help="captured MVP requests.json to replay")
+    parser.add_argument("--no-list-endpoints", action="store_true", help="do not add the list endpoints to the mix")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS, help="total requests to send")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the weighted request order")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_SECONDS, help="per-request timeout (s)")
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=None,
+        help="exit with status 1 when the overall error rate exceeds this fraction",
+    )
+    args = parser.parse_args(argv)
+
+    include_lists = not args.no_list_endpoints
+    if args.seed_payloads is not None:
+        with args.seed_payloads.open("r", encoding="utf-8-sig") as file_obj:
+            mix = build_default_mix(json.load(file_obj), include_lists=include_lists)
+    else:
+        mix = load_requests_file(args.requests_file, include_lists=include_lists)
+
+    report = run_load_test(
+        mix,
+        base_url=args.base_url,
+        concurrency=args.concurrency,
+        total_requests=args.requests,
+        seed=args.seed,
+        timeout_seconds=args.timeout,
+    )
+    print(write_report(args.output_dir, report))
+    if args.max_error_rate is not None and report["overall"]["error_rate"] > args.max_error_rate:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
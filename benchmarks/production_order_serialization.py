@@ -0,0 +1,238 @@
+"""Serialization benchmark for large production-order proposal responses.
+
+Builds a ``ProductionOrderProposalResponse`` with ``explainability_mode="full"`` for a synthetic
+multi-color/multi-size article on an in-memory SQLite database and times three response paths:
+
+- ``jsonable_encoder``: FastAPI's generic path (``jsonable_encoder`` + stdlib ``json.dumps``);
+- ``response_model``: FastAPI's ``response_model`` path (re-validate the model, then dump to JSON);
+- ``orjson``: ``build_model_response`` (one ``model_dump(mode="json")`` + orjson).
+
+Usage::
+
+    python -m benchmarks.production_order_serialization --colors 24 --sizes 10 --bundle-types 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.responses import build_model_response
+from app.models.base import Base
+from app.models.models import (
+    Article,
+    ArticlePlanningSettings,
+    BundleRecipe,
+    BundleType,
+    Color,
+    GlobalPlanningSettings,
+    PlanningSettings,
+    Size,
+    SkuUnit,
+    StockBalance,
+    Warehouse,
+)
+from app.schemas.planning_production_order import (
+    ProductionOrderProposalRequest,
+    ProductionOrderProposalResponse,
+)
+from app.services.planning_production_order import build_production_order_proposal
+
+
+def _seed_wide_article(db: Session, *, colors: int, sizes: int, bundle_types: int, colors_per_bundle: int) -> dict:
+    article = Article(code="BENCH-PO-ART", name="BENCH-PO-ART")
+    db.add(article)
+    db.flush()
+
+    color_rows = [
+        Color(inner_code=f"BENCH-C{i}", pantone_code=f"BENCH-{i:03d}", description=f"Color {i}")
+        for i in range(colors)
+    ]
+    size_rows = [Size(label=f"BENCH-S{i}", sort_order=i) for i in range(sizes)]
+    bundle_rows = [BundleType(code=f"BENCH-BT{i}", name=f"BENCH-BT{i}") for i in range(bundle_types)]
+    warehouse = Warehouse(code="BENCH-NSK", name="BENCH-NSK", type="local")
+    db.add_all([*color_rows, *size_rows, *bundle_rows, warehouse])
+    db.flush()
+
+    skus = [
+        SkuUnit(article_id=article.id, color_id=color.id, size_id=size.id)
+        for color in color_rows
+        for size in size_rows
+    ]
+    db.add_all(skus)
+    db.flush()
+
+    now = datetime.now(timezone.utc)
+    db.add_all(
+        StockBalance(sku_unit_id=sku.id, warehouse_id=warehouse.id, quantity=10 + (sku.id % 7), updated_at=now)
+        for sku in skus
+    )
+    db.add_all(
+        BundleRecipe(
+            article_id=article.id,
+            bundle_type_id=bundle.id,
+            color_id=color_rows[(bundle_index + position) % colors].id,
+            position=position + 1,
+        )
+        for bundle_index, bundle in enumerate(bundle_rows)
+        for position in range(colors_per_bundle)
+    )
+    db.add(
+        GlobalPlanningSettings(
+            default_target_coverage_days=60,
+            default_lead_time_days=70,
+            default_service_level_percent=90,
+            default_fabric_min_batch_qty=7000,
+            default_elastic_min_batch_qty=3000,
+            default_production_order_available_capital=1000000,
+        )
+    )
+    db.add(
+        ArticlePlanningSettings(
+            article_id=article.id,
+            include_in_planning=True,
+            priority=2,
+            target_coverage_days=60,
+            lead_time_days=70,
+            service_level_percent=90,
+        )
+    )
+    db.add(
+        PlanningSettings(
+            article_id=article.id,
+            is_active=True,
+            min_fabric_batch=0,
+            min_elastic_batch=0,
+            alert_threshold_days=90,
+            safety_stock_days=0,
+            strictness=1.0,
+        )
+    )
+    db.commit()
+    return {"article": article, "sizes": size_rows, "bundle_types": bundle_rows}
+
+
+def _build_request(seeded: dict) -> ProductionOrderProposalRequest:
+    sizes = seeded["sizes"]
+    bundle_types = seeded["bundle_types"]
+    return ProductionOrderProposalRequest.model_validate(
+        {
+            "article_id": seeded["article"].id,
+            "planning_horizon_days": 90,
+            "explainability_mode": "full",
+            "bundle_daily_sales": [
+                {"bundle_type_id": bundle.id, "daily_sales": 5.0 + index} for index, bundle in enumerate(bundle_types)
+            ],
+            "bundle_stock": [
+                {"bundle_type_id": bundle.id, "wb_qty": 5, "local_qty": 5} for bundle in bundle_types
+            ],
+            "in_flight_supply": [],
+            "size_weights": {str(size.id): 1.0 / len(sizes) for size in sizes},
+            "overrides": {
+                "target_coverage_days": 60,
+                "service_level_percent": 90,
+                "alert_threshold_days": 90,
+                "lead_time_days": {"production": 30, "china_to_nsk": 30, "packaging": 3, "nsk_to_wb": 7},
+                "fabric_min_batch_qty_default": 7000,
+                "elastic_min_batch_qty_default": 3000,
+                "available_capital": 1000000.0,
+                "allow_order_with_buffer": True,
+            },
+        }
+    )
+
+
+def build_large_proposal(*, colors: int, sizes: int, bundle_types: int, colors_per_bundle: int) -> ProductionOrderProposalResponse:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine, autoflush=False)() as db:
+        seeded = _seed_wide_article(
+            db,
+            colors=colors,
+            sizes=sizes,
+            bundle_types=bundle_types,
+            colors_per_bundle=colors_per_bundle,
+        )
+        return build_production_order_proposal(db=db, request=_build_request(seeded))
+
+
+def _time_ms(fn: Callable[[], bytes], *, repeat: int) -> dict[str, float]:
+    fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def run(*, colors: int, sizes: int, bundle_types: int, colors_per_bundle: int, repeat: int) -> dict:
+    proposal = build_large_proposal(
+        colors=colors,
+        sizes=sizes,
+        bundle_types=bundle_types,
+        colors_per_bundle=colors_per_bundle,
+    )
+    adapter = TypeAdapter(ProductionOrderProposalResponse)
+
+    paths: dict[str, Callable[[], bytes]] = {
+        "jsonable_encoder": lambda: json.dumps(jsonable_encoder(proposal)).encode("utf-8"),
+        "response_model": lambda: adapter.dump_json(adapter.validate_python(proposal.model_dump())),
+        "orjson": lambda: build_model_response(proposal).body,
+    }
+    results = {name: _time_ms(fn, repeat=repeat) for name, fn in paths.items()}
+    return {
+        "benchmark": "production_order_serialization",
+        "params": {
+            "colors": colors,
+            "sizes": sizes,
+            "bundle_types": bundle_types,
+            "colors_per_bundle": colors_per_bundle,
+            "repeat": repeat,
+        },
+        "payload_bytes": len(build_model_response(proposal).body),
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--colors", type=int, default=24)
+    parser.add_argument("--sizes", type=int, default=10)
+    parser.add_argument("--bundle-types", type=int, default=12)
+    parser.add_argument("--colors-per-bundle", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    report = run(
+        colors=args.colors,
+        sizes=args.sizes,
+        bundle_types=args.bundle_types,
+        colors_per_bundle=args.colors_per_bundle,
+        repeat=args.repeat,
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
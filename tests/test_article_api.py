@@ -85,3 +85,28 @@ def test_patch_article_returns_structured_409_for_duplicate_code(client, db_sess
         "article_code": "ART-1",
         "next_steps": ["use_unique_article_code"],
     }
+
+
+def test_list_articles_keyset_pagination_returns_next_cursor(client, db_session):
+    articles = [Article(code=f"ART-PAGE-{index}", name=f"Article {index}") for index in range(5)]
+    db_session.add_all(articles)
+    db_session.commit()
+    ids = sorted(article.id for article in articles)
+
+    first_page = client.get("/api/v1/article/", params={"limit": 2})
+    assert first_page.status_code == 200
+    assert [item["id"] for item in first_page.json()] == ids[:2]
+    assert first_page.headers["X-Next-After-Id"] == str(ids[1])
+
+    second_page = client.get(
+        "/api/v1/article/",
+        params={"limit": 2, "after_id": first_page.headers["X-Next-After-Id"]},
+    )
+    assert [item["id"] for item in second_page.json()] == ids[2:4]
+
+    last_page = client.get("/api/v1/article/", params={"limit": 2, "after_id": ids[3]})
+    assert [item["id"] for item in last_page.json()] == ids[4:]
+    assert "X-Next-After-Id" not in last_page.headers
+
+    unpaginated = client.get("/api/v1/article/")
+    assert [item["id"] for item in unpaginated.json()] == ids
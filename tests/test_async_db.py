@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import _derive_async_db_url
+from app.core.db import get_async_db
+from app.main import app
+from app.models.base import Base
+from app.models.models import MonitoringAlertRule, MonitoringSnapshotRecord, PurchaseOrder, PurchaseOrderItem
+from app.services.monitoring_history import get_monitoring_history_async
+from app.services.monitoring_timeseries import build_monitoring_timeseries_async
+
+
+@pytest.mark.parametrize(
+    ("sync_url", "expected"),
+    [
+        (
+            "postgresql+psycopg2://maconly:maconly@db:5432/maconly_db",
+            "postgresql+asyncpg://maconly:maconly@db:5432/maconly_db",
+        ),
+        ("postgresql://u:p@localhost/db", "postgresql+asyncpg://u:p@localhost/db"),
+        ("sqlite:///./ci.db", "sqlite+aiosqlite:///./ci.db"),
+        ("sqlite://", "sqlite+aiosqlite://"),
+        ("mysql+pymysql://u:p@localhost/db", "mysql+pymysql://u:p@localhost/db"),
+    ],
+)
+def test_derive_async_db_url_maps_sync_drivers(sync_url, expected):
+    assert _derive_async_db_url(sync_url) == expected
+
+
+@pytest.fixture
+def async_session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def _setup() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(_setup())
+    try:
+        yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    finally:
+        asyncio.run(engine.dispose())
+
+
+def _seed(async_session_factory) -> None:
+    now = datetime.now(timezone.utc)
+
+    async def _run() -> None:
+        async with async_session_factory() as db:
+            db.add_all(
+                [
+                    MonitoringSnapshotRecord(created_at=now - timedelta(hours=2), risk_critical=1),
+                    MonitoringSnapshotRecord(created_at=now - timedelta(hours=1), risk_critical=3),
+                    MonitoringAlertRule(
+                        name="critical",
+                        metric="risk_critical",
+                        threshold_type="above",
+                        threshold_value=0,
+                        severity="critical",
+                        is_active=True,
+                    ),
+                ]
+            )
+            order = PurchaseOrder(status="draft", target_date=now.date(), created_at=now, updated_at=now)
+            order.items = [
+                PurchaseOrderItem(article_id=1, color_id=1, size_id=1, quantity=5),
+                PurchaseOrderItem(article_id=1, color_id=1, size_id=2, quantity=7),
+            ]
+            db.add(order)
+            await db.commit()
+
+    asyncio.run(_run())
+
+
+def test_async_monitoring_services_read_through_aiosqlite(async_session_factory):
+    _seed(async_session_factory)
+
+    async def _run():
+        async with async_session_factory() as db:
+            history = await get_monitoring_history_async(db=db, limit=1)
+            series = await build_monitoring_timeseries_async(
+                db=db,
+                metrics=["risk_critical", "unknown_metric"],
+                limit=30,
+            )
+        return history, series
+
+    history, series = asyncio.run(_run())
+
+    assert [item.risk_critical for item in history] == [3]
+    assert [s.metric for s in series] == ["risk_critical"]
+    assert [point.value for point in series[0].points] == [1, 3]
+
+
+def test_async_endpoints_serve_from_async_session(async_session_factory):
+    _seed(async_session_factory)
+
+    async def _override():
+        async with async_session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = _override
+    try:
+        with TestClient(app) as client:
+            rules = client.get("/api/v1/planning/monitoring/alert-rules")
+            history = client.get("/api/v1/planning/monitoring/history", params={"limit": 5})
+            orders = client.get("/api/v1/purchase-order/")
+            headers = client.get("/api/v1/wb/manager/shipment/headers")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert rules.status_code == 200
+    assert [item["metric"] for item in rules.json()["items"]] == ["risk_critical"]
+    assert history.status_code == 200
+    assert len(history.json()["items"]) == 2
+    assert orders.status_code == 200
+    assert [item["quantity"] for item in orders.json()[0]["items"]] == [5, 7]
+    assert headers.status_code == 200
+    assert headers.json() == []
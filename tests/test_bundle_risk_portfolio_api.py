@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import csv
+import io
+import json
 from datetime import date, datetime, timedelta, timezone
 
 import pytest
@@ -252,3 +255,73 @@ def test_bundle_risk_portfolio_ignores_unknown_article_ids_with_structured_not_f
     items = resp.json()["items"]
     codes = {entry["article_code"] for entry in items}
     assert codes == {article.code}
+
+
+def test_bundle_risk_portfolio_ndjson_and_csv_export(client, db_session):
+    article, _ = _create_article_bundle_with_planning_and_sales(
+        db_session,
+        code="RISK-EXPORT",
+        total_available_bundles=8,
+        sales_per_day=2,
+        num_sales_days=10,
+    )
+
+    resp = client.get("/api/v1/planning/bundle-risk-portfolio", params={"format": "ndjson"})
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines() if line]
+    by_article = {row["article_code"]: row for row in lines}
+    assert by_article[article.code]["risk_level"] == "critical"
+
+    resp = client.get("/api/v1/planning/bundle-risk-portfolio", params={"format": "csv"})
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert "bundle-risk-portfolio.csv" in resp.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    by_article = {row["article_code"]: row for row in rows}
+    assert by_article[article.code]["risk_level"] == "critical"
+    assert by_article[article.code]["total_available_bundles"] == "8"
+
+
+def test_bundle_risk_portfolio_csv_export_empty_has_header(client):
+    resp = client.get(
+        "/api/v1/planning/bundle-risk-portfolio",
+        params={"format": "csv", "article_ids": [999999]},
+    )
+    assert resp.status_code == 200, resp.text
+    lines = resp.text.splitlines()
+    assert len(lines) == 1
+    assert lines[0].startswith("article_id,")
+
+
+@pytest.mark.parametrize("response_format", ["json", "ndjson", "csv"])
+def test_bundle_risk_portfolio_unknown_bundle_type_is_structured_404_in_every_format(
+    client, db_session, response_format
+):
+    from app.models.models import BundleRecipe
+
+    article, _ = _create_article_bundle_with_planning_and_sales(
+        db_session,
+        code=f"RISK-BAD-BT-{response_format}",
+        total_available_bundles=8,
+        sales_per_day=2,
+        num_sales_days=10,
+    )
+    recipe = db_session.query(BundleRecipe).filter(BundleRecipe.article_id == article.id).one()
+    db_session.add(
+        BundleRecipe(
+            article_id=article.id,
+            bundle_type_id=999999,
+            color_id=recipe.color_id,
+            position=1,
+        )
+    )
+    db_session.commit()
+
+    resp = client.get(
+        "/api/v1/planning/bundle-risk-portfolio",
+        params={"format": response_format, "article_ids": [article.id]},
+    )
+    assert resp.status_code == 404, resp.text
+    assert resp.json()["detail"]["code"] == "bundle_type_not_found"
+    assert resp.json()["detail"]["bundle_type_id"] == 999999
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from benchmarks import hot_paths
+from benchmarks.synthetic_portfolio import PortfolioSpec
+
+EXPECTED_CASES = {
+    "production_order_direct_none",
+    "production_order_direct_compact",
+    "production_order_direct_full",
+    "production_order_from_wb_none",
+    "production_order_from_wb_compact",
+    "production_order_from_wb_full",
+    "bundle_risk_portfolio",
+    "order_explanation_portfolio",
+    "monitoring_snapshot",
+    "monitoring_dashboard_http",
+    "wb_replenishment",
+    "wb_shipment_proposal_comparison",
+    "wb_load_sales_daily",
+}
+
+
+def _report(medians: dict[str, float]) -> dict:
+    return {
+        "generated_at": "2026-01-01T00:00:00+00:00",
+        "results": {name: {"median_ms": median, "db_queries": 1} for name, median in medians.items()},
+    }
+
+
+def test_run_suite_times_every_hot_path(tmp_path):
+    spec = PortfolioSpec(articles=2, days=5, shipments=1, purchase_orders=1, as_of=date(2026, 3, 31))
+
+    report = hot_paths.run_suite(spec, rounds=2, warmup=0, sales_rows=40)
+
+    assert report["report_type"] == hot_paths.REPORT_TYPE
+    assert report["dataset"]["rows"]["article"] == 2
+    assert set(report["results"]) == EXPECTED_CASES
+    for result in report["results"].values():
+        assert result["rounds"] == 2
+        assert result["min_ms"] <= result["median_ms"] <= result["max_ms"]
+    assert report["results"]["monitoring_dashboard_http"]["db_queries"] > 0
+    assert report["results"]["wb_load_sales_daily"]["db_queries"] > 0
+
+    report_path = hot_paths.write_report(tmp_path, report)
+    assert json.loads(report_path.read_text(encoding="utf-8"))["results"].keys() == EXPECTED_CASES
+    assert "| wb_load_sales_daily | ingest |" in (tmp_path / hot_paths.MARKDOWN_FILENAME).read_text(encoding="utf-8")
+
+
+def test_compare_reports_flags_regressions_against_baseline():
+    baseline = _report({"steady": 10.0, "slower": 10.0, "faster": 10.0})
+    current = _report({"steady": 11.0, "slower": 13.0, "faster": 5.0, "added": 1.0})
+
+    comparison = hot_paths.compare_reports(current, baseline, max_regression=0.25)
+
+    statuses = {case["name"]: case["status"] for case in comparison["cases"]}
+    assert statuses == {"steady": "ok", "slower": "regression", "faster": "improvement", "added": "new"}
+    assert comparison["comparison_status"] == "regression"
+    assert comparison["regressions"] == ["slower"]
+
+
+def test_main_exits_nonzero_on_regression(tmp_path, monkeypatch):
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(_report({"case": 1.0})), encoding="utf-8")
+    monkeypatch.setattr(hot_paths, "run_suite", lambda *args, **kwargs: _report({"case": 2.0}))
+
+    exit_code = hot_paths.main(["--output-dir", str(tmp_path / "out"), "--baseline", str(baseline_path)])
+
+    assert exit_code == 1
+    written = json.loads((tmp_path / "out" / hot_paths.REPORT_FILENAME).read_text(encoding="utf-8"))
+    assert written["comparison"]["regressions"] == ["case"]
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from app.core.db import get_async_db, get_db
+from app.main import app
+from benchmarks import load_test
+from tests.test_utils import create_article, make_async_db_override
+
+SEED_PAYLOADS = {
+    "direct_payload": {"article_id": 1},
+    "from_wb_payload": {"article_id": 1},
+    "shipment_comparison_payload": {"target_date": "2026-03-31", "wb_arrival_date": "2026-03-31"},
+}
+
+
+@pytest.fixture
+def asgi_transport(db_session):
+    def _get_db_override():
+        yield db_session
+
+    app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_async_db] = make_async_db_override(db_session)
+    yield httpx.ASGITransport(app=app)
+    app.dependency_overrides.clear()
+
+
+def test_default_mix_covers_proposal_monitoring_and_list_routes():
+    names = {request.name for request in load_test.build_default_mix(SEED_PAYLOADS)}
+
+    assert {
+        "production-order-direct",
+        "production-order-from-wb",
+        "shipment-comparison",
+        "monitoring-dashboard",
+        "monitoring-risk-focus",
+        "article-list",
+        "purchase-order-list",
+        "shipment-headers",
+    } == names
+
+
+def test_requests_file_replays_captured_paths(tmp_path):
+    captured = tmp_path / "requests.json"
+    base_url = "http://127.0.0.1:8010"
+    from_wb_path = "/api/v1/planning/core/production-order/proposal/from-wb"
+    captured.write_text(
+        json.dumps(
+            {
+                "base_url": base_url,
+                "requests": [
+                    {
+                        "name": "planning-core-health",
+                        "method": "GET",
+                        "url": f"{base_url}/api/v1/planning/core/health",
+                        "body": None,
+                    },
+                    {
+                        "name": "production-order-from-wb",
+                        "method": "POST",
+                        "url": f"{base_url}{from_wb_path}",
+                        "body": {"article_id": 7},
+                    },
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    mix = load_test.load_requests_file(captured, include_lists=False)
+
+    assert [(r.name, r.method, r.path, r.body) for r in mix] == [
+        ("planning-core-health", "GET", "/api/v1/planning/core/health", None),
+        ("production-order-from-wb", "POST", from_wb_path, {"article_id": 7}),
+    ]
+
+
+def test_percentile_interpolates_sorted_values():
+    values = [float(v) for v in range(1, 101)]
+
+    assert load_test.percentile(values, 0.5) == 50.5
+    assert load_test.percentile(values, 0.99) == 99.01
+    assert load_test.percentile([], 0.5) is None
+
+
+def test_run_load_test_reports_percentiles_and_error_rates(tmp_path, db_session, asgi_transport):
+    create_article(db_session, code="LOAD-1")
+    mix = [
+        load_test.LoadRequest(name="article-list", method="GET", path="/api/v1/article/", weight=3.0),
+        load_test.LoadRequest(name="missing", method="GET", path="/api/v1/does-not-exist"),
+    ]
+
+    report = load_test.run_load_test(
+        mix,
+        base_url="http://testserver",
+        concurrency=2,
+        total_requests=20,
+        transport=asgi_transport,
+    )
+
+    routes = report["routes"]
+    assert report["report_type"] == load_test.REPORT_TYPE
+    assert routes["article-list"]["requests"] + routes["missing"]["requests"] == 20
+    assert routes["article-list"]["errors"] == 0
+    assert routes["article-list"]["p50_ms"] <= routes["article-list"]["p95_ms"] <= routes["article-list"]["p99_ms"]
+    assert routes["missing"]["error_rate"] == 1.0
+    assert routes["missing"]["status_counts"] == {"404": routes["missing"]["requests"]}
+    assert report["overall"]["errors"] == routes["missing"]["requests"]
+
+    report_path = load_test.write_report(tmp_path, report)
+    assert json.loads(report_path.read_text(encoding="utf-8"))["routes"].keys() == {"article-list", "missing"}
+    assert "| article-list | GET | " in (tmp_path / load_test.MARKDOWN_FILENAME).read_text(encoding="utf-8")
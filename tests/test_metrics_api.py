@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.db import get_db
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, MetricsRegistry, render_prometheus_text
+from app.main import app
+from app.services import monitoring_scheduler, wb_ingest
+
+
+@pytest.fixture
+def client(db_session):
+    def _get_db_override():
+        try:
+            yield db_session
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = _get_db_override
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+def _sample_value(text: str, prefix: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"sample {prefix!r} not found")
+
+
+def test_render_prometheus_text_formats_histograms_and_counters():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("demo_seconds", "Demo.", labelnames=("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.5, route="/a")
+    histogram.observe(5.0, route="/a")
+    counter = registry.counter("demo_total", "Demo counter.", labelnames=("kind",))
+    counter.inc(kind='quoted "x"')
+    counter.inc(2, kind='quoted "x"')
+
+    text = render_prometheus_text(registry)
+
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'demo_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{route="/a"} 3' in text
+    assert "# TYPE demo_total counter" in text
+    assert 'demo_total{kind="quoted \\"x\\""} 3' in text
+
+
+def test_metrics_endpoint_exposes_route_latency_and_cache_stats(client):
+    assert client.get("/api/v1/planning/monitoring/metrics").status_code == 200
+    assert client.get("/api/v1/planning/monitoring/metrics").status_code == 200
+
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == PROMETHEUS_CONTENT_TYPE
+
+    text = resp.text
+    route_count = (
+        'http_request_duration_seconds_count{method="GET",'
+        'route="/api/v1/planning/monitoring/metrics",status="200"}'
+    )
+    assert _sample_value(text, route_count) >= 2
+    assert _sample_value(text, 'cache_requests_total{cache="monitoring_metrics_catalog",result="hit"}') >= 1
+    assert 'cache_hit_ratio{cache="monitoring_metrics_catalog"}' in text
+    assert "# TYPE db_pool_connections gauge" in text
+    assert "# TYPE monitoring_job_duration_seconds histogram" in text
+
+    client.get("/does-not-exist")
+    client.get("/api/v1/planning/article-dashboard/999999")
+    text = client.get("/metrics").text
+    assert 'route="unmatched",status="404"' in text
+    assert 'route="/api/v1/planning/article-dashboard/{article_id}"' in text
+    assert "article-dashboard/999999" not in text
+
+
+def test_wb_request_records_calls_and_rate_limit_retries(monkeypatch):
+    endpoint = "/api/v1/metrics-test"
+    responses = [
+        httpx.Response(429, headers={"X-Ratelimit-Retry": "1"}),
+        httpx.Response(200, json=[]),
+    ]
+    monkeypatch.setattr(wb_ingest.httpx, "request", lambda *args, **kwargs: responses.pop(0))
+    monkeypatch.setattr(wb_ingest.time, "sleep", lambda _seconds: None)
+
+    wb_ingest._wb_request(method="get", url=f"https://example.test{endpoint}?page=1", token="t")
+
+    calls = wb_ingest.WB_API_REQUESTS_COUNTER.samples()
+    assert calls[("GET", endpoint, "429")] == 1
+    assert calls[("GET", endpoint, "200")] == 1
+    assert wb_ingest.WB_API_RATE_LIMIT_RETRIES_COUNTER.samples()[(endpoint,)] == 1
+    assert wb_ingest.WB_API_REQUEST_DURATION_HISTOGRAM.samples()[("GET", endpoint)].count == 2
+
+
+def test_monitoring_job_duration_records_outcome(monkeypatch):
+    def failing_snapshot(db):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(monitoring_scheduler, "build_and_persist_monitoring_snapshot", failing_snapshot)
+    before = monitoring_scheduler.JOB_DURATION_HISTOGRAM.samples().get(("monitoring_snapshot", "error"))
+
+    monitoring_scheduler.MonitoringScheduler._run_snapshot_job()
+
+    after = monitoring_scheduler.JOB_DURATION_HISTOGRAM.samples()[("monitoring_snapshot", "error")]
+    assert after.count == (before.count if before else 0) + 1
@@ -3,9 +3,10 @@ from __future__ import annotations
 import pytest
 from fastapi.testclient import TestClient
 
-from app.core.db import get_db
+from app.core.db import get_async_db, get_db
 from app.main import app
 from app.models.models import MonitoringAlertRule
+from tests.test_utils import make_async_db_override
 
 
 @pytest.fixture
@@ -17,6 +18,7 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_async_db] = make_async_db_override(db_session)
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
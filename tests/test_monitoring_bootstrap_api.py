@@ -112,11 +112,11 @@ def test_monitoring_bootstrap_consistency_with_metrics_and_layout(client):
 
 
 def test_monitoring_bootstrap_signatures_use_db():
-    # API function must expose a db: Session dependency
+    # API function must expose a db: Session dependency (plus the request for conditional GET)
     sig_api = inspect.signature(planning_module.get_monitoring_bootstrap)
     api_params = list(sig_api.parameters.values())
-    assert len(api_params) == 1
-    p = api_params[0]
+    assert [param.name for param in api_params] == ["request", "db"]
+    p = sig_api.parameters["db"]
     assert p.annotation is Session
     assert isinstance(p.default, Depends)
     assert p.default.dependency is get_db
@@ -127,3 +127,26 @@ def test_monitoring_bootstrap_signatures_use_db():
     assert len(service_params) == 1
     sp = service_params[0]
     assert sp.annotation in {Session, "Session"}
+
+
+def test_monitoring_bootstrap_not_modified_skips_building_the_payload(client, monkeypatch):
+    calls: list[int] = []
+
+    def counting_build_monitoring_bootstrap(db):
+        calls.append(1)
+        return build_monitoring_bootstrap(db=db)
+
+    monkeypatch.setattr(planning_module, "build_monitoring_bootstrap", counting_build_monitoring_bootstrap)
+
+    first = client.get("/api/v1/planning/monitoring/bootstrap")
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+    assert len(calls) == 1
+
+    unchanged = client.get("/api/v1/planning/monitoring/bootstrap", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["etag"] == etag
+    assert len(calls) == 1
+
+    dashboard = client.get("/api/v1/planning/monitoring/dashboard")
+    assert dashboard.headers["etag"] != etag
@@ -5,13 +5,14 @@ from datetime import datetime, timezone
 import pytest
 from fastapi.testclient import TestClient
 
-from app.core.db import get_db
+from app.core.db import get_async_db, get_db
 from app.main import app
 from app.api.v1.endpoints import planning as planning_module
 from app.models.models import MonitoringAlertRule, MonitoringSnapshotRecord
 from app.schemas.monitoring import IntegrationStatus, MonitoringSnapshot, OrderSummary, RiskSummary
 from app.schemas.monitoring_alerts import ActiveAlertSchema
 from app.services import monitoring_status
+from tests.test_utils import make_async_db_override
 
 
 @pytest.fixture
@@ -23,6 +24,7 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_async_db] = make_async_db_override(db_session)
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
@@ -339,3 +341,65 @@ def test_monitoring_dashboard_status_warning_only(client, db_session, monkeypatc
     assert status["overall_status"] == "warning"
     assert status["critical_alerts"] == 0
     assert status["warning_alerts"] == 2
+
+
+def test_monitoring_dashboard_etag_ignores_snapshot_updated_at(client, db_session):  # noqa: ARG001
+    first = client.get("/api/v1/planning/monitoring/dashboard")
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+
+    # The live snapshot is recomputed (new updated_at) but business content is unchanged.
+    unchanged = client.get("/api/v1/planning/monitoring/dashboard", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["etag"] == etag
+
+    db_session.add(
+        MonitoringAlertRule(
+            name="ETag rule",
+            metric="risk_critical",
+            threshold_type="above",
+            threshold_value=0,
+            severity="critical",
+            is_active=True,
+        )
+    )
+    db_session.commit()
+
+    changed = client.get("/api/v1/planning/monitoring/dashboard", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(changed.json()["rules"]["items"]) == 1
+
+
+def test_monitoring_dashboard_not_modified_skips_snapshot_builder(client, db_session, monkeypatch):
+    calls: list[str] = []
+
+    def _counting(builder):
+        def _wrapped(db):
+            calls.append(builder.__name__)
+            return builder(db=db)
+
+        return _wrapped
+
+    for module in (planning_module, monitoring_status):
+        monkeypatch.setattr(module, "build_monitoring_snapshot", _counting(module.build_monitoring_snapshot))
+
+    first = client.get("/api/v1/planning/monitoring/dashboard")
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+    built = len(calls)
+    assert built > 0
+
+    unchanged = client.get("/api/v1/planning/monitoring/dashboard", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["etag"] == etag
+    assert len(calls) == built
+
+    # A newly persisted snapshot moves the version key.
+    db_session.add(MonitoringSnapshotRecord())
+    db_session.commit()
+
+    changed = client.get("/api/v1/planning/monitoring/dashboard", headers={"If-None-Match": etag})
+    assert changed.status_code == 200, changed.text
+    assert changed.headers["etag"] != etag
+    assert len(calls) > built
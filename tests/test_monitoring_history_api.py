@@ -5,11 +5,12 @@ from datetime import datetime, timedelta, timezone
 import pytest
 from fastapi.testclient import TestClient
 
-from app.core.db import get_db
+from app.core.db import get_async_db, get_db
 from app.main import app
 from app.models.models import MonitoringSnapshotRecord
 from app.schemas.monitoring import IntegrationStatus, MonitoringSnapshot, OrderSummary, RiskSummary
 from app.services import monitoring_history
+from tests.test_utils import make_async_db_override
 
 
 @pytest.fixture
@@ -21,6 +22,7 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_async_db] = make_async_db_override(db_session)
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
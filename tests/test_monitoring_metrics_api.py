@@ -99,3 +99,25 @@ def test_status_flags_consistent_with_alert_flags():
     for item in catalog.items:
         if item.supports_alerts:
             assert item.used_in_status is True
+
+
+def test_monitoring_metrics_conditional_get_and_gzip(client):
+    first = client.get("/api/v1/planning/monitoring/metrics", headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200, first.text
+    # The catalog is well above GZIP_MINIMUM_SIZE; httpx transparently decodes the body.
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.json()["items"]
+    etag = first.headers["etag"]
+    # The gzip and identity bodies share the tag, so it must be weak.
+    assert etag.startswith('W/"')
+
+    second = client.get(
+        "/api/v1/planning/monitoring/metrics",
+        headers={"If-None-Match": f"{etag.removeprefix('W/')}, \"stale\""},
+    )
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+
+    plain = client.get("/api/v1/planning/monitoring/metrics", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] == etag
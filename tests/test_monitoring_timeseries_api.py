@@ -5,9 +5,10 @@ from datetime import datetime, timedelta, timezone
 import pytest
 from fastapi.testclient import TestClient
 
-from app.core.db import get_db
+from app.core.db import get_async_db, get_db
 from app.main import app
 from app.models.models import MonitoringSnapshotRecord
+from tests.test_utils import make_async_db_override
 
 
 @pytest.fixture
@@ -19,6 +20,7 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_async_db] = make_async_db_override(db_session)
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
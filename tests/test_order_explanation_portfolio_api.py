@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import csv
+import io
+import json
 from datetime import date
 
 import pytest
@@ -259,6 +262,82 @@ def test_build_order_explanation_portfolio_reuses_shared_scoped_proposal_for_req
     assert calls[0]["article_ids"] == [article_a.id, article_b.id]
 
 
+def test_iter_order_explanation_portfolio_scopes_proposal_to_each_batch(db_session, monkeypatch):
+    article_a, _color_a = _setup_basic_article_with_deficit(db_session, code="EXPL-BATCH-A")
+    article_b, _color_b = _setup_basic_article_with_deficit(db_session, code="EXPL-BATCH-B")
+    proposal_article_ids: list[list[int]] = []
+
+    def fake_generate_order_proposal(*, db, target_date, explanation, article_ids=None):
+        proposal_article_ids.append(list(article_ids))
+        return OrderProposalResponse(target_date=target_date, items=[], global_explanation=None)
+
+    monkeypatch.setattr(order_explanation, "PORTFOLIO_BATCH_SIZE", 1)
+    monkeypatch.setattr(order_explanation, "generate_order_proposal", fake_generate_order_proposal)
+
+    explanations = order_explanation.iter_order_explanation_portfolio(
+        db=db_session,
+        article_ids=[article_a.id, article_b.id],
+    )
+
+    # The first article is explained before the rest of the portfolio is proposed.
+    assert next(explanations).article_id == article_a.id
+    assert proposal_article_ids == [[article_a.id]]
+    assert [item.article_id for item in explanations] == [article_b.id]
+    assert proposal_article_ids == [[article_a.id], [article_b.id]]
+
+
+@pytest.mark.parametrize("response_format", ["ndjson", "csv"])
+def test_order_explanation_portfolio_export_surfaces_proposal_errors(
+    client, db_session, monkeypatch, response_format
+):
+    article, _color = _setup_basic_article_with_deficit(db_session, code=f"EXPL-ERR-{response_format}")
+
+    def failing_generate_order_proposal(*, db, target_date, explanation, article_ids=None):
+        raise HTTPException(status_code=422, detail={"code": "order_proposal_failed"})
+
+    monkeypatch.setattr(order_explanation, "generate_order_proposal", failing_generate_order_proposal)
+
+    resp = client.get(
+        "/api/v1/planning/order-explanation-portfolio",
+        params={"format": response_format, "article_ids": [article.id]},
+    )
+    assert resp.status_code == 422, resp.text
+    assert resp.json()["detail"] == {"code": "order_proposal_failed"}
+
+
+def test_order_explanation_portfolio_csv_has_one_row_per_article(client, db_session):
+    article_deficit, _color = _setup_basic_article_with_deficit(db_session, code="EXPL-CSV-DEFICIT")
+    article_idle = create_article(db_session, code="EXPL-CSV-IDLE")
+    create_sku(
+        db_session,
+        article_idle,
+        create_color(db_session, inner_code="EXPL-CSV-IDLE-C"),
+        create_size(db_session, label="S-EXPL-CSV-IDLE", sort_order=1),
+    )
+    create_article_planning_settings(db_session, article_idle, target_coverage_days=10)
+    create_planning_settings(
+        db_session,
+        article_idle,
+        is_active=True,
+        min_fabric_batch=0,
+        min_elastic_batch=0,
+        strictness=1.0,
+    )
+
+    resp = client.get(
+        "/api/v1/planning/order-explanation-portfolio",
+        params={"format": "csv", "article_ids": [article_deficit.id, article_idle.id]},
+    )
+    assert resp.status_code == 200, resp.text
+    assert "order-explanation-portfolio.csv" in resp.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [row["article_code"] for row in rows] == ["EXPL-CSV-DEFICIT", "EXPL-CSV-IDLE"]
+    by_code = {row["article_code"]: json.loads(row["reasons"]) for row in rows}
+    assert by_code["EXPL-CSV-DEFICIT"]
+    assert all(reason["article_id"] == article_deficit.id for reason in by_code["EXPL-CSV-DEFICIT"])
+    assert by_code["EXPL-CSV-IDLE"] == []
+
+
 def test_filtering_by_article_ids_and_is_active(client, db_session):
     article_active, _color_active = _setup_basic_article_with_deficit(db_session)
     article_inactive = create_article(db_session, code="EXPL-INACTIVE")
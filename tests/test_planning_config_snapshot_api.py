@@ -9,6 +9,7 @@ from app.main import app
 from app.core.db import get_db
 from app.models.models import Article
 from tests.test_utils import (
+    count_queries,
     create_article,
     create_article_planning_settings,
     create_color,
@@ -236,3 +237,82 @@ def test_planning_config_snapshot_without_article_id_lists_active_planning_setti
     ids = {a["article_id"] for a in body["articles"]}
     assert art_active.id in ids
     assert art_inactive.id not in ids
+
+
+def test_planning_config_snapshot_conditional_get_tracks_settings_changes(client, db_session):
+    article = _setup_full_planning_config(db_session)
+    params = {"article_id": article.id}
+
+    first = client.get("/api/v1/planning/config-snapshot", params=params)
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert first.headers["cache-control"] == "no-cache"
+
+    unchanged = client.get(
+        "/api/v1/planning/config-snapshot",
+        params=params,
+        headers={"If-None-Match": etag},
+    )
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["etag"] == etag
+
+    create_color_planning_settings(
+        db_session,
+        article,
+        create_color(db_session, inner_code="CFG-SNAP-ETAG"),
+        fabric_min_batch_qty=123,
+    )
+    db_session.commit()
+
+    changed = client.get(
+        "/api/v1/planning/config-snapshot",
+        params=params,
+        headers={"If-None-Match": etag},
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def _count_config_snapshot_statements(client, db_session) -> tuple[int, dict]:
+    db_session.expire_all()
+    with count_queries() as counter:
+        resp = client.get("/api/v1/planning/config-snapshot")
+
+    assert resp.status_code == 200, resp.text
+    return counter.count, resp.json()
+
+
+def _add_configured_article(db_session, code: str):
+    article = create_article(db_session, code=code)
+    create_planning_settings(db_session, article, is_active=True)
+    create_article_planning_settings(db_session, article, target_coverage_days=20)
+    for index in range(2):
+        color = create_color(db_session, inner_code=f"{code}-C{index}")
+        create_color_planning_settings(db_session, article=article, color=color, fabric_min_batch_qty=100 + index)
+    create_elastic_planning_settings(db_session, article=article, elastic_min_batch_qty=500)
+    return article
+
+
+def test_planning_config_snapshot_all_articles_uses_constant_query_count(client, db_session):
+    create_global_planning_settings(db_session)
+    for index in range(2):
+        _add_configured_article(db_session, code=f"CFG-BULK-{index}")
+    db_session.commit()
+    small_count, small_body = _count_config_snapshot_statements(client, db_session)
+
+    for index in range(2, 8):
+        _add_configured_article(db_session, code=f"CFG-BULK-{index}")
+    db_session.commit()
+    large_count, large_body = _count_config_snapshot_statements(client, db_session)
+
+    assert len(small_body["articles"]) == 2
+    assert len(large_body["articles"]) == 8
+    # global settings + active articles + one query per settings table
+    assert small_count == large_count == 6
+
+    first = large_body["articles"][0]
+    assert [row["fabric_min_batch_qty"] for row in first["color_settings"]] == [100, 101]
+    assert len(first["elastic_settings"]) == 1
+    assert first["article_planning_settings"]["target_coverage_days"] == 20
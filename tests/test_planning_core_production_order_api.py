@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import itertools
 from copy import deepcopy
 from datetime import date, datetime, timedelta, timezone
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.core.db import get_db
+from app.core.query_stats import start_query_stats, stop_query_stats
 from app.main import app
+from app.schemas.planning_production_order import (
+    ProductionOrderExplanationBlock,
+    ProductionOrderRecommendationLine,
+)
 from app.services import planning_production_order as planning_production_order_service
 from app.services.planning_production_order import (
     ASSORTI_CLASSIFICATION_ADMIN_FALLBACK_SOURCE,
@@ -21,8 +30,10 @@ from app.services.planning_production_order import (
     ECONOMICS_TRUST_WARNING_CODE_PARTIAL,
     ECONOMICS_TRUST_WARNING_CODE_UNTRUSTED,
     EXPLAINABILITY_MODE_COMPACT,
+    EXPLAINABILITY_MODE_NONE,
     FROM_WB_OBSERVED_ECONOMIC_SOURCE,
     FROM_WB_TARIFFS_COMMISSION_SOURCE,
+    LAYER1_CONTRACT_VERSION,
     LAYER1_HIGH_STOCKOUT_RISK_THRESHOLD,
     LAYER2_ALLOCATION_METHOD,
     LAYER2_ALLOCATION_METHOD_CANONICAL,
@@ -36,6 +47,8 @@ from app.services.planning_production_order import (
     LAYER2_OVERSTOCK_PENALTY_WEIGHT,
     LAYER2_STOCKOUT_PENALTY_WEIGHT,
     LAYER3_CONTRACT_VERSION,
+    LAYER4_CONTRACT_VERSION,
+    LAYER4_EFFICIENCY_FRONTIER_META_KEY,
     LAYER4_SCENARIO_FACTORS,
     LAYER5_CONTRACT_VERSION,
     LAYER5_ACCELERATE_PRODUCTION_RISK_THRESHOLD,
@@ -56,6 +69,7 @@ from app.services.planning_production_order import (
     _build_line_objective_capital_rankings,
     _build_layer3_contract_summary,
     _build_layer4_aggregate_deltas,
+    _build_layer4_efficiency_frontier_summary,
     _build_layer4_scenarios,
     _build_layer4_contract_summary,
     _build_capital_constraint_contract_summary,
@@ -64,6 +78,36 @@ from app.services.planning_production_order import (
     _build_layer5_intervention_signals,
     _choose_action,
 )
+from app.services import planning_production_order_contract_validation as contract_validation_module
+from app.services.planning_production_order_contract_validation import (
+    CONTRACT_STATUS_SKIPPED,
+    CONTRACT_VALIDATION_LEVEL_FULL,
+    CONTRACT_VALIDATION_LEVEL_OFF,
+    CONTRACT_VALIDATION_LEVEL_SAMPLED,
+    _should_validate_contracts,
+)
+from app.services import planning_production_order_competition as competition_module
+from app.services.planning_production_order_capital import (
+    _build_layer4_efficiency_frontier,
+    _build_layer4_scenario_basis,
+    _evaluate_layer4_scenario_grid,
+)
+from app.services.planning_production_order_competition import _build_competition_allocation_plan
+from app.services.planning_production_order_grid import ColorSizeGrid, _as_color_size_grid
+from app.services.planning_production_order_stage_executor import _ProductionOrderStageExecutor
+from app.services.planning_production_order_portfolio import _allocate_portfolio_capital, _PortfolioArticleInput
+from app.services.planning_production_order_shared_color_pool_index import SHARED_COLOR_POOL_INDEX_CACHE
+from app.services.planning_production_order_math import _allocate_units, _allocate_units_batch
+from app.services.planning_production_order_explanation_steps import (
+    STEP_CODE_COMPACT_OMITTED,
+    STEP_CODE_DEMAND,
+    STEP_CODE_LAYER4_CONTRACT,
+    ExplanationStep,
+)
+from app.services.planning_production_order_stage_timing import (
+    STAGE_DURATION_HISTOGRAM,
+    STAGE_TIMINGS_META_KEY,
+)
 from app.services.planning_production_order_recommendation import (
     _build_alternatives as extracted_build_alternatives,
     _choose_action as extracted_choose_action,
@@ -79,6 +123,7 @@ from app.services.planning_production_order_freshness import (
 from app.services.planning_production_order_operator_contracts import (
     _build_from_wb_freshness_failure_detail,
 )
+from app.models.base import Base
 from app.models.models import (
     Article,
     ArticleWbMapping,
@@ -1898,6 +1943,129 @@ def test_build_competition_aware_resource_allocation_prevents_shared_color_doubl
     assert sorted(item.bundle_type_id for item in shared_reservation.allocations) == [1, 2]
 
 
+def test_competition_allocation_plan_feeds_raw_stock_estimate_and_reservations(monkeypatch):
+    normalize_calls: list[list[int]] = []
+    original_normalize_weights = competition_module._normalize_weights
+
+    def counting_normalize_weights(keys, raw_weights):
+        normalize_calls.append(list(keys))
+        return original_normalize_weights(keys, raw_weights)
+
+    monkeypatch.setattr(competition_module, "_normalize_weights", counting_normalize_weights)
+    plan = _build_competition_allocation_plan(
+        bundle_type_ids=[1, 2],
+        recipe_colors_by_bundle={1: {101, 102}, 2: {101, 103}},
+        all_recipe_color_ids=[101, 102, 103],
+        size_ids=[201, 202],
+        shares_by_bundle={1: 0.7, 2: 0.3},
+    )
+    stock_by_color_size = {(101, 201): 11, (102, 201): 9, (103, 201): 5, (101, 202): 7, (102, 202): 3}
+
+    allocation = _build_competition_aware_resource_allocation(
+        bundle_type_ids=[1, 2],
+        recipe_colors_by_bundle={1: {101, 102}, 2: {101, 103}},
+        all_recipe_color_ids=[101, 102, 103],
+        size_ids=[201, 202],
+        stock_by_color_size=stock_by_color_size,
+        shares_by_bundle={1: 0.7, 2: 0.3},
+        allocation_plan=plan,
+    )
+    estimate = planning_production_order_service._estimate_competition_aware_raw_bundle_stock(
+        bundle_type_ids=[1, 2],
+        recipe_colors_by_bundle={1: {101, 102}, 2: {101, 103}},
+        all_recipe_color_ids=[101, 102, 103],
+        size_ids=[201, 202],
+        stock_by_color_size=stock_by_color_size,
+        shares_by_bundle={1: 0.7, 2: 0.3},
+        allocation_plan=plan,
+    )
+
+    # Only the shared color is normalized, once for the whole plan rather than per size and pass.
+    assert normalize_calls == [[1, 2]]
+    assert allocation.reserved_bundle_units == estimate == {1: 11, 2: 3}
+    assert allocation.contract["status"] == "ok"
+
+
+def test_allocate_units_batch_matches_single_allocation_and_tie_breaking():
+    shared_weights = {3: 0.25, 1: 0.25, 2: 0.5}
+    skewed_weights = {10: 0.7, 20: 0.3}
+    totals = [0, 1, 2, 3, 7, 11, -4, 5]
+    weight_vectors = [
+        shared_weights,
+        shared_weights,
+        shared_weights,
+        shared_weights,
+        skewed_weights,
+        skewed_weights,
+        shared_weights,
+        {},
+    ]
+
+    batch = _allocate_units_batch(totals, weight_vectors)
+
+    assert batch == [_allocate_units(total, weights) for total, weights in zip(totals, weight_vectors)]
+    assert batch[1] == {1: 0, 2: 1, 3: 0}
+    # Keys 1 and 3 tie on the fractional part; the smaller key gets the remaining unit.
+    assert batch[2] == {1: 1, 2: 1, 3: 0}
+    assert batch[4] == {10: 5, 20: 2}
+    assert batch[6] == {3: 0, 1: 0, 2: 0}
+    assert batch[7] == {}
+
+
+def test_color_size_grid_reads_like_the_dict_map_it_replaces():
+    quantities = {(102, 201): 9, (101, 202): 7, (101, 201): 11, (999, 201): 4}
+    grid = ColorSizeGrid.from_mapping(quantities, color_ids=[101, 102], size_ids=[201, 202])
+
+    assert grid == {(101, 201): 11, (101, 202): 7, (102, 201): 9}
+    assert list(grid) == [(101, 201), (101, 202), (102, 201)]
+    assert grid.get((102, 202)) is None
+    assert grid.get((999, 201), 0) == 0
+    assert grid.get("101-201", 0) == 0
+    assert (102, 202) not in grid
+    with pytest.raises(KeyError):
+        grid[(102, 202)]
+    assert grid.rows() == [[11, 7], [9, 0]]
+
+    stock = grid.copy()
+    stock.add(102, 202, 5)
+    stock.put(101, 201, 1)
+    assert stock.rows() == [[1, 7], [9, 5]]
+    assert grid.rows() == [[11, 7], [9, 0]]
+    assert (102, 202) not in grid
+    with pytest.raises(KeyError):
+        stock.add(103, 201, 1)
+
+    assert _as_color_size_grid(stock, color_ids=[101, 102], size_ids=[201, 202]) is stock
+    assert _as_color_size_grid(stock, color_ids=[101], size_ids=[201, 202]).rows() == [[1, 7]]
+
+
+def test_stage_executor_runs_stage_once_and_closes_its_lap():
+    executor = _ProductionOrderStageExecutor()
+    calls: list[dict[str, object]] = []
+
+    def counting_risk_level(**kwargs):
+        calls.append(kwargs)
+        return planning_production_order_service._apply_production_order_risk_level(**kwargs)
+
+    executor.mark("article_lookup")
+    risk = executor.run(
+        "risk_level",
+        counting_risk_level,
+        total_daily_sales=2.0,
+        available_bundles_for_cover=10,
+        reorder_point_days=30,
+        alert_threshold_days=7,
+        target_coverage_days=60,
+    )
+
+    assert len(calls) == 1
+    assert executor.results == {"risk_level": risk}
+    assert risk.days_of_cover_estimate == 5.0
+    # Stage results are slotted and handed back as-is; there is no second projection object.
+    assert not hasattr(risk, "__dict__")
+    assert [entry["stage"] for entry in executor.timer.stages] == ["article_lookup", "risk_level"]
+
+
 def _business_projection(body: dict[str, object]) -> dict[str, object]:
     return {
         "status": body["status"],
@@ -2220,6 +2388,101 @@ def test_production_order_proposal_shared_color_pool_reduces_local_fabric_min_up
     assert any("Shared color pool:" in step for step in compact_body["explanation"]["steps"])
 
 
+def test_shared_color_pool_index_serves_repeat_snapshots_from_memory(db_session):
+    seeded = _seed_article_bundle_base(db_session)
+    pantone_code = seeded["color_1"].pantone_code
+    sibling_article = Article(code="PO-ART-INDEX", name="PO-ART-INDEX")
+    sibling_color = Color(inner_code="PO-C-INDEX", pantone_code=pantone_code, description="Shared Pantone")
+    db_session.add_all([sibling_article, sibling_color])
+    db_session.flush()
+    db_session.add_all(
+        [
+            SkuUnit(article_id=sibling_article.id, color_id=sibling_color.id, size_id=seeded["size_s"].id),
+            ArticleWbMapping(article_id=sibling_article.id, wb_sku="WB-INDEX-1"),
+            WbSalesDaily(
+                wb_sku="WB-INDEX-1",
+                date=date(2026, 1, 10),
+                sales_qty=30,
+                revenue=None,
+                created_at=datetime(2026, 1, 10, tzinfo=timezone.utc),
+            ),
+        ]
+    )
+    db_session.commit()
+
+    def _snapshot():
+        stats, token = start_query_stats()
+        try:
+            snapshot = planning_production_order_service._build_shared_color_pool_snapshot(
+                db=db_session,
+                article_id=seeded["article"].id,
+                pantone_by_color={seeded["color_1"].id: pantone_code},
+                target_horizon_days=30,
+                observation_window_days=30,
+                as_of_date=None,
+            )
+        finally:
+            stop_query_stats(token)
+        return snapshot, stats.count
+
+    first, first_queries = _snapshot()
+    assert first["status"] == "ok"
+    assert (first["as_of_date"], first["as_of_source"]) == ("2026-01-10", "latest_wb_sales")
+    assert first["pantones"][pantone_code]["sibling_article_ids"] == [sibling_article.id]
+    assert first["sibling_proxy_required_total"] == 30
+    assert first_queries > 0
+
+    hits_before = SHARED_COLOR_POOL_INDEX_CACHE.cache_info().hits
+    second, second_queries = _snapshot()
+    assert second == first
+    assert second_queries == 0
+    assert SHARED_COLOR_POOL_INDEX_CACHE.cache_info().hits == hits_before + 2
+
+    # An ORM write to a source table invalidates the index on flush.
+    db_session.add(
+        ArticlePlanningSettings(
+            article_id=sibling_article.id,
+            include_in_planning=False,
+            priority=1,
+            target_coverage_days=60,
+            lead_time_days=70,
+            service_level_percent=90,
+        )
+    )
+    db_session.flush()
+    excluded, excluded_queries = _snapshot()
+    assert excluded["status"] == "siblings_excluded_from_planning"
+    assert excluded_queries > 0
+    # Until its transaction ends, the writing session loads its own index and never caches it,
+    # so its uncommitted rows stay out of the shared index.
+    assert SHARED_COLOR_POOL_INDEX_CACHE.cache_info().currsize == 0
+    _, excluded_again_queries = _snapshot()
+    assert excluded_again_queries > 0
+    assert SHARED_COLOR_POOL_INDEX_CACHE.cache_info().currsize == 0
+    db_session.commit()
+    _snapshot()
+    assert SHARED_COLOR_POOL_INDEX_CACHE.cache_info().currsize > 0
+
+    # Another database in the same process never reads this one's cached index.
+    other_engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=other_engine)
+    other_session = sessionmaker(bind=other_engine)()
+    try:
+        other = planning_production_order_service._build_shared_color_pool_snapshot(
+            db=other_session,
+            article_id=seeded["article"].id,
+            pantone_by_color={seeded["color_1"].id: pantone_code},
+            target_horizon_days=30,
+            observation_window_days=30,
+            as_of_date=None,
+        )
+    finally:
+        other_session.close()
+        other_engine.dispose()
+    assert other["status"] == "no_sibling_articles"
+    assert other["as_of_source"] == "utc_today"
+
+
 def test_production_order_proposal_economic_overrides_are_traced_in_meta(client, db_session):
     seeded = _seed_article_bundle_base(db_session)
     seeded["bundle_type"].is_assorti = True
@@ -6690,6 +6953,140 @@ def test_layer4_scenarios_include_economic_money_fields():
     assert float(balanced["objective_score_delta_vs_balanced"]) == 0.0
 
 
+def test_portfolio_capital_allocator_fills_shared_budget_across_articles():
+    def _article(article_id, unit_capital, ranked_lines):
+        return _PortfolioArticleInput(
+            article_id=article_id,
+            candidate_lines=[
+                ProductionOrderRecommendationLine(
+                    article_id=article_id,
+                    color_id=color_id,
+                    size_id=size_id,
+                    recommended_qty=qty,
+                    source_reason="target_coverage",
+                )
+                for color_id, size_id, qty, _score in ranked_lines
+            ],
+            ranking=[
+                {
+                    "color_id": color_id,
+                    "size_id": size_id,
+                    "requested_qty": qty,
+                    "stockout_risk": 0.5,
+                    "overstock_risk": 0.0,
+                    "objective_score": score * qty * unit_capital,
+                    "objective_score_per_capital": score,
+                    "rank": rank,
+                }
+                for rank, (color_id, size_id, qty, score) in enumerate(ranked_lines, start=1)
+            ],
+            unit_capital_per_unit=unit_capital,
+        )
+
+    articles = [
+        _article(1, 10.0, [(1, 1, 10, 0.4), (1, 2, 10, 0.2)]),
+        _article(2, 25.0, [(2, 1, 4, 0.5), (2, 2, 2, 0.3)]),
+        _article(3, 0.0, [(3, 1, 7, 0.0)]),
+    ]
+
+    # 0.5 -> art 2 takes 4 (100), 0.4 -> art 1 takes 10 (100), 0.3 -> art 2 fits 1 of 2 (25),
+    # 0.2 -> art 1 still fits 1 of 10 (10) with the 15 left; 5 stays unspent.
+    allocation = _allocate_portfolio_capital(articles=articles, available_capital=240.0)
+    assert allocation.status == "budget_limited_applied"
+    assert allocation.constrained is True
+    assert (allocation.required_capital, allocation.allocated_capital, allocation.remaining_capital) == (
+        350.0,
+        235.0,
+        5.0,
+    )
+    by_article = {row["article_id"]: row for row in allocation.articles}
+    assert [(line.color_id, line.size_id, line.recommended_qty) for line in by_article[1]["lines"]] == [
+        (1, 1, 10),
+        (1, 2, 1),
+    ]
+    assert by_article[1]["lines"][0].source_reason == "target_coverage"
+    assert by_article[1]["lines"][1].source_reason == "target_coverage|portfolio_capital_constraint"
+    assert (by_article[1]["requested_qty"], by_article[1]["allocated_qty"], by_article[1]["cut_qty"]) == (20, 11, 9)
+    assert by_article[1]["cut_lines"] == [
+        {"rank": 2, "color_id": 1, "size_id": 2, "requested_qty": 10, "allocated_qty": 1}
+    ]
+    assert (by_article[2]["allocated_qty"], by_article[2]["allocated_capital"]) == (5, 125.0)
+    assert by_article[2]["cut_lines"] == [
+        {"rank": 2, "color_id": 2, "size_id": 2, "requested_qty": 2, "allocated_qty": 1}
+    ]
+    # Lines that need no capital are never cut.
+    assert (by_article[3]["allocated_qty"], by_article[3]["cut_lines"]) == (7, [])
+
+    unconstrained = _allocate_portfolio_capital(articles=articles, available_capital=1000.0)
+    assert unconstrained.status == "within_budget"
+    assert unconstrained.remaining_capital == 650.0
+    assert all(row["cut_qty"] == 0 for row in unconstrained.articles)
+    assert unconstrained.articles[0]["lines"] == articles[0].candidate_lines
+
+    empty = _allocate_portfolio_capital(articles=articles, available_capital=0.0)
+    assert [row["allocated_qty"] for row in empty.articles] == [0, 0, 7]
+
+
+def test_layer4_scenario_grid_frontier_keeps_only_non_dominated_points():
+    scenario_inputs = dict(
+        base_purchase_units=300,
+        available_bundles_for_cover=0,
+        total_daily_sales=5.0,
+        reorder_point_days=40,
+        expected_horizon_sales=450.0,
+        layer3_purchase_shaping={"main_lines": 1, "assorti_lines": 1, "hold_lines": 0},
+        unit_capital_per_unit=2.0,
+        margin_main_per_unit=1.5,
+        margin_assorti_per_unit=1.0,
+        average_realized_price_main=3.5,
+        average_realized_price_assorti=3.0,
+    )
+    basis = _build_layer4_scenario_basis(**scenario_inputs)
+
+    fixed_grid = _evaluate_layer4_scenario_grid(basis, [factor for _name, factor in LAYER4_SCENARIO_FACTORS])
+    scenarios = _build_layer4_scenarios(**scenario_inputs)
+    assert [item["purchase_units"] for item in scenarios] == fixed_grid.purchase_units
+    assert [item["objective_score"] for item in scenarios] == [
+        round(score, 2) for score in fixed_grid.objective_score
+    ]
+
+    # Units 0/150/300/450/600 give cover 0/30/60/90/120 days against anchors of 40 and 80 days:
+    # past 300 units stockout is already 0, so extra capital only adds overstock risk.
+    summary = _build_layer4_efficiency_frontier_summary(grid_points=5, **scenario_inputs)
+    assert summary["grid_points"] == 5
+    assert [point["purchase_factor"] for point in summary["frontier"]] == [0.0, 0.5, 1.0]
+    assert [point["stockout_risk_proxy"] for point in summary["frontier"]] == [1.0, 0.25, 0.0]
+
+    # Factors that round to the same purchase units collapse onto the smallest factor.
+    small_basis = _build_layer4_scenario_basis(**{**scenario_inputs, "base_purchase_units": 1})
+    small_frontier = _build_layer4_efficiency_frontier(
+        _evaluate_layer4_scenario_grid(small_basis, [0.0, 0.5, 1.0, 1.5, 2.0])
+    )
+    assert [(point["purchase_factor"], point["purchase_units"]) for point in small_frontier] == [
+        (0.0, 0),
+        (0.5, 1),
+        (1.5, 2),
+    ]
+
+    dense_grid = _evaluate_layer4_scenario_grid(basis, [index / 200 for index in range(401)])
+    points = list(
+        zip(dense_grid.total_capital_required, dense_grid.stockout_risk, dense_grid.overstock_risk)
+    )
+    non_dominated = {
+        point
+        for point in points
+        if not any(other != point and all(o <= p for o, p in zip(other, point)) for other in points)
+    }
+    frontier = _build_layer4_efficiency_frontier(dense_grid)
+    assert {
+        (point["total_capital_required"], point["stockout_risk_proxy"], point["overstock_risk_proxy"])
+        for point in frontier
+    } == {(capital, round(stockout, 4), round(overstock, 4)) for capital, stockout, overstock in non_dominated}
+    assert [point["total_capital_required"] for point in frontier] == sorted(
+        point["total_capital_required"] for point in frontier
+    )
+
+
 def test_layer4_aggregate_deltas_aggressive_vs_conservative_are_emitted():
     scenarios = _build_layer4_scenarios(
         base_purchase_units=100,
@@ -18604,3 +19001,502 @@ def test_production_order_proposal_from_wb_validation_error(client, db_session):
     detail_locs = {tuple(item["loc"]) for item in detail}
     assert ("body", "planning_horizon_days") in detail_locs
     assert ("body", "observation_window_days") in detail_locs
+
+
+def test_production_order_proposal_debug_stage_timings_in_meta(client, db_session):
+    seeded = _seed_article_bundle_base(db_session)
+    payload = _build_payload(
+        article_id=seeded["article"].id,
+        bundle_type_id=seeded["bundle_type"].id,
+        size_s_id=seeded["size_s"].id,
+        size_m_id=seeded["size_m"].id,
+    )
+
+    response = client.post("/api/v1/planning/core/production-order/proposal", json=payload)
+    assert response.status_code == 200, response.text
+    assert STAGE_TIMINGS_META_KEY not in response.json()["explanation"]["meta"]
+
+    duration_samples_before = STAGE_DURATION_HISTOGRAM.samples()
+    response = client.post(
+        "/api/v1/planning/core/production-order/proposal",
+        json={**payload, "explainability_mode": "compact", "debug_stage_timings": True},
+    )
+    assert response.status_code == 200, response.text
+
+    timings = response.json()["explanation"]["meta"][STAGE_TIMINGS_META_KEY]
+    stages = [entry["stage"] for entry in timings["stages"]]
+    assert stages[0] == "article_lookup"
+    assert stages[-1] == "response"
+    assert {"settings_loading", "inputs", "resource_allocation", "layer4", "layer5", "explanation"} <= set(stages)
+    assert all(entry["wall_ms"] >= 0 for entry in timings["stages"])
+    assert timings["total_wall_ms"] >= max(entry["wall_ms"] for entry in timings["stages"])
+    # The request runs under the query-stats middleware, so DB work is attributed per stage.
+    assert timings["total_db_queries"] == sum(entry["db_queries"] for entry in timings["stages"])
+    assert next(e for e in timings["stages"] if e["stage"] == "settings_loading")["db_queries"] > 0
+    assert next(e for e in timings["stages"] if e["stage"] == "layer4")["db_queries"] == 0
+
+    duration_samples_after = STAGE_DURATION_HISTOGRAM.samples()
+    before = duration_samples_before.get(("layer4",))
+    assert duration_samples_after[("layer4",)].count == (before.count if before else 0) + 1
+
+
+def test_production_order_proposal_layer4_scenario_grid_frontier_in_meta(client, db_session):
+    seeded = _seed_article_bundle_base(db_session)
+    payload = _build_payload(
+        article_id=seeded["article"].id,
+        bundle_type_id=seeded["bundle_type"].id,
+        size_s_id=seeded["size_s"].id,
+        size_m_id=seeded["size_m"].id,
+    )
+
+    response = client.post("/api/v1/planning/core/production-order/proposal", json=payload)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert LAYER4_EFFICIENCY_FRONTIER_META_KEY not in body["explanation"]["meta"]
+
+    response = client.post(
+        "/api/v1/planning/core/production-order/proposal",
+        json={**payload, "explainability_mode": "compact", "layer4_scenario_grid_points": 201},
+    )
+    assert response.status_code == 200, response.text
+    frontier_meta = response.json()["explanation"]["meta"][LAYER4_EFFICIENCY_FRONTIER_META_KEY]
+    assert frontier_meta["grid_points"] == 201
+    assert (frontier_meta["factor_min"], frontier_meta["factor_max"]) == (0.0, 2.0)
+    assert frontier_meta["frontier_points"] == len(frontier_meta["frontier"]) >= 1
+    capitals = [point["total_capital_required"] for point in frontier_meta["frontier"]]
+    assert capitals == sorted(capitals)
+    # The grid is an exploration aid; the recommendation is unchanged.
+    assert response.json()["recommendation"] == body["recommendation"]
+
+    response = client.post(
+        "/api/v1/planning/core/production-order/proposal",
+        json={**payload, "layer4_scenario_grid_points": 1002},
+    )
+    assert response.status_code == 422
+
+
+def _seed_portfolio_article(db_session, seeded, code: str):
+    article = Article(code=code, name=code)
+    db_session.add(article)
+    db_session.flush()
+    db_session.add_all(
+        [
+            SkuUnit(article_id=article.id, color_id=color.id, size_id=size.id)
+            for color in (seeded["color_1"], seeded["color_2"])
+            for size in (seeded["size_s"], seeded["size_m"])
+        ]
+        + [
+            BundleRecipe(
+                article_id=article.id,
+                bundle_type_id=seeded["bundle_type"].id,
+                color_id=color.id,
+                position=position,
+            )
+            for position, color in enumerate((seeded["color_1"], seeded["color_2"]), start=1)
+        ]
+        + [
+            ArticlePlanningSettings(
+                article_id=article.id,
+                include_in_planning=True,
+                priority=2,
+                target_coverage_days=60,
+                lead_time_days=70,
+                service_level_percent=90,
+            )
+        ]
+    )
+    db_session.commit()
+    return article
+
+
+def _build_portfolio_payload(seeded, article_id: int, daily_sales: float):
+    payload = _build_payload(
+        article_id=article_id,
+        bundle_type_id=seeded["bundle_type"].id,
+        size_s_id=seeded["size_s"].id,
+        size_m_id=seeded["size_m"].id,
+    )
+    payload["bundle_daily_sales"][0]["daily_sales"] = daily_sales
+    payload["overrides"]["production_cost_per_unit"] = 10.0
+    payload["overrides"]["logistics_cost_per_unit"] = 2.0
+    return payload
+
+
+def test_production_order_portfolio_splits_one_budget_across_articles(client, db_session):
+    seeded = _seed_article_bundle_base(db_session)
+    second_article = _seed_portfolio_article(db_session, seeded, "PO-ART-2")
+
+    proposals = []
+    for article_id, daily_sales in ((seeded["article"].id, 20.0), (second_article.id, 10.0)):
+        proposals.append(_build_portfolio_payload(seeded, article_id, daily_sales))
+
+    response = client.post(
+        "/api/v1/planning/core/production-order/portfolio",
+        json={"available_capital": 1000000.0, "proposals": proposals},
+    )
+    assert response.status_code == 200, response.text
+    unconstrained = response.json()
+    assert unconstrained["status"] == "within_budget"
+    assert unconstrained["skipped_article_ids"] == []
+    assert unconstrained["waiting_article_ids"] == []
+    assert [row["article_id"] for row in unconstrained["articles"]] == [seeded["article"].id, second_article.id]
+    for row, payload in zip(unconstrained["articles"], proposals):
+        assert row["cut_qty"] == 0
+        assert row["unit_capital_per_unit"] > 0
+        single = client.post("/api/v1/planning/core/production-order/proposal", json=payload)
+        assert single.status_code == 200, single.text
+        assert row["lines"] == single.json()["recommendation"]["lines"]
+
+    budget = round(unconstrained["required_capital"] / 2, 2)
+    response = client.post(
+        "/api/v1/planning/core/production-order/portfolio",
+        json={"available_capital": budget, "proposals": proposals},
+    )
+    assert response.status_code == 200, response.text
+    constrained = response.json()
+    assert constrained["status"] == "budget_limited_applied"
+    assert constrained["allocated_capital"] <= budget
+    assert constrained["remaining_capital"] < max(row["unit_capital_per_unit"] for row in constrained["articles"])
+    assert sum(row["cut_qty"] for row in constrained["articles"]) > 0
+    for row in constrained["articles"]:
+        assert row["requested_qty"] - row["allocated_qty"] == row["cut_qty"]
+        assert row["cut_qty"] == sum(line["requested_qty"] - line["allocated_qty"] for line in row["cut_lines"])
+        assert row["allocated_capital"] == round(row["allocated_qty"] * row["unit_capital_per_unit"], 2)
+
+    response = client.post(
+        "/api/v1/planning/core/production-order/portfolio",
+        json={"available_capital": budget, "proposals": [proposals[0], proposals[0]]},
+    )
+    assert response.status_code == 422
+
+
+def test_production_order_portfolio_gives_no_budget_to_articles_that_wait(client, db_session):
+    seeded = _seed_article_bundle_base(db_session)
+    overstock_article = _seed_portfolio_article(db_session, seeded, "PO-ART-OVERSTOCK")
+
+    critical_payload = _build_portfolio_payload(seeded, seeded["article"].id, 20.0)
+    overstock_payload = _build_portfolio_payload(seeded, overstock_article.id, 1.0)
+    overstock_payload["bundle_stock"] = [{"bundle_type_id": seeded["bundle_type"].id, "wb_qty": 5000, "local_qty": 0}]
+
+    single_bodies = {}
+    for payload in (critical_payload, overstock_payload):
+        single = client.post("/api/v1/planning/core/production-order/proposal", json=payload)
+        assert single.status_code == 200, single.text
+        single_bodies[payload["article_id"]] = single.json()
+    assert single_bodies[overstock_article.id]["recommendation"]["action"] == "wait"
+    assert single_bodies[overstock_article.id]["recommendation"]["total_units"] == 0
+    critical_recommendation = single_bodies[seeded["article"].id]["recommendation"]
+    assert critical_recommendation["action"] != "wait"
+
+    # The budget covers the critical article alone; a waiting article must not dilute it.
+    response = client.post(
+        "/api/v1/planning/core/production-order/portfolio",
+        json={
+            "available_capital": critical_recommendation["total_units"] * 12.0,
+            "proposals": [overstock_payload, critical_payload],
+        },
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["waiting_article_ids"] == [overstock_article.id]
+    assert body["status"] == "within_budget"
+    assert [row["article_id"] for row in body["articles"]] == [seeded["article"].id]
+    assert body["articles"][0]["cut_qty"] == 0
+    assert body["articles"][0]["lines"] == critical_recommendation["lines"]
+
+
+def test_production_order_portfolio_budget_does_not_decide_which_articles_wait(client, db_session):
+    seeded = _seed_article_bundle_base(db_session)
+    second_article = _seed_portfolio_article(db_session, seeded, "PO-ART-2")
+    proposals = [
+        _build_portfolio_payload(seeded, seeded["article"].id, 20.0),
+        _build_portfolio_payload(seeded, second_article.id, 10.0),
+    ]
+
+    def _portfolio(available_capital):
+        response = client.post(
+            "/api/v1/planning/core/production-order/portfolio",
+            json={"available_capital": available_capital, "proposals": proposals},
+        )
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    unconstrained = _portfolio(1000000.0)
+    assert unconstrained["waiting_article_ids"] == []
+    required_capital = unconstrained["required_capital"]
+    assert required_capital > 0
+    cheapest_unit = min(row["unit_capital_per_unit"] for row in unconstrained["articles"])
+
+    # Articles are ranked on their uncapped need: a budget too small for a single unit cuts every
+    # line instead of turning the articles into "wait".
+    for budget in (0.0, round(cheapest_unit / 2, 2)):
+        body = _portfolio(budget)
+        assert body["status"] == "budget_limited_applied"
+        assert body["constrained"] is True
+        assert body["waiting_article_ids"] == []
+        assert body["required_capital"] == required_capital
+        assert body["allocated_capital"] == 0.0
+        assert body["remaining_capital"] == budget
+        assert [row["article_id"] for row in body["articles"]] == [seeded["article"].id, second_article.id]
+        for row, unconstrained_row in zip(body["articles"], unconstrained["articles"]):
+            assert row["requested_qty"] == unconstrained_row["requested_qty"] > 0
+            assert row["allocated_qty"] == 0
+            assert row["cut_qty"] == row["requested_qty"]
+            assert row["lines"] == []
+
+
+def test_production_order_proposal_from_wb_compact_keeps_debug_stage_timings(client, db_session):
+    seeded = _seed_article_bundle_base(db_session)
+    db_session.add(
+        ArticleWbMapping(
+            article_id=seeded["article"].id,
+            wb_sku="WB-PO-TIMING",
+            bundle_type_id=seeded["bundle_type"].id,
+            size_id=seeded["size_s"].id,
+        )
+    )
+    db_session.add(
+        WbSalesDaily(
+            wb_sku="WB-PO-TIMING",
+            date=date(2026, 1, 10),
+            sales_qty=60,
+            revenue=None,
+            created_at=datetime.now(timezone.utc),
+        )
+    )
+    db_session.add(
+        WbStock(
+            wb_sku="WB-PO-TIMING",
+            warehouse_id=1,
+            warehouse_name="WB-1",
+            stock_qty=20,
+            updated_at=datetime(2026, 1, 10, tzinfo=timezone.utc),
+        )
+    )
+    db_session.commit()
+
+    payload = {
+        "article_id": seeded["article"].id,
+        "observation_window_days": 30,
+        "as_of_date": "2026-01-10",
+        "explainability_mode": EXPLAINABILITY_MODE_COMPACT,
+        "debug_stage_timings": True,
+        "bundle_type_ids": [seeded["bundle_type"].id],
+        "overrides": {
+            "fabric_min_batch_qty_default": 0,
+            "elastic_min_batch_qty_default": 0,
+        },
+    }
+
+    response = client.post("/api/v1/planning/core/production-order/proposal/from-wb", json=payload)
+    assert response.status_code == 200, response.text
+
+    meta = response.json()["explanation"]["meta"]
+    assert meta["explainability"]["mode"] == EXPLAINABILITY_MODE_COMPACT
+    assert meta[STAGE_TIMINGS_META_KEY]["stages"][-1]["stage"] == "response"
+
+
+def test_production_order_proposal_none_mode_skips_explanation_construction(client, db_session, monkeypatch):
+    seeded = _seed_article_bundle_base(db_session)
+    payload = _build_payload(
+        article_id=seeded["article"].id,
+        bundle_type_id=seeded["bundle_type"].id,
+        size_s_id=seeded["size_s"].id,
+        size_m_id=seeded["size_m"].id,
+    )
+
+    full_response = client.post("/api/v1/planning/core/production-order/proposal", json=payload)
+    assert full_response.status_code == 200, full_response.text
+    full_body = full_response.json()
+
+    def fail_if_called(*args, **kwargs):  # noqa: ARG001
+        raise AssertionError("explanation-only builder must not run in none mode")
+
+    for builder_name in (
+        "_build_layer1_contract_summary",
+        "_build_layer2_contract_summary",
+        "_build_layer2_decision_quality_summary",
+        "_build_layer3_contract_summary",
+        "_build_capital_constraint_contract_summary",
+        "_build_layer4_contract_summary",
+        "_build_layer5_contract_summary",
+        "_build_explanation_warnings",
+        "_build_alpha_proxy_economics_meta",
+        "_build_explanation_steps",
+        "_build_explanation_meta",
+    ):
+        monkeypatch.setattr(planning_production_order_service, builder_name, fail_if_called)
+
+    response = client.post(
+        "/api/v1/planning/core/production-order/proposal",
+        json={**payload, "explainability_mode": EXPLAINABILITY_MODE_NONE, "debug_stage_timings": True},
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+
+    assert _business_projection(body) == _business_projection(full_body)
+    assert body["explanation"]["summary"] == full_body["explanation"]["summary"]
+    assert body["explanation"]["steps"] == []
+    meta = body["explanation"]["meta"]
+    assert set(meta) == {"explainability", STAGE_TIMINGS_META_KEY}
+    assert meta["explainability"] == {"mode": EXPLAINABILITY_MODE_NONE}
+    stages = [entry["stage"] for entry in meta[STAGE_TIMINGS_META_KEY]["stages"]]
+    assert "explanation" in stages
+    assert not {"explanation_warnings", "alpha_proxy_economics", "explainability_mode"} & set(stages)
+
+
+def test_production_order_proposal_from_wb_none_mode_matches_full_recommendation(client, db_session):
+    seeded = _seed_article_bundle_base(db_session)
+    db_session.add(
+        ArticleWbMapping(
+            article_id=seeded["article"].id,
+            wb_sku="WB-PO-NONE",
+            bundle_type_id=seeded["bundle_type"].id,
+            size_id=seeded["size_s"].id,
+        )
+    )
+    db_session.add(
+        WbSalesDaily(
+            wb_sku="WB-PO-NONE",
+            date=date(2026, 1, 10),
+            sales_qty=60,
+            revenue=None,
+            created_at=datetime.now(timezone.utc),
+        )
+    )
+    db_session.add(
+        WbStock(
+            wb_sku="WB-PO-NONE",
+            warehouse_id=1,
+            warehouse_name="WB-1",
+            stock_qty=20,
+            updated_at=datetime(2026, 1, 10, tzinfo=timezone.utc),
+        )
+    )
+    db_session.commit()
+
+    payload = {
+        "article_id": seeded["article"].id,
+        "observation_window_days": 30,
+        "as_of_date": "2026-01-10",
+        "bundle_type_ids": [seeded["bundle_type"].id],
+        "overrides": {
+            "fabric_min_batch_qty_default": 0,
+            "elastic_min_batch_qty_default": 0,
+        },
+    }
+
+    full_response = client.post("/api/v1/planning/core/production-order/proposal/from-wb", json=payload)
+    assert full_response.status_code == 200, full_response.text
+    none_response = client.post(
+        "/api/v1/planning/core/production-order/proposal/from-wb",
+        json={**payload, "explainability_mode": EXPLAINABILITY_MODE_NONE},
+    )
+    assert none_response.status_code == 200, none_response.text
+
+    full_body = full_response.json()
+    none_body = none_response.json()
+    assert full_body["recommendation"]["total_units"] > 0
+    assert _business_projection(none_body) == _business_projection(full_body)
+    assert none_body["explanation"]["steps"] == []
+    assert none_body["explanation"]["meta"] == {"explainability": {"mode": EXPLAINABILITY_MODE_NONE}}
+
+
+def test_contract_validation_levels_select_which_proposals_are_checked():
+    assert _should_validate_contracts(level=CONTRACT_VALIDATION_LEVEL_FULL) is True
+    assert _should_validate_contracts(level=CONTRACT_VALIDATION_LEVEL_OFF) is False
+    assert _should_validate_contracts(level="unknown") is True
+
+    sequence = itertools.count()
+    sampled = [
+        _should_validate_contracts(level=CONTRACT_VALIDATION_LEVEL_SAMPLED, sample_every_n=3, sequence=sequence)
+        for _ in range(7)
+    ]
+    assert sampled == [True, False, False, True, False, False, True]
+
+
+def test_production_order_proposal_contract_validation_off_keeps_versions(client, db_session, monkeypatch):
+    seeded = _seed_article_bundle_base(db_session)
+    payload = _build_payload(
+        article_id=seeded["article"].id,
+        bundle_type_id=seeded["bundle_type"].id,
+        size_s_id=seeded["size_s"].id,
+        size_m_id=seeded["size_m"].id,
+    )
+
+    full_response = client.post("/api/v1/planning/core/production-order/proposal", json=payload)
+    assert full_response.status_code == 200, full_response.text
+    full_body = full_response.json()
+
+    def fail_if_called(*args, **kwargs):  # noqa: ARG001
+        raise AssertionError("contract summary must not be rebuilt with validation off")
+
+    for builder_name in (
+        "_build_layer1_contract_summary",
+        "_build_layer2_contract_summary",
+        "_build_layer3_contract_summary",
+        "_build_capital_constraint_contract_summary",
+        "_build_layer4_contract_summary",
+        "_build_layer5_contract_summary",
+    ):
+        monkeypatch.setattr(planning_production_order_service, builder_name, fail_if_called)
+    monkeypatch.setattr(contract_validation_module, "CONTRACT_VALIDATION_LEVEL", CONTRACT_VALIDATION_LEVEL_OFF)
+
+    response = client.post("/api/v1/planning/core/production-order/proposal", json=payload)
+    assert response.status_code == 200, response.text
+    body = response.json()
+
+    assert body["recommendation"] == full_body["recommendation"]
+    meta = body["explanation"]["meta"]
+    contracts = [
+        meta["layer_1_stock_health"]["contract"],
+        meta["layer_2_allocation"]["contract"],
+        meta["layer_3_purchase_shaping"]["contract"],
+        meta["layer_4_scenarios"]["contract"],
+        meta["layer_5_intervention"]["contract"],
+        meta["capital_constraint"]["contract"],
+        body["constraints_applied"]["resource_allocation"]["contract"],
+    ]
+    assert [contract["version"] for contract in contracts] == [
+        LAYER1_CONTRACT_VERSION,
+        LAYER2_CONTRACT_VERSION,
+        LAYER3_CONTRACT_VERSION,
+        LAYER4_CONTRACT_VERSION,
+        LAYER5_CONTRACT_VERSION,
+        CAPITAL_CONSTRAINT_CONTRACT_VERSION,
+        RESOURCE_ALLOCATION_CONTRACT_VERSION,
+    ]
+    assert {contract["status"] for contract in contracts} == {CONTRACT_STATUS_SKIPPED}
+    assert full_body["explanation"]["meta"]["layer_4_scenarios"]["contract"]["status"] == "ok"
+
+
+def test_compact_mode_filters_explanation_steps_by_code_without_rendering_dropped_steps():
+    explanation = ProductionOrderExplanationBlock(
+        summary="summary",
+        step_records=[
+            ExplanationStep(
+                STEP_CODE_DEMAND,
+                {"total_daily_sales": 1.5, "planning_horizon_days": 30, "expected_horizon_sales": 45.0},
+            ),
+            # Rendering this record would raise (no contract keys), so compaction must drop it unrendered.
+            ExplanationStep(STEP_CODE_LAYER4_CONTRACT, {"layer4_contract": {}}),
+            # Plain text has no code and is no longer matched by substring.
+            "Layer 4 scenarios: legacy free-text step.",
+        ],
+    )
+
+    compact = planning_production_order_service._apply_explainability_mode(explanation, EXPLAINABILITY_MODE_COMPACT)
+
+    assert [step.code for step in compact.step_records] == [STEP_CODE_DEMAND, STEP_CODE_COMPACT_OMITTED]
+    assert compact.model_dump(mode="json")["steps"] == [
+        "Спрос по наборам: total_daily_sales=1.500, planning_horizon_days=30, expected_horizon_sales=45.0.",
+        "Explainability compact mode: omitted_steps=2.",
+    ]
+    assert compact.meta["explainability"]["steps_omitted"] == 2
+
+
+def test_explanation_block_accepts_text_steps():
+    explanation = ProductionOrderExplanationBlock.model_validate({"summary": "summary", "steps": ["a", "b"]})
+
+    assert explanation.steps == ["a", "b"]
+    assert explanation.model_dump(mode="json") == {"summary": "summary", "meta": {}, "steps": ["a", "b"]}
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import json
+
+from fastapi.encoders import jsonable_encoder
+
+from app.api.v1.responses import build_model_response
+from benchmarks.production_order_serialization import build_large_proposal, run
+
+
+def test_orjson_response_matches_default_encoder_payload():
+    proposal = build_large_proposal(colors=4, sizes=3, bundle_types=2, colors_per_bundle=2)
+
+    response = build_model_response(proposal)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(proposal)
+    assert proposal.explanation.steps
+
+
+def test_serialization_benchmark_reports_every_path():
+    report = run(colors=3, sizes=2, bundle_types=2, colors_per_bundle=2, repeat=2)
+
+    assert report["benchmark"] == "production_order_serialization"
+    assert report["payload_bytes"] > 0
+    assert set(report["results"]) == {"jsonable_encoder", "response_model", "orjson"}
+    for timings in report["results"].values():
+        assert timings["min_ms"] <= timings["median_ms"] <= timings["max_ms"]
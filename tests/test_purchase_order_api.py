@@ -6,11 +6,12 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.core.db import get_db
+from app.core.db import get_async_db, get_db
 from app.models.models import BundleRecipe, BundleType, PurchaseOrder, PurchaseOrderItem
 from tests.test_utils import (
     add_wb_sales,
     add_wb_stock,
+    count_queries,
     create_article,
     create_article_planning_settings,
     create_color,
@@ -19,6 +20,7 @@ from tests.test_utils import (
     create_size,
     create_sku,
     create_wb_mapping,
+    make_async_db_override,
 )
 
 
@@ -31,6 +33,7 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_async_db] = make_async_db_override(db_session)
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
@@ -595,3 +598,32 @@ def test_patch_purchase_order_item_respects_status_and_updates_timestamp(client,
         "status": "approved",
         "next_steps": ["use_draft_purchase_order_for_item_updates"],
     }
+
+
+def test_list_purchase_orders_batches_item_loading(client, db_session):
+    article = create_article(db_session, code="PO-eager-A")
+    color = create_color(db_session, inner_code="PO-eager-C")
+    sizes = [create_size(db_session, label=f"PO-eager-S{i}", sort_order=i) for i in range(2)]
+    now = datetime.now(timezone.utc)
+    for index in range(5):
+        po = PurchaseOrder(
+            status="draft",
+            target_date=date(2025, 1, 1) + timedelta(days=index),
+            created_at=now,
+            updated_at=now,
+        )
+        po.items = [
+            PurchaseOrderItem(article_id=article.id, color_id=color.id, size_id=size.id, quantity=index + 1)
+            for size in sizes
+        ]
+        db_session.add(po)
+    db_session.commit()
+    db_session.expire_all()
+
+    with count_queries() as counter:
+        resp = client.get("/api/v1/purchase-order/")
+
+    assert resp.status_code == 200
+    assert len(resp.json()) == 5
+    assert all(len(order["items"]) == 2 for order in resp.json())
+    assert counter.count == 2
@@ -284,7 +284,7 @@ def test_create_purchase_order_from_proposal_uses_canonical_from_wb_adapter(
     request = captured_request["request"]
     assert request.article_id == 77
     assert request.planning_horizon_days == 45
-    assert request.explainability_mode == "compact"
+    assert request.explainability_mode == "none"
 
     items = (
         db_session.query(PurchaseOrderItem)
@@ -327,7 +327,7 @@ def test_create_purchase_order_from_proposal_canonical_adapter_clamps_past_targe
     request = captured_request["request"]
     assert request.article_id == 77
     assert request.planning_horizon_days == 1
-    assert request.explainability_mode == "full"
+    assert request.explainability_mode == "none"
 
     items = (
         db_session.query(PurchaseOrderItem)
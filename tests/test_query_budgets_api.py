@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.db import get_async_db, get_db
+from app.main import app
+from app.models.base import Base
+from benchmarks.synthetic_portfolio import PortfolioSpec, generate_portfolio
+from tests.test_utils import count_queries, make_async_db_override
+
+SMALL_PORTFOLIO = 5
+LARGE_PORTFOLIO = 50
+
+# Every endpoint here must issue the same number of statements no matter how many
+# articles are seeded; a growing count means a per-article query (N+1) crept back in.
+BUDGETED_PATHS = [
+    "/api/v1/planning/bundle-risk-portfolio",
+    "/api/v1/planning/order-explanation-portfolio",
+    "/api/v1/planning/health-portfolio",
+    "/api/v1/planning/order-proposal?target_date=2026-03-31",
+    "/api/v1/planning/config-snapshot",
+    "/api/v1/purchase-order/",
+    "/api/v1/article/",
+    "/api/v1/planning/monitoring/snapshot",
+    "/api/v1/planning/monitoring/risk-focus",
+    "/api/v1/planning/monitoring/alerts",
+    "/api/v1/planning/monitoring/status",
+    "/api/v1/planning/monitoring/bootstrap",
+    "/api/v1/planning/monitoring/dashboard",
+]
+
+
+def _seeded_session(articles: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine, autoflush=False)()
+    generate_portfolio(
+        db,
+        PortfolioSpec(
+            articles=articles,
+            colors_per_article=2,
+            sizes_per_article=2,
+            bundle_types_per_article=2,
+            colors_per_bundle=2,
+            days=3,
+            shipments=1,
+            purchase_orders=articles,
+            purchase_order_items=3,
+            as_of=date(2026, 3, 31),
+        ),
+    )
+    return db
+
+
+@pytest.fixture(scope="module")
+def seeded_sessions():
+    sessions = {size: _seeded_session(size) for size in (SMALL_PORTFOLIO, LARGE_PORTFOLIO)}
+    yield sessions
+    for db in sessions.values():
+        db.close()
+
+
+def _query_count(db, path: str) -> int:
+    def _get_db_override():
+        yield db
+
+    app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_async_db] = make_async_db_override(db)
+    try:
+        with TestClient(app) as client:
+            with count_queries() as counter:
+                resp = client.get(path)
+    finally:
+        app.dependency_overrides.clear()
+    assert resp.status_code == 200, resp.text
+    return counter.count
+
+
+def test_count_queries_records_statements(db_session):
+    with count_queries() as counter:
+        db_session.execute(Base.metadata.tables["article"].select())
+        db_session.execute(Base.metadata.tables["color"].select())
+
+    assert counter.count == 2
+    assert counter.statements[0].startswith("SELECT")
+
+
+@pytest.mark.parametrize("path", BUDGETED_PATHS)
+def test_query_count_does_not_grow_with_portfolio(seeded_sessions, path):
+    small = _query_count(seeded_sessions[SMALL_PORTFOLIO], path)
+    large = _query_count(seeded_sessions[LARGE_PORTFOLIO], path)
+
+    assert large == small, f"{path}: {small} queries at {SMALL_PORTFOLIO} articles, {large} at {LARGE_PORTFOLIO}"
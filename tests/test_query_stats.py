@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core import query_stats
+from app.core.db import get_db
+from app.main import app
+from tests.test_utils import create_article, create_global_planning_settings, create_planning_settings
+
+
+@pytest.fixture
+def client(db_session):
+    def _get_db_override():
+        try:
+            yield db_session
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = _get_db_override
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+def test_query_stats_scope_counts_statements(db_session):
+    stats, token = query_stats.start_query_stats()
+    try:
+        db_session.execute(text("SELECT 1"))
+        db_session.execute(text("SELECT 2"))
+    finally:
+        query_stats.stop_query_stats(token)
+    db_session.execute(text("SELECT 3"))
+
+    assert stats.count == 2
+    assert [item.statement for item in stats.statements] == ["SELECT 1", "SELECT 2"]
+    assert stats.total_ms == pytest.approx(sum(item.duration_ms for item in stats.statements))
+    assert query_stats.current_query_stats() is None
+
+
+def test_request_exposes_db_query_headers(client, db_session):
+    create_global_planning_settings(db_session)
+    article = create_article(db_session, code="QSTATS-1")
+    create_planning_settings(db_session, article, is_active=True)
+    db_session.commit()
+
+    resp = client.get("/api/v1/planning/config-snapshot")
+    assert resp.status_code == 200, resp.text
+    assert resp.headers[query_stats.DB_QUERIES_HEADER] == "6"
+    server_timing = resp.headers[query_stats.SERVER_TIMING_HEADER]
+    assert server_timing.startswith("db;dur=")
+    assert server_timing.endswith('desc="6 queries"')
+
+    no_db = client.get("/")
+    assert no_db.headers[query_stats.DB_QUERIES_HEADER] == "0"
+
+
+def test_slow_request_logs_statement_list(client, db_session, caplog, monkeypatch):
+    create_global_planning_settings(db_session)
+    db_session.commit()
+    monkeypatch.setattr(query_stats, "DB_SLOW_REQUEST_MS", 0.0)
+
+    with caplog.at_level(logging.INFO, logger=query_stats.logger.name):
+        resp = client.get("/api/v1/planning/config-snapshot")
+    assert resp.status_code == 200, resp.text
+
+    [record] = [r for r in caplog.records if r.getMessage().startswith("slow_request_db_stats")]
+    assert record.levelno == logging.WARNING
+    payload = json.loads(record.getMessage().split(" ", 1)[1])
+    assert payload["path"] == "/api/v1/planning/config-snapshot"
+    assert payload["status_code"] == 200
+    # No active articles: global settings + active-article lookup only.
+    assert payload["db_queries"] == len(payload["statements"]) == 2
+    assert 0 < len(payload["slowest_statements"]) <= query_stats.QUERY_STATS_TOP_STATEMENTS
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+import pstats
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.profiling import ProfilingMiddleware
+from app.main import app
+
+
+def _busy_proposal_work() -> int:
+    deadline = time.perf_counter() + 0.15
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(200))
+    return total
+
+
+def _profiled_app(tmp_path) -> FastAPI:
+    demo = FastAPI()
+
+    @demo.get("/slow")
+    def slow_endpoint():
+        return {"total": _busy_proposal_work()}
+
+    demo.add_middleware(ProfilingMiddleware, admin_token="secret", output_dir=tmp_path, interval_ms=1)
+    return demo
+
+
+def test_profile_opt_in_writes_speedscope_and_pstats(tmp_path):
+    with TestClient(_profiled_app(tmp_path)) as client:
+        resp = client.get("/slow", headers={"X-Profile": "1", "X-Admin-Token": "secret", "X-Request-ID": "req-42"})
+
+    assert resp.status_code == 200
+    assert resp.headers["X-Request-ID"] == "req-42"
+
+    speedscope = json.loads((tmp_path / "req-42.speedscope.json").read_text(encoding="utf-8"))
+    assert speedscope["name"] == "GET /slow"
+    frame_names = {frame["name"] for frame in speedscope["shared"]["frames"]}
+    assert "_busy_proposal_work" in frame_names
+    assert sum(len(profile["samples"]) for profile in speedscope["profiles"]) > 0
+
+    stats = pstats.Stats(str(tmp_path / "req-42.prof"))
+    profiled_functions = {func_name for (_file, _line, func_name) in stats.stats}
+    assert {"slow_endpoint", "_busy_proposal_work"} <= profiled_functions
+
+
+def test_profile_query_flag_generates_request_id(tmp_path):
+    with TestClient(_profiled_app(tmp_path)) as client:
+        resp = client.get("/slow?profile=1", headers={"X-Admin-Token": "secret", "X-Request-ID": "../bad id"})
+
+    request_id = resp.headers["X-Request-ID"]
+    assert request_id != "../bad id"
+    assert (tmp_path / f"{request_id}.prof").exists()
+
+
+def test_profile_requires_admin_token(tmp_path):
+    with TestClient(_profiled_app(tmp_path)) as client:
+        denied = client.get("/slow", headers={"X-Profile": "1", "X-Admin-Token": "wrong"})
+        non_ascii = client.get("/slow?profile=1", headers={"X-Admin-Token": "s\xe9cret".encode("latin-1")})
+        plain = client.get("/slow")
+
+    assert denied.status_code == 403
+    assert denied.json()["detail"]["code"] == "profiling_forbidden"
+    assert non_ascii.status_code == 403
+    assert non_ascii.json()["detail"]["code"] == "profiling_forbidden"
+    assert plain.status_code == 200
+    assert "X-Request-ID" not in plain.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profiling_is_disabled_without_configured_token():
+    with TestClient(app) as client:
+        resp = client.get("/", headers={"X-Profile": "1", "X-Admin-Token": ""})
+
+    assert resp.status_code == 403
+    assert resp.json()["detail"]["code"] == "profiling_forbidden"
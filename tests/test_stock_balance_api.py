@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 
 import pytest
@@ -135,3 +136,35 @@ def test_patch_stock_balance_returns_structured_409_for_duplicate_pair(client, d
         "warehouse_id": warehouse_one.id,
         "next_steps": ["use_unique_stock_balance_sku_unit_warehouse_pair"],
     }
+
+
+def test_list_stock_balances_streams_ndjson(client, db_session):
+    sku, warehouse = _create_sku_and_warehouse(db_session)
+    other_warehouse = Warehouse(code="SB-MSK", name="Stock MSK", type="internal")
+    db_session.add(other_warehouse)
+    db_session.flush()
+    balances = [
+        StockBalance(
+            sku_unit_id=sku.id,
+            warehouse_id=wh.id,
+            quantity=quantity,
+            updated_at=datetime.now(timezone.utc),
+        )
+        for wh, quantity in ((warehouse, 10), (other_warehouse, 25))
+    ]
+    db_session.add_all(balances)
+    db_session.commit()
+
+    response = client.get("/api/v1/stock-balance/", params={"format": "ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["quantity"] for row in rows] == [10, 25]
+    assert [row["id"] for row in rows] == sorted(balance.id for balance in balances)
+
+    after_first = client.get(
+        "/api/v1/stock-balance/",
+        params={"format": "ndjson", "after_id": rows[0]["id"]},
+    )
+    assert [json.loads(line)["quantity"] for line in after_first.text.splitlines()] == [25]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.models import Color, SkuUnit, WbSalesDaily, WbStock
+from app.schemas.planning_production_order import ProductionOrderProposalFromWbRequest
+from app.services.planning_production_order import build_production_order_proposal_from_wb
+from benchmarks.synthetic_portfolio import PortfolioSpec, generate_portfolio
+
+AS_OF = date(2026, 3, 31)
+SMALL_SPEC = PortfolioSpec(articles=3, days=7, shipments=2, purchase_orders=2, seed=11, as_of=AS_OF)
+
+
+def _generate_fresh(spec: PortfolioSpec):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine, autoflush=False)()
+    return db, generate_portfolio(db, spec)
+
+
+def _sales_fingerprint(db) -> list[tuple]:
+    return list(
+        db.execute(
+            select(WbSalesDaily.wb_sku, WbSalesDaily.date, WbSalesDaily.sales_qty).order_by(
+                WbSalesDaily.wb_sku, WbSalesDaily.date
+            )
+        )
+    )
+
+
+def test_generate_portfolio_is_deterministic_per_seed():
+    first_db, first = _generate_fresh(SMALL_SPEC)
+    second_db, second = _generate_fresh(SMALL_SPEC)
+    other_db, _ = _generate_fresh(PortfolioSpec(articles=3, days=7, seed=12, as_of=AS_OF))
+    try:
+        assert first.rows == second.rows
+        assert first.bundle_type_ids_by_article == second.bundle_type_ids_by_article
+        assert _sales_fingerprint(first_db) == _sales_fingerprint(second_db)
+        assert [row[1:] for row in _sales_fingerprint(first_db)] != [row[1:] for row in _sales_fingerprint(other_db)]
+    finally:
+        first_db.close()
+        second_db.close()
+        other_db.close()
+
+
+def test_generate_portfolio_row_counts_follow_spec(db_session):
+    summary = generate_portfolio(db_session, SMALL_SPEC)
+
+    skus_per_article = SMALL_SPEC.colors_per_article * SMALL_SPEC.sizes_per_article
+    wb_skus = SMALL_SPEC.articles * SMALL_SPEC.bundle_types_per_article * SMALL_SPEC.sizes_per_article
+    assert len(summary.article_ids) == SMALL_SPEC.articles
+    assert summary.rows["sku_unit"] == SMALL_SPEC.articles * skus_per_article
+    assert summary.rows["stock_balance"] == summary.rows["sku_unit"] * SMALL_SPEC.warehouses
+    assert summary.rows["article_wb_mapping"] == wb_skus
+    assert summary.rows["wb_stock"] == wb_skus * SMALL_SPEC.wb_warehouses
+    assert db_session.scalar(select(func.count()).select_from(SkuUnit)) == summary.rows["sku_unit"]
+    assert db_session.scalar(select(func.max(WbSalesDaily.date))) == AS_OF
+    assert db_session.scalar(select(func.count()).select_from(WbStock)) == summary.rows["wb_stock"]
+    shared_pantones = db_session.scalar(select(func.count(func.distinct(Color.pantone_code))))
+    assert shared_pantones == SMALL_SPEC.pantones < summary.rows["color"]
+
+    with pytest.raises(ValueError, match="already exists"):
+        generate_portfolio(db_session, SMALL_SPEC)
+
+
+def test_generated_article_supports_production_order_from_wb(db_session):
+    summary = generate_portfolio(db_session, SMALL_SPEC)
+    article_id = summary.article_ids[0]
+
+    proposal = build_production_order_proposal_from_wb(
+        db=db_session,
+        request=ProductionOrderProposalFromWbRequest(
+            article_id=article_id,
+            observation_window_days=SMALL_SPEC.days,
+            as_of_date=AS_OF,
+            bundle_type_ids=summary.bundle_type_ids_by_article[article_id],
+        ),
+    )
+
+    assert proposal.article_id == article_id
+    assert proposal.status == "ok"
+    assert proposal.risk_level != "no_data"
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
 from app.models.models import (
@@ -237,3 +242,65 @@ def add_wb_stock(
     session.add(row)
     session.flush()
     return row
+
+
+class SyncBackedAsyncSession:
+    """Expose a sync test Session through the AsyncSession subset used by async endpoints.
+
+    API tests seed data inside the uncommitted ``db_session`` transaction, so async read
+    endpoints are routed through that same session to keep the seeded rows visible.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    async def execute(self, statement, *args, **kwargs):
+        return self._session.execute(statement, *args, **kwargs)
+
+    async def scalars(self, statement, *args, **kwargs):
+        return self._session.scalars(statement, *args, **kwargs)
+
+    async def get(self, entity, ident, **kwargs):
+        return self._session.get(entity, ident, **kwargs)
+
+    async def commit(self) -> None:
+        self._session.commit()
+
+    async def close(self) -> None:
+        return None
+
+
+def make_async_db_override(session: Session):
+    async def _get_async_db_override():
+        yield SyncBackedAsyncSession(session)
+
+    return _get_async_db_override
+
+
+@dataclass
+class QueryCounter:
+    statements: list[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """Record every SQL statement executed on any engine while the block runs.
+
+    Unlike ``app.core.query_stats`` this is not bound to the calling context, so it
+    also sees statements issued by endpoints running inside ``TestClient``.
+    """
+
+    counter = QueryCounter()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+        counter.statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _record)
+    try:
+        yield counter
+    finally:
+        event.remove(Engine, "before_cursor_execute", _record)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import csv
+import io
+import json
 from datetime import date
 
 import pytest
@@ -78,6 +81,38 @@ def test_wb_manager_online_basic(client, db_session):
     assert by_wh[(1, "MSK")] == 10
 
 
+def test_wb_manager_online_ndjson_and_csv_export(client, db_session):
+    target_date = date(2025, 1, 31)
+    article = _setup_basic_wb_manager_article(db_session, code="MGR-API-EXPORT")
+    wb_sku = "SKU-MGR-API-EXPORT"
+    create_wb_mapping(db_session, article, wb_sku=wb_sku)
+    add_wb_sales(db_session, wb_sku=wb_sku, day=target_date, sales_qty=5)
+    add_wb_stock(db_session, wb_sku=wb_sku, stock_qty=10, warehouse_id=1, warehouse_name="MSK")
+
+    resp = client.get(
+        "/api/v1/wb/manager/online",
+        params={"target_date": target_date.isoformat(), "format": "ndjson"},
+    )
+    assert resp.status_code == 200, resp.text
+    rows = [json.loads(line) for line in resp.text.splitlines() if line]
+    assert len(rows) == 1
+    assert rows[0]["article_id"] == article.id
+    assert rows[0]["wb_stock_total"] == 10
+
+    resp = client.get(
+        "/api/v1/wb/manager/online",
+        params={"target_date": target_date.isoformat(), "format": "csv"},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert "wb-manager-online-2025-01-31.csv" in resp.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert len(rows) == 1
+    assert rows[0]["sales_1d"] == "5"
+    # Nested per-warehouse stock is kept as compact JSON in one cell.
+    assert json.loads(rows[0]["wb_stock_by_warehouse"])[0]["stock_qty"] == 10
+
+
 def test_wb_manager_online_filters_by_article_ids(client, db_session):
     target_date = date(2025, 1, 31)
     article1 = _setup_basic_wb_manager_article(db_session, code="MGR-API-A1")
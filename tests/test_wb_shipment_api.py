@@ -6,7 +6,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.core.db import get_db
+from app.core.db import get_async_db, get_db
 from app.models.models import (
     WbShipment,
     WbShipmentItem,
@@ -16,11 +16,13 @@ from app.models.models import (
 from tests.test_utils import (
     add_wb_sales,
     add_wb_stock,
+    count_queries,
     create_article,
     create_color,
     create_size,
     create_sku,
     create_wb_mapping,
+    make_async_db_override,
 )
 
 
@@ -33,6 +35,7 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_async_db] = make_async_db_override(db_session)
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
@@ -1692,3 +1695,66 @@ def test_shipment_preset_with_history(client, db_session):
 def test_shipment_preset_required_param(client):
 	resp = client.get("/api/v1/wb/manager/shipment/preset")
 	assert resp.status_code == 422
+
+
+def test_shipment_list_and_detail_batch_item_loading(client, db_session):
+    article = create_article(db_session, code="SHIP-EAGER-A")
+    color = create_color(db_session, inner_code="C-EAGER")
+    size = create_size(db_session, label="SZ-EAGER", sort_order=1)
+    now = datetime.now(timezone.utc)
+
+    shipment_ids: list[int] = []
+    for index in range(4):
+        shipment = WbShipment(
+            status="draft",
+            target_date=date(2025, 2, 1),
+            wb_arrival_date=date(2025, 2, 5),
+            comment=None,
+            created_at=now,
+            updated_at=now,
+            strategy="normal",
+            zero_sales_policy="ignore",
+            target_coverage_days=30,
+            min_coverage_days=7,
+            max_coverage_days_after=60,
+            max_replenishment_per_article=None,
+        )
+        shipment.items = [
+            WbShipmentItem(
+                article_id=article.id,
+                color_id=color.id,
+                size_id=size.id,
+                wb_sku=None,
+                recommended_qty=index + 1,
+                final_qty=index + 1,
+                nsk_stock_available=0,
+                oos_risk_before="green",
+                oos_risk_after="green",
+                limited_by_nsk_stock=False,
+                limited_by_max_coverage=False,
+                ignored_due_to_zero_sales=False,
+                below_min_coverage_threshold=False,
+                article_total_deficit=0,
+                article_total_recommended=0,
+                explanation=None,
+            )
+        ]
+        db_session.add(shipment)
+        db_session.flush()
+        shipment_ids.append(shipment.id)
+    db_session.commit()
+    db_session.expire_all()
+
+    with count_queries() as list_counter:
+        list_resp = client.get("/api/v1/wb/manager/shipment/")
+    db_session.expire_all()
+    with count_queries() as detail_counter:
+        detail_resp = client.get(f"/api/v1/wb/manager/shipment/{shipment_ids[0]}")
+
+    assert list_resp.status_code == 200
+    assert len(list_resp.json()) == 4
+    assert all(len(item["items"]) == 1 for item in list_resp.json())
+    assert list_counter.count == 2
+    assert detail_resp.status_code == 200
+    assert len(detail_resp.json()["items"]) == 1
+    assert detail_counter.count == 2